@@ -17,8 +17,9 @@ from PyQt6.QtCore import (
     Qt,
     QTimer,
     QVariantAnimation,
+    pyqtSignal,
 )
-from PyQt6.QtGui import QCursor
+from PyQt6.QtGui import QCursor, QRegion
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -32,13 +33,16 @@ from PyQt6.QtWidgets import (
 )
 from win32con import HWND_BOTTOM, HWND_NOTOPMOST, HWND_TOPMOST, SWP_NOACTIVATE, SWP_NOMOVE, SWP_NOSIZE
 
+from core.events.service import EventService
+from core.events.win32 import WinEvent
 from core.utils.controller import exit_application, reload_application
 from core.utils.utilities import refresh_widget_style
 from core.utils.win32.app_bar import APPBAR_CALLBACK_MESSAGE, AppBarNotify
 from core.utils.win32.bindings import SetWindowPos
-from core.utils.win32.bindings.user32 import KillTimer, RegisterWindowMessage, SetTimer, user32
+from core.utils.win32.bindings.user32 import GetAncestor, KillTimer, RegisterWindowMessage, SetTimer
+from core.utils.win32.maximized_windows import MaximizedWindowTracker
 from core.utils.win32.structs import MSG
-from core.utils.win32.utils import apply_qmenu_style
+from core.utils.win32.utils import apply_qmenu_style, get_monitor_hwnd, is_window_maximized
 
 # Register TaskbarCreated message to detect Explorer restarts
 WM_TASKBARCREATED = RegisterWindowMessage("TaskbarCreated")
@@ -68,7 +72,14 @@ class ThemeState:
 
 
 class BarAnimationManager(QObject):
-    """Handles bar show/hide animations."""
+    """
+    Handles bar show/hide animations.
+
+    Slides never resize the bar window. While the bar emerges from the screen edge the window sits
+    at the edge with its full size, ``_bar_frame`` is offset inside it and a window mask clips what
+    has not emerged yet; after that only the window position changes (``setGeometry`` with an
+    unchanged size is a plain move). So the widgets in the bar are laid out once, not on every frame.
+    """
 
     def __init__(self, bar_widget: QWidget, parent=None):
         super().__init__(parent)
@@ -77,6 +88,7 @@ class BarAnimationManager(QObject):
         self._target_geo = None
         self._full_height = None
         self._pending_action = None
+        self._clip: tuple[int, int] | None = None  # (y, height) of the current window mask
 
     def show_bar(self):
         if not self.bar_widget._animation.get("enabled"):
@@ -111,8 +123,23 @@ class BarAnimationManager(QObject):
             self._animation.stop()
         self._animation = None
 
+    def _clear_clip(self):
+        if self._clip is not None:
+            self._clip = None
+            self.bar_widget.clearMask()
+
+    def _set_clip(self, y: int, height: int):
+        if self._clip != (y, height):
+            self._clip = (y, height)
+            self.bar_widget.setMask(QRegion(0, y, self._target_geo[2], height))
+
+    def _reset_slide(self):
+        self._clear_clip()
+        self.bar_widget._bar_frame.move(0, 0)
+
     def _start_fade(self, show: bool):
         self._stop_animation()
+        self._reset_slide()
         duration = self.bar_widget._animation.get("duration", 300)
         self._animation = QPropertyAnimation(self.bar_widget, b"windowOpacity")
         self._animation.setDuration(duration)
@@ -127,6 +154,7 @@ class BarAnimationManager(QObject):
 
     def _start_slide(self, show: bool):
         self._stop_animation()
+        self._clear_clip()
         bar = self.bar_widget
 
         bar.position_bar()
@@ -168,27 +196,33 @@ class BarAnimationManager(QObject):
         pp = self._phase_point
         is_top = self.bar_widget._alignment["position"] == "top"
 
+        bar = self.bar_widget
+
         if value <= pp and pp > 0:
+            # Emerging from the screen edge: the window stays against the edge and the mask
+            # shows only the part of the frame that is already on screen
             t = value / pp
             h = max(1, round(full_h * t))
             if is_top:
-                self.bar_widget.setGeometry(x, self._edge_y, w, h)
-                self.bar_widget._bar_frame.move(0, h - full_h)
+                bar.setGeometry(x, self._edge_y, w, full_h)
+                bar._bar_frame.move(0, h - full_h)
+                self._set_clip(0, h)
             else:
-                self.bar_widget.setGeometry(x, self._edge_y - h, w, h)
-                self.bar_widget._bar_frame.move(0, 0)
+                bar.setGeometry(x, self._edge_y - full_h, w, full_h)
+                bar._bar_frame.move(0, full_h - h)
+                self._set_clip(full_h - h, h)
         else:
             t = (value - pp) / (1.0 - pp) if pp < 1.0 else 1.0
+            self._reset_slide()
             if is_top:
-                self.bar_widget.setGeometry(x, round(self._edge_y + self._padding * t), w, full_h)
+                bar.setGeometry(x, round(self._edge_y + self._padding * t), w, full_h)
             else:
-                self.bar_widget.setGeometry(x, round(self._edge_y - full_h - self._padding * t), w, full_h)
-            self.bar_widget._bar_frame.move(0, 0)
+                bar.setGeometry(x, round(self._edge_y - full_h - self._padding * t), w, full_h)
 
     def _on_show_finished(self):
         if self._target_geo:
             self.bar_widget.setGeometry(*self._target_geo)
-        self.bar_widget._bar_frame.move(0, 0)
+        self._reset_slide()
         self._animation = None
         self._process_pending()
 
@@ -214,6 +248,7 @@ class BarAnimationManager(QObject):
         self.bar_widget.hide()
         self.bar_widget._skip_animation = False
         self.bar_widget.setWindowOpacity(1.0)
+        self._reset_slide()
         self._animation = None
         self._process_pending()
 
@@ -646,66 +681,165 @@ class AppBarManager(QAbstractNativeEventFilter):
                 self._bar_intended_state[hwnd] = True
 
 
+class Win32MaximizedWindowProbe:
+    """Window queries for ``MaximizedWindowTracker``, cheapest checks first."""
+
+    GA_ROOT = 2
+
+    def windows(self) -> list[int]:
+        hwnds: list[int] = []
+
+        def collect(hwnd, _):
+            hwnds.append(hwnd)
+            return True
+
+        win32gui.EnumWindows(collect, None)
+        return hwnds
+
+    def maximized_monitor(self, hwnd: int) -> int | None:
+        try:
+            if not win32gui.IsWindowVisible(hwnd):
+                return None
+            # Events also name child windows, only top-level windows count
+            if GetAncestor(hwnd, self.GA_ROOT) != hwnd:
+                return None
+            if not is_window_maximized(hwnd):
+                return None
+            if not win32gui.GetWindowText(hwnd):
+                return None
+            cls_name = win32gui.GetClassName(hwnd)
+            if cls_name in AppBarManager.EXCLUDED_WINDOW_CLASSES:
+                return None
+            if cls_name.endswith(AppBarManager.EXCLUDED_WINDOW_CLASS_SUFFIXES):
+                return None
+            return get_monitor_hwnd(hwnd)
+        except Exception:
+            # The window is already gone
+            return None
+
+
+class MaximizedWindowHub(QObject):
+    """
+    Tracks maximized windows for all bars from WinEvents and tells each bar's watcher when its
+    monitor gains its first or loses its last maximized window.
+    """
+
+    # Events that can change whether a window is maximized, visible or on which monitor
+    WINDOW_EVENTS = (
+        WinEvent.EventSystemForeground,
+        WinEvent.EventSystemMinimizeStart,
+        WinEvent.EventSystemMinimizeEnd,
+        WinEvent.EventSystemMoveSizeEnd,
+        WinEvent.EventObjectLocationChange,
+        WinEvent.EventObjectShow,
+        WinEvent.EventObjectHide,
+    )
+    # Location changes arrive in bursts while windows animate, handle them in batches
+    COALESCE_MS = 50
+
+    window_changed = pyqtSignal(int, WinEvent)
+    window_destroyed = pyqtSignal(int, WinEvent)
+
+    _instance: MaximizedWindowHub | None = None
+
+    @classmethod
+    def get_instance(cls) -> MaximizedWindowHub:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._event_service = EventService()
+        self._tracker = MaximizedWindowTracker(Win32MaximizedWindowProbe())
+        self._watchers: list[MaximizedWindowWatcher] = []
+        self._changed: set[int] = set()
+        self._destroyed: set[int] = set()
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(self.COALESCE_MS)
+        self._batch_timer.timeout.connect(self._process_batch)
+        self.window_changed.connect(self._on_window_changed)
+        self.window_destroyed.connect(self._on_window_destroyed)
+
+    def has_maximized(self, monitor: int | None) -> bool:
+        return self._tracker.has_maximized(monitor)
+
+    def subscribe(self, watcher: MaximizedWindowWatcher) -> None:
+        if watcher in self._watchers:
+            return
+        if not self._watchers:
+            for event in self.WINDOW_EVENTS:
+                self._event_service.register_event(event, self.window_changed)
+            self._event_service.register_event(WinEvent.EventObjectDestroy, self.window_destroyed)
+            self._tracker.rescan()
+        self._watchers.append(watcher)
+        watcher.set_maximized(self._tracker.has_maximized(watcher.monitor))
+
+    def unsubscribe(self, watcher: MaximizedWindowWatcher) -> None:
+        if watcher not in self._watchers:
+            return
+        self._watchers.remove(watcher)
+        if not self._watchers:
+            for event in self.WINDOW_EVENTS:
+                self._event_service.unregister_event(event, self.window_changed)
+            self._event_service.unregister_event(WinEvent.EventObjectDestroy, self.window_destroyed)
+            self._batch_timer.stop()
+            self._changed.clear()
+            self._destroyed.clear()
+            self._tracker.clear()
+
+    def _on_window_changed(self, hwnd: int, _event: WinEvent):
+        if hwnd:
+            self._changed.add(hwnd)
+            if not self._batch_timer.isActive():
+                self._batch_timer.start()
+
+    def _on_window_destroyed(self, hwnd: int, _event: WinEvent):
+        if hwnd:
+            self._destroyed.add(hwnd)
+            if not self._batch_timer.isActive():
+                self._batch_timer.start()
+
+    def _process_batch(self):
+        destroyed, self._destroyed = self._destroyed, set()
+        changed, self._changed = self._changed - destroyed, set()
+        try:
+            flipped = self._tracker.remove(destroyed) | self._tracker.update(changed)
+        except Exception:
+            logging.exception("Failed to update maximized windows")
+            return
+        if not flipped:
+            return
+        for watcher in self._watchers[:]:
+            if watcher.monitor in flipped:
+                watcher.set_maximized(self._tracker.has_maximized(watcher.monitor))
+
+
 class MaximizedWindowWatcher(QObject):
-    """Watches for any maximized window on the bar's monitor and toggles autohide accordingly."""
+    """Toggles autohide while any maximized window is on the bar's monitor."""
 
     def __init__(self, bar_widget, parent=None):
         super().__init__(parent)
         self.bar_widget = bar_widget
         self._is_autohide_active = False
         self._had_autohide_before = False
+        self._hub = MaximizedWindowHub.get_instance()
+        self._hub.subscribe(self)
 
-        self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(500)
-        self._poll_timer.timeout.connect(self._check_maximized_windows)
-        self._poll_timer.start()
+    @property
+    def monitor(self) -> int | None:
+        return getattr(self.bar_widget, "monitor_hwnd", None)
 
-    def _check_maximized_windows(self):
-        """Check if any top-level window is maximized on the bar's monitor."""
+    def set_maximized(self, has_maximized: bool):
+        """Called by the hub with the current state of the bar's monitor"""
         try:
-            from core.utils.win32.utils import get_monitor_hwnd, is_window_maximized
-
-            bar_monitor = getattr(self.bar_widget, "monitor_hwnd", None)
-            if not bar_monitor:
-                return
-
-            has_maximized = False
-
-            def enum_callback(hwnd, _):
-                nonlocal has_maximized
-                if has_maximized:
-                    return False
-                try:
-                    if not win32gui.IsWindowVisible(hwnd):
-                        return True
-                    if not win32gui.GetWindowText(hwnd):
-                        return True
-                    cls_name = win32gui.GetClassName(hwnd)
-                    if cls_name in AppBarManager.EXCLUDED_WINDOW_CLASSES:
-                        return True
-                    if cls_name.endswith(AppBarManager.EXCLUDED_WINDOW_CLASS_SUFFIXES):
-                        return True
-                    window_monitor = get_monitor_hwnd(hwnd)
-                    if window_monitor != bar_monitor:
-                        return True
-                    if is_window_maximized(hwnd):
-                        has_maximized = True
-                        return False
-                except Exception:
-                    pass
-                return True
-
-            WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.wintypes.HWND, ctypes.POINTER(ctypes.c_long))
-            callback = WNDENUMPROC(enum_callback)
-            user32.EnumWindows(callback, 0)
-
             if has_maximized and not self._is_autohide_active:
                 self._enable_autohide()
             elif not has_maximized and self._is_autohide_active:
                 self._disable_autohide()
-
         except Exception:
-            logging.exception("Failed to check maximized windows")
+            logging.exception("Failed to apply maximized window state")
 
     def _enable_autohide(self):
         """Enable autohide because a maximized window was detected."""
@@ -739,7 +873,7 @@ class MaximizedWindowWatcher(QObject):
 
     def cleanup(self):
         """Clean up resources."""
-        self._poll_timer.stop()
+        self._hub.unsubscribe(self)
         if self._is_autohide_active:
             self._disable_autohide()
 
@@ -1,5 +1,6 @@
 import functools
 import logging
+from collections.abc import Callable
 from threading import RLock
 from typing import Any
 
@@ -15,11 +16,38 @@ class EventService(QObject):
         self._registered_event_signals: dict[Event, list[pyqtSignal]] = {}
         self._mutex = RLock()
         self._is_shutdown: bool = False
+        self._subscription_observers: list[Callable[[], None]] = []
+
+    def add_subscription_observer(self, callback: Callable[[], None]):
+        """
+        Call ``callback`` whenever an event type gains its first or loses its last signal.
+        The callback runs on the registering thread and should only schedule work.
+        """
+        with self._mutex:
+            self._subscription_observers.append(callback)
+
+    def remove_subscription_observer(self, callback: Callable[[], None]):
+        with self._mutex:
+            if callback in self._subscription_observers:
+                self._subscription_observers.remove(callback)
+
+    def subscribed_event_types(self) -> set[Any]:
+        """Event types that currently have at least one registered signal."""
+        with self._mutex:
+            return {event_type for event_type, signals in self._registered_event_signals.items() if signals}
+
+    def _notify_subscription_observers(self):
+        for callback in list(self._subscription_observers):
+            try:
+                callback()
+            except Exception:
+                logging.exception("Subscription observer %s failed", callback)
 
     def register_event(self, event_type: Event, event_signal: pyqtSignal):
         with self._mutex:
             if event_type not in self._registered_event_signals:
                 self._registered_event_signals[event_type] = [event_signal]
+                self._notify_subscription_observers()
             else:
                 self._registered_event_signals[event_type].append(event_signal)
 
@@ -40,6 +68,7 @@ class EventService(QObject):
             # Clean up empty lists to avoid growing the dict
             if not signals:
                 self._registered_event_signals.pop(event_type, None)
+                self._notify_subscription_observers()
 
     def emit_event(self, event_type: Event, *args: Any):
         if self._is_shutdown:
@@ -55,10 +84,14 @@ class EventService(QObject):
                     with self._mutex:
                         if event_signal in event_signals:
                             event_signals.remove(event_signal)
+                        if not event_signals and self._registered_event_signals.get(event_type) is event_signals:
+                            self._registered_event_signals.pop(event_type, None)
+                            self._notify_subscription_observers()
 
     def clear(self):
         with self._mutex:
             self._registered_event_signals.clear()
+            self._notify_subscription_observers()
 
     def shutdown(self):
         """Suppress future emits and clear registry during application shutdown."""
@@ -41,6 +41,7 @@ from PyQt6.QtGui import (
 )
 from PyQt6.QtNetwork import (
     QNetworkAccessManager,
+    QNetworkDiskCache,
     QNetworkProxyFactory,
     QNetworkReply,
     QNetworkRequest,
@@ -72,7 +73,7 @@ from core.ui.components.loader import Spinner
 from core.ui.theme import FONT_FAMILIES, get_tokens, is_dark
 from core.ui.views.view_base import ViewBase
 from core.utils.markdown import md_to_html, preprocess_readme
-from core.utils.system import is_windows_10
+from core.utils.system import app_data_path, is_windows_10
 from settings import DEFAULT_CONFIG_DIRECTORY
 
 QNetworkProxyFactory.setUseSystemConfiguration(True)
@@ -104,6 +105,9 @@ SMOOTH_SCROLL_DURATION_MS = 180
 SMOOTH_SCROLL_STEP = 84
 SCROLLBAR_WIDTH = 8
 
+THEME_CACHE_DIR = "themes_cache"
+THEME_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 
 def _ui_font(size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
     f = QFont()
@@ -121,6 +125,42 @@ def _network_request(url: str, referer: str = "") -> QNetworkRequest:
     return req
 
 
+_shared_net: QNetworkAccessManager | None = None
+
+
+def _network() -> QNetworkAccessManager:
+    """Access manager shared by the whole view, backed by a persistent HTTP cache.
+
+    Qt stores every response on disk together with its ETag/Last-Modified validators. A fresh
+    entry is answered from disk, a stale one is revalidated with a conditional request and an
+    unchanged resource comes back as a 304 without its body.
+    """
+    global _shared_net
+    if _shared_net is None:
+        _shared_net = QNetworkAccessManager(QApplication.instance())
+        cache = QNetworkDiskCache(_shared_net)
+        cache.setCacheDirectory(str(app_data_path(THEME_CACHE_DIR)))
+        cache.setMaximumCacheSize(THEME_CACHE_MAX_BYTES)
+        _shared_net.setCache(cache)
+    return _shared_net
+
+
+def _cached_data(url: str) -> bytes | None:
+    """Body of *url* from the disk cache, fresh or stale, without going to the network."""
+    cache = _network().cache()
+    device = cache.data(QUrl(url)) if cache is not None else None
+    if device is None:
+        return None
+    data = bytes(device.readAll())
+    device.close()
+    return data or None
+
+
+def _is_cached(url: str) -> bool:
+    cache = _network().cache()
+    return cache is not None and cache.metaData(QUrl(url)).isValid()
+
+
 def _run_yasbc(cmd: str):
     subprocess.run(
         ["yasbc", cmd],
@@ -406,13 +446,16 @@ class ThemeSplashScreen(QWidget):
 
 
 class RemoteImageTextBrowser(QTextBrowser):
-    """QTextBrowser that asynchronously fetches remote images."""
+    """QTextBrowser that asynchronously fetches remote images.
+
+    Images already in the disk cache are shown right away and revalidated in the background.
+    """
 
     content_ready = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._net = QNetworkAccessManager(self)
+        self._net = _network()
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.document().documentLayout().documentSizeChanged.connect(
@@ -434,27 +477,42 @@ class RemoteImageTextBrowser(QTextBrowser):
         if rtype == QTextDocument.ResourceType.ImageResource:
             s = url.toString()
             if s in self._images:
-                px = self._images[s]
-                vw = self.viewport().width()
-                if vw > 0 and px.width() > vw:
-                    return px.scaledToWidth(vw, Qt.TransformationMode.SmoothTransformation)
-                return px
+                return self._fit_width(self._images[s])
             if url.scheme() in ("http", "https") and s not in self._loading:
+                cached = _cached_data(s)
+                px = QPixmap()
+                if cached and px.loadFromData(cached):
+                    self._images[s] = px
+                    self._request(s, cached)
+                    return self._fit_width(px)
                 self._loading.add(s)
-                rev = self._rev
-                reply = self._net.get(_network_request(s, referer="https://github.com"))
-                reply.finished.connect(lambda u=s, rv=rev, r=reply: self._on_fetched(rv, u, r))
-                self._replies[s] = reply
+                self._request(s)
             return None
         return super().loadResource(rtype, url)
 
-    def _on_fetched(self, rev: int, url: str, reply: QNetworkReply):
-        self._replies.pop(url, None)
+    def _fit_width(self, px: QPixmap) -> QPixmap:
+        vw = self.viewport().width()
+        if vw > 0 and px.width() > vw:
+            return px.scaledToWidth(vw, Qt.TransformationMode.SmoothTransformation)
+        return px
+
+    def _request(self, url: str, cached: bytes = b""):
+        rev = self._rev
+        reply = self._net.get(_network_request(url, referer="https://github.com"))
+        reply.finished.connect(lambda u=url, rv=rev, r=reply, c=cached: self._on_fetched(rv, u, r, c))
+        self._replies[url] = reply
+
+    def _on_fetched(self, rev: int, url: str, reply: QNetworkReply, cached: bytes = b""):
+        if self._replies.get(url) is reply:
+            del self._replies[url]
         ok = reply.error() == QNetworkReply.NetworkError.NoError
         data = bytes(reply.readAll()) if ok else b""
         reply.deleteLater()
         if rev != self._rev:
             return
+        if cached and (not data or data == cached):
+            # Revalidation of an image already shown from the disk cache, nothing changed
+            return
         self._loading.discard(url)
         px = QPixmap()
         if not (data and px.loadFromData(data)):
@@ -686,12 +744,13 @@ class ThemeDetailPanel(QWidget):
         super().__init__(parent)
         self.theme_data: dict | None = None
         self._tokens = _theme_tokens()
-        self._net = QNetworkAccessManager(self)
+        self._net = _network()
         self._image_reply: QNetworkReply | None = None
         self._readme_reply: QNetworkReply | None = None
         self._image_data = b""
         self._readme_text = ""
-        self._pending_requests = 0
+        # Resources still to arrive before the content is shown, cached ones are only revalidated
+        self._waiting: set[str] = set()
         self._install_dialog: QDialog | None = None
         self._build_ui()
 
@@ -926,7 +985,7 @@ class ThemeDetailPanel(QWidget):
         self._cancel_requests()
         self._image_data = b""
         self._readme_text = ""
-        self._pending_requests = 0
+        self._waiting = set()
 
         self._apply_theme_metadata(data)
 
@@ -939,13 +998,19 @@ class ThemeDetailPanel(QWidget):
         image_url = data.get("image")
         readme_url = data.get("readme")
         if image_url:
-            self._pending_requests += 1
+            if (cached := _cached_data(image_url)) is not None:
+                self._image_data = cached
+            else:
+                self._waiting.add("image")
             self._image_reply = self._net.get(_network_request(image_url))
             self._image_reply.finished.connect(
                 lambda current_theme_id=theme_id, reply=self._image_reply: self._on_image_reply(current_theme_id, reply)
             )
         if readme_url:
-            self._pending_requests += 1
+            if (cached := _cached_data(readme_url)) is not None:
+                self._readme_text = cached.decode("utf-8", errors="replace")
+            else:
+                self._waiting.add("readme")
             self._readme_reply = self._net.get(_network_request(readme_url))
             self._readme_reply.finished.connect(
                 lambda current_theme_id=theme_id, reply=self._readme_reply: self._on_readme_reply(
@@ -953,7 +1018,7 @@ class ThemeDetailPanel(QWidget):
                 )
             )
 
-        if self._pending_requests == 0:
+        if not self._waiting:
             self._show_content()
 
     def _apply_theme_metadata(self, data: dict) -> None:
@@ -1000,10 +1065,7 @@ class ThemeDetailPanel(QWidget):
         data = self._finish_reply("_image_reply", theme_id, reply)
         if data is None:
             return
-        self._image_data = data
-        self._pending_requests -= 1
-        if self._pending_requests <= 0:
-            self._show_content()
+        self._deliver("image", "_image_data", data)
 
     def _on_readme_reply(self, theme_id: str, reply: QNetworkReply | None) -> None:
         if reply is None:
@@ -1011,9 +1073,15 @@ class ThemeDetailPanel(QWidget):
         text = self._finish_reply("_readme_reply", theme_id, reply, decode=True)
         if text is None:
             return
-        self._readme_text = text
-        self._pending_requests -= 1
-        if self._pending_requests <= 0:
+        self._deliver("readme", "_readme_text", text)
+
+    def _deliver(self, kind: str, attr: str, value: bytes | str) -> None:
+        if kind not in self._waiting and (not value or value == getattr(self, attr)):
+            # Background revalidation of a cached copy that is already shown
+            return
+        self._waiting.discard(kind)
+        setattr(self, attr, value)
+        if not self._waiting:
             self._show_content()
 
     def _show_content(self) -> None:
@@ -1225,8 +1293,9 @@ class ThemeViewer(ViewBase, QMainWindow):
         self._tokens = _theme_tokens()
         self.theme_items: list[dict] = []
         self.themes: dict = {}
-        self._net = QNetworkAccessManager(self)
+        self._net = _network()
         self._theme_reply: QNetworkReply | None = None
+        self._prefetch_replies: dict[str, QNetworkReply] = {}
         self._load_error: str | None = None
         self._themes_loaded = False
         self._minimum_splash_elapsed = False
@@ -1362,10 +1431,28 @@ class ThemeViewer(ViewBase, QMainWindow):
         return sidebar
 
     def _start_loading(self) -> None:
-        self._request_theme_index(0)
         self._splash_timer = QTimer(self, singleShot=True)
         self._splash_timer.timeout.connect(self._on_splash_elapsed)
-        self._splash_timer.start(self.splash_screen.minimum_display_ms())
+        if self._load_cached_index():
+            # Render the catalog from disk right away, the request below only revalidates it
+            self._minimum_splash_elapsed = True
+            QTimer.singleShot(0, self._check_ready)
+        else:
+            self._splash_timer.start(self.splash_screen.minimum_display_ms())
+        self._request_theme_index(0)
+
+    def _load_cached_index(self) -> bool:
+        for url in self._theme_urls:
+            cached = _cached_data(url)
+            if cached is None:
+                continue
+            try:
+                self.themes = json.loads(cached.decode("utf-8"))
+            except Exception:
+                continue
+            self._themes_loaded = True
+            return True
+        return False
 
     def _on_splash_elapsed(self) -> None:
         self._minimum_splash_elapsed = True
@@ -1386,10 +1473,14 @@ class ThemeViewer(ViewBase, QMainWindow):
             self._theme_reply = None
         if reply.error() == QNetworkReply.NetworkError.NoError:
             try:
-                self.themes = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                self._themes_loaded = True
+                themes = json.loads(bytes(reply.readAll()).decode("utf-8"))
                 reply.deleteLater()
-                self._check_ready()
+                if not self._themes_loaded:
+                    self.themes = themes
+                    self._themes_loaded = True
+                    self._check_ready()
+                elif themes != self.themes:
+                    self._update_themes(themes)
                 return
             except Exception as exc:
                 err = f"Invalid theme index response: {exc}"
@@ -1401,7 +1492,24 @@ class ThemeViewer(ViewBase, QMainWindow):
         else:
             self._on_load_error(err)
 
+    def _update_themes(self, themes: dict) -> None:
+        """Swap in a catalog that changed since the cached copy was rendered."""
+        self.themes = themes
+        if not self.theme_items:
+            # The list is not built yet, _show_body picks up the new catalog
+            return
+        current = self.theme_list.currentItem()
+        data = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        self.theme_items = [{**theme, "id": theme_id} for theme_id, theme in themes.items()]
+        self._rebuild_list(self._filtered_items(self.search_box.text()))
+        row = self._find_theme_row(data.get("id", "")) if data else -1
+        if self.theme_list.count():
+            self.theme_list.setCurrentRow(max(row, 0))
+
     def _on_load_error(self, message: str) -> None:
+        if self._themes_loaded and self.themes:
+            # Offline, keep showing the cached catalog
+            return
         self._themes_loaded = True
         self.themes = {}
         self.theme_items = []
@@ -1501,18 +1609,18 @@ class ThemeViewer(ViewBase, QMainWindow):
             QRect(PILL_MARGIN, rect.y() + (rect.height() - PILL_HEIGHT) // 2, PILL_WIDTH, PILL_HEIGHT)
         )
 
-    def _filter_sidebar(self, text: str) -> None:
+    def _filtered_items(self, text: str) -> list[dict]:
         query = text.strip().lower()
-        items = (
-            self.theme_items
-            if not query
-            else [
-                theme
-                for theme in self.theme_items
-                if query in theme.get("name", "").lower() or query in theme.get("author", "").lower()
-            ]
-        )
-        self._rebuild_list(items)
+        if not query:
+            return self.theme_items
+        return [
+            theme
+            for theme in self.theme_items
+            if query in theme.get("name", "").lower() or query in theme.get("author", "").lower()
+        ]
+
+    def _filter_sidebar(self, text: str) -> None:
+        self._rebuild_list(self._filtered_items(text))
         if self.theme_list.count():
             self.theme_list.setCurrentRow(0)
 
@@ -1521,6 +1629,28 @@ class ThemeViewer(ViewBase, QMainWindow):
         self._move_pill(current)
         if current is not None and (data := current.data(Qt.ItemDataRole.UserRole)):
             self.detail_panel.load_theme(data)
+            self._prefetch_neighbours(self.theme_list.row(current))
+
+    def _prefetch_neighbours(self, row: int) -> None:
+        """Pull the preview and README of the themes above and below *row* into the disk cache."""
+        for neighbour in (row - 1, row + 1):
+            item = self.theme_list.item(neighbour) if neighbour >= 0 else None
+            data = item.data(Qt.ItemDataRole.UserRole) if item is not None else None
+            if not data:
+                continue
+            for url in (data.get("image"), data.get("readme")):
+                if not url or url in self._prefetch_replies or _is_cached(url):
+                    continue
+                request = _network_request(url)
+                request.setPriority(QNetworkRequest.Priority.LowPriority)
+                reply = self._net.get(request)
+                reply.finished.connect(lambda u=url, r=reply: self._on_prefetched(u, r))
+                self._prefetch_replies[url] = reply
+
+    def _on_prefetched(self, url: str, reply: QNetworkReply) -> None:
+        if self._prefetch_replies.get(url) is reply:
+            del self._prefetch_replies[url]
+        reply.deleteLater()
 
     @staticmethod
     def _config_paths() -> tuple[str, str, str, str]:
@@ -1575,6 +1705,10 @@ class ThemeViewer(ViewBase, QMainWindow):
             self._theme_reply.abort()
             self._theme_reply.deleteLater()
             self._theme_reply = None
+        for reply in list(self._prefetch_replies.values()):
+            reply.abort()
+            reply.deleteLater()
+        self._prefetch_replies.clear()
         self.detail_panel.shutdown()
         super().closeEvent(event)
 
@@ -0,0 +1,468 @@
+"""
+Process-wide HTTP client shared by the network widgets and quick launch providers.
+
+Keeps a small pool of keep-alive connections per host, caches GET responses with a TTL
+and HTTP validators (ETag / Last-Modified), and coalesces identical in-flight GET requests
+so several widget instances asking for the same URL produce a single fetch.
+
+Errors are raised as ``urllib.error.HTTPError`` subclasses / ``urllib.error.URLError`` so existing
+``urllib`` based error handling keeps working unchanged.
+"""
+
+import gzip
+import http.client
+import io
+import json
+import logging
+import ssl
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+logger = logging.getLogger("http_client")
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0"
+
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+# Errors that mean a pooled keep-alive connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpStatusError(HTTPError):
+    """``HTTPError`` whose body can be read any number of times, so coalesced callers can share it."""
+
+    def __init__(self, url: str, code: int, msg: str, hdrs: http.client.HTTPMessage, body: bytes):
+        super().__init__(url, code, msg, hdrs, io.BytesIO(body))
+        self.body = body
+
+    def read(self, *_args) -> bytes:
+        return self.body
+
+
+@dataclass
+class HttpResponse:
+    """A fully read HTTP response."""
+
+    url: str
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+    from_cache: bool = False
+
+    def getheader(self, name: str, default: str | None = None) -> str | None:
+        return self.headers.get(name, default)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding)
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+@dataclass
+class _CacheEntry:
+    response: HttpResponse
+    expires: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class _InFlight:
+    event: threading.Event = field(default_factory=threading.Event)
+    response: HttpResponse | None = None
+    error: BaseException | None = None
+
+
+class HttpClient:
+    """Thread-safe HTTP client with connection pooling, response caching and request coalescing."""
+
+    _instance: HttpClient | None = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> HttpClient:
+        """Return the process-wide client, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(
+        self,
+        max_idle_per_host: int = 4,
+        max_cache_entries: int = 256,
+        max_workers: int = 4,
+        user_agent: str = DEFAULT_USER_AGENT,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        self._max_idle_per_host = max_idle_per_host
+        self._max_cache_entries = max_cache_entries
+        self._max_workers = max_workers
+        self._user_agent = user_agent
+        self._lock = threading.Lock()
+        self._pools: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._cache: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._in_flight: dict[tuple, _InFlight] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._ssl_context = ssl_context or ssl.create_default_context()
+        self._stats = {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "latency_samples": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10.0,
+        ttl: float | None = None,
+        use_cache: bool = True,
+    ) -> HttpResponse:
+        """
+        Perform a GET request, served from the cache when possible.
+
+        Args:
+            url: Absolute http(s) URL.
+            headers: Extra request headers; they are part of the cache key.
+            timeout: Socket timeout in seconds.
+            ttl: Seconds a response stays fresh. ``None`` uses the response ``Cache-Control: max-age``.
+            use_cache: When False the cache is bypassed, but identical in-flight requests are still coalesced.
+        """
+        headers = headers or {}
+        key = (url, tuple(sorted((k.lower(), v) for k, v in headers.items())))
+
+        with self._lock:
+            entry = self._cache.get(key) if use_cache else None
+            if entry is not None and entry.expires > time.monotonic():
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry.response
+            pending = self._in_flight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._in_flight[key] = _InFlight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not is_owner:
+            # Another thread is already fetching this URL, share its result
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.response
+
+        try:
+            pending.response = self._fetch(url, headers, timeout, ttl, key, entry)
+            return pending.response
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.event.set()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: bytes | None = None,
+        timeout: float = 10.0,
+    ) -> HttpResponse:
+        """Perform an uncached request (POST, PUT, PATCH, ...) over a pooled connection."""
+        start = time.perf_counter()
+        try:
+            return self._send(method, url, headers or {}, data, timeout)
+        finally:
+            self._record_latency(time.perf_counter() - start)
+
+    def get_async(
+        self,
+        url: str,
+        callback: Callable[[HttpResponse | None, Exception | None], None],
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Run ``get`` on the shared worker pool and invoke ``callback(response, error)`` from that worker thread.
+
+        Qt callers should forward the result to the GUI thread through a signal.
+        """
+
+        def _run():
+            try:
+                response = self.get(url, **kwargs)
+            except Exception as e:
+                callback(None, e)
+            else:
+                callback(response, None)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="HttpClient")
+            executor = self._executor
+        return executor.submit(_run)
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Drop cached responses for ``url`` (any headers), or the whole cache when ``url`` is None."""
+        with self._lock:
+            if url is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == url]:
+                del self._cache[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the hit/miss/latency counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+            stats["idle_connections"] = sum(len(pool) for pool in self._pools.values())
+        network_requests = stats["misses"] + stats["revalidated"]
+        # Retried attempts count as requests but are timed together, so average over the timed calls
+        samples = stats["latency_samples"]
+        stats["latency_avg"] = stats["latency_total"] / samples if samples else 0.0
+        stats["hit_ratio"] = stats["hits"] / (stats["hits"] + network_requests) if stats["hits"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close all pooled connections and stop the worker pool."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            executor, self._executor = self._executor, None
+        for pool in pools:
+            for conn in pool:
+                conn.close()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        ttl: float | None,
+        key: tuple,
+        entry: _CacheEntry | None,
+    ) -> HttpResponse:
+        request_headers = dict(headers)
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        start = time.perf_counter()
+        try:
+            response = self._send("GET", url, request_headers, None, timeout)
+        finally:
+            self._record_latency(time.perf_counter() - start)
+
+        if response.status == 304 and entry is not None:
+            cached = HttpResponse(
+                entry.response.url,
+                entry.response.status,
+                entry.response.reason,
+                entry.response.headers,
+                entry.response.body,
+                from_cache=True,
+            )
+            with self._lock:
+                self._stats["revalidated"] += 1
+                self._store(key, cached, ttl)
+            return cached
+
+        with self._lock:
+            self._stats["misses"] += 1
+            self._store(key, response, ttl)
+        return response
+
+    def _store(self, key: tuple, response: HttpResponse, ttl: float | None) -> None:
+        """Cache a response. Caller must hold ``self._lock``."""
+        cache_control = (response.getheader("Cache-Control") or "").lower()
+        if "no-store" in cache_control:
+            self._cache.pop(key, None)
+            return
+        if ttl is None:
+            ttl = 0.0
+            for directive in cache_control.split(","):
+                name, _, value = directive.strip().partition("=")
+                if name == "max-age" and value.isdigit():
+                    ttl = float(value)
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+        if ttl <= 0 and not etag and not last_modified:
+            self._cache.pop(key, None)
+            return
+        self._cache[key] = _CacheEntry(response, time.monotonic() + ttl, etag, last_modified)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_cache_entries:
+            self._cache.popitem(last=False)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: bytes | None,
+        timeout: float,
+    ) -> HttpResponse:
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, reason, response_headers, body = self._send_once(method, url, headers, data, timeout)
+            location = response_headers.get("Location")
+            if status in _REDIRECT_CODES and location:
+                url = urljoin(url, location)
+                if status == 303 or (status in {301, 302} and method == "POST"):
+                    method, data = "GET", None
+                continue
+            if status >= 400:
+                with self._lock:
+                    self._stats["errors"] += 1
+                raise HttpStatusError(url, status, reason, response_headers, body)
+            return HttpResponse(url, status, reason, response_headers, body)
+        raise URLError(f"Too many redirects for {url}")
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: bytes | None,
+        timeout: float,
+    ) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        pool_key = (parts.scheme, parts.hostname, port)
+        proxy = self._proxy_for(parts.scheme, parts.hostname)
+        target = (
+            url
+            if proxy and parts.scheme == "http"
+            else (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        )
+
+        request_headers = {"User-Agent": self._user_agent, "Accept-Encoding": "gzip, deflate"}
+        request_headers.update(headers)
+
+        with self._lock:
+            self._stats["requests"] += 1
+
+        # A reused keep-alive connection may have been closed by the server; retry once on a fresh one
+        for attempt in range(2):
+            conn, reused = self._acquire(pool_key, proxy, timeout)
+            try:
+                conn.request(method, target, body=data, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                with self._lock:
+                    self._stats["errors"] += 1
+                raise URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                with self._lock:
+                    self._stats["errors"] += 1
+                raise URLError(e) from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(pool_key, conn)
+            return response.status, response.reason, response.headers, self._decode(response.headers, body)
+        raise URLError(f"Connection to {parts.hostname} failed")
+
+    def _acquire(
+        self,
+        pool_key: tuple[str, str, int],
+        proxy: tuple[str, int] | None,
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            pool = self._pools.get(pool_key)
+            if pool:
+                conn = pool.pop()
+                self._stats["connections_reused"] += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self._stats["connections_opened"] += 1
+
+        scheme, host, port = pool_key
+        connect_host, connect_port = proxy if proxy else (host, port)
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(connect_host, connect_port, timeout=timeout, context=self._ssl_context)
+            if proxy:
+                conn.set_tunnel(host, port)
+        else:
+            conn = http.client.HTTPConnection(connect_host, connect_port, timeout=timeout)
+        return conn, False
+
+    def _release(self, pool_key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            pool = self._pools.setdefault(pool_key, [])
+            if len(pool) < self._max_idle_per_host:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _record_latency(self, elapsed: float) -> None:
+        with self._lock:
+            self._stats["latency_samples"] += 1
+            self._stats["latency_total"] += elapsed
+            self._stats["latency_max"] = max(self._stats["latency_max"], elapsed)
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> tuple[str, int] | None:
+        """Resolve the system proxy the same way ``urllib.request.urlopen`` would."""
+        proxy_url = getproxies().get(scheme)
+        if not proxy_url:
+            return None
+        try:
+            if proxy_bypass(host):
+                return None
+        except OSError:
+            return None
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        proxy = urlsplit(proxy_url)
+        if not proxy.hostname:
+            return None
+        return proxy.hostname, proxy.port or 8080
+
+    @staticmethod
+    def _decode(headers: http.client.HTTPMessage, body: bytes) -> bytes:
+        encoding = (headers.get("Content-Encoding") or "").lower()
+        try:
+            if encoding == "gzip":
+                return gzip.decompress(body)
+            if encoding == "deflate":
+                return zlib.decompress(body)
+        except OSError, zlib.error:
+            logger.debug("Failed to decode %s response body", encoding)
+        return body
@@ -0,0 +1,478 @@
+"""
+Embedded SQLite store for small widget data sets (notes, tasks, alarms, snippets, launch history).
+
+Every collection is a set of rows in a single WAL-mode database, so a mutation only writes the
+rows that actually changed instead of rewriting a whole JSON file. Writes are queued in memory
+and flushed in one transaction after a short debounce, and once more at exit.
+
+Collections that used to live in JSON files are imported from them the first time they are
+opened. The JSON files are left untouched as a backup.
+"""
+
+import atexit
+import bisect
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from core.utils.system import app_data_path
+
+STORE_FILE_NAME = "local_store.db"
+# Coalesce bursts of mutations (typing, drag reordering) into a single transaction
+FLUSH_DELAY = 0.5
+# Smallest gap between two list positions before the list is renumbered
+MIN_POSITION_GAP = 1e-9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position REAL NOT NULL DEFAULT 0,
+    value TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imports (
+    collection TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    imported_at REAL NOT NULL
+);
+"""
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _dumps(value: Any) -> str:
+    return _ENCODER.encode(value)
+
+
+def _read_legacy_json(path: str, convert: Callable[[Any], Any] | None) -> Any:
+    """Read a legacy JSON file, None if there is nothing to import."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return convert(data) if convert else data
+
+
+class LocalStore:
+    """Process-wide connection to the local store with debounced, batched writes."""
+
+    _instance: LocalStore | None = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> LocalStore:
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(str(app_data_path(STORE_FILE_NAME)))
+            return cls._instance
+
+    def __init__(self, db_path: str, flush_delay: float = FLUSH_DELAY):
+        self._db_path = db_path
+        self._flush_delay = flush_delay
+        self._lock = threading.RLock()
+        # (collection, key) -> (position, value) to upsert, or None to delete
+        self._pending: dict[tuple[str, str], tuple[float, str] | None] = {}
+        self._flush_timer: threading.Timer | None = None
+        self._lists: dict[str, StoredList] = {}
+        self._dicts: dict[str, StoredDict] = {}
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL never corrupts the database, at worst the last transaction is rolled back on power loss
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        atexit.register(self.close)
+
+    def get_list(
+        self, collection: str, legacy_file: str | None = None, legacy_convert: Callable[[Any], Any] | None = None
+    ) -> StoredList:
+        """
+        Return the shared list view of ``collection``.
+
+        On first use the JSON list in ``legacy_file`` is imported, passed through ``legacy_convert`` if given.
+        """
+        with self._lock:
+            stored = self._lists.get(collection)
+            if stored is None:
+                stored = self._lists[collection] = StoredList(self, collection, legacy_file, legacy_convert)
+            return stored
+
+    def get_dict(
+        self, collection: str, legacy_file: str | None = None, legacy_convert: Callable[[Any], Any] | None = None
+    ) -> StoredDict:
+        """
+        Return the shared mapping view of ``collection``.
+
+        On first use the JSON object in ``legacy_file`` is imported, passed through ``legacy_convert`` if given.
+        """
+        with self._lock:
+            stored = self._dicts.get(collection)
+            if stored is None:
+                stored = self._dicts[collection] = StoredDict(self, collection, legacy_file, legacy_convert)
+            return stored
+
+    def rows(self, collection: str) -> list[tuple[str, float, str]]:
+        """Return ``(key, position, value)`` rows of ``collection`` ordered by position."""
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute(
+                "SELECT key, position, value FROM entries WHERE collection = ? ORDER BY position, key",
+                (collection,),
+            ).fetchall()
+
+    def put(self, collection: str, key: str, value: str, position: float = 0) -> None:
+        with self._lock:
+            self._pending[(collection, key)] = (position, value)
+            self._schedule_flush()
+
+    def delete(self, collection: str, key: str) -> None:
+        with self._lock:
+            self._pending[(collection, key)] = None
+            self._schedule_flush()
+
+    def import_once(self, collection: str, source: str, load: Callable[[], list[tuple[str, float, str]]]) -> None:
+        """
+        Fill ``collection`` with the rows returned by ``load`` unless it was imported before.
+
+        A source that fails to parse is retried next time instead of being marked as imported.
+        """
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM imports WHERE collection = ?", (collection,)).fetchone():
+                return
+            try:
+                rows = load()
+            except Exception as e:
+                logging.error("Failed to import %s into the local store: %s", source, e)
+                return
+            self._flush_locked()
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (collection, key, position, value) VALUES (?, ?, ?, ?)",
+                    [(collection, key, position, value) for key, position, value in rows],
+                )
+                self._conn.execute(
+                    "INSERT INTO imports (collection, source, imported_at) VALUES (?, ?, ?)",
+                    (collection, source, time.time()),
+                )
+            logging.info("Imported %d entries from %s into the local store", len(rows), source)
+
+    def flush(self) -> None:
+        """Write all queued mutations now."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    def _schedule_flush(self) -> None:
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending or self._conn is None:
+            return
+        pending, self._pending = self._pending, {}
+        upserts = [(c, k, p[0], p[1]) for (c, k), p in pending.items() if p is not None]
+        deletes = [(c, k) for (c, k), p in pending.items() if p is None]
+        try:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                if deletes:
+                    self._conn.executemany("DELETE FROM entries WHERE collection = ? AND key = ?", deletes)
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO entries (collection, key, position, value) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (collection, key) DO UPDATE SET position = excluded.position, value = excluded.value",
+                        upserts,
+                    )
+        except sqlite3.Error as e:
+            logging.error("Failed to write to the local store: %s", e)
+            # Keep the mutations for the next flush unless newer ones replaced them
+            for item, op in pending.items():
+                self._pending.setdefault(item, op)
+
+
+class StoredList:
+    """
+    An ordered list of JSON values persisted as one row per item.
+
+    ``save`` diffs the new list against the stored rows: rows are keyed by content, and items
+    that keep their relative order keep their position, so adding, removing, editing or moving a
+    single item only writes that item. ``insert``, ``update`` and ``remove`` change one item
+    without serializing the rest of the list.
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        collection: str,
+        legacy_file: str | None = None,
+        legacy_convert: Callable[[Any], Any] | None = None,
+    ):
+        self._store = store
+        self._collection = collection
+        if legacy_file:
+            store.import_once(collection, legacy_file, lambda: self._import_rows(legacy_file, legacy_convert))
+        rows = store.rows(collection)
+        self._keys: list[str] = [key for key, _, _ in rows]
+        self._positions: dict[str, float] = {key: position for key, position, _ in rows}
+        self._values: list[str] = [value for _, _, value in rows]
+        # Serialized item -> content digest, so unchanged items aren't hashed again
+        self._digests: dict[str, str] = {}
+
+    @staticmethod
+    def _import_rows(path: str, convert: Callable[[Any], Any] | None) -> list[tuple[str, float, str]]:
+        data = _read_legacy_json(path, convert)
+        if not isinstance(data, list):
+            return []
+        keys = StoredList._content_keys([_dumps(item) for item in data], {})
+        return [(key, float(i), _dumps(item)) for i, (key, item) in enumerate(zip(keys, data))]
+
+    @staticmethod
+    def _digest(value: str, digests: dict[str, str]) -> str:
+        digest = digests.get(value)
+        if digest is None:
+            digest = digests[value] = hashlib.blake2b(value.encode("utf-8"), digest_size=12).hexdigest()
+        return digest
+
+    @staticmethod
+    def _content_keys(values: list[str], digests: dict[str, str]) -> list[str]:
+        """Content keys, with an occurrence counter so duplicate items stay distinct."""
+        seen: dict[str, int] = {}
+        keys = []
+        for value in values:
+            digest = StoredList._digest(value, digests)
+            n = seen.get(digest, 0)
+            seen[digest] = n + 1
+            keys.append(f"{digest}:{n}")
+        return keys
+
+    def load(self) -> list[Any]:
+        """Return a fresh copy of the stored items."""
+        return [json.loads(value) for value in self._values]
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert ``item`` before ``index``, writing only its row."""
+        index = max(0, min(index, len(self._keys)))
+        lower = self._positions[self._keys[index - 1]] if index else None
+        upper = self._positions[self._keys[index]] if index < len(self._keys) else None
+        if lower is None:
+            position = 0.0 if upper is None else upper - 1
+        elif upper is None:
+            position = lower + 1
+        else:
+            position = lower + (upper - lower) / 2
+            if position - lower < MIN_POSITION_GAP:
+                # No room between the neighbours, let save renumber the list
+                items = self.load()
+                items.insert(index, item)
+                self.save(items)
+                return
+        value = _dumps(item)
+        key = self._free_key(value)
+        self._store.put(self._collection, key, value, position)
+        self._keys.insert(index, key)
+        self._values.insert(index, value)
+        self._positions[key] = position
+
+    def append(self, item: Any) -> None:
+        """Add ``item`` at the end of the list, writing only its row."""
+        self.insert(len(self._keys), item)
+
+    def update(self, old: Any, new: Any) -> bool:
+        """Replace the stored item equal to ``old`` with ``new`` in place, False if there is none."""
+        key = self._find_key(_dumps(old))
+        if key is None:
+            return False
+        value = _dumps(new)
+        index = self._keys.index(key)
+        if value == self._values[index]:
+            return True
+        position = self._positions.pop(key)
+        self._store.delete(self._collection, key)
+        new_key = self._free_key(value)
+        self._store.put(self._collection, new_key, value, position)
+        self._keys[index] = new_key
+        self._values[index] = value
+        self._positions[new_key] = position
+        return True
+
+    def remove(self, item: Any) -> bool:
+        """Remove the stored item equal to ``item``, False if there is none."""
+        key = self._find_key(_dumps(item))
+        if key is None:
+            return False
+        index = self._keys.index(key)
+        self._store.delete(self._collection, key)
+        del self._keys[index]
+        del self._values[index]
+        del self._positions[key]
+        return True
+
+    def _find_key(self, value: str) -> str | None:
+        """Row key of a stored item serialized as ``value``."""
+        digest = self._digest(value, self._digests)
+        for n in range(len(self._keys)):
+            key = f"{digest}:{n}"
+            if key in self._positions:
+                return key
+        return None
+
+    def _free_key(self, value: str) -> str:
+        """Unused row key for a new item serialized as ``value``."""
+        digest = self._digest(value, self._digests)
+        n = 0
+        while f"{digest}:{n}" in self._positions:
+            n += 1
+        return f"{digest}:{n}"
+
+    def save(self, items: list[Any]) -> None:
+        """Persist ``items``, writing only the rows that differ from the stored list."""
+        values = [_dumps(item) for item in items]
+        digests = {value: self._digests[value] for value in values if value in self._digests}
+        keys = self._content_keys(values, digests)
+        old = self._positions
+
+        for key in old.keys() - set(keys):
+            self._store.delete(self._collection, key)
+
+        # Items at the unchanged head and tail keep their positions, the rest keep theirs
+        # if they are part of the longest run that is still in stored order
+        old_keys = self._keys
+        head = 0
+        limit = min(len(keys), len(old_keys))
+        while head < limit and keys[head] == old_keys[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and keys[-1 - tail] == old_keys[-1 - tail]:
+            tail += 1
+        middle_end = len(keys) - tail
+        lower = old[keys[head - 1]] if head else float("-inf")
+        upper = old[keys[middle_end]] if tail else float("inf")
+        middle = [old.get(key) for key in keys[head:middle_end]]
+        middle = [p if p is not None and lower < p < upper else None for p in middle]
+        kept = set(range(head)) | set(range(middle_end, len(keys)))
+        kept |= {head + i for i in self._stable_indexes(middle)}
+
+        positions = self._assign_positions([old[key] if i in kept else None for i, key in enumerate(keys)])
+        if positions is None:
+            # Ran out of room between two neighbours, renumber the whole list
+            positions = [float(i) for i in range(len(keys))]
+            kept = {i for i, key in enumerate(keys) if old.get(key) == positions[i]}
+
+        for i, (key, value) in enumerate(zip(keys, values)):
+            if i not in kept:
+                self._store.put(self._collection, key, value, positions[i])
+
+        self._keys = keys
+        self._positions = dict(zip(keys, positions))
+        self._values = values
+        self._digests = digests
+
+    @staticmethod
+    def _stable_indexes(old_positions: list[float | None]) -> set[int]:
+        """Indexes of the longest run of existing items whose stored positions are already increasing."""
+        tails: list[float] = []
+        tail_indexes: list[int] = []
+        parents: dict[int, int | None] = {}
+        for i, position in enumerate(old_positions):
+            if position is None:
+                continue
+            n = bisect.bisect_left(tails, position)
+            parents[i] = tail_indexes[n - 1] if n else None
+            if n == len(tails):
+                tails.append(position)
+                tail_indexes.append(i)
+            else:
+                tails[n] = position
+                tail_indexes[n] = i
+        stable = set()
+        i = tail_indexes[-1] if tail_indexes else None
+        while i is not None:
+            stable.add(i)
+            i = parents[i]
+        return stable
+
+    @staticmethod
+    def _assign_positions(fixed: list[float | None]) -> list[float] | None:
+        """Fill the gaps between fixed positions, or return None if a gap is too narrow."""
+        positions: list[float] = []
+        i = 0
+        lower = None
+        while i < len(fixed):
+            if fixed[i] is not None:
+                lower = fixed[i]
+                positions.append(lower)
+                i += 1
+                continue
+            end = i
+            while end < len(fixed) and fixed[end] is None:
+                end += 1
+            count = end - i
+            upper = fixed[end] if end < len(fixed) else None
+            if lower is None and upper is None:
+                run = [float(n) for n in range(count)]
+            elif lower is None:
+                run = [upper - count + n for n in range(count)]
+            elif upper is None:
+                run = [lower + 1 + n for n in range(count)]
+            else:
+                step = (upper - lower) / (count + 1)
+                if step < MIN_POSITION_GAP:
+                    return None
+                run = [lower + step * (n + 1) for n in range(count)]
+            positions.extend(run)
+            i = end
+        return positions
+
+
+class StoredDict:
+    """A string-keyed mapping of JSON values persisted as one row per key."""
+
+    def __init__(
+        self,
+        store: LocalStore,
+        collection: str,
+        legacy_file: str | None = None,
+        legacy_convert: Callable[[Any], Any] | None = None,
+    ):
+        self._store = store
+        self._collection = collection
+        if legacy_file:
+            store.import_once(collection, legacy_file, lambda: self._import_rows(legacy_file, legacy_convert))
+
+    @staticmethod
+    def _import_rows(path: str, convert: Callable[[Any], Any] | None) -> list[tuple[str, float, str]]:
+        data = _read_legacy_json(path, convert)
+        if not isinstance(data, dict):
+            return []
+        return [(str(key), 0.0, _dumps(value)) for key, value in data.items()]
+
+    def load(self) -> dict[str, Any]:
+        return {key: json.loads(value) for key, _, value in self._store.rows(self._collection)}
+
+    def put(self, key: str, value: Any) -> None:
+        self._store.put(self._collection, key, _dumps(value))
+
+    def delete(self, key: str) -> None:
+        self._store.delete(self._collection, key)
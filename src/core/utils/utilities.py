@@ -61,6 +61,13 @@ def refresh_widget_style(*widgets: QWidget) -> None:
             pass
 
 
+def set_widget_class(widget: QWidget, class_name: str) -> None:
+    """Set the class of a widget, repolishing it only if the class changed."""
+    if widget.property("class") != class_name:
+        widget.setProperty("class", class_name)
+        refresh_widget_style(widget)
+
+
 def build_progress_widget(self, options: dict[str, Any]) -> None:
     """Builds a circular progress widget based on the provided options."""
     if not options["enabled"]:
@@ -179,6 +179,12 @@ kernel32.FormatMessageW.restype = DWORD
 kernel32.GetCurrentThreadId.argtypes = []
 kernel32.GetCurrentThreadId.restype = DWORD
 
+kernel32.OpenThread.argtypes = [DWORD, BOOL, DWORD]
+kernel32.OpenThread.restype = HANDLE
+
+kernel32.CancelSynchronousIo.argtypes = [HANDLE]
+kernel32.CancelSynchronousIo.restype = BOOL
+
 kernel32.GetModuleHandleW.argtypes = [LPCWSTR]
 kernel32.GetModuleHandleW.restype = HANDLE
 
@@ -453,6 +459,14 @@ def GetCurrentThreadId() -> int:
     return int(kernel32.GetCurrentThreadId())
 
 
+def OpenThread(dwDesiredAccess: int, bInheritHandle: bool, dwThreadId: int) -> int:
+    return kernel32.OpenThread(dwDesiredAccess, bInheritHandle, dwThreadId)
+
+
+def CancelSynchronousIo(hThread: int) -> bool:
+    return bool(kernel32.CancelSynchronousIo(hThread))
+
+
 def GetModuleHandle(lpModuleName: str | None) -> int:
     return kernel32.GetModuleHandleW(lpModuleName)
 
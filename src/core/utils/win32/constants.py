@@ -42,6 +42,7 @@ INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
 # Common process/query flags
 PROCESS_TERMINATE = 0x0001
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+THREAD_TERMINATE = 0x0001
 TH32CS_SNAPPROCESS = 0x00000002
 
 VIRTUAL_MEM = 0x1000 | 0x2000
@@ -98,6 +99,9 @@ EVENT_OBJECT_SHOW = 0x8002
 EVENT_OBJECT_HIDE = 0x8003
 WINEVENT_OUTOFCONTEXT = 0x0000
 WINEVENT_SKIPOWNPROCESS = 0x0002
+# WinEvent object and child ids that name the window itself
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
 
 # WiFi constants
 WLAN_INTERFACE_STATE_CONNECTED = 1
@@ -170,6 +174,7 @@ WLAN_AVAILABLE_NETWORK_HAS_PROFILE = 0x2
 
 WLAN_NOTIFICATION_SOURCE_NONE = 0x0
 WLAN_NOTIFICATION_SOURCE_ACM = 0x8
+WLAN_NOTIFICATION_SOURCE_MSM = 0x10
 WLAN_NOTIFICATION_SOURCE_ALL = 0xFFFF
 
 DOT11_AUTH_ALGO_80211_OPEN = 1
@@ -185,6 +190,8 @@ FILE_NOTIFY_CHANGE_ATTRIBUTES = 0x00000004
 FILE_NOTIFY_CHANGE_SIZE = 0x00000008
 FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
 WAIT_OBJECT_0 = 0
+WAIT_TIMEOUT = 0x00000102
+MAXIMUM_WAIT_OBJECTS = 64
 WAIT_FAILED = 0xFFFFFFFF
 INFINITE = 0xFFFFFFFF
 SHERB_NOCONFIRMATION = 0x00000001
@@ -302,6 +309,21 @@ class WlanNotificationAcm(IntEnum):
     SCAN_LIST_REFRESH = 0x1A
 
 
+class WlanNotificationMsm(IntEnum):
+    """WLAN Media Specific Module (MSM) notification codes"""
+
+    ASSOCIATING = 0x1
+    ASSOCIATED = 0x2
+    AUTHENTICATING = 0x3
+    CONNECTED = 0x4
+    ROAMING_START = 0x5
+    ROAMING_END = 0x6
+    RADIO_STATE_CHANGE = 0x7
+    SIGNAL_QUALITY_CHANGE = 0x8
+    DISASSOCIATING = 0x9
+    DISCONNECTED = 0xA
+
+
 class KnownCLSID:
     """Known Windows shell folder CLSIDs"""
 
@@ -0,0 +1,109 @@
+"""
+Subscription-driven WinEvent hook ranges.
+
+Keeps one SetWinEventHook per contiguous run of subscribed event ids, so events nobody listens
+to (location changes, value changes, ...) are never delivered to Python. The backend that
+actually installs hooks is injected, which keeps this module free of Win32 imports.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+
+from core.events.win32 import WinEvent
+
+# Ids that are not real events and must never be hooked
+_NON_EVENT_VALUES = frozenset(
+    {
+        WinEvent.WinEventOutOfContext.value,
+        WinEvent.EventMax.value,
+        WinEvent.EventSystemEnd.value,
+        WinEvent.EventObjectEnd.value,
+        WinEvent.EventAIAStart.value,
+        WinEvent.EventAIAEnd.value,
+        WinEvent.EventOEMDefinedStart.value,
+        WinEvent.EventOEMDefinedEnd.value,
+        WinEvent.EventUIAEventIdStart.value,
+        WinEvent.EventUIAEventIdEnd.value,
+        WinEvent.EventUIAPropIdStart.value,
+        WinEvent.EventUIAPropIdEnd.value,
+    }
+)
+
+
+def subscribed_win_events(event_types: Iterable[object]) -> dict[int, WinEvent]:
+    """Map the raw id of every hookable WinEvent in ``event_types`` to its enum member."""
+    return {
+        event.value: event
+        for event in event_types
+        if isinstance(event, WinEvent) and event.value not in _NON_EVENT_VALUES
+    }
+
+
+def compute_event_ranges(event_ids: Iterable[int]) -> list[tuple[int, int]]:
+    """Merge event ids into the fewest inclusive ``(min, max)`` ranges that contain no other ids."""
+    ranges: list[tuple[int, int]] = []
+    for event_id in sorted(set(event_ids)):
+        if ranges and ranges[-1][1] + 1 == event_id:
+            ranges[-1] = (ranges[-1][0], event_id)
+        else:
+            ranges.append((event_id, event_id))
+    return ranges
+
+
+class WinEventHookSet:
+    """
+    Installs and removes WinEvent hooks so they cover exactly the subscribed events.
+
+    ``install(event_min, event_max)`` returns a hook handle (0 on failure) and ``uninstall(handle)``
+    removes it. Both must be called on the thread that pumps messages for the hooks.
+    """
+
+    def __init__(self, install: Callable[[int, int], int], uninstall: Callable[[int], object]):
+        self._install = install
+        self._uninstall = uninstall
+        self._hooks: dict[tuple[int, int], int] = {}
+        self._events: dict[int, WinEvent] = {}
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return sorted(self._hooks)
+
+    @property
+    def events(self) -> dict[int, WinEvent]:
+        """Raw event id to enum member for every subscribed event."""
+        return self._events
+
+    def update(self, event_types: Iterable[object]) -> bool:
+        """
+        Hook the ranges needed for ``event_types`` and unhook the rest.
+
+        Returns False if any hook failed to install, the failed ranges are retried on the next update.
+        """
+        events = subscribed_win_events(event_types)
+        wanted = set(compute_event_ranges(events))
+
+        for event_range in set(self._hooks) - wanted:
+            self._uninstall(self._hooks.pop(event_range))
+
+        ok = True
+        for event_range in sorted(wanted - set(self._hooks)):
+            handle = self._install(*event_range)
+            if handle:
+                self._hooks[event_range] = handle
+            else:
+                logging.warning("SetWinEventHook failed for events 0x%04X-0x%04X", *event_range)
+                ok = False
+
+        # Swap in a new dict so the hook callback never sees a half-updated mapping
+        self._events = events
+        return ok
+
+    def clear(self) -> None:
+        for handle in self._hooks.values():
+            self._uninstall(handle)
+        self._hooks.clear()
+        self._events = {}
+
+    def lookup(self, event_id: int) -> WinEvent | None:
+        """Enum member for a delivered event, or None if nobody subscribes to it (anymore)."""
+        return self._events.get(event_id)
@@ -10,33 +10,50 @@ from core.events.win32 import WinEvent
 from core.utils.win32.bindings.kernel32 import GetCurrentThreadId
 from core.utils.win32.bindings.ole32 import ole32
 from core.utils.win32.bindings.user32 import user32
+from core.utils.win32.constants import CHILDID_SELF, OBJID_WINDOW
+from core.utils.win32.event_hooks import WinEventHookSet
 from core.utils.win32.structs import WINEVENTPROC
+from core.utils.win32.utils import invalidate_hwnd_info
 
-msg = ctypes.wintypes.MSG()
+WM_QUIT = 0x0012
+# Posted to the listener thread when the set of subscribed events changes
+WM_UPDATE_HOOKS = 0x8000 + 1  # WM_APP + 1
+HOOK_RETRY_INTERVAL = 1.0
 
 
 class SystemEventListener(QThread):
     def __init__(self):
         super().__init__()
-        self._hook = None
+        self._thread_id = 0
         self._event_service = EventService()
         self._win_event_process = WINEVENTPROC(self._event_handler)
+        self._hooks = WinEventHookSet(self._install_hook, user32.UnhookWinEvent)
+        self._event_service.add_subscription_observer(self._request_hook_update)
 
     def __str__(self):
         return "Win32 System Event Listener"
 
-    def _event_handler(self, _win_event_hook, event, hwnd, _id_object, _id_child, _event_thread, _event_time) -> None:
-        if event in WinEvent:
-            event_type = WinEvent._value2member_map_[event]
-            try:
-                self._event_service.emit_event(event_type, hwnd, event_type)
-            except Exception:
-                logging.exception("Failed to emit event %s for %s", event_type, hwnd)
+    def _event_handler(self, _win_event_hook, event, hwnd, id_object, id_child, _event_thread, _event_time) -> None:
+        # Hooks only cover subscribed events, this also drops stragglers from a range that was just removed
+        event_type = self._hooks.lookup(event)
+        if event_type is None:
+            return
+        # Cursor, caret and child control moves also report location changes, only windows matter
+        if event_type == WinEvent.EventObjectLocationChange and not (
+            hwnd and id_object == OBJID_WINDOW and id_child == CHILDID_SELF
+        ):
+            return
+        # Every subscriber of this event shares one fresh lookup of the window
+        invalidate_hwnd_info(hwnd)
+        try:
+            self._event_service.emit_event(event_type, hwnd, event_type)
+        except Exception:
+            logging.exception("Failed to emit event %s for %s", event_type, hwnd)
 
-    def _build_event_hook(self) -> int:
+    def _install_hook(self, event_min: int, event_max: int) -> int:
         return user32.SetWinEventHook(
-            WinEvent.EventMin.value,
-            WinEvent.EventObjectEnd.value,
+            event_min,
+            event_max,
             0,
             self._win_event_process,
             0,
@@ -44,6 +61,14 @@ class SystemEventListener(QThread):
             WinEvent.WinEventOutOfContext.value,
         )
 
+    def _update_hooks(self) -> bool:
+        return self._hooks.update(self._event_service.subscribed_event_types())
+
+    def _request_hook_update(self):
+        """Hooks belong to the listener thread, so ask it to re-hook instead of doing it here."""
+        if self._thread_id:
+            user32.PostThreadMessageW(self._thread_id, WM_UPDATE_HOOKS, 0, 0)
+
     def _emit_foreground_window_event(self):
         foreground_event = WinEvent.EventSystemForeground
         foreground_window_hwnd = GetForegroundWindow()
@@ -54,23 +79,27 @@ class SystemEventListener(QThread):
     def run(self):
         ole32.CoInitialize(0)
         try:
+            msg = ctypes.wintypes.MSG()
+            # Create the thread message queue before publishing the id, so no update request is lost
+            user32.PeekMessageW(ctypes.byref(msg), 0, 0, 0, 0)
             self._thread_id = GetCurrentThreadId()
-            self._hook = self._build_event_hook()
 
-            if self._hook == 0:
+            if not self._update_hooks():
                 logging.warning("SetWinEventHook failed. Retrying indefinitely...")
-
-            while self._hook == 0:
-                time.sleep(1)
-                self._hook = self._build_event_hook()
+                while not self._update_hooks():
+                    time.sleep(HOOK_RETRY_INTERVAL)
 
             self._emit_foreground_window_event()
 
-            user32.GetMessageW(ctypes.byref(msg), 0, 0, 0)
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                if not msg.hwnd and msg.message == WM_UPDATE_HOOKS:
+                    self._update_hooks()
         finally:
+            self._hooks.clear()
             ole32.CoUninitialize()
 
     def stop(self):
-        user32.UnhookWinEvent(self._hook)
-        # Post WM_QUIT to unblock GetMessageW
-        user32.PostThreadMessageW(self._thread_id, 0x0012, 0, 0)
+        self._event_service.remove_subscription_observer(self._request_hook_update)
+        # Post WM_QUIT to unblock GetMessageW, hooks are removed on the listener thread
+        if self._thread_id:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
@@ -0,0 +1,82 @@
+"""
+Per-monitor bookkeeping of maximized windows.
+
+The set of maximized windows is built once with a full enumeration and then kept current from
+WinEvents: each event only re-probes the window it names, so nothing is enumerated while windows
+come and go. Every update reports the monitors that gained their first or lost their last
+maximized window, which are the only bars whose state can change.
+
+Window queries are injected through ``WindowProbe``, this module has no Win32 dependencies.
+"""
+
+from collections.abc import Iterable
+from typing import Protocol
+
+
+class WindowProbe(Protocol):
+    def windows(self) -> Iterable[int]:
+        """Handles of all top-level windows"""
+        ...
+
+    def maximized_monitor(self, hwnd: int) -> int | None:
+        """Monitor of ``hwnd`` if it is a maximized window that counts, None otherwise"""
+        ...
+
+
+class MaximizedWindowTracker:
+    """Maximized windows grouped by monitor. Not thread-safe."""
+
+    def __init__(self, probe: WindowProbe):
+        self._probe = probe
+        self._monitor_of: dict[int, int] = {}
+        self._by_monitor: dict[int, set[int]] = {}
+
+    def has_maximized(self, monitor: int | None) -> bool:
+        return bool(self._by_monitor.get(monitor))
+
+    def maximized_windows(self, monitor: int) -> frozenset[int]:
+        return frozenset(self._by_monitor.get(monitor, ()))
+
+    def clear(self) -> None:
+        self._monitor_of.clear()
+        self._by_monitor.clear()
+
+    def rescan(self) -> set[int]:
+        """Rebuild from a full enumeration; returns the monitors whose state flipped"""
+        before = {monitor for monitor, hwnds in self._by_monitor.items() if hwnds}
+        self.clear()
+        for hwnd in self._probe.windows():
+            self._place(hwnd, self._probe.maximized_monitor(hwnd))
+        after = {monitor for monitor, hwnds in self._by_monitor.items() if hwnds}
+        return before ^ after
+
+    def update(self, hwnds: Iterable[int]) -> set[int]:
+        """Re-probe windows named by events; returns the monitors whose state flipped"""
+        return self._apply((hwnd, self._probe.maximized_monitor(hwnd)) for hwnd in hwnds)
+
+    def remove(self, hwnds: Iterable[int]) -> set[int]:
+        """Forget destroyed windows without probing them; returns the monitors whose state flipped"""
+        return self._apply((hwnd, None) for hwnd in hwnds if hwnd in self._monitor_of)
+
+    def _apply(self, placements: Iterable[tuple[int, int | None]]) -> set[int]:
+        touched: dict[int, bool] = {}
+        for hwnd, monitor in placements:
+            old = self._monitor_of.get(hwnd)
+            if old == monitor:
+                continue
+            for affected in (old, monitor):
+                if affected is not None and affected not in touched:
+                    touched[affected] = self.has_maximized(affected)
+            self._place(hwnd, monitor)
+        return {monitor for monitor, had in touched.items() if self.has_maximized(monitor) != had}
+
+    def _place(self, hwnd: int, monitor: int | None) -> None:
+        old = self._monitor_of.pop(hwnd, None)
+        if old is not None:
+            hwnds = self._by_monitor[old]
+            hwnds.discard(hwnd)
+            if not hwnds:
+                del self._by_monitor[old]
+        if monitor is not None:
+            self._monitor_of[hwnd] = monitor
+            self._by_monitor.setdefault(monitor, set()).add(hwnd)
@@ -3,7 +3,6 @@ import ctypes.wintypes
 import logging
 import platform
 import winreg
-from contextlib import suppress
 from ctypes import GetLastError, byref, c_ulong, create_unicode_buffer
 
 import win32api
@@ -24,15 +23,14 @@ from core.utils.win32.bindings import (
     QueryFullProcessImageNameW,
     SetForegroundWindow,
 )
-from core.utils.win32.bindings.kernel32 import GetCurrentProcess, IsWow64Process2
+from core.utils.win32.bindings.kernel32 import GetCurrentProcess, IsWow64Process2, WaitForSingleObject
 from core.utils.win32.constants import (
-    ACCESS_DENIED,
     DWMWA_EXTENDED_FRAME_BOUNDS,
-    ERROR_INVALID_HANDLE,
-    ERROR_INVALID_PARAMETER,
     PROCESS_QUERY_LIMITED_INFORMATION,
     SW_MAXIMIZE,
+    WAIT_OBJECT_0,
 )
+from core.utils.win32.window_info import WindowInfoCache
 
 
 def get_windows_host_arch():
@@ -120,48 +118,10 @@ def get_process_info(hwnd: int) -> dict:
     - Returns pid=0 when no valid PID is associated or process is gone.
     - Returns name=None when access is denied or name can't be resolved.
     - Returns path=None when access is denied or path can't be resolved.
-    """
-    try:
-        pid_c = ctypes.c_ulong(0)
-        GetWindowThreadProcessId(hwnd, ctypes.byref(pid_c))
-        pid = int(pid_c.value)
-    except Exception:
-        return {"name": None, "pid": 0, "path": None}
-
-    if pid <= 0:
-        return {"name": None, "pid": 0, "path": None}
-
-    # Try to get the full path first (includes name extraction as bonus)
-    h_process = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
-    if not h_process:
-        # Determine why it failed
-        err = GetLastError()
-        if err in (ERROR_INVALID_PARAMETER, ERROR_INVALID_HANDLE, 0):
-            # Process likely no longer exists
-            return {"name": None, "pid": 0, "path": None}
-        if err == ACCESS_DENIED:
-            # Access denied: process exists but protected
-            return {"name": None, "pid": pid, "path": None}
-        # Unknown: keep pid but no name/path
-        return {"name": None, "pid": pid, "path": None}
-
-    try:
-        # Get full path
-        size = c_ulong(1024)
-        buf = create_unicode_buffer(size.value)
-        path = None
-        if QueryFullProcessImageNameW(h_process, 0, buf, byref(size)):
-            path = buf.value
 
-        # Extract name from path if we got it
-        name = None
-        if path:
-            i = path.rfind("\\")
-            name = path[i + 1 :] if i != -1 else path
-
-        return {"name": name, "pid": pid, "path": path}
-    finally:
-        CloseHandle(h_process)
+    Name and path are memoized per PID until the process exits.
+    """
+    return _window_info_cache.process_info(hwnd)
 
 
 def get_app_name_from_pid(pid: int) -> str | None:
@@ -338,20 +298,60 @@ def is_window_maximized(hwnd: int) -> bool:
     return window_placement[1] == SW_MAXIMIZE
 
 
-def get_hwnd_info(hwnd: int) -> dict:
-    with suppress(Exception):
-        monitor_hwnd = get_monitor_hwnd(hwnd)
-        monitor_info = get_monitor_info(monitor_hwnd)
-
-        return {
-            "hwnd": hwnd,
-            "title": GetWindowText(hwnd),
-            "class_name": GetClassName(hwnd),
-            "process": get_process_info(hwnd),
-            "monitor_hwnd": monitor_hwnd,
-            "monitor_info": monitor_info,
-            "rect": get_window_rect(hwnd),
-        }
+class Win32WindowAdapter:
+    """Win32 calls behind WindowInfoCache."""
+
+    def window_text(self, hwnd: int) -> str:
+        return GetWindowText(hwnd)
+
+    def class_name(self, hwnd: int) -> str:
+        return GetClassName(hwnd)
+
+    def window_pid(self, hwnd: int) -> int:
+        pid_c = ctypes.c_ulong(0)
+        GetWindowThreadProcessId(hwnd, ctypes.byref(pid_c))
+        return int(pid_c.value)
+
+    def open_process(self, pid: int, access: int) -> tuple[int, int]:
+        h_process = OpenProcess(access, False, pid)
+        if not h_process:
+            return 0, GetLastError()
+        return h_process, 0
+
+    def process_image_path(self, handle: int) -> str | None:
+        size = c_ulong(1024)
+        buf = create_unicode_buffer(size.value)
+        if QueryFullProcessImageNameW(handle, 0, buf, byref(size)):
+            return buf.value
+        return None
+
+    def process_exited(self, handle: int) -> bool:
+        return WaitForSingleObject(handle, 0) == WAIT_OBJECT_0
+
+    def close_handle(self, handle: int) -> None:
+        CloseHandle(handle)
+
+    def monitor_hwnd(self, hwnd: int) -> int | None:
+        return get_monitor_hwnd(hwnd)
+
+    def monitor_info(self, monitor_hwnd: int) -> dict:
+        return get_monitor_info(monitor_hwnd)
+
+    def window_rect(self, hwnd: int) -> dict:
+        return get_window_rect(hwnd)
+
+
+_window_info_cache = WindowInfoCache(Win32WindowAdapter())
+
+
+def get_hwnd_info(hwnd: int) -> dict | None:
+    """Window info shared by all callers until the next event for ``hwnd`` invalidates it."""
+    return _window_info_cache.hwnd_info(hwnd)
+
+
+def invalidate_hwnd_info(hwnd: int | None = None) -> None:
+    """Drop cached info for ``hwnd`` (or all windows), called for every hooked WinEvent."""
+    _window_info_cache.invalidate(hwnd)
 
 
 def apply_qmenu_style(qwidget: QWidget):
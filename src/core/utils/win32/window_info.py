@@ -0,0 +1,231 @@
+"""
+Shared window and process info lookups.
+
+A single WinEvent is delivered to every widget that subscribes to it, one per bar. Resolving the
+window (title, class, process, monitor, rect) once and handing the result to all of them avoids
+repeating the same Win32 calls N times. Entries stay valid until the next event for the same
+HWND invalidates them, or for ``max_age`` seconds when no event arrives.
+
+Process name/path is memoized per PID for as long as the process runs: an open handle to the
+process tells us when it exited, which also protects against PID reuse. Handles of processes that
+exited are closed when their PID is looked up again, or by a sweep over the whole memo that runs
+whenever an exit is noticed and at most every ``PROCESS_SWEEP_INTERVAL`` seconds otherwise.
+
+All Win32 access goes through an adapter, so the caching rules can be exercised with a fake one.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from core.utils.win32.constants import (
+    ACCESS_DENIED,
+    ERROR_INVALID_HANDLE,
+    ERROR_INVALID_PARAMETER,
+    PROCESS_QUERY_LIMITED_INFORMATION,
+)
+
+SYNCHRONIZE = 0x00100000
+# Backstop for lookups that are not followed by an invalidating event (e.g. window moves)
+WINDOW_INFO_MAX_AGE = 0.25
+MAX_CACHED_WINDOWS = 64
+MAX_CACHED_PROCESSES = 256
+# How often memoized processes are checked for exit when their PID isn't looked up again
+PROCESS_SWEEP_INTERVAL = 30.0
+
+
+class WindowAdapter(Protocol):
+    def window_text(self, hwnd: int) -> str: ...
+    def class_name(self, hwnd: int) -> str: ...
+    def window_pid(self, hwnd: int) -> int: ...
+    def open_process(self, pid: int, access: int) -> tuple[int, int]: ...
+    def process_image_path(self, handle: int) -> str | None: ...
+    def process_exited(self, handle: int) -> bool: ...
+    def close_handle(self, handle: int) -> None: ...
+    def monitor_hwnd(self, hwnd: int) -> int | None: ...
+    def monitor_info(self, monitor_hwnd: int) -> dict: ...
+    def window_rect(self, hwnd: int) -> dict: ...
+
+
+def _process_name(path: str | None) -> str | None:
+    if not path:
+        return None
+    i = path.rfind("\\")
+    return path[i + 1 :] if i != -1 else path
+
+
+def _copy_info(info: dict) -> dict:
+    """Callers annotate and rewrite the returned dicts, so never hand out the cached ones."""
+    copied = dict(info)
+    if isinstance(copied.get("process"), dict):
+        copied["process"] = dict(copied["process"])
+    return copied
+
+
+class WindowInfoCache:
+    """Event-scoped cache of ``get_hwnd_info`` results plus a per-PID process memo."""
+
+    def __init__(
+        self,
+        adapter: WindowAdapter,
+        max_age: float = WINDOW_INFO_MAX_AGE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._adapter = adapter
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._sequence = itertools.count(1)
+        # hwnd -> (sequence at lookup, timestamp, info)
+        self._windows: OrderedDict[int, tuple[int, float, dict]] = OrderedDict()
+        # hwnd -> sequence of the latest invalidation
+        self._invalidated: dict[int, int] = {}
+        # pid -> (process handle, {name, pid, path})
+        self._processes: OrderedDict[int, tuple[int, dict]] = OrderedDict()
+        self._last_sweep = clock()
+
+    def invalidate(self, hwnd: int | None = None) -> None:
+        """Forget the info for ``hwnd`` (or every window), lookups already in flight won't be stored."""
+        with self._lock:
+            if hwnd is None:
+                self._windows.clear()
+                self._invalidated.clear()
+                return
+            self._windows.pop(hwnd, None)
+            self._invalidated[hwnd] = next(self._sequence)
+            if len(self._invalidated) > MAX_CACHED_WINDOWS * 4:
+                # Anything older than the cached entries can't matter anymore
+                oldest = min((entry[0] for entry in self._windows.values()), default=0)
+                self._invalidated = {h: seq for h, seq in self._invalidated.items() if seq >= oldest}
+
+    def hwnd_info(self, hwnd: int) -> dict | None:
+        """Return ``{hwnd, title, class_name, process, monitor_hwnd, monitor_info, rect}`` or None on failure."""
+        with self._lock:
+            entry = self._windows.get(hwnd)
+            if entry is not None:
+                sequence, stored_at, info = entry
+                if sequence > self._invalidated.get(hwnd, 0) and self._clock() - stored_at < self._max_age:
+                    self._windows.move_to_end(hwnd)
+                    return _copy_info(info)
+                del self._windows[hwnd]
+            sequence = next(self._sequence)
+
+        try:
+            adapter = self._adapter
+            monitor_hwnd = adapter.monitor_hwnd(hwnd)
+            info = {
+                "hwnd": hwnd,
+                "title": adapter.window_text(hwnd),
+                "class_name": adapter.class_name(hwnd),
+                "process": self.process_info(hwnd),
+                "monitor_hwnd": monitor_hwnd,
+                "monitor_info": adapter.monitor_info(monitor_hwnd),
+                "rect": adapter.window_rect(hwnd),
+            }
+        except Exception:
+            return None
+
+        with self._lock:
+            if sequence > self._invalidated.get(hwnd, 0):
+                self._windows[hwnd] = (sequence, self._clock(), info)
+                self._windows.move_to_end(hwnd)
+                while len(self._windows) > MAX_CACHED_WINDOWS:
+                    self._windows.popitem(last=False)
+        return _copy_info(info)
+
+    def process_info(self, hwnd: int) -> dict:
+        """
+        Get process info { name, pid, path } for the process owning ``hwnd``.
+
+        - Returns pid=0 when no valid PID is associated or process is gone.
+        - Returns name=None when access is denied or name can't be resolved.
+        - Returns path=None when access is denied or path can't be resolved.
+        """
+        try:
+            pid = int(self._adapter.window_pid(hwnd))
+        except Exception:
+            return {"name": None, "pid": 0, "path": None}
+        if pid <= 0:
+            return {"name": None, "pid": 0, "path": None}
+        return dict(self._process_for_pid(pid))
+
+    def _process_for_pid(self, pid: int) -> dict:
+        adapter = self._adapter
+        with self._lock:
+            if self._clock() - self._last_sweep >= PROCESS_SWEEP_INTERVAL:
+                self._sweep_exited_processes()
+            cached = self._processes.get(pid)
+            if cached is not None:
+                handle, info = cached
+                if not adapter.process_exited(handle):
+                    self._processes.move_to_end(pid)
+                    return info
+                # Exited, the PID may already belong to a new process. Others may be gone too
+                del self._processes[pid]
+                adapter.close_handle(handle)
+                self._sweep_exited_processes()
+
+        # SYNCHRONIZE lets us wait on the handle to notice the exit
+        handle, _ = adapter.open_process(pid, PROCESS_QUERY_LIMITED_INFORMATION | SYNCHRONIZE)
+        if not handle:
+            return self._uncached_process(pid)
+
+        info = {"name": None, "pid": pid, "path": None}
+        try:
+            path = adapter.process_image_path(handle)
+            info = {"name": _process_name(path), "pid": pid, "path": path}
+        except Exception:
+            pass
+
+        with self._lock:
+            previous = self._processes.pop(pid, None)
+            if previous is not None:
+                adapter.close_handle(previous[0])
+            self._processes[pid] = (handle, info)
+            while len(self._processes) > MAX_CACHED_PROCESSES:
+                _, (old_handle, _) = self._processes.popitem(last=False)
+                adapter.close_handle(old_handle)
+        return info
+
+    def _sweep_exited_processes(self) -> None:
+        """Close the handles of memoized processes that exited, so they aren't kept alive. Needs the lock."""
+        self._last_sweep = self._clock()
+        adapter = self._adapter
+        for pid, (handle, _) in list(self._processes.items()):
+            try:
+                exited = adapter.process_exited(handle)
+            except Exception:
+                exited = True
+            if exited:
+                del self._processes[pid]
+                adapter.close_handle(handle)
+
+    def _uncached_process(self, pid: int) -> dict[str, Any]:
+        """Lookup without a waitable handle, the result can't be memoized safely."""
+        adapter = self._adapter
+        handle, err = adapter.open_process(pid, PROCESS_QUERY_LIMITED_INFORMATION)
+        if not handle:
+            if err in (ERROR_INVALID_PARAMETER, ERROR_INVALID_HANDLE, 0):
+                # Process likely no longer exists
+                return {"name": None, "pid": 0, "path": None}
+            if err == ACCESS_DENIED:
+                # Access denied: process exists but protected
+                return {"name": None, "pid": pid, "path": None}
+            # Unknown: keep pid but no name/path
+            return {"name": None, "pid": pid, "path": None}
+        try:
+            path = adapter.process_image_path(handle)
+            return {"name": _process_name(path), "pid": pid, "path": path}
+        finally:
+            adapter.close_handle(handle)
+
+    def close(self) -> None:
+        with self._lock:
+            for handle, _ in self._processes.values():
+                self._adapter.close_handle(handle)
+            self._processes.clear()
+            self._windows.clear()
+            self._invalidated.clear()
@@ -36,6 +36,7 @@ class PrayerTuneConfig(CustomBaseModel):
 class PrayerTimeConfig(CustomBaseModel):
     label: str = " {next_prayer} in {time_until}"
     label_alt: str = " {next_prayer} in {time_until}"
+    # Unused, timings are fetched a month ahead; kept so existing configs still validate
     update_interval: int = Field(default=3600, ge=60, le=36000000)
     city: str = "Jakarta"
     country: str = "ID"
@@ -69,6 +69,7 @@ class ServerMonitorConfig(CustomBaseModel):
 
     desktop_notifications: DesktopNotificationsConfig = DesktopNotificationsConfig()
     timeout: int = Field(default=5, ge=1, le=30)
+    max_concurrent_checks: int = Field(default=8, ge=1, le=32)
     menu: MenuConfig = MenuConfig()
     icons: IconsConfig = IconsConfig()
     keybindings: list[KeybindingConfig] = []
@@ -1,22 +1,64 @@
 import logging
 import re
 import subprocess
+import time
 from collections.abc import Callable
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel
 from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
-from PyQt6.QtGui import QMouseEvent
+from PyQt6.QtGui import QHideEvent, QMouseEvent, QShowEvent
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QWidget
 
 from core.events.service import EventService
+from core.utils.utilities import refresh_widget_style
 from core.utils.win32.system_function import function_map
 from core.widgets.registry import register_widget_class
 
 
+class LabelPart(NamedTuple):
+    """One label of a widget label template"""
+
+    text: str  # Plain text, or the inner text of a <span>
+    span_class: str | None  # Class of a <span> part ("icon" if it has none), None for plain text
+
+
+@lru_cache(maxsize=512)
+def parse_label_template(content: str) -> tuple[LabelPart, ...]:
+    """Split a label template into the parts that each get their own QLabel"""
+    parts: list[LabelPart] = []
+    for part in re.split("(<span.*?>.*?</span>)", content):
+        part = part.strip()
+        if not part:
+            continue
+        if "<span" in part and "</span>" in part:
+            class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
+            icon = re.sub(r"<span.*?>|</span>", "", part).strip()
+            parts.append(LabelPart(icon, class_name.group(2) if class_name else "icon"))
+        else:
+            parts.append(LabelPart(part, None))
+    return tuple(parts)
+
+
+def replace_options(options: dict[str, Any]) -> Callable[[str], str]:
+    """Formatter for ``render_label`` that replaces each ``{option}`` key with its value"""
+
+    def format_text(text: str) -> str:
+        for option, value in options.items():
+            if option in text:
+                text = text.replace(option, str(value))
+        return text
+
+    return format_text
+
+
 class BaseWidget(QWidget):
     validation_schema: dict[str, Any] | type[BaseModel] | None = None
     event_listener: QThread = None
+    # The polling timer pauses while the bar hides the widget and catches up once it is shown
+    # again, widgets that must keep sampling in the background (e.g. history graphs) opt out
+    pause_timer_when_hidden: bool = True
 
     _hotkey_signal = pyqtSignal(str, str, str)
 
@@ -44,6 +86,10 @@ class BaseWidget(QWidget):
             self._widget_frame.setProperty("class", "widget")
 
         self.timer = QTimer(self)
+        self._timer_paused = False
+        self._last_timer_tick = 0.0
+        # QLabel -> [text, class] it was last rendered with
+        self._label_state: dict[QLabel, list[str | None]] = {}
         self.mouseReleaseEvent = self._handle_mouse_events
         self.contextMenuEvent = lambda event: event.accept()
 
@@ -126,8 +172,32 @@ class BaseWidget(QWidget):
             logging.exception("Failed to execute callback of type '%s' with args: %s", callback_type, callback_args)
 
     def _timer_callback(self):
+        self._last_timer_tick = time.monotonic()
+        if self.timer.isActive() and self.timer.interval() != self.timer_interval:
+            # First tick after resuming with the remainder of an interval
+            self.timer.setInterval(self.timer_interval)
         self._run_callback(self.callback_timer)
 
+    def hideEvent(self, event: QHideEvent):
+        super().hideEvent(event)
+        # Only pause when hidden along with the bar, a widget that hid itself keeps polling to
+        # find out when to show again
+        if self.pause_timer_when_hidden and self.timer.isActive() and not self.isHidden():
+            self.timer.stop()
+            self._timer_paused = True
+
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+        if not self._timer_paused:
+            return
+        self._timer_paused = False
+        elapsed_ms = int((time.monotonic() - self._last_timer_tick) * 1000)
+        if elapsed_ms >= self.timer_interval:
+            self.timer.start(self.timer_interval)
+            self._timer_callback()
+        else:
+            self.timer.start(self.timer_interval - elapsed_ms)
+
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
         if cmd in function_map:
             function_map[cmd]()
@@ -148,27 +218,62 @@ class BaseWidget(QWidget):
         self._widgets: list[QLabel] = []
         self._widgets_alt: list[QLabel] = []
 
+    def set_label(self, label: QLabel, text: str, class_name: str | None = None) -> None:
+        """
+        Set the text (and class) of a label, touching Qt only for values that changed.
+
+        The values are read from Qt once and remembered afterwards, so a label must not be changed
+        by anything else once it is updated through here.
+        """
+        state = self._label_state.get(label)
+        if state is None:
+            state = self._label_state[label] = [label.text(), label.property("class")]
+        if state[0] != text:
+            state[0] = text
+            label.setText(text)
+        if class_name is not None and state[1] != class_name:
+            state[1] = class_name
+            label.setProperty("class", class_name)
+            refresh_widget_style(label)
+
+    def render_label(
+        self,
+        widgets: list[QLabel],
+        content: str,
+        format_text: Callable[[str], str] | None = None,
+        label_class: str | None = None,
+        format_icon: Callable[[str], str] | None = None,
+        icon_class: str | None = None,
+    ) -> None:
+        """
+        Render a label template into the labels built from it by ``build_widget_label``.
+
+        ``format_text``/``format_icon`` turn the text of plain/<span> parts into what is shown, by
+        default it is shown as is. ``label_class`` is the full class of plain parts, ``icon_class``
+        is appended to the class of <span> parts; None leaves the class alone.
+        """
+        for label, part in zip(widgets, parse_label_template(content)):
+            if part.span_class is None:
+                text = format_text(part.text) if format_text else part.text
+                self.set_label(label, text, label_class)
+            else:
+                text = format_icon(part.text) if format_icon else part.text
+                class_name = f"{part.span_class} {icon_class}".rstrip() if icon_class is not None else None
+                self.set_label(label, text, class_name)
+
     def build_widget_label(
         self,
         content: str,
         content_alt: str | None = None,
     ):
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split("(<span.*?>.*?</span>)", content)
-            label_parts = [part for part in label_parts if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 self._widget_container_layout.addWidget(label)
@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QWidget
 
 from core.events.komorebi import KomorebiEvent
 from core.events.service import EventService
-from core.utils.utilities import refresh_widget_style
+from core.utils.utilities import set_widget_class
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utils import get_monitor_hwnd
 from core.utils.win32.window_actions import close_application
@@ -74,18 +74,14 @@ class WindowButton(QFrame):
         for index, button in enumerate(visible_buttons):
             current_class = button.property("class")
             new_class = " ".join([cls for cls in (current_class or "").split() if not cls.startswith("button-")])
-            new_class = f"{new_class} button-{index + 1}"
-            button.setProperty("class", new_class)
-            refresh_widget_style(button)
+            set_widget_class(button, f"{new_class} button-{index + 1}")
 
     def update_and_redraw(self, status: WindowStatus):
         self.status = status
-        self.setProperty("class", f"window {status.lower()}")
-        if status == WINDOW_STATUS_ACTIVE:
-            self.text_label.setText(self.active_label)
-        else:
-            self.text_label.setText(self.default_label)
-        refresh_widget_style(self)
+        text = self.active_label if status == WINDOW_STATUS_ACTIVE else self.default_label
+        if self.text_label.text() != text:
+            self.text_label.setText(text)
+        set_widget_class(self, f"window {status.lower()}")
 
         if self.parent_widget.config.show_icons == "focused":
             if self.status == WINDOW_STATUS_ACTIVE:
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSizePolic
 
 from core.events.komorebi import KomorebiEvent
 from core.events.service import EventService
-from core.utils.utilities import refresh_widget_style
+from core.utils.utilities import set_widget_class
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utils import get_monitor_hwnd, get_process_info
 from core.validation.widgets.komorebi.workspaces import KomorebiWorkspacesConfig
@@ -59,20 +59,19 @@ class WorkspaceButton(QPushButton):
         for index, button in enumerate(visible_buttons):
             current_class = button.property("class")
             new_class = " ".join([cls for cls in current_class.split() if not cls.startswith("button-")])
-            new_class = f"{new_class} button-{index + 1}"
-            button.setProperty("class", new_class)
-            refresh_widget_style(button)
+            set_widget_class(button, f"{new_class} button-{index + 1}")
 
     def update_and_redraw(self, status: WorkspaceStatus):
         self.status = status
-        self.setProperty("class", f"ws-btn {status.lower()}")
         if status == WORKSPACE_STATUS_ACTIVE:
-            self.setText(self.active_label)
+            text = self.active_label
         elif status == WORKSPACE_STATUS_POPULATED:
-            self.setText(self.populated_label)
+            text = self.populated_label
         else:
-            self.setText(self.default_label)
-        refresh_widget_style(self)
+            text = self.default_label
+        if self.text() != text:
+            self.setText(text)
+        set_widget_class(self, f"ws-btn {status.lower()}")
 
     def activate_workspace(self):
         try:
@@ -128,20 +127,19 @@ class WorkspaceButtonWithIcons(QFrame):
         for index, button in enumerate(visible_buttons):
             current_class = button.property("class")
             new_class = " ".join([cls for cls in current_class.split() if not cls.startswith("button-")])
-            new_class = f"{new_class} button-{index + 1}"
-            button.setProperty("class", new_class)
-            refresh_widget_style(button)
+            set_widget_class(button, f"{new_class} button-{index + 1}")
 
     def update_and_redraw(self, status: WorkspaceStatus):
         self.status = status
-        self.setProperty("class", f"ws-btn {status.lower()}")
         if status == WORKSPACE_STATUS_ACTIVE:
-            self.text_label.setText(self.active_label)
+            text = self.active_label
         elif status == WORKSPACE_STATUS_POPULATED:
-            self.text_label.setText(self.populated_label)
+            text = self.populated_label
         else:
-            self.text_label.setText(self.default_label)
-        refresh_widget_style(self)
+            text = self.default_label
+        if self.text_label.text() != text:
+            self.text_label.setText(text)
+        set_widget_class(self, f"ws-btn {status.lower()}")
 
     def update_icons(self, icons: dict[int, QPixmap] = None):
         if icons:
@@ -448,18 +446,16 @@ class WorkspaceWidget(BaseWidget):
             if workspace and "layer" in workspace:
                 # Set base class plus layer-specific class
                 layer_type = workspace["layer"].lower()  # Either "tiling" or "floating"
-                self.workspace_layer_label.setProperty("class", f"workspace-layer {layer_type}")
+                set_widget_class(self.workspace_layer_label, f"workspace-layer {layer_type}")
 
                 # Set appropriate label text
                 if workspace["layer"] == "Tiling":
                     self.workspace_layer_label.setText(self.config.toggle_workspace_layer.tiling_label)
                 elif workspace["layer"] == "Floating":
                     self.workspace_layer_label.setText(self.config.toggle_workspace_layer.floating_label)
-                refresh_widget_style(self.workspace_layer_label)
             else:
-                self.workspace_layer_label.setProperty("class", "workspace-layer")
+                set_widget_class(self.workspace_layer_label, "workspace-layer")
                 self.workspace_layer_label.setText("")
-                refresh_widget_style(self.workspace_layer_label)
 
     def _update_button(self, workspace_btn: WorkspaceButton) -> None:
         self._refresh_button_labels(workspace_btn)
@@ -0,0 +1,167 @@
+"""
+This is very experimental and may not work as expected. It uses ctypes to interact with the Windows Bluetooth API. We need to test this on more systems to ensure it works as expected.
+"""
+
+import ctypes
+import os
+from ctypes import wintypes
+
+from core.utils.win32.bindings.kernel32 import CloseHandle
+from core.widgets.services.bluetooth.bluetooth_state import BluetoothDevice
+
+
+def get_bluetooth_api():
+    """Get Bluetooth API with fallbacks since the DLL may not be in the same location on all systems."""
+    possible_paths = [
+        "BluetoothAPIs.dll",
+        os.path.join(os.environ["SystemRoot"], "System32", "BluetoothAPIs.dll"),
+        os.path.join(os.environ["SystemRoot"], "SysWOW64", "BluetoothAPIs.dll"),  # For 32-bit Python on 64-bit Windows
+    ]
+
+    for path in possible_paths:
+        try:
+            return ctypes.WinDLL(path)
+        except OSError as e:
+            last_error = e
+            continue
+
+    raise RuntimeError(f"Failed to load BluetoothAPIs.dll. Error: {last_error}")
+
+
+# Define SYSTEMTIME structure
+class SYSTEMTIME(ctypes.Structure):
+    _fields_ = [
+        ("wYear", wintypes.WORD),
+        ("wMonth", wintypes.WORD),
+        ("wDayOfWeek", wintypes.WORD),
+        ("wDay", wintypes.WORD),
+        ("wHour", wintypes.WORD),
+        ("wMinute", wintypes.WORD),
+        ("wSecond", wintypes.WORD),
+        ("wMilliseconds", wintypes.WORD),
+    ]
+
+
+# Define BLUETOOTH_DEVICE_INFO structure
+class BLUETOOTH_DEVICE_INFO(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("Address", ctypes.c_ulonglong),
+        ("ulClassofDevice", wintypes.ULONG),
+        ("fConnected", wintypes.BOOL),
+        ("fRemembered", wintypes.BOOL),
+        ("fAuthenticated", wintypes.BOOL),
+        ("stLastSeen", SYSTEMTIME),
+        ("stLastUsed", SYSTEMTIME),
+        ("szName", ctypes.c_wchar * 248),
+    ]
+
+
+# Define BLUETOOTH_DEVICE_SEARCH_PARAMS structure
+class BLUETOOTH_DEVICE_SEARCH_PARAMS(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("fReturnAuthenticated", wintypes.BOOL),
+        ("fReturnRemembered", wintypes.BOOL),
+        ("fReturnUnknown", wintypes.BOOL),
+        ("fReturnConnected", wintypes.BOOL),
+        ("fIssueInquiry", wintypes.BOOL),
+        ("cTimeoutMultiplier", ctypes.c_ubyte),
+        ("hRadio", wintypes.HANDLE),
+    ]
+
+
+# Define BLUETOOTH_FIND_RADIO_PARAMS structure
+class BLUETOOTH_FIND_RADIO_PARAMS(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+    ]
+
+
+def _format_address(address: int) -> str:
+    return ":".join("%02X" % ((address >> (8 * i)) & 0xFF) for i in range(5, -1, -1))
+
+
+class Win32BluetoothRadio:
+    """RadioBackend on top of BluetoothAPIs.dll, raises RuntimeError if the DLL is unavailable"""
+
+    def __init__(self):
+        api = get_bluetooth_api()
+        # Bind the prototypes once, they are shared by every enumeration
+        api.BluetoothFindFirstRadio.argtypes = [
+            ctypes.POINTER(BLUETOOTH_FIND_RADIO_PARAMS),
+            ctypes.POINTER(wintypes.HANDLE),
+        ]
+        api.BluetoothFindFirstRadio.restype = wintypes.HANDLE
+        api.BluetoothFindNextRadio.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.HANDLE)]
+        api.BluetoothFindNextRadio.restype = wintypes.BOOL
+        api.BluetoothFindRadioClose.argtypes = [wintypes.HANDLE]
+        api.BluetoothFindRadioClose.restype = wintypes.BOOL
+        api.BluetoothFindFirstDevice.argtypes = [
+            ctypes.POINTER(BLUETOOTH_DEVICE_SEARCH_PARAMS),
+            ctypes.POINTER(BLUETOOTH_DEVICE_INFO),
+        ]
+        api.BluetoothFindFirstDevice.restype = wintypes.HANDLE
+        api.BluetoothFindNextDevice.argtypes = [wintypes.HANDLE, ctypes.POINTER(BLUETOOTH_DEVICE_INFO)]
+        api.BluetoothFindNextDevice.restype = wintypes.BOOL
+        api.BluetoothFindDeviceClose.argtypes = [wintypes.HANDLE]
+        api.BluetoothFindDeviceClose.restype = wintypes.BOOL
+        self._api = api
+
+    def devices(self) -> list[BluetoothDevice] | None:
+        """Remembered and connected devices of all radios, None if there is no enabled radio"""
+        api = self._api
+        find_radio_params = BLUETOOTH_FIND_RADIO_PARAMS(dwSize=ctypes.sizeof(BLUETOOTH_FIND_RADIO_PARAMS))
+        radio_handle = wintypes.HANDLE()
+        radio_finder = api.BluetoothFindFirstRadio(ctypes.byref(find_radio_params), ctypes.byref(radio_handle))
+        if not radio_finder:
+            return None
+
+        devices: list[BluetoothDevice] = []
+        try:
+            while True:
+                try:
+                    devices.extend(self._radio_devices(radio_handle))
+                finally:
+                    CloseHandle(radio_handle)
+                # Move to the next radio (if any)
+                if not api.BluetoothFindNextRadio(radio_finder, ctypes.byref(radio_handle)):
+                    break
+        finally:
+            api.BluetoothFindRadioClose(radio_finder)
+        return devices
+
+    def _radio_devices(self, radio_handle: wintypes.HANDLE) -> list[BluetoothDevice]:
+        api = self._api
+        device_search_params = BLUETOOTH_DEVICE_SEARCH_PARAMS(
+            dwSize=ctypes.sizeof(BLUETOOTH_DEVICE_SEARCH_PARAMS),
+            fReturnAuthenticated=True,
+            fReturnRemembered=True,
+            fReturnUnknown=False,
+            fReturnConnected=True,
+            fIssueInquiry=False,
+            cTimeoutMultiplier=1,
+            hRadio=radio_handle,
+        )
+        device_info = BLUETOOTH_DEVICE_INFO()
+        device_info.dwSize = ctypes.sizeof(BLUETOOTH_DEVICE_INFO)
+        device_finder = api.BluetoothFindFirstDevice(ctypes.byref(device_search_params), ctypes.byref(device_info))
+        if not device_finder:
+            return []
+
+        devices: list[BluetoothDevice] = []
+        try:
+            while True:
+                devices.append(
+                    BluetoothDevice(
+                        address=_format_address(device_info.Address),
+                        name=device_info.szName,
+                        connected=bool(device_info.fConnected),
+                        authenticated=bool(device_info.fAuthenticated),
+                    )
+                )
+                if not api.BluetoothFindNextDevice(device_finder, ctypes.byref(device_info)):
+                    break
+        finally:
+            api.BluetoothFindDeviceClose(device_finder)
+        return devices
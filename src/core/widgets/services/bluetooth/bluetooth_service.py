@@ -0,0 +1,98 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from core.widgets.services.bluetooth.bluetooth_api import Win32BluetoothRadio
+from core.widgets.services.bluetooth.bluetooth_state import BluetoothState, BluetoothStateHub, RadioBackend
+
+POLL_INTERVAL = 3.0
+
+
+class BluetoothService(QObject):
+    """
+    Process-wide Bluetooth state shared by all Bluetooth widgets.
+
+    A single thread polls the radio while anyone is subscribed and idles otherwise, subscribers are
+    called on the GUI thread and only when the state changed.
+    """
+
+    _instance: BluetoothService | None = None
+    _state_polled = pyqtSignal(object)
+
+    @classmethod
+    def get_instance(cls) -> BluetoothService:
+        if cls._instance is None:
+            try:
+                backend = Win32BluetoothRadio()
+            except (RuntimeError, AttributeError) as e:
+                logging.debug("Bluetooth support unavailable: %s", e)
+                backend = None
+            cls._instance = cls(backend)
+        return cls._instance
+
+    def __init__(self, backend: RadioBackend | None, poll_interval: float = POLL_INTERVAL):
+        super().__init__()
+        self._hub = BluetoothStateHub(backend)
+        self._poll_interval = poll_interval
+        # Set while anyone is subscribed, the thread idles on it otherwise
+        self._active = threading.Event()
+        # Cuts the wait between two polls short
+        self._wake = threading.Event()
+        self._quit = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._state_polled.connect(self._publish)
+        app_inst = QApplication.instance()
+        if app_inst is not None:
+            app_inst.aboutToQuit.connect(self._shutdown)
+
+    def subscribe(self, callback: Callable[[BluetoothState], None]) -> None:
+        """Call ``callback(state: BluetoothState)`` on every change, starting with the current state"""
+        self._hub.subscribe(callback)
+        if self._quit.is_set():
+            return
+        self._active.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def unsubscribe(self, callback: Callable[[BluetoothState], None]) -> None:
+        self._hub.unsubscribe(callback)
+        if not self._hub.has_subscribers:
+            self._stop()
+
+    def _publish(self, state: BluetoothState) -> None:
+        self._hub.publish(state)
+        # Deleted widgets are dropped while publishing
+        if not self._hub.has_subscribers:
+            self._stop()
+
+    def _stop(self) -> None:
+        self._active.clear()
+        self._wake.set()
+
+    def _shutdown(self) -> None:
+        self._quit.set()
+        # Unblock the thread wherever it waits
+        self._active.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        threading.current_thread().name = "BluetoothService"
+        while not self._quit.is_set():
+            if not self._active.is_set():
+                # The next subscriber must get the full state, not a diff against what nobody saw
+                self._hub.reset()
+                self._active.wait()
+                continue
+            try:
+                state = self._hub.poll()
+                # Always published, so the published state never falls behind the polled one
+                if state is not None:
+                    self._state_polled.emit(state)
+            except Exception as e:
+                logging.error("Bluetooth poll failed: %s", e)
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
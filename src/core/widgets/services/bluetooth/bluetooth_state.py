@@ -0,0 +1,132 @@
+"""
+Bluetooth radio state, diffing and fan-out to subscribers.
+
+The radio is enumerated once per poll for the whole process, however many bars show a Bluetooth
+widget. A poll whose result equals the previous one is dropped before it leaves the polling
+thread, subscribers are only called with states that actually differ.
+
+The radio is accessed through ``RadioBackend``, this module has no Win32 dependencies.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class BluetoothDevice:
+    address: str
+    name: str
+    connected: bool = False
+    authenticated: bool = False
+
+
+@dataclass(frozen=True)
+class DeviceChanges:
+    added: tuple[BluetoothDevice, ...] = ()
+    removed: tuple[BluetoothDevice, ...] = ()
+    changed: tuple[BluetoothDevice, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass(frozen=True)
+class BluetoothState:
+    enabled: bool = False
+    devices: tuple[BluetoothDevice, ...] = ()
+    # What changed compared to the previously published state, not part of equality
+    changes: DeviceChanges = field(default=DeviceChanges(), compare=False)
+
+    @property
+    def connected_devices(self) -> list[str]:
+        """Names of the devices that are both connected and paired"""
+        return [device.name for device in self.devices if device.connected and device.authenticated]
+
+
+DISABLED_STATE = BluetoothState()
+
+
+class RadioBackend(Protocol):
+    def devices(self) -> list[BluetoothDevice] | None:
+        """Remembered and connected devices of all radios, None if there is no enabled radio"""
+        ...
+
+
+def diff_devices(old: tuple[BluetoothDevice, ...], new: tuple[BluetoothDevice, ...]) -> DeviceChanges:
+    """Devices added, removed and changed (same address, different fields) between two device lists"""
+    old_by_address = {device.address: device for device in old}
+    new_by_address = {device.address: device for device in new}
+    return DeviceChanges(
+        added=tuple(device for address, device in new_by_address.items() if address not in old_by_address),
+        removed=tuple(device for address, device in old_by_address.items() if address not in new_by_address),
+        changed=tuple(
+            device
+            for address, device in new_by_address.items()
+            if address in old_by_address and old_by_address[address] != device
+        ),
+    )
+
+
+class BluetoothStateHub:
+    """
+    Polls the radio, diffs the result and hands changed states to subscribers.
+
+    ``poll`` belongs to the polling thread. ``subscribe``, ``unsubscribe`` and ``publish`` belong
+    to the thread the subscribers live in.
+    """
+
+    def __init__(self, backend: RadioBackend | None):
+        self._backend = backend
+        self._polled: BluetoothState | None = None
+        self._published: BluetoothState | None = None
+        self._subscribers: list[Callable[[BluetoothState], None]] = []
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, callback: Callable[[BluetoothState], None]) -> None:
+        """Add a subscriber, it is called right away if a state is already known"""
+        if callback in self._subscribers:
+            return
+        self._subscribers.append(callback)
+        if self._published is not None:
+            self._deliver(callback, self._published)
+
+    def unsubscribe(self, callback: Callable[[BluetoothState], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def poll(self) -> BluetoothState | None:
+        """Read the radio once; returns the new state, or None if nothing changed"""
+        devices = self._backend.devices() if self._backend is not None else None
+        state = DISABLED_STATE if devices is None else BluetoothState(enabled=True, devices=tuple(devices))
+
+        previous = self._polled
+        if previous is not None and state == previous:
+            return None
+        changes = diff_devices(previous.devices if previous else (), state.devices)
+        state = BluetoothState(state.enabled, state.devices, changes)
+        self._polled = state
+        return state
+
+    def reset(self) -> None:
+        """Forget the last polled state, so the next ``poll`` reports the full state again"""
+        self._polled = None
+
+    def publish(self, state: BluetoothState) -> None:
+        """Call every subscriber with a state returned by ``poll``"""
+        self._published = state
+        for callback in self._subscribers[:]:
+            self._deliver(callback, state)
+
+    def _deliver(self, callback: Callable[[BluetoothState], None], state: BluetoothState) -> None:
+        try:
+            callback(state)
+        except RuntimeError:
+            # The subscribing widget was deleted
+            self.unsubscribe(callback)
+        except Exception:
+            logging.exception("Bluetooth subscriber failed")
@@ -0,0 +1,223 @@
+"""
+Per-monitor I/O lanes for brightness and contrast.
+
+DDC/CI runs over each display's own I2C bus, a slow or unresponsive display can take hundreds of
+milliseconds per read with retries. Every monitor therefore gets its own lane: a thread that owns
+all VCP traffic for that monitor, so one display's slow bus never holds back slider feedback or
+polling of the others.
+
+A lane sleeps on a condition variable until a queued write becomes due or its next poll is due.
+Writes are latest-wins per VCP code and debounced, dragging a slider costs one write once the
+slider settles. A poll result for a code with a write still queued is dropped, the read would
+report the value the write is about to replace.
+
+Device access is injected as ``read``/``write`` callables, this module has no Win32 dependencies.
+``FakeVcpBackend`` stands in for real displays when benchmarking.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+# read(hmonitor, code) -> percentage or None, write(hmonitor, code, percentage) -> success
+VcpRead = Callable[[int, int], int | None]
+VcpWrite = Callable[[int, int, int], bool]
+# on_read(hmonitor, code, percentage_or_none), called on the lane thread
+VcpReadCallback = Callable[[int, int, int | None], None]
+
+POLL_INTERVAL = 5.0
+SET_DEBOUNCE = 0.05
+
+
+class MonitorLane:
+    """Serializes VCP I/O for one monitor on a dedicated thread."""
+
+    def __init__(
+        self,
+        hmonitor: int,
+        read: VcpRead,
+        write: VcpWrite,
+        on_read: VcpReadCallback,
+        poll_codes: tuple[int, ...],
+        poll_interval: float = POLL_INTERVAL,
+        debounce: float = SET_DEBOUNCE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.hmonitor = hmonitor
+        self._read = read
+        self._write = write
+        self._on_read = on_read
+        self._poll_codes = poll_codes
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._clock = clock
+        self._condition = threading.Condition()
+        # code -> (value, due)
+        self._pending: dict[int, tuple[int, float]] = {}
+        self._next_poll = 0.0
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name=f"BrightnessLane-{self.hmonitor}")
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def set(self, code: int, value: int) -> None:
+        """Queue a write, replacing any queued value for the same code"""
+        with self._condition:
+            self._pending[code] = (value, self._clock() + self._debounce)
+            self._condition.notify()
+
+    def request_poll(self) -> None:
+        """Poll as soon as the lane is free instead of waiting for the interval"""
+        with self._condition:
+            self._next_poll = 0.0
+            self._condition.notify()
+
+    def _next_work(self) -> tuple[dict[int, int], bool] | None:
+        """Block until writes or a poll are due; returns them, or None once stopped"""
+        with self._condition:
+            while not self._stopped:
+                now = self._clock()
+                writes = {code: value for code, (value, due) in self._pending.items() if due <= now}
+                for code in writes:
+                    del self._pending[code]
+                poll = self._next_poll <= now
+                if poll:
+                    self._next_poll = now + self._poll_interval
+                if writes or poll:
+                    return writes, poll
+                deadline = min([self._next_poll, *(due for _, due in self._pending.values())])
+                self._condition.wait(deadline - now)
+            return None
+
+    def _run(self) -> None:
+        while (work := self._next_work()) is not None:
+            writes, poll = work
+            for code, value in writes.items():
+                try:
+                    if not self._write(self.hmonitor, code, value):
+                        logging.debug("Brightness lane %s: write of VCP 0x%02X failed", self.hmonitor, code)
+                except Exception as e:
+                    logging.error("Brightness lane %s: write failed: %s", self.hmonitor, e)
+            if poll:
+                self._poll()
+
+    def _poll(self) -> None:
+        for code in self._poll_codes:
+            with self._condition:
+                if self._stopped:
+                    return
+                if code in self._pending:
+                    continue
+            try:
+                value = self._read(self.hmonitor, code)
+            except Exception as e:
+                logging.error("Brightness lane %s: read failed: %s", self.hmonitor, e)
+                continue
+            with self._condition:
+                if code in self._pending:
+                    continue
+            self._on_read(self.hmonitor, code, value)
+
+
+class MonitorLanes:
+    """
+    One ``MonitorLane`` per monitor.
+
+    Writes queued before ``start`` are kept for the monitors that ``start`` is given, writes for
+    monitors without a lane after that are ignored.
+    """
+
+    def __init__(
+        self,
+        read: VcpRead,
+        write: VcpWrite,
+        on_read: VcpReadCallback,
+        poll_codes: tuple[int, ...],
+        poll_interval: float = POLL_INTERVAL,
+        debounce: float = SET_DEBOUNCE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._lane_args = (read, write, on_read, poll_codes, poll_interval, debounce, clock)
+        self._lock = threading.Lock()
+        self._lanes: dict[int, MonitorLane] = {}
+        self._started = False
+        self._stopped = False
+
+    def start(self, hmonitors: Iterable[int]) -> None:
+        """Start a lane for each monitor, each polls once right away"""
+        with self._lock:
+            if self._stopped:
+                return
+            lanes = {
+                hmonitor: self._lanes.get(hmonitor) or MonitorLane(hmonitor, *self._lane_args) for hmonitor in hmonitors
+            }
+            self._lanes = lanes
+            self._started = True
+        for lane in lanes.values():
+            lane.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            lanes = list(self._lanes.values())
+            self._lanes = {}
+            self._stopped = True
+        for lane in lanes:
+            lane.stop()
+
+    def set(self, hmonitor: int, code: int, value: int) -> None:
+        with self._lock:
+            lane = self._lanes.get(hmonitor)
+            if lane is None:
+                if self._started or self._stopped:
+                    return
+                lane = self._lanes[hmonitor] = MonitorLane(hmonitor, *self._lane_args)
+        lane.set(code, value)
+
+    def request_poll(self) -> None:
+        with self._lock:
+            lanes = list(self._lanes.values())
+        for lane in lanes:
+            lane.request_poll()
+
+
+class FakeVcpBackend:
+    """
+    In-memory VCP device with per-call latency, for benchmarking lanes without DDC/CI displays.
+
+    ``latency`` is seconds per read or write, either for all monitors or per hmonitor.
+    """
+
+    def __init__(self, latency: float | dict[int, float] = 0.0, default: int = 50):
+        self._latency = latency
+        self._default = default
+        self._lock = threading.Lock()
+        self._values: dict[tuple[int, int], int] = {}
+        self.reads = 0
+        self.writes = 0
+
+    def _delay(self, hmonitor: int) -> None:
+        latency = self._latency.get(hmonitor, 0.0) if isinstance(self._latency, dict) else self._latency
+        if latency > 0:
+            time.sleep(latency)
+
+    def read(self, hmonitor: int, code: int) -> int | None:
+        self._delay(hmonitor)
+        with self._lock:
+            self.reads += 1
+            return self._values.get((hmonitor, code), self._default)
+
+    def write(self, hmonitor: int, code: int, value: int) -> bool:
+        self._delay(hmonitor)
+        with self._lock:
+            self.writes += 1
+            self._values[(hmonitor, code)] = value
+        return True
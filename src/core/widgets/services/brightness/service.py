@@ -24,6 +24,7 @@ from core.utils.win32.constants import (
 from core.utils.win32.structs import DISPLAY_BRIGHTNESS
 from core.utils.win32.utils import get_monitor_info
 from core.widgets.services.brightness.display_targets import get_active_display_targets
+from core.widgets.services.brightness.monitor_lanes import MonitorLanes
 
 
 class _MonitorInfo:
@@ -77,15 +78,20 @@ class BrightnessService(QObject):
         self._lcd_tested = False
         self._lcd_available = False
         self._lcd_owner: int | None = None
+        self._lcd_lock = threading.Lock()
         self._running = False
         self._thread: threading.Thread | None = None
         self._lock = threading.Lock()
-        self._pending_set: dict[int, tuple[int, float]] = {}
-        self._pending_contrast_set: dict[int, tuple[int, float]] = {}
 
-        # Configuration
-        self._poll_interval = 5.0  # seconds between polls
-        self._set_debounce = 0.05  # seconds to wait before applying set
+        # Each monitor's DDC/CI traffic runs on its own lane so a slow bus only delays that monitor
+        self._lanes = MonitorLanes(
+            read=self._read_value,
+            write=self._write_value,
+            on_read=self._on_value_read,
+            poll_codes=(VCP_BRIGHTNESS, VCP_CONTRAST),
+            poll_interval=5.0,  # seconds between polls
+            debounce=0.05,  # seconds to wait before applying set
+        )
 
     @classmethod
     def instance(cls) -> BrightnessService:
@@ -116,8 +122,8 @@ class BrightnessService(QObject):
         """Queue a brightness change."""
         value = max(0, min(100, value))
         should_emit = False
+        self._lanes.set(hmonitor, VCP_BRIGHTNESS, value)
         with self._lock:
-            self._pending_set[hmonitor] = (value, time.monotonic())
             # Update cache immediately for responsive UI
             if hmonitor in self._monitors:
                 monitor = self._monitors[hmonitor]
@@ -137,8 +143,8 @@ class BrightnessService(QObject):
     def set_contrast(self, hmonitor: int, value: int) -> None:
         """Queue a contrast change."""
         value = max(0, min(100, value))
+        self._lanes.set(hmonitor, VCP_CONTRAST, value)
         with self._lock:
-            self._pending_contrast_set[hmonitor] = (value, time.monotonic())
             if hmonitor in self._monitors:
                 self._monitors[hmonitor].contrast = value
 
@@ -164,7 +170,7 @@ class BrightnessService(QObject):
 
     # Internal methods
     def _start(self) -> None:
-        """Start the background polling thread."""
+        """Start the background thread that discovers monitors and starts their lanes."""
         if self._running:
             return
         self._running = True
@@ -181,107 +187,66 @@ class BrightnessService(QObject):
     def _stop(self) -> None:
         """Stop the background thread and cleanup resources."""
         self._running = False
+        self._lanes.stop()
         if self._lcd_handle:
             kernel32.CloseHandle(self._lcd_handle)
             self._lcd_handle = None
 
     def _run(self) -> None:
-        """Background thread main loop."""
+        """Discover monitors, then hand each one to its own I/O lane."""
         self._enumerate_monitors()
         logging.debug("BrightnessService started with %d monitors", len(self._monitors))
-
-        # Initial poll
-        self._poll_all_monitors()
-        last_poll = time.monotonic()
-
-        while self._running:
-            now = time.monotonic()
-
-            # Process pending brightness changes
-            self._process_pending_sets(now)
-
-            # Periodic polling
-            if now - last_poll >= self._poll_interval:
-                last_poll = now
-                self._poll_all_monitors()
-
-            time.sleep(0.05)
-
-    def _process_pending_sets(self, now: float) -> None:
-        """Process debounced set operations."""
+        if not self._running:
+            return
         with self._lock:
-            pending_b = list(self._pending_set.items())
-            pending_c = list(self._pending_contrast_set.items())
+            hmonitors = list(self._monitors)
+        self._lanes.start(hmonitors)
 
-        for hmonitor, (value, timestamp) in pending_b:
-            if now - timestamp < self._set_debounce:
-                continue
-            with self._lock:
-                current = self._pending_set.get(hmonitor)
-                if current is None or current[1] != timestamp:
-                    continue
-                del self._pending_set[hmonitor]
-            self._apply_brightness(hmonitor, value)
-
-        for hmonitor, (value, timestamp) in pending_c:
-            if now - timestamp < self._set_debounce:
-                continue
-            with self._lock:
-                current = self._pending_contrast_set.get(hmonitor)
-                if current is None or current[1] != timestamp:
-                    continue
-                del self._pending_contrast_set[hmonitor]
-            self._vcp_write(hmonitor, VCP_CONTRAST, value)
-
-    def _poll_all_monitors(self) -> None:
-        """Poll brightness for supported monitors only and emit changes."""
+    def _read_value(self, hmonitor: int, code: int) -> int | None:
+        """Lane read: brightness via DDC or LCD, contrast via DDC only."""
+        if code == VCP_BRIGHTNESS:
+            return self._read_brightness(hmonitor)
         with self._lock:
-            # Only poll monitors that support brightness (DDC or LCD)
-            # Skip monitors that have been tested and don't support either
-            hmonitors = [
-                hmon
-                for hmon, info in self._monitors.items()
-                if not info.tested or info.supports_ddc or info.supports_lcd
-            ]
+            monitor = self._monitors.get(hmonitor)
+            if not monitor or not monitor.supports_ddc:
+                return None
+        return self._vcp_read(hmonitor, code)
 
-        for hmonitor in hmonitors:
-            brightness = self._read_brightness(hmonitor)
+    def _write_value(self, hmonitor: int, code: int, value: int) -> bool:
+        """Lane write: brightness via DDC or LCD, contrast via DDC only."""
+        if code == VCP_BRIGHTNESS:
+            return self._apply_brightness(hmonitor, value)
+        return self._vcp_write(hmonitor, code, value)
 
+    def _on_value_read(self, hmonitor: int, code: int, value: int | None) -> None:
+        """Update the cache from a lane poll and emit changes."""
+        if code == VCP_BRIGHTNESS:
             with self._lock:
                 monitor = self._monitors.get(hmonitor)
                 if not monitor:
-                    continue
-                # Skip cache update if a user-initiated "set" event is pending or just applied;
-                # physical reads can lag and would overwrite the newer in‑memory value.
-                if hmonitor in self._pending_set:
-                    continue
+                    return
                 old_brightness = monitor.brightness
                 was_reported = monitor.reported
-                monitor.brightness = brightness
+                monitor.brightness = value
                 monitor.reported = True
 
             # Emit on first report or change
-            if not was_reported or old_brightness != brightness:
-                self.brightness_changed.emit(hmonitor, brightness)
-
-            # Poll contrast for DDC monitors
-            with self._lock:
-                monitor = self._monitors.get(hmonitor)
-                if not monitor or not monitor.supports_ddc or hmonitor in self._pending_contrast_set:
-                    continue
-                already_tested = monitor.contrast_tested
-
-            contrast = self._vcp_read(hmonitor, VCP_CONTRAST)
+            if not was_reported or old_brightness != value:
+                self.brightness_changed.emit(hmonitor, value)
+            return
 
-            with self._lock:
-                monitor = self._monitors.get(hmonitor)
-                if monitor:
-                    if not already_tested:
-                        monitor.contrast_tested = True
-                        monitor.supports_contrast = contrast is not None
-                    if monitor.supports_contrast and monitor.contrast != contrast:
-                        monitor.contrast = contrast
-                        self.contrast_changed.emit(hmonitor, contrast)
+        with self._lock:
+            monitor = self._monitors.get(hmonitor)
+            if not monitor or not monitor.supports_ddc:
+                return
+            if not monitor.contrast_tested:
+                monitor.contrast_tested = True
+                monitor.supports_contrast = value is not None
+            changed = monitor.supports_contrast and monitor.contrast != value
+            if changed:
+                monitor.contrast = value
+        if changed:
+            self.contrast_changed.emit(hmonitor, value)
 
     def _enumerate_monitors(self) -> None:
         """Enumerate all system monitors."""
@@ -527,6 +492,10 @@ class BrightnessService(QObject):
         The LCD device is global (laptop panel) so only one monitor may own it.
         First non-DDC monitor to ask wins; subsequent calls return False.
         """
+        with self._lcd_lock:
+            return self._claim_lcd(hmonitor)
+
+    def _claim_lcd(self, hmonitor: int) -> bool:
         if self._lcd_owner is not None:
             return self._lcd_owner == hmonitor
 
@@ -15,6 +15,8 @@ from datetime import UTC, datetime
 from threading import Lock, Thread
 from typing import Any
 
+from core.widgets.services.copilot import usage_cache
+
 API_BASE_URL = "https://api.github.com"
 # I have set version of GitHub API to a fixed date to avoid unexpected changes
 API_VERSION = "2022-11-28"
@@ -62,6 +64,8 @@ class CopilotDataManager:
     _update_thread: Thread | None = None
     _chart_enabled: bool = True
     _daily_cache: dict[str, int] = {}  # Cache for daily data (date_str -> requests)
+    _daily_cache_key: tuple[str, str] | None = None  # (username, "YYYY-MM") the cache belongs to
+    _daily_final: set[str] = set()  # Cached days that were fetched after they ended and are on disk
 
     @classmethod
     def get_instance(cls) -> CopilotDataManager:
@@ -246,26 +250,29 @@ class CopilotDataManager:
         year = time_period.get("year", now.year)
         month = time_period.get("month", now.month)
         current_day = now.day
+        is_current_month = (year, month) == (now.year, now.month)
 
         # If API returned a different month than requested, use the full month
-        if (year, month) != (now.year, now.month):
+        if not is_current_month:
             current_day = calendar.monthrange(year, month)[1]
 
         days_in_month = calendar.monthrange(year, month)[1]
 
-        # Clear cache if month changed
+        # Load completed days from disk when the user or month changed (or on first fetch)
         cache_month_key = f"{year}-{month:02d}"
-        if cls._daily_cache and not any(k.startswith(cache_month_key) for k in cls._daily_cache):
-            cls._daily_cache.clear()
+        if cls._daily_cache_key != (cls._username, cache_month_key):
+            cls._daily_cache = usage_cache.load_days(cls._username, cache_month_key)
+            cls._daily_cache_key = (cls._username, cache_month_key)
+            cls._daily_final = set(cls._daily_cache)
 
-        # Determine which days need fetching
+        # Determine which days need fetching, a day cached while it was still today is fetched once more
         days_to_fetch = []
         for day in range(1, current_day + 1):
             date_str = f"{year}-{month:02d}-{day:02d}"
-            if day == current_day or date_str not in cls._daily_cache:
+            if (is_current_month and day == current_day) or date_str not in cls._daily_final:
                 days_to_fetch.append(day)
 
-        def fetch_day(day: int) -> tuple[str, int]:
+        def fetch_day(day: int) -> tuple[str, int | None]:
             date_str = f"{year}-{month:02d}-{day:02d}"
             url = f"{API_BASE_URL}/users/{cls._username}/settings/billing/premium_request/usage?year={year}&month={month}&day={day}"
             data, status_code, _ = self._make_request(url, timeout=10)
@@ -276,15 +283,25 @@ class CopilotDataManager:
                     if "copilot" in item.get("product", "").lower()
                 )
                 return date_str, total
-            return date_str, 0
+            return date_str, None
 
         # Fetch only needed days in parallel
         if days_to_fetch:
+            completed: dict[str, int] = {}
             with ThreadPoolExecutor(max_workers=5) as executor:
                 futures = {executor.submit(fetch_day, day): day for day in days_to_fetch}
                 for future in as_completed(futures):
                     date_str, requests = future.result()
+                    if requests is None:
+                        # Failed, leave it out of the cache so the next update retries it
+                        continue
                     cls._daily_cache[date_str] = requests
+                    if not is_current_month or futures[future] != current_day:
+                        completed[date_str] = requests
+            # Past days are final, persist them so a restart does not fetch them again
+            if completed:
+                usage_cache.save_days(cls._username, cache_month_key, completed)
+                cls._daily_final.update(completed)
 
         # Build result for ALL days in the detected month
         result = [
@@ -0,0 +1,67 @@
+"""Disk cache for Copilot per-day usage.
+
+Billing data for a completed day no longer changes, so its request count is stored in
+``copilot_usage.json`` inside the YASB app data directory, keyed by user and month. After a
+restart only the current day has to be fetched again to redraw the month chart.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from core.utils.system import app_data_path
+
+_CACHE_FILE = "copilot_usage.json"
+_CACHE_VERSION = 1
+# Months kept per user, the chart only shows one but the API may still report the previous one
+_MONTHS_KEPT = 2
+
+
+def _get_file_path() -> Path:
+    return app_data_path(_CACHE_FILE)
+
+
+def _read_file(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        logging.warning("Failed to read %s: %s", path, e)
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data
+
+
+def _write_file(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error("Failed to write %s: %s", path, e)
+
+
+def load_days(username: str, month_key: str, path: Path | None = None) -> dict[str, int]:
+    """Cached request counts of completed days (``YYYY-MM-DD`` -> requests) for ``YYYY-MM``."""
+    data = _read_file(path or _get_file_path())
+    days = data.get("users", {}).get(username, {}).get(month_key, {})
+    return {date: int(requests) for date, requests in days.items() if isinstance(requests, int)}
+
+
+def save_days(username: str, month_key: str, days: dict[str, int], path: Path | None = None) -> None:
+    """Store request counts of completed days, merging with what is already cached."""
+    path = path or _get_file_path()
+    data = _read_file(path)
+    users = data.setdefault("users", {})
+    months = users.setdefault(username, {})
+    months[month_key] = {**months.get(month_key, {}), **days}
+    for old_key in sorted(months)[:-_MONTHS_KEPT]:
+        del months[old_key]
+    data["version"] = _CACHE_VERSION
+    _write_file(path, data)
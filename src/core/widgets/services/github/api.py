@@ -2,13 +2,14 @@ import json
 import logging
 import threading
 import urllib.error
-import urllib.request
 from collections.abc import Callable
 from datetime import UTC
 from typing import Any
 
 from PyQt6.QtCore import QTimer
 
+from core.utils.http_client import HttpClient
+
 
 class GitHubDataManager:
     """
@@ -189,10 +190,8 @@ class GitHubDataManager:
         """Sync single notification as read with GitHub API."""
         headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
         url = f"https://api.github.com/notifications/threads/{notification_id}"
-        req = urllib.request.Request(url, headers=headers, method="PATCH")
         try:
-            with urllib.request.urlopen(req):
-                pass
+            HttpClient.get_instance().request("PATCH", url, headers=headers)
         except urllib.error.HTTPError as e:
             logging.error("GitHubDataManager HTTP error marking notification as read: %s - %s", e.code, e.reason)
         except urllib.error.URLError:
@@ -235,9 +234,8 @@ class GitHubDataManager:
                 last_read_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
                 data = json.dumps({"last_read_at": last_read_at}).encode("utf-8")
                 url = "https://api.github.com/notifications"
-                req = urllib.request.Request(url, headers=headers, data=data, method="PUT")
-                with urllib.request.urlopen(req):
-                    logging.info("GitHubDataManager marked all notifications as read on GitHub")
+                HttpClient.get_instance().request("PUT", url, headers=headers, data=data)
+                logging.info("GitHubDataManager marked all notifications as read on GitHub")
             except urllib.error.HTTPError as e:
                 logging.error("GitHubDataManager HTTP error marking all as read: %s - %s", e.code, e.reason)
             except urllib.error.URLError:
@@ -319,18 +317,18 @@ class GitHubDataManager:
 
         all_notifications: list[dict] = []
         while next_url and len(all_notifications) < max_notification:
-            req = urllib.request.Request(next_url, headers=headers)
-            with urllib.request.urlopen(req) as response:
-                page = json.loads(response.read().decode())
-                all_notifications.extend(page)
-
-                # Check for next page via Link header
-                link_header = response.getheader("Link")
-                if link_header:
-                    links = cls._parse_link_header(link_header)
-                    next_url = links.get("next")
-                else:
-                    next_url = None
+            # ttl=0 always revalidates, unchanged pages come back as 304 which GitHub doesn't count against rate limits
+            response = HttpClient.get_instance().get(next_url, headers=headers, ttl=0)
+            page = response.json()
+            all_notifications.extend(page)
+
+            # Check for next page via Link header
+            link_header = response.getheader("Link")
+            if link_header:
+                links = cls._parse_link_header(link_header)
+                next_url = links.get("next")
+            else:
+                next_url = None
 
         # Trim to requested maximum
         all_notifications = all_notifications[:max_notification]
@@ -444,11 +442,11 @@ class GitHubDataManager:
             "Content-Type": "application/json",
         }
 
-        request = urllib.request.Request("https://api.github.com/graphql", data=payload, headers=headers, method="POST")
-
         try:
-            with urllib.request.urlopen(request) as response:
-                data = json.loads(response.read().decode())
+            response = HttpClient.get_instance().request(
+                "POST", "https://api.github.com/graphql", headers=headers, data=payload
+            )
+            data = response.json()
 
             if data.get("errors"):
                 logging.warning("GitHubDataManager GraphQL errors: %s", data["errors"])
@@ -1,4 +1,3 @@
-import json
 import logging
 import threading
 import uuid
@@ -10,11 +9,45 @@ from PyQt6.QtCore import QThread
 
 from core.events.komorebi import KomorebiEvent
 from core.events.service import EventService
+from core.utils.win32.bindings import CancelSynchronousIo, CloseHandle, GetCurrentThreadId, OpenThread
+from core.utils.win32.constants import THREAD_TERMINATE
 from core.widgets.services.komorebi.client import KomorebiClient
+from core.widgets.services.komorebi.notifications import parse_burst, read_bursts
 
 KOMOREBI_PIPE_BUFF_SIZE = 64 * 1024 * 8
 KOMOREBI_PIPE_NAME = "yasb"
 
+ERROR_BROKEN_PIPE = 109
+ERROR_MORE_DATA = 234
+ERROR_OPERATION_ABORTED = 995
+
+
+class _PipeTransport:
+    """Blocking reads from the server end of the komorebi named pipe."""
+
+    def __init__(self, pipe, buffer_size: int):
+        self._pipe = pipe
+        self._buffer_size = buffer_size
+
+    def read(self) -> bytes:
+        try:
+            result, data = win32file.ReadFile(self._pipe, self._buffer_size, None)
+        except pywintypes.error as e:
+            if e.winerror == ERROR_BROKEN_PIPE:
+                logging.warning("Pipe has been ended: %s", e)
+                return b""
+            if e.winerror == ERROR_OPERATION_ABORTED:
+                return b""
+            raise
+        # The pipe is in message mode, a read that is not ERROR_MORE_DATA ends a message
+        if result != ERROR_MORE_DATA and not data.endswith(b"\n"):
+            data += b"\n"
+        return data
+
+    def pending(self) -> bool:
+        _, bytes_available, _ = win32pipe.PeekNamedPipe(self._pipe, 0)
+        return bytes_available > 0
+
 
 class KomorebiEventListener(QThread):
     def __init__(self, pipe_name: str = KOMOREBI_PIPE_NAME, buffer_size: int = KOMOREBI_PIPE_BUFF_SIZE):
@@ -25,6 +58,9 @@ class KomorebiEventListener(QThread):
         self.buffer_size = buffer_size
         self.event_service = EventService()
         self.pipe = None
+        # Id of the listener thread while run() is executing, guarded by _thread_lock
+        self._thread_id: int | None = None
+        self._thread_lock = threading.Lock()
 
     def __str__(self):
         return "Komorebi Event Listener"
@@ -62,58 +98,60 @@ class KomorebiEventListener(QThread):
             self.pipe = None
 
     def run(self):
-        while self._app_running:
-            should_reconnect = True
-            try:
-                self._create_pipe()
-                self._wait_until_komorebi_online()
-
-                while self._app_running:
-                    try:
-                        buffer, bytes_to_read, result = win32pipe.PeekNamedPipe(self.pipe, 1)
-                        if not bytes_to_read:
-                            if self._stop_event.wait(0.05):
-                                break
-                            continue
-
-                        result, data = win32file.ReadFile(self.pipe, bytes_to_read, None)
-
-                        if not data.strip():
-                            continue
-
-                        try:
-                            event_message = json.loads(data.decode("utf-8"))
-                            event = event_message["event"]
-                            state = event_message["state"]
-
-                            if event and state:
-                                self._emit_event(event, state)
-                        except KeyError, ValueError:
-                            logging.exception("Failed to parse komorebi state. Received data: %s", data)
-                    except pywintypes.error as e:
-                        if e.winerror == 109:  # ERROR_BROKEN_PIPE
-                            logging.warning("Pipe has been ended: %s", e)
-                            break
-                        else:
-                            logging.exception("Unexpected error occurred: %s", e)
-            except BaseException, Exception:
-                logging.exception("Komorebi has disconnected from the named pipe %s", self.pipe_name)
-            finally:
-                self._close_pipe()
-                self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
-                if not self._app_running:
-                    should_reconnect = False
-                elif should_reconnect:
-                    logging.info("Attempting to reconnect to Komorebi...")
-                    if self._stop_event.wait(3):
+        with self._thread_lock:
+            self._thread_id = GetCurrentThreadId()
+        try:
+            while self._app_running:
+                should_reconnect = True
+                try:
+                    self._create_pipe()
+                    self._wait_until_komorebi_online()
+                    if self._app_running and self.pipe is not None:
+                        self._listen(_PipeTransport(self.pipe, self.buffer_size))
+                except BaseException, Exception:
+                    if self._app_running:
+                        logging.exception("Komorebi has disconnected from the named pipe %s", self.pipe_name)
+                finally:
+                    self._close_pipe()
+                    self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
+                    if not self._app_running:
                         should_reconnect = False
-            if not should_reconnect:
-                break
+                    elif should_reconnect:
+                        logging.info("Attempting to reconnect to Komorebi...")
+                        if self._stop_event.wait(3):
+                            should_reconnect = False
+                if not should_reconnect:
+                    break
+        finally:
+            # The id may be reused by another thread once this one exits
+            with self._thread_lock:
+                self._thread_id = None
+
+    def _listen(self, transport: _PipeTransport) -> None:
+        # Every notification carries the whole state, only the newest one of a burst is parsed
+        for lines in read_bursts(transport):
+            if not self._app_running:
+                return
+            events, state = parse_burst(lines)
+            for event in events:
+                self._emit_event(event, state)
 
     def stop(self):
         self._stop_event.set()
+        self._cancel_blocking_io()
         self._close_pipe()
 
+    def _cancel_blocking_io(self) -> None:
+        """Wake the listener thread from a blocking ConnectNamedPipe or ReadFile"""
+        # Held so run() cannot return and give up its thread id while it is being cancelled
+        with self._thread_lock:
+            if self._thread_id is None:
+                return
+            handle = OpenThread(THREAD_TERMINATE, False, self._thread_id)
+            if handle:
+                CancelSynchronousIo(handle)
+                CloseHandle(handle)
+
     def _emit_event(self, event: dict, state: dict) -> None:
         if isinstance(event, str):
             return
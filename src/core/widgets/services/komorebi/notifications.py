@@ -0,0 +1,126 @@
+"""
+Framing and coalescing of komorebi notifications.
+
+komorebi writes one JSON notification per line, each holds the event that happened and the
+complete window manager state after it. ``NotificationFramer`` splits the byte stream on
+newlines whatever the chunk boundaries are. ``read_bursts`` blocks on the transport until data
+arrives and then drains everything that is already waiting, so a burst of notifications (e.g.
+while komorebi retiles a workspace) is handled as one batch. ``parse_burst`` decodes the event
+of every notification, which is small, but the state of the newest one only: the states before
+it are already outdated.
+
+The transport is injected through ``NotificationTransport``, this module has no Win32
+dependencies. ``SocketTransport`` replays notifications over a local socket for benchmarking.
+"""
+
+import json
+import logging
+import re
+import select
+import socket
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+# serde writes the fields of a notification in declaration order, the event comes first
+_EVENT_KEY = re.compile(r'\s*\{\s*"event"\s*:\s*')
+_decoder = json.JSONDecoder()
+
+
+class NotificationTransport(Protocol):
+    def read(self) -> bytes:
+        """Block until data arrives, b"" once the other end is gone"""
+        ...
+
+    def pending(self) -> bool:
+        """Whether ``read`` would return without blocking"""
+        ...
+
+
+class NotificationFramer:
+    """Splits a byte stream into newline-terminated notifications."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    @property
+    def buffered(self) -> int:
+        """Bytes of a notification that is not complete yet"""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Append a chunk, returns the non-empty notifications it completed"""
+        end = data.rfind(b"\n")
+        if end < 0:
+            self._buffer += data
+            return []
+        self._buffer += data[:end]
+        complete = bytes(self._buffer)
+        self._buffer = bytearray(data[end + 1 :])
+        return [line for line in complete.split(b"\n") if line.strip()]
+
+
+def read_bursts(transport: NotificationTransport) -> Iterator[list[bytes]]:
+    """Yield the notifications that arrived together, until the transport is closed"""
+    framer = NotificationFramer()
+    closed = False
+    while not closed:
+        data = transport.read()
+        if not data:
+            return
+        lines = framer.feed(data)
+        while transport.pending():
+            data = transport.read()
+            if not data:
+                closed = True
+                break
+            lines += framer.feed(data)
+        if lines:
+            yield lines
+
+
+def _read_event(line: bytes) -> Any:
+    try:
+        text = line.decode("utf-8")
+        match = _EVENT_KEY.match(text)
+        if match is not None:
+            return _decoder.raw_decode(text, match.end())[0]
+        return json.loads(text)["event"]
+    except KeyError, TypeError, ValueError:
+        logging.warning("Failed to parse komorebi event. Received data: %.200s", line)
+        return None
+
+
+def parse_burst(lines: list[bytes]) -> tuple[list[Any], dict | None]:
+    """Events of all notifications in a burst, oldest first, and the state of the newest one"""
+    for index in range(len(lines) - 1, -1, -1):
+        try:
+            message = json.loads(lines[index])
+            state = message["state"]
+        except KeyError, TypeError, ValueError:
+            logging.exception("Failed to parse komorebi state. Received data: %.200s", lines[index])
+            continue
+        if not state:
+            continue
+        events = [event for line in lines[:index] if (event := _read_event(line))]
+        if message.get("event"):
+            events.append(message["event"])
+        return events, state
+    return [], None
+
+
+class SocketTransport:
+    """``NotificationTransport`` over a connected stream socket."""
+
+    def __init__(self, sock: socket.socket, chunk_size: int = 64 * 1024):
+        self._sock = sock
+        self._chunk_size = chunk_size
+
+    def read(self) -> bytes:
+        try:
+            return self._sock.recv(self._chunk_size)
+        except OSError:
+            return b""
+
+    def pending(self) -> bool:
+        readable, _, _ = select.select([self._sock], [], [], 0)
+        return bool(readable)
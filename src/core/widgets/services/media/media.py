@@ -18,6 +18,7 @@ from winrt.windows.media.control import GlobalSystemMediaTransportControlsSessio
 from winrt.windows.storage.streams import Buffer, InputStreamOptions, IRandomAccessStreamReference
 
 from core.utils.singleton import QSingleton
+from core.widgets.services.media.thumbnail import artwork_hash
 
 pil_logger = logging.getLogger("PIL")
 pil_logger.setLevel(logging.INFO)
@@ -46,6 +47,7 @@ class SessionState:
         self.is_current = False
         self.timeline_enabled = False
         self.thumbnail: Image.Image | None = None
+        self.thumbnail_key: str | None = None
         self.cleanup_callbacks: list[Callable[..., None]] = []
         self.session: MediaSession | None = None
         self.playback_info: MediaPlaybackInfo | None = None
@@ -195,9 +197,9 @@ class WindowsMedia(QObject, metaclass=QSingleton):
             state.title = new_title
             state.artist = props.artist
             if tn := props.thumbnail:
-                state.thumbnail = await self._get_thumbnail_async(tn)
+                state.thumbnail, state.thumbnail_key = await self._get_thumbnail_async(tn)
             else:
-                state.thumbnail = None
+                state.thumbnail, state.thumbnail_key = None, None
             self.media_properties_changed.emit()
         except Exception as e:
             logger.error("Error syncing session: %s", e, exc_info=True)
@@ -271,8 +273,10 @@ class WindowsMedia(QObject, metaclass=QSingleton):
         return wrapper
 
     @staticmethod
-    async def _get_thumbnail_async(thumbnail_stream_reference: IRandomAccessStreamReference) -> Image.Image | None:
-        """Read the thumbnail for the IRandomAccessStreamReference and return it as PIL ImageFile"""
+    async def _get_thumbnail_async(
+        thumbnail_stream_reference: IRandomAccessStreamReference,
+    ) -> tuple[Image.Image | None, str | None]:
+        """Read the thumbnail for the IRandomAccessStreamReference and return it as PIL ImageFile with its hash"""
         # Read the stream into the buffer
         readable_stream = await thumbnail_stream_reference.open_read_async()
         try:
@@ -286,13 +290,14 @@ class WindowsMedia(QObject, metaclass=QSingleton):
                 InputStreamOptions.READ_AHEAD,
             )
 
-            # Convert bytearray to pillow image
-            pillow_image = Image.open(io.BytesIO(thumb_read_buffer))
+            # Convert bytearray to pillow image, decoding is deferred to the thumbnail worker
+            data = bytes(thumb_read_buffer)
+            pillow_image = Image.open(io.BytesIO(data))
 
-            return pillow_image
+            return pillow_image, artwork_hash(data)
         except Exception as e:
             logging.error("get_thumbnail(): Error occurred when loading the thumbnail: %s", e)
-            return None
+            return None, None
         finally:
             # Close the stream
             readable_stream.close()
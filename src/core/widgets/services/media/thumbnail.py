@@ -0,0 +1,230 @@
+"""
+Album-art thumbnail rendering for the media widget.
+
+Rendering (resizing, masking, fading) runs on a single background thread so the GUI thread
+never blocks on PIL. Masks and fade gradients are cached per (size, radius, alpha, ...)
+and finished thumbnails are memoized by artwork hash, so switching back to a track or
+showing the same artwork on several bars only renders it once.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image
+from PIL.ImageDraw import ImageDraw
+from PIL.ImageQt import ImageQt
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from core.utils.singleton import QSingleton
+
+logger = logging.getLogger("MediaWidget")
+
+# Finished thumbnails kept in memory (bar and popup variants for a handful of tracks)
+MAX_CACHED_THUMBNAILS = 32
+# Let PIL box-reduce large artwork before the LANCZOS pass, visually identical but much faster
+REDUCING_GAP = 3.0
+EDGE_FADE_RATIO = 0.3
+
+
+def artwork_hash(data: bytes) -> str:
+    """Stable key for the encoded artwork bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class BarThumbnailStyle:
+    """Bar thumbnail options taken from the widget config."""
+
+    alpha: int
+    edge_fade: bool
+    corner_radius: int
+    corners: tuple[bool, bool, bool, bool]
+
+
+@lru_cache(maxsize=16)
+def _corner_mask(size: tuple[int, int], radius: int, fill: int, corners: tuple[bool, bool, bool, bool]) -> Image.Image:
+    """Anti-aliased rounded corner alpha mask, drawn at 2x and scaled down."""
+    scale_factor = 2
+    hr_size = (size[0] * scale_factor, size[1] * scale_factor)
+    corner_mask = Image.new("L", hr_size, color=0)
+    ImageDraw(corner_mask).rounded_rectangle(
+        (0, 0, hr_size[0] - 1, hr_size[1] - 1),
+        radius * scale_factor,
+        fill,
+        None,
+        0,
+        corners=corners,
+    )
+    return corner_mask.resize(size, Image.LANCZOS)
+
+
+@lru_cache(maxsize=16)
+def _edge_fade_mask(size: tuple[int, int], alpha: int) -> Image.Image:
+    """Alpha mask fading out the left and right edges, built from a single gradient row."""
+    width, height = size
+    fade_width = int(width * EDGE_FADE_RATIO)
+    row = bytearray([alpha]) * width
+    for x in range(fade_width):
+        row[x] = min(alpha, int(255 * (x / fade_width)))
+        row[width - fade_width + x] = min(alpha, int(255 * ((fade_width - x) / fade_width)))
+    return Image.frombytes("L", (width, 1), bytes(row)).resize((width, height), Image.NEAREST)
+
+
+@lru_cache(maxsize=8)
+def _popup_mask(size: int, radius: int) -> Image.Image:
+    """Rounded square mask for the popup thumbnail, drawn at 4x for smooth corners."""
+    scale = 4
+    hr_size = size * scale
+    mask = Image.new("L", (hr_size, hr_size), color=0)
+    ImageDraw(mask).rounded_rectangle(((0, 0), (hr_size, hr_size)), radius=radius * scale, fill=255)
+    return mask.resize((size, size), Image.LANCZOS)
+
+
+def render_bar_thumbnail(image: Image.Image, width: int, height: int, style: BarThumbnailStyle) -> Image.Image:
+    """Scale artwork to the label width, crop it to the bar height and apply the alpha mask."""
+    width = max(1, width)
+    new_height = max(1, int(width / (image.width / image.height)))
+    thumbnail = image.resize((width, new_height), Image.LANCZOS, reducing_gap=REDUCING_GAP)
+
+    # Crop vertically to fit widget height
+    height = max(1, height)
+    if thumbnail.height > height:
+        y1 = (thumbnail.height - height) // 2
+        thumbnail = thumbnail.crop((0, y1, thumbnail.width, y1 + height))
+
+    if thumbnail.mode != "RGBA":
+        thumbnail = thumbnail.convert("RGBA")
+
+    if style.edge_fade:
+        # If edge fade is enabled, use it without corner radius
+        alpha = _edge_fade_mask(thumbnail.size, style.alpha)
+    elif style.corner_radius > 0:
+        try:
+            alpha = _corner_mask(thumbnail.size, style.corner_radius, style.alpha, style.corners)
+        except Exception as e:
+            logger.error("Error creating corner mask, return default thumb: %s", e)
+            alpha = Image.new("L", thumbnail.size, color=style.alpha)
+    else:
+        alpha = Image.new("L", thumbnail.size, color=style.alpha)
+
+    thumbnail.putalpha(alpha)
+    return thumbnail
+
+
+def render_popup_thumbnail(image: Image.Image, size: int, corner_radius: int) -> Image.Image:
+    """Scale artwork to cover a square, crop it and round the corners."""
+    aspect = image.width / image.height
+    if aspect > 1:
+        new_width, new_height = int(size * aspect), size
+    else:
+        new_width, new_height = size, int(size / aspect)
+    resized = image.resize((max(1, new_width), max(1, new_height)), Image.LANCZOS, reducing_gap=REDUCING_GAP)
+
+    if resized.width >= size and resized.height >= size:
+        left = (resized.width - size) // 2
+        top = (resized.height - size) // 2
+        square_img = resized.crop((left, top, left + size, top + size))
+    else:
+        square_img = resized.resize((size, size), Image.LANCZOS)
+
+    if square_img.mode != "RGBA":
+        square_img = square_img.convert("RGBA")
+    square_img.putalpha(_popup_mask(size, corner_radius))
+    return square_img
+
+
+@lru_cache(maxsize=4)
+def render_empty_thumbnail(size: int, corner_radius: int) -> QImage:
+    """Default popup thumbnail with an eighth note icon."""
+    large_size = size * 2  # Draw at higher resolution for better quality
+    large_img = Image.new("RGBA", (large_size, large_size), (0, 0, 0, 255))
+    draw = ImageDraw(large_img)
+    note_color = (255, 255, 255, 255)
+
+    center_x = large_size // 2
+    center_y = large_size // 2
+    head_radius = int(large_size * 0.14)
+    head_x = center_x - int(large_size * 0.1)
+    head_y = center_y + int(large_size * 0.12)
+    stem_width = int(large_size * 0.05)
+    stem_height = int(large_size * 0.4)
+    flag_width = int(large_size * 0.15)
+    flag_height = int(large_size * 0.3)
+
+    # Note stem, attached to the right side of the note head
+    stem_x = head_x + head_radius - stem_width
+    stem_top_y = head_y - stem_height
+    draw.rectangle(((stem_x, stem_top_y), (stem_x + stem_width, head_y)), fill=note_color)
+    # Note head
+    draw.ellipse(
+        [(head_x - head_radius, head_y - head_radius), (head_x + head_radius, head_y + head_radius)],
+        fill=note_color,
+    )
+    # Flag
+    draw.rectangle(
+        ((stem_x + stem_width - 1, stem_top_y), (stem_x + stem_width + flag_width, stem_top_y + flag_height // 3)),
+        fill=note_color,
+    )
+
+    img = large_img.resize((size, size), Image.LANCZOS)
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw(mask).rounded_rectangle(((0, 0), (size, size)), corner_radius, fill=150)
+    img.putalpha(mask)
+    return ImageQt(img).copy()
+
+
+class ThumbnailRenderer(QObject, metaclass=QSingleton):
+    """Renders thumbnails on a worker thread and memoizes the results."""
+
+    thumbnail_ready = pyqtSignal(tuple, QImage)
+
+    def __init__(self):
+        super().__init__()
+        # A single worker: PIL images are lazily decoded and not safe to load from several threads at once
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MediaThumbnail")
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple, QImage] = OrderedDict()
+        self._pending: set[tuple] = set()
+
+    def request(self, key: tuple, render: Callable[..., Image.Image], *args) -> QImage | None:
+        """
+        Return the memoized thumbnail for ``key``, or schedule ``render(*args)`` and return None.
+
+        ``thumbnail_ready(key, image)`` is emitted once a scheduled render finishes.
+        """
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+            if key in self._pending:
+                return None
+            self._pending.add(key)
+        self._executor.submit(self._render, key, render, args)
+        return None
+
+    def _render(self, key: tuple, render: Callable[..., Image.Image], args: tuple) -> None:
+        try:
+            # Deep copy so the QImage owns its pixels independently of the PIL buffer
+            image = ImageQt(render(*args)).copy()
+        except Exception as e:
+            logger.error("Error rendering thumbnail: %s", e)
+            with self._lock:
+                self._pending.discard(key)
+            return
+        with self._lock:
+            self._pending.discard(key)
+            self._cache[key] = image
+            while len(self._cache) > MAX_CACHED_THUMBNAILS:
+                self._cache.popitem(last=False)
+        try:
+            self.thumbnail_ready.emit(key, image)
+        except RuntimeError:
+            pass
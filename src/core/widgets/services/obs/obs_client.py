@@ -7,12 +7,15 @@ import hashlib
 import json
 import os
 import socket
-import struct
 import threading
 import uuid
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from core.widgets.services.obs.ws_frames import OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, FrameParser, encode_frame
+
+RECV_CHUNK_SIZE = 65536
+
 
 class ObsWebSocketClient:
     """WebSocket client for OBS."""
@@ -32,6 +35,8 @@ class ObsWebSocketClient:
         self._identified = False
         self._running = False
         self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._parser = FrameParser()
         self._pending: dict[str, threading.Event] = {}
         self._responses: dict[str, dict] = {}
         self._recv_thread: threading.Thread | None = None
@@ -49,6 +54,7 @@ class ObsWebSocketClient:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.settimeout(2.0)
             self._socket.connect((self.host, self.port))
+            self._parser = FrameParser()
 
             if not self._ws_handshake():
                 self._cleanup()
@@ -176,111 +182,57 @@ class ObsWebSocketClient:
                 return False
             response += chunk
 
-        return b"101" in response and b"Upgrade" in response
+        # OBS may send Hello in the same segment as the handshake response
+        headers, _, rest = response.partition(b"\r\n\r\n")
+        self._parser.feed(rest)
+        return b"101" in headers and b"Upgrade" in headers
 
     def _ws_send(self, data: str):
-        payload = data.encode()
-        length = len(payload)
-        header = bytearray([0x81])
-
-        if length < 126:
-            header.append(0x80 | length)
-        elif length < 65536:
-            header.append(0x80 | 126)
-            header.extend(struct.pack(">H", length))
-        else:
-            header.append(0x80 | 127)
-            header.extend(struct.pack(">Q", length))
-
-        mask = os.urandom(4)
-        header.extend(mask)
-
-        masked = bytearray(payload)
-        for i in range(length):
-            masked[i] ^= mask[i % 4]
+        self._ws_send_frame(OP_TEXT, data.encode())
 
-        self._socket.sendall(bytes(header) + bytes(masked))
-
-    def _ws_recv(self) -> tuple[int, bytes] | None:
-        try:
-            header = self._recv_exact(2)
-            if not header:
-                return None
-
-            opcode = header[0] & 0x0F
-            masked = (header[1] & 0x80) != 0
-            length = header[1] & 0x7F
-
-            if length == 126:
-                ext = self._recv_exact(2)
-                if not ext:
-                    return None
-                length = struct.unpack(">H", ext)[0]
-            elif length == 127:
-                ext = self._recv_exact(8)
-                if not ext:
-                    return None
-                length = struct.unpack(">Q", ext)[0]
-
-            mask = self._recv_exact(4) if masked else None
-            payload = self._recv_exact(length)
-            if payload is None:
-                return None
-
-            if mask:
-                payload = bytearray(payload)
-                for i in range(len(payload)):
-                    payload[i] ^= mask[i % 4]
-                payload = bytes(payload)
-
-            return (opcode, payload)
-        except Exception:
-            return None
-
-    def _recv_exact(self, n: int) -> bytes | None:
-        data = b""
-        while len(data) < n:
-            try:
-                chunk = self._socket.recv(n - len(data))
-                if not chunk:
-                    return None
-                data += chunk
-            except Exception:
-                return None
-        return data
+    def _ws_send_frame(self, opcode: int, payload: bytes):
+        frame = encode_frame(opcode, payload, os.urandom(4))
+        # Requests go out from caller threads while the receive thread answers pings
+        with self._send_lock:
+            self._socket.sendall(frame)
 
     def _receive_loop(self):
+        self._socket.settimeout(0.5)
+        # Frames that arrived along with the handshake response
+        if not self._dispatch_frames():
+            self._cleanup()
+            return
         while self._running and self._socket:
             try:
-                self._socket.settimeout(0.5)
-                result = self._ws_recv()
-                if result is None:
-                    continue
-
-                opcode, payload = result
-                if opcode == 0x1:  # Text
-                    self._handle_message(payload.decode())
-                elif opcode == 0x9:  # Ping
-                    self._ws_send_pong(payload)
-                elif opcode == 0x8:  # Close
-                    break
+                # A timeout mid-frame keeps the partial frame buffered in the parser
+                chunk = self._socket.recv(RECV_CHUNK_SIZE)
             except TimeoutError:
                 continue
             except Exception:
                 break
+            if not chunk:
+                break
+            self._parser.feed(chunk)
+            if not self._dispatch_frames():
+                break
 
         self._cleanup()
 
+    def _dispatch_frames(self) -> bool:
+        """Handle every complete message in the buffer; returns False once the server closed"""
+        for opcode, payload in self._parser:
+            if opcode == OP_TEXT:
+                # A malformed frame must not escape and kill the receive loop
+                self._handle_message(payload.decode("utf-8", errors="replace"))
+            elif opcode == OP_PING:
+                self._ws_send_pong(payload)
+            elif opcode == OP_CLOSE:
+                return False
+        return True
+
     def _ws_send_pong(self, payload: bytes):
-        length = len(payload)
-        header = bytearray([0x8A, 0x80 | length])
-        mask = os.urandom(4)
-        header.extend(mask)
-        masked = bytearray(payload)
-        for i in range(length):
-            masked[i] ^= mask[i % 4]
         try:
-            self._socket.sendall(bytes(header) + bytes(masked))
+            self._ws_send_frame(OP_PONG, payload)
         except Exception:
             pass
 
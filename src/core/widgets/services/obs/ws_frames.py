@@ -0,0 +1,119 @@
+"""
+WebSocket (RFC 6455) framing for the OBS client.
+
+``FrameParser`` keeps everything received in one buffer and parses frames out of it as they
+complete, so a socket timeout in the middle of a frame loses nothing: the partial frame stays in
+the buffer until the rest arrives. Masking XORs the whole payload as one big integer instead of
+byte by byte, which keeps large responses (e.g. scene lists) cheap.
+"""
+
+import struct
+from collections.abc import Iterator
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def mask_payload(payload: bytes, mask: bytes) -> bytes:
+    """Apply a 4-byte WebSocket mask (masking and unmasking are the same operation)"""
+    length = len(payload)
+    if not length:
+        return b""
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(length, "little")
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bytes | None = None) -> bytes:
+    """Build a single final frame, masked when ``mask`` is given (required for client frames)"""
+    length = len(payload)
+    mask_bit = 0x80 if mask is not None else 0
+    header = bytearray([0x80 | opcode])
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 65536:
+        header.append(mask_bit | 126)
+        header.extend(struct.pack(">H", length))
+    else:
+        header.append(mask_bit | 127)
+        header.extend(struct.pack(">Q", length))
+    if mask is None:
+        return bytes(header) + payload
+    header.extend(mask)
+    return bytes(header) + mask_payload(payload, mask)
+
+
+class FrameParser:
+    """Incremental frame parser; ``feed`` received bytes, then iterate complete messages."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._fragments: list[bytes] = []
+        self._fragment_opcode: int | None = None
+
+    @property
+    def buffered(self) -> int:
+        """Bytes received but not yet part of a complete frame"""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+
+    def __iter__(self) -> Iterator[tuple[int, bytes]]:
+        """Yield ``(opcode, payload)`` for every complete message, fragmented messages are joined"""
+        while (frame := self._next_frame()) is not None:
+            fin, opcode, payload = frame
+            if opcode >= OP_CLOSE:
+                # Control frames may arrive between the fragments of a message
+                yield opcode, payload
+            elif opcode == OP_CONTINUATION:
+                if self._fragment_opcode is None:
+                    continue
+                self._fragments.append(payload)
+                if fin:
+                    message = b"".join(self._fragments)
+                    yield self._fragment_opcode, message
+                    self._fragments = []
+                    self._fragment_opcode = None
+            elif fin:
+                yield opcode, payload
+            else:
+                self._fragment_opcode = opcode
+                self._fragments = [payload]
+
+    def _next_frame(self) -> tuple[bool, int, bytes] | None:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        fin = (buffer[0] & 0x80) != 0
+        opcode = buffer[0] & 0x0F
+        masked = (buffer[1] & 0x80) != 0
+        length = buffer[1] & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            length = struct.unpack_from(">H", buffer, 2)[0]
+            offset = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            length = struct.unpack_from(">Q", buffer, 2)[0]
+            offset = 10
+        mask = None
+        if masked:
+            if len(buffer) < offset + 4:
+                return None
+            mask = bytes(buffer[offset : offset + 4])
+            offset += 4
+        end = offset + length
+        if len(buffer) < end:
+            return None
+        payload = bytes(buffer[offset:end])
+        del buffer[:end]
+        if mask is not None:
+            payload = mask_payload(payload, mask)
+        return fin, opcode, payload
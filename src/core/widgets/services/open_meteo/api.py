@@ -1,16 +1,20 @@
 import json
 import logging
 import re
+import socket
 import traceback
 from typing import Any
+from urllib.error import HTTPError, URLError
 
 from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+from core.utils.http_client import HttpClient, HttpResponse
 
 logger = logging.getLogger("open_meteo")
 
-HEADER = (b"User-Agent", b"Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0")
-CACHE_CONTROL = (b"Cache-Control", b"no-cache")
+# Forecast responses are shared between widgets with the same location for a minute
+RESPONSE_TTL = 60
+GEOCODING_TTL = 60 * 60
 
 # Open-Meteo API base URLs
 FORECAST_BASE_URL = "https://api.open-meteo.com/v1/forecast"
@@ -40,6 +44,7 @@ class OpenMeteoDataFetcher(QObject):
     """Fetches weather forecast data from the Open-Meteo API."""
 
     finished = pyqtSignal(dict)
+    _response_ready = pyqtSignal(object, object)
 
     def __init__(
         self,
@@ -51,8 +56,8 @@ class OpenMeteoDataFetcher(QObject):
     ):
         super().__init__(parent)
         self.started = False
-        self._manager = QNetworkAccessManager(self)
-        self._manager.finished.connect(self._handle_response)
+        self._http = HttpClient.get_instance()
+        self._response_ready.connect(self._handle_response)
 
         self._fetch_timer = QTimer(self)
         self._fetch_timer.timeout.connect(self.make_request)
@@ -88,27 +93,28 @@ class OpenMeteoDataFetcher(QObject):
 
     def make_request(self):
         """Make a single weather data request."""
-        request = QNetworkRequest(self._url)
-        request.setRawHeader(*HEADER)
-        request.setRawHeader(*CACHE_CONTROL)
-        self._manager.get(request)
+        self._http.get_async(self._url.toEncoded().data().decode(), self._on_response, ttl=RESPONSE_TTL)
 
-    def _handle_response(self, reply: QNetworkReply):
+    def _on_response(self, response: HttpResponse | None, error: Exception | None):
+        # Called from the HTTP worker thread, hand the result over to the GUI thread
         try:
-            error = reply.error()
-            status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
-            if error == QNetworkReply.NetworkError.NoError:
-                data = json.loads(reply.readAll().data().decode())
-                self.finished.emit(data)
-            elif error == QNetworkReply.NetworkError.HostNotFoundError:
-                logger.error("No internet connection or host not found. Unable to fetch weather.")
+            self._response_ready.emit(response, error)
+        except RuntimeError:
+            pass
+
+    def _handle_response(self, response: HttpResponse | None, error: Exception | None):
+        try:
+            if response is not None:
+                self.finished.emit(response.json())
+            elif isinstance(error, HTTPError) and error.code in {400, 401, 403}:
+                data = json.loads(error.read().decode())
+                logger.error("Open-Meteo API error %s: %s", error.code, data.get("reason", "Unknown"))
                 self.finished.emit({})
-            elif status in {400, 401, 403}:
-                data = json.loads(reply.readAll().data().decode())
-                logger.error("Open-Meteo API error %s: %s", status, data.get("reason", "Unknown"))
+            elif isinstance(error, URLError) and isinstance(error.reason, socket.gaierror):
+                logger.error("No internet connection or host not found. Unable to fetch weather.")
                 self.finished.emit({})
             else:
-                logger.error("Open-Meteo response error %s: %s %s", status, error.name, error.value)
+                logger.error("Open-Meteo response error: %s", error)
                 self.finished.emit({})
         except json.JSONDecodeError as e:
             logger.error("Open-Meteo invalid JSON response: %s", e)
@@ -116,20 +122,18 @@ class OpenMeteoDataFetcher(QObject):
         except Exception as e:
             logger.error("Open-Meteo fetch error: %s\n%s", e, traceback.format_exc())
             self.finished.emit({})
-        finally:
-            reply.deleteLater()
 
 
 class GeocodingFetcher(QObject):
     """Searches for locations using the Open-Meteo Geocoding API."""
 
     results_ready = pyqtSignal(list)
+    _response_ready = pyqtSignal(object, object, object)
 
     def __init__(self, parent: QObject):
         super().__init__(parent)
-        self._manager = QNetworkAccessManager(self)
-        self._manager.finished.connect(self._handle_response)
-        self._current_country_filter: str | None = None
+        self._http = HttpClient.get_instance()
+        self._response_ready.connect(self._handle_response)
 
     def search(self, query: str, count: int = 100):
         """Search for locations matching the query string."""
@@ -138,11 +142,11 @@ class GeocodingFetcher(QObject):
             return
 
         # Check for a trailing 2-letter country code
-        self._current_country_filter = None
+        country_filter = None
         match = re.search(r"^(.*?)(?:,\s*|\s+)([A-Za-z]{2})$", query.strip())
         if match:
             query = match.group(1).strip()
-            self._current_country_filter = match.group(2).upper()
+            country_filter = match.group(2).upper()
 
         url = QUrl(
             f"{GEOCODING_BASE_URL}"
@@ -151,33 +155,36 @@ class GeocodingFetcher(QObject):
             f"&language=en"
             f"&format=json"
         )
-        request = QNetworkRequest(url)
-        request.setRawHeader(*HEADER)
-        request.setRawHeader(*CACHE_CONTROL)
-        self._manager.get(request)
+        self._http.get_async(
+            url.toEncoded().data().decode(),
+            lambda response, error: self._on_response(response, error, country_filter),
+            ttl=GEOCODING_TTL,
+        )
+
+    def _on_response(self, response: HttpResponse | None, error: Exception | None, country_filter: str | None):
+        # Called from the HTTP worker thread, hand the result over to the GUI thread
+        try:
+            self._response_ready.emit(response, error, country_filter)
+        except RuntimeError:
+            pass
 
-    def _handle_response(self, reply: QNetworkReply):
+    def _handle_response(self, response: HttpResponse | None, error: Exception | None, country_filter: str | None):
         results: list[dict[str, Any]] = []
         try:
-            error = reply.error()
-            if error == QNetworkReply.NetworkError.NoError:
-                data = json.loads(reply.readAll().data().decode())
+            if response is not None:
+                data = response.json()
                 raw_results: list[dict[str, Any]] = data.get("results", [])
 
-                if self._current_country_filter:
+                if country_filter:
                     # Filter results by the extracted 2-letter country code
-                    results = [
-                        r for r in raw_results if r.get("country_code", "").upper() == self._current_country_filter
-                    ]
+                    results = [r for r in raw_results if r.get("country_code", "").upper() == country_filter]
                 else:
                     results = raw_results
             else:
-                logger.warning("Geocoding search failed: %s", error.name)
+                logger.warning("Geocoding search failed: %s", error)
         except json.JSONDecodeError as e:
             logger.error("Geocoding invalid JSON response: %s", e)
         except Exception as e:
             logger.error("Geocoding fetch error: %s", e)
         finally:
-            self._current_country_filter = None
             self.results_ready.emit(results)
-            reply.deleteLater()
@@ -1,6 +1,5 @@
 import ctypes
 import ctypes.wintypes
-import json
 import logging
 import os
 import time
@@ -10,6 +9,7 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from win32comext.shell import shell
 
+from core.utils.local_store import LocalStore
 from core.utils.shell_utils import shell_open
 from core.utils.system import app_data_path
 from core.widgets.services.quick_launch.base_provider import (
@@ -26,7 +26,11 @@ class LaunchHistory:
     """Manages launch history and frecency scoring for apps."""
 
     def __init__(self):
-        self._recent_file = str(app_data_path("quick_launch_recent.json"))
+        self._store = LocalStore.get_instance().get_dict(
+            "quick_launch_recent",
+            legacy_file=str(app_data_path("quick_launch_recent.json")),
+            legacy_convert=_migrate_legacy_history,
+        )
         self._history: dict[str, dict] = self._load()
 
     @property
@@ -41,17 +45,18 @@ class LaunchHistory:
             entry["count"] += 1
             entry["last_used"] = now
         else:
-            self._history[key] = {
+            entry = self._history[key] = {
                 "name": name,
                 "path": path,
                 "count": 1,
                 "last_used": now,
             }
-        self.save()
+        # Only the launched entry is written, not the whole history
+        self._store.put(key, entry)
 
     def remove(self, key: str):
         self._history.pop(key, None)
-        self.save()
+        self._store.delete(key)
 
     def get_frecency_score(self, app_key: str) -> float:
         """Return a frecency boost in range [0.0, 3.0].
@@ -75,37 +80,28 @@ class LaunchHistory:
             recency = 0.4
         return min(count * recency * 1.5, 3.0)
 
-    def save(self):
-        try:
-            os.makedirs(os.path.dirname(self._recent_file), exist_ok=True)
-            with open(self._recent_file, "w", encoding="utf-8") as f:
-                json.dump(self._history, f, indent=2)
-        except Exception:
-            pass
-
     def _load(self) -> dict[str, dict]:
         try:
-            if os.path.isfile(self._recent_file):
-                with open(self._recent_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                # Migrate legacy list format
-                if isinstance(data, list):
-                    history: dict[str, dict] = {}
-                    for r in reversed(data):
-                        key = r.get("key", "")
-                        if key:
-                            history[key] = {
-                                "name": r.get("name", ""),
-                                "path": r.get("path", ""),
-                                "count": 1,
-                                "last_used": r.get("timestamp", time.time()),
-                            }
-                    return history
-                if isinstance(data, dict):
-                    return data
+            return self._store.load()
         except Exception:
-            pass
-        return {}
+            return {}
+
+
+def _migrate_legacy_history(data) -> dict[str, dict]:
+    """Convert the legacy list format of quick_launch_recent.json to the keyed history."""
+    if isinstance(data, list):
+        history: dict[str, dict] = {}
+        for r in reversed(data):
+            key = r.get("key", "")
+            if key:
+                history[key] = {
+                    "name": r.get("name", ""),
+                    "path": r.get("path", ""),
+                    "count": 1,
+                    "last_used": r.get("timestamp", time.time()),
+                }
+        return history
+    return data
 
 
 def _get_exe_description(exe_path: str) -> str | None:
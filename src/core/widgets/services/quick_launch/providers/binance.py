@@ -2,6 +2,7 @@ import json
 import logging
 import re
 import time
+import urllib.error
 import webbrowser
 
 from PyQt6.QtWidgets import QApplication
@@ -206,13 +207,11 @@ class BinanceProvider(BaseProvider):
 
     def _fetch_prices(self) -> dict[str, float] | None:
         try:
-            import urllib.request
+            from core.utils.http_client import HttpClient
 
             url = f"https://{self._domain}/api/v3/ticker/price"
             logging.debug("Fetching all prices from %s", url)
-            req = urllib.request.Request(url, headers={"User-Agent": "yasb/1.0"})
-            with urllib.request.urlopen(req, timeout=5) as resp:  # noqa: S310
-                data = json.loads(resp.read())
+            data = HttpClient.get_instance().get(url, headers={"User-Agent": "yasb/1.0"}, timeout=5).json()
 
             prices: dict[str, float] = {}
             for entry in data:
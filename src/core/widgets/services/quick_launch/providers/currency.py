@@ -284,11 +284,9 @@ class CurrencyProvider(BaseProvider):
 
     def _fetch_rates(self) -> dict[str, float] | None:
         try:
-            import urllib.request
+            from core.utils.http_client import HttpClient
 
-            req = urllib.request.Request(_ECB_URL, headers={"User-Agent": "yasb/1.0"})
-            with urllib.request.urlopen(req, timeout=5) as resp:  # noqa: S310
-                xml_data = resp.read()
+            xml_data = HttpClient.get_instance().get(_ECB_URL, headers={"User-Agent": "yasb/1.0"}, timeout=5).body
 
             root = ElementTree.fromstring(xml_data)  # noqa: S314
             cube = root.find(".//ecb:Cube/ecb:Cube", _ECB_NS)
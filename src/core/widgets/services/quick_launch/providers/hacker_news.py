@@ -4,12 +4,12 @@ import re
 import time
 import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import UTC, datetime
 from xml.etree import ElementTree
 
 from PyQt6.QtWidgets import QApplication
 
+from core.utils.http_client import HttpClient
 from core.utils.shell_utils import shell_open
 from core.utils.system import app_data_path
 from core.widgets.services.quick_launch.base_provider import (
@@ -242,11 +242,7 @@ class HackerNewsProvider(BaseProvider):
         if keyword:
             url += f"&q={urllib.parse.quote(keyword)}"
 
-        req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if cancel_event and cancel_event.is_set():
-                return []
-            xml_data = resp.read()
+        xml_data = HttpClient.get_instance().get(url, headers={"User-Agent": _USER_AGENT}, timeout=10).body
 
         if cancel_event and cancel_event.is_set():
             return []
@@ -1,6 +1,5 @@
 import ctypes
 import ctypes.wintypes
-import json
 import logging
 import os
 import re
@@ -11,6 +10,7 @@ from datetime import datetime
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
+from core.utils.local_store import LocalStore
 from core.utils.system import app_data_path
 from core.widgets.services.quick_launch.base_provider import (
     BaseProvider,
@@ -173,20 +173,15 @@ class SnippetsProvider(BaseProvider):
 
     def _load_snippets(self) -> list[dict]:
         try:
-            if os.path.isfile(_SNIPPETS_FILE):
-                with open(_SNIPPETS_FILE, encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, list):
-                    return [s for s in data if isinstance(s, dict) and s.get("content")]
+            data = LocalStore.get_instance().get_list("quick_launch_snippets", legacy_file=_SNIPPETS_FILE).load()
+            return [s for s in data if isinstance(s, dict) and s.get("content")]
         except Exception as e:
             logging.debug("Failed to load snippets: %s", e)
         return []
 
     def _save_snippets(self):
         try:
-            os.makedirs(os.path.dirname(_SNIPPETS_FILE), exist_ok=True)
-            with open(_SNIPPETS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._snippets, f, ensure_ascii=False, indent=2)
+            LocalStore.get_instance().get_list("quick_launch_snippets").save(self._snippets)
         except Exception as e:
             logging.debug("Failed to save snippets: %s", e)
 
@@ -0,0 +1,59 @@
+"""
+Trailing-edge debounce for Recycle Bin change notifications.
+
+Deleting many files raises a change notification per file on the drive's $Recycle.Bin. Querying
+the bin for each of them is wasted work, so notifications are folded into bursts: the query runs
+once the notifications have been quiet for ``quiet`` seconds. A burst that never goes quiet (e.g.
+a long delete) still fires every ``max_delay`` seconds so the widget keeps showing progress.
+
+The clock is injected and nothing here waits, the owner asks ``next_fire_in`` how long it may
+sleep, which keeps the policy testable without Win32 or real time.
+"""
+
+import time
+from collections.abc import Callable
+
+# Quiet time that ends a burst, and the longest a busy burst waits for a query
+DEBOUNCE_QUIET = 0.3
+DEBOUNCE_MAX_DELAY = 1.0
+
+
+class TrailingDebounce:
+    """Coalesces notifications into at most one firing per burst. Not thread-safe."""
+
+    def __init__(
+        self,
+        quiet: float = DEBOUNCE_QUIET,
+        max_delay: float = DEBOUNCE_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._quiet = quiet
+        self._max_delay = max(max_delay, quiet)
+        self._clock = clock
+        self._first: float | None = None
+        self._last = 0.0
+
+    @property
+    def pending(self) -> bool:
+        return self._first is not None
+
+    def notify(self) -> None:
+        """Record a change notification"""
+        now = self._clock()
+        if self._first is None:
+            self._first = now
+        self._last = now
+
+    def next_fire_in(self) -> float | None:
+        """Seconds until the pending burst is due, or None if nothing is pending"""
+        if self._first is None:
+            return None
+        due = min(self._last + self._quiet, self._first + self._max_delay)
+        return max(0.0, due - self._clock())
+
+    def take_due(self) -> bool:
+        """True (once) when the pending burst is due; the caller then runs the query"""
+        if self._first is None or self.next_fire_in() > 0:
+            return False
+        self._first = None
+        return True
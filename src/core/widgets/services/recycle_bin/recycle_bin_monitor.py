@@ -1,9 +1,9 @@
 import ctypes
 import logging
+import math
 import os
 import string
 import threading
-import time
 from ctypes import wintypes
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
@@ -19,6 +19,7 @@ from core.utils.win32.constants import (
     FILE_SHARE_WRITE,
     INFINITE,
     INVALID_HANDLE_VALUE,
+    MAXIMUM_WAIT_OBJECTS,
     OPEN_EXISTING,
     S_OK,
     SHERB_NOCONFIRMATION,
@@ -26,62 +27,32 @@ from core.utils.win32.constants import (
     SHERB_NOSOUND,
     WAIT_FAILED,
     WAIT_OBJECT_0,
+    WAIT_TIMEOUT,
     KnownCLSID,
 )
 from core.utils.win32.structs import SHQUERYRBINFO
+from core.widgets.services.recycle_bin.change_debounce import TrailingDebounce
 
 
-class BinInfoWorker(QThread):
-    """Reusable worker thread to query recycle bin info on demand"""
+def query_recycle_bin_info():
+    """Get information about the Recycle Bin using SHQueryRecycleBinW"""
+    info = SHQUERYRBINFO()
+    info.cbSize = ctypes.sizeof(info)
 
-    info_ready = pyqtSignal(dict)
+    # Query all Recycle Bins (pszRootPath = None)
+    result = shell32.SHQueryRecycleBinW(None, ctypes.byref(info))
 
-    def __init__(self):
-        super().__init__()
-        self._request_event = threading.Event()
-        self._stop_event = threading.Event()
-
-    def run(self):
-        """Wait for requests and query bin info"""
-        while True:
-            self._request_event.wait()
-            self._request_event.clear()
-
-            if self._stop_event.is_set():
-                break
-
-            info = self._get_recycle_bin_info()
-            self.info_ready.emit(info)
-
-    def request_query(self):
-        """Request a bin info query"""
-        self._request_event.set()
-
-    def stop(self):
-        """Stop the worker thread"""
-        self._stop_event.set()
-        self._request_event.set()
-        self.wait(1000)
-
-    def _get_recycle_bin_info(self):
-        """Get information about the Recycle Bin using SHQueryRecycleBinW"""
-        info = SHQUERYRBINFO()
-        info.cbSize = ctypes.sizeof(info)
+    if result == S_OK:
+        return {"size_bytes": info.i64Size, "num_items": info.i64NumItems}
 
-        # Query all Recycle Bins (pszRootPath = None)
-        result = shell32.SHQueryRecycleBinW(None, ctypes.byref(info))
+    error_code = result & 0xFFFF  # Equivalent to HRESULT_CODE macro
+    try:
+        error_message = str(ctypes.WinError(error_code))
+    except Exception:
+        error_message = f"HRESULT 0x{result & 0xFFFFFFFF:08X}"
+    logging.debug("SHQueryRecycleBinW failed: %s", error_message)
 
-        if result == S_OK:
-            return {"size_bytes": info.i64Size, "num_items": info.i64NumItems}
-
-        error_code = result & 0xFFFF  # Equivalent to HRESULT_CODE macro
-        try:
-            error_message = str(ctypes.WinError(error_code))
-        except Exception:
-            error_message = f"HRESULT 0x{result & 0xFFFFFFFF:08X}"
-        logging.debug("SHQueryRecycleBinW failed: %s", error_message)
-
-        return {"size_bytes": 0, "num_items": 0}
+    return {"size_bytes": 0, "num_items": 0}
 
 
 class EmptyBinThread(QThread):
@@ -115,17 +86,10 @@ class RecycleBinMonitor(QObject):
 
     def __init__(self):
         super().__init__()
-        self._active = False
-        self._monitoring_thread = None
-        self._watchers = []  # Win32DirectoryWatcher instances
+        self._watcher = None  # Win32DirectoryWatcher covering every drive
         self._last_info = {"size_bytes": 0, "num_items": 0}
+        self._has_info = False
         self._lock = threading.Lock()
-        self._query_worker = None  # Reusable worker thread for async queries
-        self._query_pending = False  # Flag to prevent multiple simultaneous queries
-        self._poll_timer = None  # Timer for periodic polling during bursts
-        self._poll_interval = 1  # Poll interval in seconds during bursts
-        self._last_change_time = time.monotonic()  # Timestamp of last detected change
-        self._last_poll_time = 0.0  # Timestamp of last direct poll trigger
         self._subscribers = set()  # Track subscribers (widget instances)
 
     def subscribe(self, subscriber_id):
@@ -172,47 +136,27 @@ class RecycleBinMonitor(QObject):
         if self._is_monitoring:
             return
 
-        self._active = True
-        self._last_poll_time = time.monotonic() - self._poll_interval
-
-        # Start the reusable worker thread
-        self._query_worker = BinInfoWorker()
-        self._query_worker.info_ready.connect(self._on_bin_info_ready)
-        self._query_worker.start()
-
-        self._monitoring_thread = threading.Thread(target=self._monitor_recycle_bin, daemon=True)
-        self._monitoring_thread.start()
+        with self._lock:
+            self._has_info = False
 
-        # Get initial info
-        self._query_bin_info_async(mark_poll_time=False)
+        self._watcher = Win32DirectoryWatcher(self._recycle_bin_paths, callback=self._update_bin_info)
+        # The watcher queries the initial info once it has opened the drives
+        if not self._watcher.start():
+            self._watcher = None
+            return
 
         self._is_monitoring = True
 
     def stop_monitoring(self):
         """Stop monitoring the recycle bin"""
-        self._active = False
         self._is_monitoring = False
 
-        # Stop polling timer
-        self._stop_poll_timer()
-
-        # Stop any active watchers
-        for watcher in getattr(self, "_watchers", []):
+        if self._watcher:
             try:
-                watcher.stop(timeout=1.0)
+                self._watcher.stop(timeout=1.0)
             except Exception:
                 logging.exception("Error stopping watcher")
-        self._watchers = []
-
-        # If there was a legacy monitoring thread, join it
-        if self._monitoring_thread and self._monitoring_thread.is_alive():
-            self._monitoring_thread.join(timeout=1.0)
-
-        # Stop the worker thread
-        if self._query_worker:
-            self._query_worker.stop()
-            self._query_worker.deleteLater()
-            self._query_worker = None
+            self._watcher = None
 
     def empty_recycle_bin(self, show_confirmation=False, show_progress=False, play_sound=False):
         """Empty the recycle bin with configurable UI options
@@ -278,101 +222,23 @@ class RecycleBinMonitor(QObject):
             logging.error("Error opening recycle bin: %s", e)
             return False
 
-    def _query_bin_info_async(self, mark_poll_time=True):
-        """Request bin info query from the worker thread
+    def _update_bin_info(self):
+        """Query bin info on the watcher thread and emit if changed"""
+        bin_info = query_recycle_bin_info()
 
-        Args:
-            mark_poll_time: When True, record the trigger time to throttle bursts.
-        """
         with self._lock:
-            if self._query_pending or not self._query_worker:
-                return
-            self._query_pending = True
-            if mark_poll_time:
-                self._last_poll_time = time.monotonic()
-
-        self._query_worker.request_query()
-
-    def _on_bin_info_ready(self, bin_info):
-        """Handle bin info result from async query and emit if changed"""
-        if not bin_info:
-            with self._lock:
-                self._query_pending = False
-            return
-
-        with self._lock:
-            self._query_pending = False
-
-            # Only emit signal if the info has changed
-            if (
-                bin_info["size_bytes"] != self._last_info["size_bytes"]
-                or bin_info["num_items"] != self._last_info["num_items"]
-            ):
-                self._last_info = bin_info
-                should_emit = True
-            else:
-                # Update last_info even if unchanged (for initial load)
-                if self._last_info["size_bytes"] == 0 and self._last_info["num_items"] == 0:
-                    self._last_info = bin_info
-                    should_emit = True
-                else:
-                    should_emit = False
+            # Always emit the first result so subscribers get an initial state
+            should_emit = not self._has_info or bin_info != self._last_info
+            self._last_info = bin_info
+            self._has_info = True
 
         if should_emit:
             self.bin_updated.emit(bin_info)
 
-    def _start_poll_timer(self):
-        """Start polling timer for burst handling"""
-        with self._lock:
-            if self._poll_timer or not self._active:
-                return
-
-            timer = threading.Timer(self._poll_interval, self._poll_tick)
-            timer.daemon = True
-            self._poll_timer = timer
-            timer.start()
-
-    def _stop_poll_timer(self):
-        """Stop the polling timer"""
-        with self._lock:
-            if self._poll_timer:
-                self._poll_timer.cancel()
-                self._poll_timer = None
-
-    def _poll_tick(self):
-        """Periodic polling callback during bursts"""
-        with self._lock:
-            self._poll_timer = None
-
-            if not self._active:
-                return
-
-            # Check if we should continue polling
-            time_since_change = time.monotonic() - self._last_change_time
-            should_continue = time_since_change < self._poll_interval
-
-        # Query current state
-        self._query_bin_info_async()
-
-        # Reschedule if activity is ongoing
-        if should_continue:
-            self._start_poll_timer()
-
-    def _handle_change_notification(self):
-        """Handle filesystem change notification"""
-        with self._lock:
-            now = time.monotonic()
-            self._last_change_time = now
-            has_timer = self._poll_timer is not None
-            query_pending = self._query_pending
-            should_query_now = not query_pending and (now - self._last_poll_time) >= self._poll_interval
-
-        # Start polling if not already running
-        if should_query_now:
-            self._query_bin_info_async()
-
-        if not has_timer:
-            self._start_poll_timer()
+    def _recycle_bin_paths(self):
+        """$Recycle.Bin folders of all drives, resolved on the watcher thread as drives may be slow"""
+        paths = [os.path.join(drive, "$Recycle.Bin") for drive in self.get_all_drives()]
+        return [path for path in paths if os.path.exists(path)]
 
     def get_all_drives(self):
         drive_bitmask = kernel32.GetLogicalDrives()
@@ -382,31 +248,24 @@ class RecycleBinMonitor(QObject):
                 drives.append(string.ascii_uppercase[i] + ":\\")
         return drives
 
-    def _monitor_recycle_bin(self):
-        """Monitor the Recycle Bin status using Windows change notifications"""
-
-        # Create watchers for each drive's Recycle Bin folder
-        for drive in self.get_all_drives():
-            recycle_bin_path = os.path.join(drive, "$Recycle.Bin")
-            if not os.path.exists(recycle_bin_path):
-                continue
-
-            watcher = Win32DirectoryWatcher(recycle_bin_path, callback=self._handle_change_notification)
-            if watcher.start():
-                self._watchers.append(watcher)
-
 
 class Win32DirectoryWatcher:
-    """Small helper that watches a directory for changes using Win32 APIs"""
+    """
+    Watches several directories for changes from a single thread
 
-    def __init__(self, path, callback):
-        self.path = path
+    One WaitForMultipleObjects covers the change handles of all directories returned by
+    ``get_paths``. Notifications are debounced, ``callback`` runs on the watcher thread once per
+    burst of changes (and once at start).
+    """
+
+    def __init__(self, get_paths, callback, debounce=None):
+        self.get_paths = get_paths
         self.callback = callback
         self.watch_subtree = True
         self.flag = FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME
 
-        self._change_handle = INVALID_HANDLE_VALUE
-        self._dir_handle = INVALID_HANDLE_VALUE
+        self._debounce = debounce or TrailingDebounce()
+        self._change_handles = []  # (path, change handle, dir handle)
         self._stop_event = None
         self._thread = None
         self._running = False
@@ -418,13 +277,21 @@ class Win32DirectoryWatcher:
         # Create stop event
         self._stop_event = kernel32.CreateEventW(None, True, False, None)
         if not self._stop_event:
-            logging.error("Watcher: failed to create stop event for %s: %s", self.path, ctypes.WinError())
+            logging.error("Watcher: failed to create stop event: %s", ctypes.WinError())
             self._stop_event = None
             return False
 
+        # Start thread
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return True
+
+    def _open(self, path):
+        """Open a change notification for ``path``, returns (change handle, dir handle) or None"""
         # Open directory handle (required on some Windows versions)
-        self._dir_handle = kernel32.CreateFileW(
-            self.path,
+        dir_handle = kernel32.CreateFileW(
+            path,
             FILE_LIST_DIRECTORY,
             FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE,
             None,
@@ -432,77 +299,92 @@ class Win32DirectoryWatcher:
             FILE_FLAG_BACKUP_SEMANTICS,
             None,
         )
-
-        if self._dir_handle == INVALID_HANDLE_VALUE:
-            logging.error("Watcher: failed to open dir handle for %s: %s", self.path, ctypes.WinError())
-            if self._stop_event is not None:
-                kernel32.CloseHandle(self._stop_event)
-                self._stop_event = None
-            return False
+        if dir_handle == INVALID_HANDLE_VALUE:
+            logging.error("Watcher: failed to open dir handle for %s: %s", path, ctypes.WinError())
+            return None
 
         # Register change notification
-        self._change_handle = kernel32.FindFirstChangeNotificationW(self.path, self.watch_subtree, self.flag)
-        if self._change_handle == INVALID_HANDLE_VALUE:
-            logging.error("Watcher: failed to register change notification for %s: %s", self.path, ctypes.WinError())
-            if self._dir_handle != INVALID_HANDLE_VALUE:
-                kernel32.CloseHandle(self._dir_handle)
-                self._dir_handle = INVALID_HANDLE_VALUE
-            if self._stop_event is not None:
-                kernel32.CloseHandle(self._stop_event)
-                self._stop_event = None
-            return False
-
-        # Start thread
-        self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
-        return True
+        change_handle = kernel32.FindFirstChangeNotificationW(path, self.watch_subtree, self.flag)
+        if change_handle == INVALID_HANDLE_VALUE:
+            logging.error("Watcher: failed to register change notification for %s: %s", path, ctypes.WinError())
+            kernel32.CloseHandle(dir_handle)
+            return None
+        return change_handle, dir_handle
+
+    def _close(self, entry):
+        _path, change_handle, dir_handle = entry
+        kernel32.FindCloseChangeNotification(change_handle)
+        kernel32.CloseHandle(dir_handle)
+
+    def _notify(self):
+        try:
+            self.callback()
+        except Exception:
+            logging.exception("Watcher callback raised")
 
     def _run(self):
-        wait_handles = (wintypes.HANDLE * 2)(self._change_handle, self._stop_event)
-        while self._running:
-            result = kernel32.WaitForMultipleObjects(2, wait_handles, False, INFINITE)
-            if not self._running:
+        # Stop event plus one handle per directory must fit in a single wait
+        for path in self.get_paths()[: MAXIMUM_WAIT_OBJECTS - 1]:
+            handles = self._open(path)
+            if handles is not None:
+                self._change_handles.append((path, *handles))
+
+        self._notify()
+
+        wait_handles = None
+        # Only the stop event ends the loop normally, stop() owns the event and closes it after join
+        while True:
+            if wait_handles is None:
+                # Stop event first, so stopping wins over pending changes
+                handles = [self._stop_event] + [entry[1] for entry in self._change_handles]
+                wait_handles = (wintypes.HANDLE * len(handles))(*handles)
+
+            delay = self._debounce.next_fire_in()
+            timeout = INFINITE if delay is None else math.ceil(delay * 1000)
+            result = kernel32.WaitForMultipleObjects(len(wait_handles), wait_handles, False, timeout)
+            if result == WAIT_OBJECT_0:
                 break
 
             if result == WAIT_FAILED:
-                logging.error("Watcher: wait failed for %s: %s", self.path, ctypes.WinError())
+                logging.error("Watcher: wait failed: %s", ctypes.WinError())
                 break
 
-            if result == WAIT_OBJECT_0:
-                try:
-                    self.callback()
-                except Exception:
-                    logging.exception("Watcher callback raised")
-
+            if WAIT_OBJECT_0 < result < WAIT_OBJECT_0 + len(wait_handles):
+                self._debounce.notify()
+                index = result - WAIT_OBJECT_0 - 1
+                entry = self._change_handles[index]
                 # Reset change notification
-                if not kernel32.FindNextChangeNotification(self._change_handle):
-                    logging.error("Watcher: failed to reset notification for %s: %s", self.path, ctypes.WinError())
-                    break
-            elif result == WAIT_OBJECT_0 + 1:
-                # Stop event signaled
-                break
-            else:
+                if not kernel32.FindNextChangeNotification(entry[1]):
+                    logging.error("Watcher: failed to reset notification for %s: %s", entry[0], ctypes.WinError())
+                    self._close(self._change_handles.pop(index))
+                    wait_handles = None
+            elif result != WAIT_TIMEOUT:
                 logging.error("Watcher: unexpected wait result: %s", result)
                 break
 
+            if self._debounce.take_due():
+                self._notify()
+
         # Cleanup
-        if self._change_handle != INVALID_HANDLE_VALUE:
-            kernel32.FindCloseChangeNotification(self._change_handle)
-            self._change_handle = INVALID_HANDLE_VALUE
-        if self._dir_handle != INVALID_HANDLE_VALUE:
-            kernel32.CloseHandle(self._dir_handle)
-            self._dir_handle = INVALID_HANDLE_VALUE
-        if self._stop_event is not None:
-            kernel32.CloseHandle(self._stop_event)
-            self._stop_event = None
+        for entry in self._change_handles:
+            self._close(entry)
+        self._change_handles = []
 
     def stop(self, timeout=None):
         if not self._running:
             return
         self._running = False
+        # Signal first, the event stays open until the thread is done waiting on it
         if self._stop_event is not None:
             kernel32.SetEvent(self._stop_event)
         if self._thread is not None:
             self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logging.warning("Watcher: thread did not stop in time, leaving its stop event open")
+                self._thread = None
+                self._stop_event = None
+                return
             self._thread = None
+        if self._stop_event is not None:
+            kernel32.CloseHandle(self._stop_event)
+            self._stop_event = None
@@ -12,6 +12,7 @@ class ServerCheckService(QObject):
     """Server-check runner."""
 
     status_updated = pyqtSignal(int, list)
+    server_checked = pyqtSignal(int, dict)
     refresh_started = pyqtSignal()
 
     _instances: ClassVar[dict[tuple, ServerCheckService]] = {}
@@ -24,8 +25,16 @@ class ServerCheckService(QObject):
         ssl_check: bool,
         timeout: int,
         update_interval_s: int,
+        max_concurrency: int = 8,
     ) -> ServerCheckService:
-        key = (tuple(s["url"] for s in servers), ssl_verify, ssl_check, timeout, int(update_interval_s))
+        key = (
+            tuple(s["url"] for s in servers),
+            ssl_verify,
+            ssl_check,
+            timeout,
+            int(update_interval_s),
+            max_concurrency,
+        )
         inst = cls._instances.get(key)
         if inst is None:
             inst = cls(
@@ -34,6 +43,7 @@ class ServerCheckService(QObject):
                 ssl_check=ssl_check,
                 timeout=timeout,
                 update_interval_s=int(update_interval_s),
+                max_concurrency=max_concurrency,
                 _key=key,
             )
             cls._instances[key] = inst
@@ -47,6 +57,7 @@ class ServerCheckService(QObject):
         ssl_check: bool,
         timeout: int,
         update_interval_s: int,
+        max_concurrency: int,
         _key: tuple,
     ):
         super().__init__()
@@ -55,8 +66,9 @@ class ServerCheckService(QObject):
         self._run_id = 0
 
         self._worker = ServerCheckWorker()
-        self._worker.set_servers(servers, ssl_verify, ssl_check, timeout)
+        self._worker.set_servers(servers, ssl_verify, ssl_check, timeout, max_concurrency)
         self._worker.status_updated.connect(self._on_worker_status_updated)
+        self._worker.server_checked.connect(self._on_worker_server_checked)
 
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._start_if_idle)
@@ -103,3 +115,6 @@ class ServerCheckService(QObject):
 
     def _on_worker_status_updated(self, status_list: list) -> None:
         self.status_updated.emit(self._run_id, status_list)
+
+    def _on_worker_server_checked(self, status: dict) -> None:
+        self.server_checked.emit(self._run_id, status)
@@ -1,18 +1,25 @@
 import logging
 import socket
 import ssl
+import time
 import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urlparse
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from core.utils.http_client import HttpClient
+
 logger = logging.getLogger("server_monitor")
 
+# Certificate expiry is reported in days, no need to re-handshake for it on every cycle
+SSL_EXPIRY_CACHE_TTL = 3600
+
 
 class ServerCheckWorker(QThread):
     status_updated = pyqtSignal(list)
+    server_checked = pyqtSignal(dict)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -20,17 +27,44 @@ class ServerCheckWorker(QThread):
         self.ssl_check: bool = True
         self.ssl_verify: bool = True
         self.timeout: int = 5
+        self.max_concurrency: int = 8
         self.running = True
-
-    def set_servers(self, servers: list[dict], ssl_verify: bool, ssl_check: bool, timeout: int) -> None:
+        self._http: HttpClient | None = None
+        self._ssl_expiry_cache: dict[str, tuple[float, int | None]] = {}
+
+    def set_servers(
+        self,
+        servers: list[dict],
+        ssl_verify: bool,
+        ssl_check: bool,
+        timeout: int,
+        max_concurrency: int = 8,
+    ) -> None:
         self.servers = servers
         self.ssl_check = ssl_check
         self.ssl_verify = ssl_verify
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def stop(self) -> None:
         self.running = False
         self.wait()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _get_http_client(self) -> HttpClient:
+        """Client owned by this worker, its keep-alive connections are reused between check cycles."""
+        if self._http is None:
+            context = ssl.create_default_context()
+            if not self.ssl_verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._http = HttpClient(max_idle_per_host=1, max_cache_entries=0, ssl_context=context)
+        return self._http
 
     def _has_internet(self) -> bool:
         """Check if internet is available."""
@@ -68,17 +102,31 @@ class ServerCheckWorker(QThread):
             self.status_updated.emit(server_statuses)
             return
 
-        server_statuses: list[dict] = []
-
-        for server in self.servers:
-            if not self.running:
-                break
-
-            status = self.check_single_server(server["url"], self.ssl_verify, self.ssl_check, self.timeout)
-            status["name"] = server["name"]
-            server_statuses.append(status)
-
-        self.status_updated.emit(server_statuses)
+        # Check servers concurrently so one slow or unreachable host doesn't delay the others,
+        # each result is emitted as soon as its check finishes.
+        servers = list(self.servers)
+        server_statuses: list[dict | None] = [None] * len(servers)
+        workers = max(1, min(self.max_concurrency, len(servers)))
+        self._get_http_client()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ServerCheck") as executor:
+            futures = {
+                executor.submit(
+                    self.check_single_server, server["url"], self.ssl_verify, self.ssl_check, self.timeout
+                ): index
+                for index, server in enumerate(servers)
+            }
+            for future in as_completed(futures):
+                if not self.running:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                index = futures[future]
+                status = future.result()
+                status["name"] = servers[index]["name"]
+                server_statuses[index] = status
+                self.server_checked.emit(status)
+
+        self.status_updated.emit([status for status in server_statuses if status is not None])
 
     def check_single_server(self, server: str, ssl_verify: bool, ssl_check: bool, timeout: int) -> dict:
         ping_result = self.ping_server(server, ssl_verify, ssl_check, timeout)
@@ -99,26 +147,19 @@ class ServerCheckWorker(QThread):
         final_hostname = server
         url = f"https://{server}" if ssl_check else f"http://{server}"
 
-        # Configure SSL context if needed
-        context = ssl.create_default_context() if not ssl_verify else None
-        if context:
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
         try:
-            start_time = datetime.now()
-            request = urllib.request.Request(url, method="GET")
+            start_time = time.perf_counter()
 
             try:
-                with urllib.request.urlopen(request, timeout=timeout, context=context) as response:
-                    http_status = response.status
-                    parsed_url = urlparse(response.url)
-                    final_hostname = parsed_url.netloc or server
+                response = self._get_http_client().request("GET", url, timeout=timeout)
+                http_status = response.status
+                parsed_url = urlparse(response.url)
+                final_hostname = parsed_url.netloc or server
             except urllib.error.HTTPError as e:
                 http_status = e.code
 
             if http_status is not None:
-                response_time = int((datetime.now() - start_time).total_seconds() * 1000)
+                response_time = int((time.perf_counter() - start_time) * 1000)
 
         except OSError as e:
             reason = str(e).lower()
@@ -150,6 +191,15 @@ class ServerCheckWorker(QThread):
         }
 
     def check_ssl_expiry(self, hostname: str, timeout: int) -> int | None:
+        cached = self._ssl_expiry_cache.get(hostname)
+        if cached is not None and time.monotonic() - cached[0] < SSL_EXPIRY_CACHE_TTL:
+            return cached[1]
+        days = self._fetch_ssl_expiry(hostname, timeout)
+        if days is not None:
+            self._ssl_expiry_cache[hostname] = (time.monotonic(), days)
+        return days
+
+    def _fetch_ssl_expiry(self, hostname: str, timeout: int) -> int | None:
         try:
             context = ssl.create_default_context()
             with socket.create_connection((hostname, 443), timeout=timeout) as sock:
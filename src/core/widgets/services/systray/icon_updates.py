@@ -0,0 +1,221 @@
+"""
+Coalescing and deduplication of systray icon updates.
+
+Apps that animate their tray icon send NIM_MODIFY many times per second. Updates for the same
+(hWnd, uID) are merged so at most one is processed per frame: the first update after a quiet
+period goes out immediately, later ones are held until the frame ends and only the merged result
+is processed. Processing resolves the owning exe (memoized per window) and converts the icon,
+where converted images are shared by pixel hash so a recurring animation frame is converted once.
+An update that changes nothing compared to what was last emitted for the icon is dropped.
+
+This module has no Win32 dependencies, the exe lookup and the icon rendering are injected.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from pathlib import Path
+from uuid import UUID
+
+from PIL import Image
+from PIL.ImageFilter import SHARPEN
+from PIL.ImageQt import ImageQt
+from PyQt6.QtGui import QImage
+
+from core.utils.win32.constants import NIF_GUID, NIF_ICON, NIF_INFO, NIF_MESSAGE, NIF_STATE, NIF_TIP, NIM_ADD
+
+# One frame at 60 Hz
+FRAME_INTERVAL = 1 / 60
+MAX_CACHED_ICON_IMAGES = 256
+
+ICON_SIZE = 32
+
+
+@dataclass
+class IconData:
+    """Data class for validated systray icon data"""
+
+    message_type: int = 0
+    hWnd: int = 0
+    uID: int = 0
+    guid: UUID | None = None
+    uFlags: int = 0
+    dwState: int = 0
+    dwStateMask: int = 0
+    hIcon: int = 0
+    szTip: str = ""
+    szInfo: str = ""
+    szInfoTitle: str = ""
+    dwInfoFlags: int = 0
+    uTimeout: int = 0
+    uCallbackMessage: int = 0
+    uVersion: int = 0
+    icon_image: QImage | None = None
+    exe: str = ""
+    exe_path: str = ""
+
+
+FLAG_DEPENDENT_ATTRS = {
+    NIF_MESSAGE: ("uCallbackMessage",),
+    NIF_ICON: ("hIcon",),
+    NIF_TIP: ("szTip",),
+    NIF_STATE: ("dwState", "dwStateMask"),
+    NIF_GUID: ("guid",),
+    NIF_INFO: ("dwInfoFlags", "szInfoTitle", "szInfo", "uTimeout"),
+}
+
+# Handles change with every NIM_MODIFY even when the pixels don't, the pixel hash stands in for them
+_SIGNATURE_FIELDS = tuple(f.name for f in fields(IconData) if f.name not in ("icon_image", "hIcon"))
+
+
+def render_icon_image(image: Image.Image) -> QImage:
+    """Convert a tray icon to a QImage of consistent size"""
+    if image.size != (ICON_SIZE, ICON_SIZE):
+        image = image.resize((ICON_SIZE, ICON_SIZE), Image.Resampling.LANCZOS).filter(SHARPEN)  # pyright: ignore [reportUnknownMemberType]
+    return QImage(ImageQt(image)).copy()
+
+
+def icon_pixel_hash(image: Image.Image) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}|{image.width}x{image.height}|".encode())
+    digest.update(image.tobytes())
+    return digest.digest()
+
+
+def merge_icon_data(old: IconData, new: IconData) -> IconData:
+    """Fold ``new`` into ``old`` the way consecutive updates apply to an icon; returns ``old``"""
+    if new.message_type == NIM_ADD or old.message_type != NIM_ADD:
+        old.message_type = new.message_type
+    old.hWnd = new.hWnd or old.hWnd
+    old.uID = new.uID or old.uID
+    if 0 < new.uVersion <= 4:
+        old.uVersion = new.uVersion
+    old.uFlags |= new.uFlags
+    for flag, attrs in FLAG_DEPENDENT_ATTRS.items():
+        if new.uFlags & flag:
+            for attr in attrs:
+                setattr(old, attr, getattr(new, attr))
+    return old
+
+
+class _Pending:
+    __slots__ = ("data", "image")
+
+    def __init__(self, data: IconData, image: Image.Image | None):
+        self.data = data
+        self.image = image
+
+
+class IconUpdateQueue:
+    """
+    Per-icon coalescing of NIM_ADD/NIM_MODIFY updates, used from a single thread.
+
+    ``push`` returns the updates to emit right away, ``flush`` the held ones once
+    ``next_flush_in`` has elapsed. ``discard`` must be called for NIM_DELETE so held
+    updates of a removed icon are never emitted after its deletion.
+    """
+
+    def __init__(
+        self,
+        exe_path_for_hwnd: Callable[[int], str | None],
+        render: Callable[[Image.Image], QImage] = render_icon_image,
+        interval: float = FRAME_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        max_images: int = MAX_CACHED_ICON_IMAGES,
+    ):
+        self._exe_path_for_hwnd = exe_path_for_hwnd
+        self._render = render
+        self._interval = interval
+        self._clock = clock
+        self._max_images = max_images
+        self._pending: dict[tuple[int, int], _Pending] = {}
+        # (hWnd, uID) -> when it was last processed
+        self._last_processed: dict[tuple[int, int], float] = {}
+        # (hWnd, uID) -> signature of the last emitted update
+        self._last_emitted: dict[tuple[int, int], tuple] = {}
+        self._exe_paths: dict[int, str | None] = {}
+        self._images: OrderedDict[bytes, QImage] = OrderedDict()
+
+    def push(self, data: IconData, image: Image.Image | None = None) -> list[IconData]:
+        """Queue an update with its raw icon image (if NIF_ICON); returns what to emit now"""
+        key = (data.hWnd, data.uID)
+        pending = self._pending.get(key)
+        if pending is not None:
+            merge_icon_data(pending.data, data)
+            if data.uFlags & NIF_ICON:
+                pending.image = image
+            return []
+
+        now = self._clock()
+        last = self._last_processed.get(key)
+        if last is None or now - last >= self._interval or data.message_type == NIM_ADD:
+            processed = self._process(key, data, image, now)
+            return [processed] if processed is not None else []
+
+        self._pending[key] = _Pending(data, image)
+        return []
+
+    def next_flush_in(self) -> float | None:
+        """Seconds until held updates are due, or None if nothing is held"""
+        if not self._pending:
+            return None
+        now = self._clock()
+        due = min(self._last_processed.get(key, now) + self._interval for key in self._pending)
+        return max(0.0, due - now)
+
+    def flush(self) -> list[IconData]:
+        """Process held updates that are due; returns what to emit"""
+        now = self._clock()
+        emitted = []
+        for key, pending in list(self._pending.items()):
+            if now - self._last_processed.get(key, now - self._interval) < self._interval:
+                continue
+            del self._pending[key]
+            processed = self._process(key, pending.data, pending.image, now)
+            if processed is not None:
+                emitted.append(processed)
+        return emitted
+
+    def discard(self, hwnd: int, uid: int) -> None:
+        """Forget an icon on NIM_DELETE"""
+        key = (hwnd, uid)
+        self._pending.pop(key, None)
+        self._last_processed.pop(key, None)
+        self._last_emitted.pop(key, None)
+        if not any(other[0] == hwnd for other in self._last_processed):
+            self._exe_paths.pop(hwnd, None)
+
+    def _process(self, key: tuple[int, int], data: IconData, image: Image.Image | None, now: float) -> IconData | None:
+        self._last_processed[key] = now
+
+        # NIM_ADD re-resolves, the window handle may have been reused by another process
+        if data.message_type == NIM_ADD or data.hWnd not in self._exe_paths:
+            self._exe_paths[data.hWnd] = self._exe_path_for_hwnd(data.hWnd)
+        exe_path = self._exe_paths[data.hWnd]
+        if exe_path is not None:
+            data.exe_path = exe_path
+            data.exe = Path(exe_path).name.split(".")[0] if exe_path else ""
+
+        pixel_hash = None
+        if data.uFlags & NIF_ICON and image is not None:
+            pixel_hash = icon_pixel_hash(image)
+            data.icon_image = self._image_for(pixel_hash, image)
+
+        signature = (tuple(getattr(data, name) for name in _SIGNATURE_FIELDS), bool(data.hIcon), pixel_hash)
+        if data.message_type != NIM_ADD and self._last_emitted.get(key) == signature:
+            return None
+        self._last_emitted[key] = signature
+        return data
+
+    def _image_for(self, pixel_hash: bytes, image: Image.Image) -> QImage:
+        cached = self._images.get(pixel_hash)
+        if cached is not None:
+            self._images.move_to_end(pixel_hash)
+            return cached
+        rendered = self._render(image)
+        self._images[pixel_hash] = rendered
+        while len(self._images) > self._max_images:
+            self._images.popitem(last=False)
+        return rendered
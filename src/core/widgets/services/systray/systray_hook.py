@@ -38,12 +38,15 @@ from core.utils.win32.constants import (
     WH_GETMESSAGE,
 )
 from core.utils.win32.structs import NOTIFYICONDATA, SHELLTRAYDATA
+from core.widgets.services.systray.icon_updates import IconUpdateQueue
 from core.widgets.services.systray.utils import (
     IconData,
     get_dll_path,
+    get_exe_path_from_hwnd,
     get_explorer_pid,
     is_dll_loaded,
-    validate_icon_data,
+    read_icon_data,
+    read_icon_image,
 )
 
 logger = logging.getLogger("systray_hook")
@@ -124,6 +127,7 @@ class SystrayHook(QObject):
         self._h_mutex = None
         self._message_pipe = None
         self._h_hook: int = 0
+        self._icon_updates = IconUpdateQueue(get_exe_path_from_hwnd)
 
         # Create the watchdog mutex — held for entire lifetime.
         try:
@@ -244,7 +248,8 @@ class SystrayHook(QObject):
 
                         if hr == winerror.ERROR_IO_PENDING:
                             while self._running:
-                                wait_res = win32event.WaitForSingleObject(h_event, 500)
+                                wait_res = win32event.WaitForSingleObject(h_event, self._icon_flush_timeout(500))
+                                self._flush_icon_updates()
                                 if wait_res == win32event.WAIT_OBJECT_0:
                                     break
                             if not self._running:
@@ -268,6 +273,7 @@ class SystrayHook(QObject):
                         break
                     if chunks:
                         self.process_message(b"".join(chunks))
+                        self._flush_icon_updates()
             except Exception as e:
                 # Avoid logging error if shutting down
                 if self._running:
@@ -316,10 +322,15 @@ class SystrayHook(QObject):
                 icon = Image.frombuffer("RGBA", (icon_w, icon_h), rgba_bytes, "raw", "RGBA", 0, 1)  # type: ignore
 
             if tray_message.message_type in {NIM_ADD, NIM_MODIFY, NIM_SETVERSION}:
-                validated_data = validate_icon_data(icon_data, icon)
+                validated_data = read_icon_data(icon_data)
                 validated_data.message_type = tray_message.message_type
-                self.icon_modified.emit(validated_data)
+                # The hook usually copies the icon pixels, fall back to reading the HICON
+                if icon is None:
+                    icon = read_icon_image(icon_data)
+                for data in self._icon_updates.push(validated_data, icon):
+                    self.icon_modified.emit(data)
             elif tray_message.message_type == NIM_DELETE:
+                self._icon_updates.discard(icon_data.hWnd, icon_data.uID)
                 self.icon_deleted.emit(
                     IconData(
                         hWnd=icon_data.hWnd,
@@ -327,3 +338,14 @@ class SystrayHook(QObject):
                         guid=icon_data.guidItem.to_uuid() if icon_data.uFlags & NIF_GUID else None,
                     )
                 )
+
+    def _icon_flush_timeout(self, timeout_ms: int) -> int:
+        """Shorten a pipe wait so held icon updates go out at the end of their frame"""
+        delay = self._icon_updates.next_flush_in()
+        if delay is None:
+            return timeout_ms
+        return min(timeout_ms, max(1, round(delay * 1000)))
+
+    def _flush_icon_updates(self) -> None:
+        for data in self._icon_updates.flush():
+            self.icon_modified.emit(data)
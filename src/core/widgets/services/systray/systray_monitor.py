@@ -28,6 +28,7 @@ from core.utils.win32.bindings import (
     DefWindowProc,
     DestroyWindow,
     IsWindow,
+    KillTimer,
     PostMessage,
     RegisterWindowMessage,
     SendMessage,
@@ -48,12 +49,15 @@ from core.utils.win32.structs import (
     SHELLTRAYDATA,
     WINNOTIFYICONIDENTIFIER,
 )
+from core.widgets.services.systray.icon_updates import IconUpdateQueue
 from core.widgets.services.systray.utils import (
     IconData,
     NativeWindowEx,
     find_real_tray_hwnd,
+    get_exe_path_from_hwnd,
     pack_i32,
-    validate_icon_data,
+    read_icon_data,
+    read_icon_image,
 )
 
 logger = logging.getLogger("systray_widget")
@@ -64,6 +68,10 @@ kernel32 = windll.kernel32
 
 WM_TASKBARCREATED = RegisterWindowMessage("TaskbarCreated")
 
+TOPMOST_TIMER_ID = 1
+# Fires once the held icon updates of the current frame are due
+ICON_FLUSH_TIMER_ID = 2
+
 
 class SystrayMonitor(QObject):
     """Main class to handle systray message interception and forwarding"""
@@ -77,6 +85,8 @@ class SystrayMonitor(QObject):
         self.hwnd: int = 0
         self.real_tray_hwnd: int = 0
         self._is_destroyed: bool = False
+        self._icon_updates = IconUpdateQueue(get_exe_path_from_hwnd)
+        self._flush_timer_set = False
 
         try:
             self.destroyed.connect(lambda: setattr(self, "_is_destroyed", True))
@@ -93,7 +103,7 @@ class SystrayMonitor(QObject):
         SetWindowPos(self.hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
 
         # Set a timer to keep the window as a foreground window to keep receiving messages
-        SetTimer(self.hwnd, 1, 100, None)
+        SetTimer(self.hwnd, TOPMOST_TIMER_ID, 100, None)
 
         self.update_icons.emit()
         self.tray_monitor_window.start_message_loop()
@@ -135,6 +145,12 @@ class SystrayMonitor(QObject):
             self.set_taskbar_list_hwnd()
             return 0
         elif uMsg == WM_TIMER:
+            if wParam == ICON_FLUSH_TIMER_ID:
+                KillTimer(hwnd, ICON_FLUSH_TIMER_ID)
+                self._flush_timer_set = False
+                self._emit_icon_updates(self._icon_updates.flush())
+                self._schedule_icon_flush(hwnd)
+                return 0
             # We need to set our window topmost to have the priority over the native system tray
             SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
             return 0
@@ -155,14 +171,14 @@ class SystrayMonitor(QObject):
             tray_message = cast(copy_data.lpData, POINTER(SHELLTRAYDATA)).contents
             icon_data: NOTIFYICONDATA = tray_message.icon_data
             if tray_message.message_type in {NIM_ADD, NIM_MODIFY, NIM_SETVERSION}:
-                validated_data = validate_icon_data(icon_data)
+                validated_data = read_icon_data(icon_data)
                 validated_data.message_type = tray_message.message_type
-                if not self._is_destroyed:
-                    try:
-                        self.icon_modified.emit(validated_data)
-                    except RuntimeError:
-                        return 0
+                updates = self._icon_updates.push(validated_data, read_icon_image(icon_data))
+                if not self._emit_icon_updates(updates):
+                    return 0
+                self._schedule_icon_flush(hwnd)
             elif tray_message.message_type == NIM_DELETE:
+                self._icon_updates.discard(icon_data.hWnd, icon_data.uID)
                 if not self._is_destroyed:
                     try:
                         self.icon_deleted.emit(
@@ -191,6 +207,25 @@ class SystrayMonitor(QObject):
         else:
             return self.forward_message(hwnd, uMsg, wParam, lParam)
 
+    def _emit_icon_updates(self, updates: list[IconData]) -> bool:
+        """Emit processed icon updates; returns False once the receiver side is gone"""
+        if self._is_destroyed:
+            return False
+        try:
+            for data in updates:
+                self.icon_modified.emit(data)
+        except RuntimeError:
+            return False
+        return True
+
+    def _schedule_icon_flush(self, hwnd: int):
+        """Arm the flush timer while icon updates are held back"""
+        delay = self._icon_updates.next_flush_in()
+        if delay is None or self._flush_timer_set:
+            return
+        SetTimer(hwnd, ICON_FLUSH_TIMER_ID, max(1, round(delay * 1000)), None)
+        self._flush_timer_set = True
+
     def forward_message(self, hwnd: int, msg: int, wParam: int, lParam: int):
         """Forward messages to the real tray window"""
         if not self.real_tray_hwnd or not IsWindow(self.real_tray_hwnd):
@@ -14,14 +14,8 @@ from ctypes.wintypes import (
     MSG,
     POINT,
 )
-from dataclasses import dataclass
-from pathlib import Path
-from uuid import UUID
 
 from PIL import Image
-from PIL.ImageFilter import SHARPEN
-from PIL.ImageQt import ImageQt
-from PyQt6.QtGui import QImage
 from win32con import (
     PROCESS_QUERY_INFORMATION,
     PROCESS_VM_READ,
@@ -57,6 +51,7 @@ from core.utils.win32.constants import (
 )
 from core.utils.win32.structs import NOTIFYICONDATA, WNDCLASS, WNDPROC
 from core.utils.win32.utils import get_windows_host_arch
+from core.widgets.services.systray.icon_updates import IconData
 from settings import IS_FROZEN
 
 logger = logging.getLogger("systray_widget")
@@ -66,30 +61,6 @@ gdi32 = windll.gdi32
 kernel32 = windll.kernel32
 
 
-@dataclass
-class IconData:
-    """Data class for validated systray icon data"""
-
-    message_type: int = 0
-    hWnd: int = 0
-    uID: int = 0
-    guid: UUID | None = None
-    uFlags: int = 0
-    dwState: int = 0
-    dwStateMask: int = 0
-    hIcon: int = 0
-    szTip: str = ""
-    szInfo: str = ""
-    szInfoTitle: str = ""
-    dwInfoFlags: int = 0
-    uTimeout: int = 0
-    uCallbackMessage: int = 0
-    uVersion: int = 0
-    icon_image: QImage | None = None
-    exe: str = ""
-    exe_path: str = ""
-
-
 class NativeWindowEx:
     """
     Native window utility class
@@ -196,21 +167,16 @@ def array_to_str(array: bytes) -> str:
     return "".join(chr(c) for c in array[:null_pos]).replace("\r", "")
 
 
-def validate_icon_data(data: NOTIFYICONDATA, icon: Image.Image | None = None) -> IconData:
+def read_icon_data(data: NOTIFYICONDATA) -> IconData:
     """
-    Validates and processes raw icon data
-    Pre-processed icon can be also passed
+    Copies the raw icon data into an IconData
+    The owning exe and the icon image are filled in by IconUpdateQueue
     """
     icon_data = IconData()
     icon_data.hWnd = data.hWnd
     icon_data.uID = data.uID
     icon_data.uFlags = data.uFlags
 
-    exe_path = get_exe_path_from_hwnd(icon_data.hWnd)
-    if exe_path is not None:
-        icon_data.exe_path = exe_path
-        icon_data.exe = Path(exe_path).name.split(".")[0] if exe_path else ""
-
     if 0 < data.anonymous.uVersion <= 4:
         icon_data.uVersion = data.anonymous.uVersion
 
@@ -219,15 +185,6 @@ def validate_icon_data(data: NOTIFYICONDATA, icon: Image.Image | None = None) ->
 
     if data.uFlags & NIF_ICON:
         icon_data.hIcon = data.hIcon
-        if not icon:
-            icon_image = hicon_to_image(icon_data.hIcon)
-        else:
-            icon_image = icon
-        if icon_image is not None:
-            if icon_image.size != (32, 32):  # Ensure we have consistent icon sizes
-                icon_image = icon_image.resize((32, 32), Image.Resampling.LANCZOS).filter(SHARPEN)  # pyright: ignore [reportUnknownMemberType]
-            icon_image = QImage(ImageQt(icon_image)).copy()
-        icon_data.icon_image = icon_image
 
     if data.uFlags & NIF_TIP:
         icon_data.szTip = array_to_str(data.szTip)
@@ -247,6 +204,16 @@ def validate_icon_data(data: NOTIFYICONDATA, icon: Image.Image | None = None) ->
     return icon_data
 
 
+def read_icon_image(data: NOTIFYICONDATA) -> Image.Image | None:
+    """
+    Reads the icon pixels right away, the sending app may destroy the HICON after the call
+    Returns None if the update carries no icon
+    """
+    if not data.uFlags & NIF_ICON:
+        return None
+    return hicon_to_image(data.hIcon)
+
+
 def find_real_tray_hwnd(hwnd_ignore: int | None = None):
     hwnd = 0
     while True:
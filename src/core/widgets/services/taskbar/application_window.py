@@ -1,5 +1,6 @@
 import ctypes
 import logging
+from enum import StrEnum
 
 import win32api
 import win32con
@@ -12,6 +13,33 @@ logger = logging.getLogger("application_window")
 logger.setLevel(logging.WARNING)
 
 
+class WindowChange(StrEnum):
+    """Window properties reported as changed by ``window_updated``."""
+
+    TITLE = "title"
+    CLASS_NAME = "class_name"
+    ACTIVE = "is_active"
+    FLASHING = "is_flashing"
+    CLOAKED = "is_cloaked"
+    MONITOR = "monitor_handle"
+    PROCESS = "process"
+
+
+ALL_WINDOW_CHANGES = frozenset(WindowChange)
+
+_PROCESS_KEYS = ("process_name", "process_pid", "process_path")
+
+
+def diff_window_data(old: dict, new: dict) -> frozenset[WindowChange]:
+    """Return the changes between two ``ApplicationWindow.as_dict()`` snapshots."""
+    changes = {
+        change for change in WindowChange if change is not WindowChange.PROCESS and old.get(change) != new.get(change)
+    }
+    if any(old.get(key) != new.get(key) for key in _PROCESS_KEYS):
+        changes.add(WindowChange.PROCESS)
+    return frozenset(changes)
+
+
 class ApplicationWindow:
     """
     Represents a top-level window tracked by the taskbar.
@@ -36,7 +64,13 @@ class ApplicationWindow:
         self.process_pid = 0
         self.process_path = None
 
+        # Cached Win32 state, refreshed by the manager on the events that change it
+        self.is_cloaked = False
+        self.monitor_handle = None
+
         self._refresh_process_info()
+        self.refresh_cloaked()
+        self.refresh_monitor()
 
         # Default ignored processes
         default_ignored_processes = {"SearchHost.exe"}
@@ -69,29 +103,37 @@ class ApplicationWindow:
         self.excluded_classes.update(default_system_classes)
 
     def as_dict(self):
-        # Get monitor handle for this window
-        monitor_handle = None
-        try:
-            mh = win32api.MonitorFromWindow(self.hwnd, 0)
-            monitor_handle = int(mh) if mh is not None else None
-        except Exception:
-            pass
-
-        self._refresh_process_info()
-
+        """Snapshot of the cached state, makes no Win32 calls."""
         return {
             "hwnd": self.hwnd,
             "title": self.title,
             "class_name": self.class_name,
             "is_active": self.is_active,
             "is_flashing": self.is_flashing,
-            "is_cloaked": self._is_cloaked(),
-            "monitor_handle": monitor_handle,
+            "is_cloaked": self.is_cloaked,
+            "monitor_handle": self.monitor_handle,
             "process_name": self.process_name,
             "process_pid": self.process_pid,
             "process_path": self.process_path,
         }
 
+    def refresh_monitor(self) -> bool:
+        """Re-query the monitor the window is on; returns True if it changed."""
+        monitor_handle = None
+        try:
+            mh = win32api.MonitorFromWindow(self.hwnd, 0)
+            monitor_handle = int(mh) if mh is not None else None
+        except Exception:
+            pass
+        changed = monitor_handle != self.monitor_handle
+        self.monitor_handle = monitor_handle
+        return changed
+
+    def refresh_cloaked(self) -> bool:
+        """Re-query the DWM cloak state and return it."""
+        self.is_cloaked = self._is_cloaked()
+        return self.is_cloaked
+
     def _refresh_process_info(self) -> None:
         """Refresh cached process information for this window."""
         try:
@@ -220,7 +262,7 @@ class ApplicationWindow:
                 return False
 
             # Cloaked UWP windows should not appear
-            if self._is_cloaked():
+            if self.refresh_cloaked():
                 return False
             # Immersive shell windows should not appear
             if self._is_immersive_shell_window():
@@ -243,15 +285,20 @@ class ApplicationWindow:
             return False
 
     def update(self):
-        """Refresh cached title/class; returns True if anything changed."""
+        """Refresh cached title/class/cloak state; returns True if anything changed."""
         old_title = self.title
         old_class_name = self.class_name
+        old_cloaked = self.is_cloaked
 
         self.title = self._get_title()
         self.class_name = self._get_class_name()
-        # is_active is managed by the window manager
+        self.refresh_cloaked()
+        # The owning process never changes, only retry when it couldn't be resolved yet
+        if not self.process_pid or not self.process_name:
+            self._refresh_process_info()
+        # is_active is managed by the window manager, monitor_handle by HSHELL_MONITORCHANGED
 
-        return old_title != self.title or old_class_name != self.class_name
+        return old_title != self.title or old_class_name != self.class_name or old_cloaked != self.is_cloaked
 
     def __eq__(self, other):
         """Two ApplicationWindow objects are equal if they wrap the same hwnd."""
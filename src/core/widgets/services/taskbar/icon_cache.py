@@ -0,0 +1,125 @@
+"""
+Window icon pixmaps shared by all taskbar widgets.
+
+Pixmaps are keyed by the content of the icon the window reports (plus target size and DPI), so
+windows of the same app and Explorer folders with the same icon share one pixmap, and a cache hit
+costs no PIL resize or QImage conversion. Each window remembers which icon it showed for a given
+title, which lets repeated updates skip the Win32 icon extraction too.
+
+The number of pixmaps is bounded by an LRU and window entries are dropped when the window closes,
+so a long session with heavy window churn can't grow the cache without limit.
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+
+from PIL import Image
+from PyQt6.QtGui import QImage, QPixmap
+
+# Enough for every running app at a couple of DPIs plus recently closed ones
+MAX_CACHED_ICONS = 256
+
+
+def icon_digest(image: Image.Image) -> bytes:
+    """Content hash of an icon image, independent of the window it came from."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}|{image.width}x{image.height}|".encode())
+    digest.update(image.tobytes())
+    return digest.digest()
+
+
+def icon_to_pixmap(image: Image.Image, pixel_size: int, dpr: float) -> QPixmap:
+    """Resize ``image`` to ``pixel_size`` device pixels and convert it to a QPixmap."""
+    image = image.resize((pixel_size, pixel_size), Image.LANCZOS).convert("RGBA")
+    qimage = QImage(image.tobytes(), image.width, image.height, QImage.Format.Format_RGBA8888)
+    pixmap = QPixmap.fromImage(qimage)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+class TaskbarIconCache:
+    """Bounded LRU of ready to use window icon pixmaps. Must be used from the GUI thread."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> TaskbarIconCache:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_icons: int = MAX_CACHED_ICONS):
+        self._max_icons = max_icons
+        # (digest, pixel_size, dpr) -> QPixmap
+        self._pixmaps: OrderedDict[tuple[bytes, int, float], QPixmap] = OrderedDict()
+        # hwnd -> (title, digest) of the icon last read for that window
+        self._windows: dict[int, tuple[str, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    @property
+    def window_count(self) -> int:
+        return len(self._windows)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate pixel memory held by the cached pixmaps."""
+        return sum(p.width() * p.height() * max(1, p.depth() // 8) for p in self._pixmaps.values())
+
+    def get(
+        self,
+        hwnd: int,
+        title: str,
+        pixel_size: int,
+        dpr: float,
+        read_icon: Callable[[int], Image.Image | None],
+    ) -> QPixmap | None:
+        """
+        Return the icon pixmap for ``hwnd``, reading it with ``read_icon(hwnd)`` only when needed.
+
+        ``title`` is part of the window key for windows whose icon follows their title (Explorer),
+        pass an empty string for everything else.
+        """
+        known = self._windows.get(hwnd)
+        if known is not None and known[0] == title:
+            pixmap = self._lookup((known[1], pixel_size, dpr))
+            if pixmap is not None:
+                return pixmap
+
+        image = read_icon(hwnd)
+        if not image:
+            return None
+
+        digest = icon_digest(image)
+        self._windows[hwnd] = (title, digest)
+        key = (digest, pixel_size, dpr)
+        pixmap = self._lookup(key)
+        if pixmap is None:
+            pixmap = icon_to_pixmap(image, pixel_size, dpr)
+            self._pixmaps[key] = pixmap
+            while len(self._pixmaps) > self._max_icons:
+                self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def forget_window(self, hwnd: int) -> None:
+        """Drop a closed window and the pixmaps no other window uses."""
+        known = self._windows.pop(hwnd, None)
+        if known is None:
+            return
+        digest = known[1]
+        if any(other[1] == digest for other in self._windows.values()):
+            return
+        for key in [key for key in self._pixmaps if key[0] == digest]:
+            del self._pixmaps[key]
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._windows.clear()
+
+    def _lookup(self, key: tuple[bytes, int, float]) -> QPixmap | None:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
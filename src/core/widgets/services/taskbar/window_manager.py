@@ -17,7 +17,7 @@ from core.utils.win32.bindings import (
 from core.utils.win32.bindings import user32 as _user32_raw
 from core.utils.win32.bindings.ole32 import ole32
 from core.utils.win32.structs import MSG
-from core.widgets.services.taskbar.application_window import ApplicationWindow
+from core.widgets.services.taskbar.application_window import ApplicationWindow, WindowChange, diff_window_data
 
 logger = logging.getLogger("taskbar_window_manager")
 logger.setLevel(logging.INFO)
@@ -139,12 +139,13 @@ class TaskbarWindowManager(QObject):
     """
     Tracks top-level windows and emits signals on create/destroy/update/activation.
     Receives SHELLHOOK via the application's Qt top-level window; uses WinEvent hooks for cloak changes.
+    ``window_updated`` carries the window snapshot and the frozenset of WindowChange that caused it.
     """
 
     # Signal definitions for Qt integration
     window_added = pyqtSignal(int, dict)
     window_removed = pyqtSignal(int, dict)
-    window_updated = pyqtSignal(int, dict)
+    window_updated = pyqtSignal(int, dict, frozenset)
     window_monitor_changed = pyqtSignal(int, dict)
 
     # Windows constants (subset)
@@ -153,6 +154,8 @@ class TaskbarWindowManager(QObject):
     def __init__(self, excluded_classes=None, ignored_processes=None, ignored_titles=None, strict_filtering=False):
         super().__init__()
         self._windows = {}
+        # Only one window is active at a time, tracking it keeps focus switches O(1)
+        self._active_hwnd = None
         self._initialized = False
         self._shell_hook_registered = False
         self._shell_hook_hwnd = None
@@ -370,57 +373,49 @@ class TaskbarWindowManager(QObject):
     def _on_window_activated(self, hwnd):
         """Mark activated window active and clear flashing; emit updates for state changes."""
         try:
-            foreground_hwnd = GetForegroundWindow()
-
-            if not hwnd and foreground_hwnd:
-                hwnd = foreground_hwnd
-
-            windows_to_update = set()
-            old_states = {}
-
-            for window_hwnd, window in self._windows.items():
-                if hasattr(window, "is_active"):
-                    old_states[window_hwnd] = window.is_active
+            if not hwnd:
+                hwnd = GetForegroundWindow()
 
-            for window_hwnd, window in self._windows.items():
-                if hasattr(window, "is_active"):
-                    window.is_active = False
-                    if old_states.get(window_hwnd, False) != window.is_active:
-                        windows_to_update.add(window_hwnd)
+            windows_to_update = self._set_active_window(hwnd)
 
-            if hwnd and hwnd in self._windows:
-                window = self._windows[hwnd]
-                if hasattr(window, "is_active"):
-                    window.is_active = True
-                    if old_states.get(hwnd, False) != window.is_active:
-                        windows_to_update.add(hwnd)
-                if hasattr(window, "is_flashing") and window.is_flashing:
-                    window.is_flashing = False
-                    windows_to_update.add(hwnd)
-            elif hwnd:
+            if hwnd and hwnd not in self._windows:
                 self._add_window(hwnd, is_active=True)
-            else:
-                if foreground_hwnd and foreground_hwnd in self._windows:
-                    window = self._windows[foreground_hwnd]
-                    if hasattr(window, "is_active"):
-                        window.is_active = True
-                        if old_states.get(foreground_hwnd, False) != window.is_active:
-                            windows_to_update.add(foreground_hwnd)
-                    if hasattr(window, "is_flashing") and window.is_flashing:
-                        window.is_flashing = False
-                        windows_to_update.add(foreground_hwnd)
-
-            for window_hwnd in windows_to_update:
-                if window_hwnd in self._windows:
-                    window_data = self._windows[window_hwnd].as_dict()
-                    self.window_updated.emit(window_hwnd, window_data)
-
-            # if hwnd and hwnd in self._windows:
-            #    self._debounce_update(hwnd, delay=60)
+
+            for window_hwnd, changes in windows_to_update.items():
+                window = self._windows.get(window_hwnd)
+                if window is not None:
+                    self.window_updated.emit(window_hwnd, window.as_dict(), changes)
 
         except Exception as e:
             logger.error("Error handling window activated for %s: %s", hwnd, e)
 
+    def _set_active_window(self, hwnd) -> dict[int, frozenset[WindowChange]]:
+        """Move the active flag from the previous window to ``hwnd``; returns the changes per hwnd."""
+        changed = {}
+        previous = self._active_hwnd
+        if previous is not None and previous != hwnd:
+            window = self._windows.get(previous)
+            if window is not None and window.is_active:
+                window.is_active = False
+                changed[previous] = frozenset({WindowChange.ACTIVE})
+
+        window = self._windows.get(hwnd) if hwnd else None
+        if window is None:
+            self._active_hwnd = None
+            return changed
+
+        self._active_hwnd = hwnd
+        changes = set()
+        if not window.is_active:
+            window.is_active = True
+            changes.add(WindowChange.ACTIVE)
+        if window.is_flashing:
+            window.is_flashing = False
+            changes.add(WindowChange.FLASHING)
+        if changes:
+            changed[hwnd] = frozenset(changes)
+        return changed
+
     def _on_window_redraw(self, hwnd):
         """Update or add window on redraw notification."""
         try:
@@ -437,14 +432,9 @@ class TaskbarWindowManager(QObject):
         try:
             if hwnd in self._windows:
                 window = self._windows[hwnd]
-                if hasattr(window, "is_flashing"):
-                    was_flashing = window.is_flashing
+                if not window.is_flashing:
                     window.is_flashing = True
-                    if not was_flashing:
-                        window_data = window.as_dict()
-                        self.window_updated.emit(hwnd, window_data)
-                    else:
-                        self._update_window(hwnd)
+                    self.window_updated.emit(hwnd, window.as_dict(), frozenset({WindowChange.FLASHING}))
                 else:
                     self._update_window(hwnd)
             else:
@@ -469,13 +459,15 @@ class TaskbarWindowManager(QObject):
                 app_window = self._windows[hwnd]
                 old_data = app_window.as_dict()
 
+                app_window.refresh_monitor()
                 app_window.update()
                 new_data = app_window.as_dict()
 
                 self.window_monitor_changed.emit(hwnd, new_data)
 
-                if old_data != new_data:
-                    self.window_updated.emit(hwnd, new_data)
+                changes = diff_window_data(old_data, new_data)
+                if changes:
+                    self.window_updated.emit(hwnd, new_data, changes)
 
             else:
                 self._try_add_window_delayed(hwnd, delay=50)
@@ -520,8 +512,12 @@ class TaskbarWindowManager(QObject):
             if hwnd in self._windows:
                 # Already tracked force-emit so widgets that removed it while cloaked can re-add it
                 app_window = self._windows[hwnd]
+                old_data = app_window.as_dict()
                 app_window.update()
-                self.window_updated.emit(hwnd, app_window.as_dict())
+                # Virtual desktop switches uncloak windows that may have moved meanwhile
+                app_window.refresh_monitor()
+                new_data = app_window.as_dict()
+                self.window_updated.emit(hwnd, new_data, diff_window_data(old_data, new_data))
             else:
                 # Was removed while cloaked; add it back now that it's visible
                 self._add_window(hwnd)
@@ -570,13 +566,15 @@ class TaskbarWindowManager(QObject):
                 return
 
             # Set initial state
-            if hasattr(app_window, "is_active"):
-                app_window.is_active = is_active
-            if hasattr(app_window, "is_flashing"):
-                app_window.is_flashing = is_flashing
+            app_window.is_flashing = is_flashing
 
             # Add to collection
             self._windows[hwnd] = app_window
+            if is_active:
+                # Also clears the flag on the previously active window
+                for window_hwnd, changes in self._set_active_window(hwnd).items():
+                    if window_hwnd != hwnd:
+                        self.window_updated.emit(window_hwnd, self._windows[window_hwnd].as_dict(), changes)
 
             # Emit signal
             window_data = app_window.as_dict()
@@ -634,6 +632,8 @@ class TaskbarWindowManager(QObject):
                 app_window = self._windows[hwnd]
                 window_data = app_window.as_dict()
                 del self._windows[hwnd]
+                if self._active_hwnd == hwnd:
+                    self._active_hwnd = None
                 self.window_removed.emit(hwnd, window_data)
 
         except Exception as e:
@@ -661,19 +661,15 @@ class TaskbarWindowManager(QObject):
                             )
                             if is_uwp:
                                 new_data = app_window.as_dict()
-                                self.window_updated.emit(hwnd, new_data)
+                                self.window_updated.emit(hwnd, new_data, diff_window_data(old_data, new_data))
                                 return
                         except Exception:
                             pass
                     # If cloaked and preference says keep cloaked tasks, keep and emit
-                    try:
-                        is_cloaked = bool(app_window._is_cloaked())
-                    except Exception:
-                        is_cloaked = False
-
-                    if is_cloaked and getattr(self, "_keep_cloaked_tasks", False):
+                    # is_taskbar_window() just refreshed the cloak state
+                    if app_window.is_cloaked and getattr(self, "_keep_cloaked_tasks", False):
                         new_data = app_window.as_dict()
-                        self.window_updated.emit(hwnd, new_data)
+                        self.window_updated.emit(hwnd, new_data, diff_window_data(old_data, new_data))
                         return
 
                     # Otherwise remove
@@ -682,8 +678,9 @@ class TaskbarWindowManager(QObject):
 
                 new_data = app_window.as_dict()
 
-                if old_data != new_data:
-                    self.window_updated.emit(hwnd, new_data)
+                changes = diff_window_data(old_data, new_data)
+                if changes:
+                    self.window_updated.emit(hwnd, new_data, changes)
 
         except Exception as e:
             logger.error("Error updating window %s: %s", hwnd, e)
@@ -734,11 +731,7 @@ class TaskbarWindowManager(QObject):
 
             EnumWindows(enum_callback, 0)
 
-            foreground_hwnd = GetForegroundWindow()
-            if foreground_hwnd and foreground_hwnd in self._windows:
-                window = self._windows[foreground_hwnd]
-                if hasattr(window, "is_active"):
-                    window.is_active = True
+            self._set_active_window(GetForegroundWindow())
 
         except Exception as e:
             logger.error("Error enumerating existing windows: %s", e)
@@ -0,0 +1,271 @@
+"""
+Wallpaper listing and thumbnail caches shared by the gallery and the wallpaper manager.
+
+Directory listings are remembered together with the mtime of every directory that was walked,
+so a repeated listing only stats the directories instead of re-walking them.
+
+Thumbnails are rendered once per (path, mtime, size, target px, dpr) and stored as PNG files in
+the YASB data folder, with a small in-memory LRU on top for page flips and prefetching.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader, QPainter
+
+from core.utils.system import app_data_path
+
+WALLPAPER_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
+
+THUMBNAIL_DIR_NAME = "wallpaper_thumbnails"
+# Rendered thumbnails kept in memory, a few gallery pages worth
+MAX_MEMORY_THUMBNAILS = 128
+# Thumbnail files kept on disk, oldest are pruned once per session
+MAX_DISK_THUMBNAILS = 5000
+
+_listing_lock = threading.Lock()
+_listing_cache: dict[tuple[str, ...], tuple[dict[str, int], list[str]]] = {}
+
+_memory_lock = threading.Lock()
+_memory_cache: OrderedDict[str, QImage] = OrderedDict()
+_prune_started = False
+
+
+def _scan_directory(root: str, dir_mtimes: dict[str, int], files: list[str]) -> None:
+    """Collect wallpaper files below ``root`` and the mtime of every directory visited."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        # Like os.walk, links and junctions are not followed so a loop can't repeat files
+                        if entry.is_junction() or (entry.is_symlink() and entry.is_dir()):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(WALLPAPER_EXTENSIONS):
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.debug("Failed to scan wallpaper directory %s: %s", directory, e)
+
+
+def _listing_is_current(dir_mtimes: dict[str, int]) -> bool:
+    for directory, mtime in dir_mtimes.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def list_wallpapers(image_paths: str | list[str]) -> list[str]:
+    """
+    Return the sorted wallpaper files found below ``image_paths``.
+
+    The result is reused while none of the walked directories changed. Adding, removing or
+    renaming a file updates its parent directory mtime, which invalidates the listing.
+    """
+    if isinstance(image_paths, str):
+        image_paths = [image_paths]
+    key = tuple(image_paths)
+
+    with _listing_lock:
+        cached = _listing_cache.get(key)
+    if cached is not None:
+        dir_mtimes, files = cached
+        if _listing_is_current(dir_mtimes) and all(os.path.exists(path) == (path in dir_mtimes) for path in key):
+            return list(files)
+
+    dir_mtimes: dict[str, int] = {}
+    files: list[str] = []
+    for path in image_paths:
+        if not os.path.exists(path):
+            logging.warning("Invalid image path: %s", path)
+            continue
+        _scan_directory(path, dir_mtimes, files)
+    files.sort()
+
+    with _listing_lock:
+        _listing_cache[key] = (dir_mtimes, files)
+    return list(files)
+
+
+def thumbnail_key(image_path: str, width: int, height: int, dpr: float) -> str | None:
+    """Cache key for a thumbnail, or None if the source file can't be read."""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    raw = f"{os.path.normcase(os.path.abspath(image_path))}|{st.st_mtime_ns}|{st.st_size}|{width}x{height}|{dpr:.2f}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _thumbnail_dir() -> str:
+    folder = app_data_path(THUMBNAIL_DIR_NAME)
+    folder.mkdir(parents=True, exist_ok=True)
+    return str(folder)
+
+
+def cached_thumbnail(key: str) -> QImage | None:
+    """Return the in-memory thumbnail for ``key`` without touching the disk."""
+    with _memory_lock:
+        image = _memory_cache.get(key)
+        if image is not None:
+            _memory_cache.move_to_end(key)
+        return image
+
+
+def _remember(key: str, image: QImage) -> None:
+    with _memory_lock:
+        _memory_cache[key] = image
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MAX_MEMORY_THUMBNAILS:
+            _memory_cache.popitem(last=False)
+
+
+def render_thumbnail(image_path: str, width: int, height: int, dpr: float) -> QImage:
+    """
+    Decode ``image_path`` at a reduced size, filling and center-cropping the target area.
+
+    Returns a null QImage if the file can't be decoded.
+    """
+    target_w = int(width * dpr)
+    target_h = int(height * dpr)
+
+    # Get original image dimensions first
+    reader = QImageReader(image_path)
+    original_size = reader.size()
+
+    if not original_size.isValid():
+        # Fallback if we can't determine original size
+        reader.setScaledSize(QSize(target_w, target_h))
+        image = reader.read()
+    else:
+        # Calculate dimensions to FILL the target area (may crop edges)
+        orig_aspect = original_size.width() / original_size.height()
+        target_aspect = target_w / target_h if target_h != 0 else 1.0
+
+        if orig_aspect > target_aspect:
+            # Image is wider than target - scale to match height and crop width
+            scaled_height = target_h
+            scaled_width = int(scaled_height * orig_aspect)
+        else:
+            # Image is taller than target - scale to match width and crop height
+            scaled_width = target_w
+            scaled_height = int(scaled_width / orig_aspect) if orig_aspect != 0 else target_h
+
+        reader.setScaledSize(QSize(scaled_width, scaled_height))
+        image = reader.read()
+
+    if image.isNull():
+        logging.debug("Failed to decode wallpaper %s: %s", image_path, reader.errorString())
+        return image
+
+    # Transparent image of the target size, QImage so it can be painted off the GUI thread
+    thumbnail = QImage(target_w, target_h, QImage.Format.Format_ARGB32_Premultiplied)
+    thumbnail.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(thumbnail)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+
+    # Calculate position to center the image (may crop edges)
+    x = (target_w - image.width()) // 2
+    y = (target_h - image.height()) // 2
+
+    # Create source rectangle that ensures the image fills the target area
+    source_x = max(0, -x)
+    source_y = max(0, -y)
+    source_width = min(image.width() - source_x, target_w)
+    source_height = min(image.height() - source_y, target_h)
+
+    # Draw only the visible portion of the image
+    painter.drawImage(
+        QRect(max(0, x), max(0, y), source_width, source_height),
+        image,
+        QRect(source_x, source_y, source_width, source_height),
+    )
+    painter.end()
+    return thumbnail
+
+
+def load_thumbnail(image_path: str, width: int, height: int, dpr: float) -> QImage:
+    """
+    Return the thumbnail for ``image_path`` from memory, disk, or by rendering it.
+
+    Safe to call from worker threads. Freshly rendered thumbnails are written to the disk
+    cache through a temporary file so concurrent readers never see a partial PNG.
+    """
+    key = thumbnail_key(image_path, width, height, dpr)
+    if key is None:
+        return render_thumbnail(image_path, width, height, dpr)
+
+    image = cached_thumbnail(key)
+    if image is not None:
+        return image
+
+    _start_prune()
+    cache_file = os.path.join(_thumbnail_dir(), f"{key}.png")
+    if os.path.isfile(cache_file):
+        image = QImage(cache_file)
+        if not image.isNull():
+            try:
+                # Keep recently used thumbnails at the young end for pruning
+                os.utime(cache_file)
+            except OSError:
+                pass
+            _remember(key, image)
+            return image
+
+    image = render_thumbnail(image_path, width, height, dpr)
+    if not image.isNull():
+        tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        try:
+            if image.save(tmp_file, "PNG"):
+                os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logging.debug("Failed to write wallpaper thumbnail %s: %s", cache_file, e)
+        finally:
+            if os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+        _remember(key, image)
+    return image
+
+
+def _start_prune() -> None:
+    """Trim the disk cache to MAX_DISK_THUMBNAILS once per session, in the background."""
+    global _prune_started
+    with _memory_lock:
+        if _prune_started:
+            return
+        _prune_started = True
+    threading.Thread(target=_prune_disk_cache, name="WallpaperThumbnailPrune", daemon=True).start()
+
+
+def _prune_disk_cache() -> None:
+    try:
+        with os.scandir(_thumbnail_dir()) as entries:
+            thumbnails = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+    except OSError:
+        return
+    if len(thumbnails) <= MAX_DISK_THUMBNAILS:
+        return
+    thumbnails.sort()
+    for _, path in thumbnails[: len(thumbnails) - MAX_DISK_THUMBNAILS]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
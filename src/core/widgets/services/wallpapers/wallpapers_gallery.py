@@ -1,4 +1,3 @@
-import os
 from functools import partial
 
 from PyQt6.QtCore import (
@@ -6,16 +5,14 @@ from PyQt6.QtCore import (
     QObject,
     QPoint,
     QPropertyAnimation,
-    QRect,
     QRectF,
     QRunnable,
-    QSize,
     Qt,
     QThreadPool,
     QTimer,
     pyqtSignal,
 )
-from PyQt6.QtGui import QCursor, QImageReader, QPainter, QPainterPath, QPixmap, QWheelEvent
+from PyQt6.QtGui import QCursor, QImage, QPainter, QPainterPath, QPixmap, QWheelEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QFrame,
@@ -34,6 +31,12 @@ from core.utils.utilities import refresh_widget_style
 from core.utils.win32.backdrop import enable_blur
 from core.utils.win32.utils import apply_qmenu_style
 from core.utils.win32.window_actions import force_foreground_focus
+from core.widgets.services.wallpapers.thumbnail_cache import (
+    cached_thumbnail,
+    list_wallpapers,
+    load_thumbnail,
+    thumbnail_key,
+)
 from core.widgets.services.wallpapers.wallpaper_manager import WallpaperManager
 
 
@@ -80,7 +83,7 @@ class HoverLabel(QFrame):
 
 
 class ImageSignals(QObject):
-    loaded = pyqtSignal(str, QPixmap, int)
+    loaded = pyqtSignal(str, QImage, int)
 
 
 class ImageLoader(QRunnable):
@@ -95,64 +98,12 @@ class ImageLoader(QRunnable):
         self.signals = ImageSignals()
 
     def run(self):
-        target_w = int(self.target_width * self.dpr)
-        target_h = int(self.target_height * self.dpr)
-
-        # Get original image dimensions first
-        reader = QImageReader(self.image_path)
-        original_size = reader.size()
-
-        if not original_size.isValid():
-            # Fallback if we can't determine original size
-            reader.setScaledSize(QSize(target_w, target_h))
-            image = reader.read()
-        else:
-            # Calculate dimensions to FILL the target area (may crop edges)
-            orig_aspect = original_size.width() / original_size.height()
-            target_aspect = target_w / target_h if target_h != 0 else 1.0
-
-            if orig_aspect > target_aspect:
-                # Image is wider than target - scale to match height and crop width
-                scaled_height = target_h
-                scaled_width = int(scaled_height * orig_aspect)
-            else:
-                # Image is taller than target - scale to match width and crop height
-                scaled_width = target_w
-                scaled_height = int(scaled_width / orig_aspect) if orig_aspect != 0 else target_h
-
-            reader.setScaledSize(QSize(scaled_width, scaled_height))
-            image = reader.read()
-
-        # Create a transparent pixmap of the target size
-        pixmap = QPixmap(target_w, target_h)
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        # Paint the image centered within the target area
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-
-        # Calculate position to center the image (may crop edges)
-        x = (target_w - image.width()) // 2
-        y = (target_h - image.height()) // 2
-
-        # Create source rectangle that ensures the image fills the target area
-        source_x = max(0, -x)
-        source_y = max(0, -y)
-        source_width = min(image.width() - source_x, target_w)
-        source_height = min(image.height() - source_y, target_h)
-
-        # Draw only the visible portion of the image
-        painter.drawImage(
-            QRect(max(0, x), max(0, y), source_width, source_height),
-            image,
-            QRect(source_x, source_y, source_width, source_height),
-        )
-        painter.end()
-
-        pixmap.setDevicePixelRatio(self.dpr)
-
-        self.signals.loaded.emit(self.image_path, pixmap, self.index)
+        image = load_thumbnail(self.image_path, self.target_width, self.target_height, self.dpr)
+        try:
+            self.signals.loaded.emit(self.image_path, image, self.index)
+        except RuntimeError:
+            # Gallery closed while the thumbnail was loading
+            pass
 
 
 class ImageGallery(QMainWindow):
@@ -167,15 +118,7 @@ class ImageGallery(QMainWindow):
         else:
             self.image_paths = image_paths
 
-        all_files = []
-        for path in self.image_paths:
-            if os.path.exists(path):
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        if f.lower().endswith(("png", "jpg", "jpeg", "gif", "bmp")):
-                            all_files.append(os.path.join(root, f))
-
-        self.image_files = sorted(all_files)  # or any ordering you prefer
+        self.image_files = list_wallpapers(self.image_paths)
         self.current_index = 0
         self.images_per_page = self.gallery["image_per_page"]
         self.gallery_columns = self.gallery["gallery_columns"]
@@ -241,6 +184,7 @@ class ImageGallery(QMainWindow):
         self.active_token = 0
         self.expected_images = 0
         self.loaded_images = 0
+        self._labels: list[HoverLabel] = []
 
     def initUI(self, parent=None):
         """Initialize the UI components and layout for the wallpapers gallery window."""
@@ -443,8 +387,26 @@ class ImageGallery(QMainWindow):
             self.image_layout.setRowMinimumHeight(row, self.image_height)
             self.image_layout.setRowStretch(row, 0)
 
+    def _thumbnail_args(self, index):
+        return self.image_files[index], self.image_width, self.image_height, getattr(self, "dpr", 1.0)
+
+    def _ensure_labels(self):
+        """Create the grid labels once, pages reuse them instead of rebuilding the grid."""
+        if self._labels:
+            return
+        for i in range(self.images_per_page):
+            label = HoverLabel(self)
+            label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+            label.setFixedSize(self.image_width, self.image_height)
+            self.image_layout.addWidget(label, i // self.columns, i % self.columns)
+            self._labels.append(label)
+
+        self.image_layout.setSpacing(self.image_spacing)
+        margin = max(0, self.image_spacing)
+        self.image_layout.setContentsMargins(margin, margin, margin, margin)
+
     def load_images(self):
-        """Load images for the current page in the background."""
+        """Load images for the current page, from the thumbnail cache or in the background."""
         self.is_loading = True
         self.load_token += 1
         current_token = self.load_token
@@ -453,66 +415,79 @@ class ImageGallery(QMainWindow):
         self.expected_images = min(self.images_per_page, remaining_images)
         self.loaded_images = 0
 
-        # Clear existing widgets and their pixmaps to free memory
-        while self.image_layout.count():
-            item = self.image_layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setPixmap(QPixmap())  # Clear the pixmap to release memory
-                widget.deleteLater()
+        # Drop loads queued for the previous page (and its prefetch) that haven't started yet
+        self.threadpool.clear()
+        self._ensure_labels()
+
+        for i, label in enumerate(self._labels):
+            if i >= self.expected_images:
+                label.image_index = -1
+                label.setPixmap(None)
+                label.hide()
+                continue
 
-        # Create placeholder labels and add to grid
-        for i in range(self.expected_images):
             index = self.current_index + i
-            row = i // self.columns
-            col = i % self.columns
-
-            label = HoverLabel(self)
             label.image_index = index
-            label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             label.mousePressEvent = self.create_mouse_press_event(index)
-            self.image_layout.addWidget(label, row, col)
-
-            # Start loading the actual image in background
-            image_path = self.image_files[index]
-            loader = ImageLoader(
-                image_path,
-                self.image_width,
-                self.image_height,
-                self.corner_radius,
-                i,
-                dpr=getattr(self, "dpr", 1.0),
-            )
+            label.show()
+
+            image_path, width, height, dpr = self._thumbnail_args(index)
+            key = thumbnail_key(image_path, width, height, dpr)
+            image = cached_thumbnail(key) if key else None
+            if image is not None:
+                self.update_image_label(image_path, image, i)
+                self.loaded_images += 1
+                continue
+
+            label.setPixmap(None)
+            loader = ImageLoader(image_path, width, height, self.corner_radius, i, dpr=dpr)
             loader.signals.loaded.connect(partial(self._handle_image_loaded, current_token))
             self.threadpool.start(loader)
 
-        self.image_layout.setSpacing(self.image_spacing)
-        margin = max(0, self.image_spacing)
-        self.image_layout.setContentsMargins(margin, margin, margin, margin)
+        if self.loaded_images >= self.expected_images:
+            self.is_loading = False
+        self._prefetch_adjacent_pages()
 
         if self.expected_images == 0:
-            self.is_loading = False
             return
 
         if self.focused_index is None and self.image_files:
             self.focused_index = self.current_index
         self.update_focus()
 
-    def _handle_image_loaded(self, token, image_path, pixmap, index):
+    def _prefetch_adjacent_pages(self):
+        """Warm the thumbnail cache for the next and previous pages at low priority."""
+        next_start = self.current_index + self.images_per_page
+        prev_start = max(0, self.current_index - self.images_per_page)
+        indexes = list(range(next_start, min(next_start + self.images_per_page, len(self.image_files))))
+        indexes += range(prev_start, self.current_index)
+        for index in indexes:
+            image_path, width, height, dpr = self._thumbnail_args(index)
+            key = thumbnail_key(image_path, width, height, dpr)
+            if key is None or cached_thumbnail(key) is not None:
+                continue
+            # Results land in the shared cache, nothing listens to the signal
+            self.threadpool.start(ImageLoader(image_path, width, height, self.corner_radius, -1, dpr=dpr), -1)
+
+    def _handle_image_loaded(self, token, image_path, image, index):
         """Process image load callbacks, ignoring stale requests."""
-        if token != self.active_token:
+        if token != self.active_token or self.is_closing:
             return
 
-        self.update_image_label(image_path, pixmap, index)
+        self.update_image_label(image_path, image, index)
         self.loaded_images += 1
         if self.loaded_images >= self.expected_images:
             self.is_loading = False
 
-    def update_image_label(self, image_path, pixmap, index):
+    def update_image_label(self, image_path, image, index):
         """Update label with loaded image."""
-        if index < self.image_layout.count():
-            label = self.image_layout.itemAt(index).widget()
-            label.setPixmap(pixmap)
+        if 0 <= index < len(self._labels):
+            if image.isNull():
+                self._labels[index].setPixmap(None)
+                return
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(getattr(self, "dpr", 1.0))
+            self._labels[index].setPixmap(pixmap)
 
     def create_mouse_press_event(self, index):
         """Create a mouse press event handler for a specific image index."""
@@ -525,15 +500,15 @@ class ImageGallery(QMainWindow):
 
     def update_focus(self):
         """Update the visual focus state of all images."""
-        for i in range(self.image_layout.count()):
-            label = self.image_layout.itemAt(i).widget()
-            label.setFixedWidth(self.image_width)
-            label.setFixedHeight(self.image_height)
+        for i, label in enumerate(self._labels):
             if i == self.focused_index - self.current_index:
-                label.setProperty("class", "wallpapers-gallery-image focused")
+                class_name = "wallpapers-gallery-image focused"
             else:
-                label.setProperty("class", "wallpapers-gallery-image")
-            refresh_widget_style(label)
+                class_name = "wallpapers-gallery-image"
+            # Restyling is expensive, only touch labels whose focus state changed
+            if label.property("class") != class_name:
+                label.setProperty("class", class_name)
+                refresh_widget_style(label)
 
     # Navigation methods
     def _navigate_page(self, direction):
@@ -740,12 +715,10 @@ class ImageGallery(QMainWindow):
         """Cleanup when fade-out animation finishes."""
         self.threadpool.clear()
 
-        while self.image_layout.count():
-            item = self.image_layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setPixmap(QPixmap())
-                widget.deleteLater()
+        for label in self._labels:
+            label.setPixmap(None)
+            label.deleteLater()
+        self._labels.clear()
 
         self.destroy()
 
@@ -1,15 +1,19 @@
 import json
 import logging
+import socket
 import traceback
 from datetime import datetime
 from random import randint
 from typing import Any
+from urllib.error import HTTPError, URLError
 
 from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
-HEADER = (b"User-Agent", b"Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0")
-CACHE_CONTROL = (b"Cache-Control", b"no-cache")
+from core.utils.http_client import HttpClient, HttpResponse
+
+# Forecast responses are shared between bars for a minute, icons never change
+RESPONSE_TTL = 60
+ICON_TTL = 24 * 60 * 60
 
 
 class BadRequestError(Exception):
@@ -24,6 +28,7 @@ class WeatherDataFetcher(QObject):
     """Fetches and processes weather data from a URL."""
 
     finished = pyqtSignal(dict)
+    _response_ready = pyqtSignal(object, object)
 
     _cached_url = None
     _instance: WeatherDataFetcher | None = None
@@ -39,8 +44,8 @@ class WeatherDataFetcher(QObject):
     def __init__(self, parent: QObject, url: QUrl, timeout: int):
         super().__init__(parent)
         self.started = False
-        self._manager = QNetworkAccessManager(self)
-        self._manager.finished.connect(self.handle_response)  # type: ignore[reportUnknownMemberType]
+        self._http = HttpClient.get_instance()
+        self._response_ready.connect(self.handle_response)  # type: ignore[reportUnknownMemberType]
         self._fetch_weather_data_timer = QTimer(self)
         self._fetch_weather_data_timer.timeout.connect(self.make_request)  # type: ignore[reportUnknownMemberType]
         self._url = url
@@ -56,28 +61,28 @@ class WeatherDataFetcher(QObject):
     def make_request(self, url: QUrl | None = None):
         if url is None:
             url = self._url
-        request = QNetworkRequest(url)
-        request.setRawHeader(*HEADER)
-        request.setRawHeader(*CACHE_CONTROL)
-        self._manager.get(request)
+        self._http.get_async(url.toEncoded().data().decode(), self._on_response, ttl=RESPONSE_TTL)
+
+    def _on_response(self, response: HttpResponse | None, error: Exception | None):
+        # Called from the HTTP worker thread, hand the result over to the GUI thread
+        try:
+            self._response_ready.emit(response, error)
+        except RuntimeError:
+            pass
 
-    def handle_response(self, reply: QNetworkReply):
+    def handle_response(self, response: HttpResponse | None, error: Exception | None):
         try:
-            error = reply.error()
-            status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
-            if error == QNetworkReply.NetworkError.NoError:
+            if response is not None:
                 logging.info("Fetching new weather data at %s", datetime.now())
-                data = json.loads(reply.readAll().data().decode())
-                self.finished.emit(data)
-                reply.deleteLater()
+                self.finished.emit(response.json())
                 return
-            elif error == QNetworkReply.NetworkError.HostNotFoundError:
+            elif isinstance(error, HTTPError) and error.code in {400, 401, 403}:
+                data = json.loads(error.read().decode())
+                raise BadRequestError(f"Weather response error {error.code}: {data['error']['message']}")
+            elif isinstance(error, URLError) and isinstance(error.reason, socket.gaierror):
                 raise HostNotFoundError("No internet connection or host not found. Unable to fetch weather.")
-            elif status in {400, 401, 403}:
-                data = json.loads(reply.readAll().data().decode())
-                raise BadRequestError(f"Weather response error {status}: {data['error']['message']}")
             else:
-                logging.warning("Weather API returned error %s. Will retry on next interval.", status)
+                logging.warning("Weather API returned error %s. Will retry on next interval.", error)
         except json.JSONDecodeError as e:
             logging.error("Weather API invalid JSON response: %s", e)
         except (BadRequestError, HostNotFoundError) as e:
@@ -85,13 +90,13 @@ class WeatherDataFetcher(QObject):
         except Exception as e:
             logging.error("%s\n%s", e, traceback.format_exc())
         self.finished.emit({})
-        reply.deleteLater()
 
 
 class IconFetcher(QObject):
     """Fetches and caches icons from a list of URLs."""
 
     finished = pyqtSignal()
+    _icon_ready = pyqtSignal(str, object, object)
 
     _instance: IconFetcher | None = None
 
@@ -104,7 +109,8 @@ class IconFetcher(QObject):
 
     def __init__(self, parent: QObject):
         super().__init__(parent)
-        self._manager = QNetworkAccessManager(self)
+        self._http = HttpClient.get_instance()
+        self._icon_ready.connect(self._handle_reply)
         self._pending_icons: set[str] = set()
         self._icon_cache: dict[str, bytes] = {}
 
@@ -115,30 +121,34 @@ class IconFetcher(QObject):
             if url in self._pending_icons:
                 continue
             self._pending_icons.add(url)
-            request = QNetworkRequest(QUrl(url))
-            request.setRawHeader(*HEADER)
-            request.setRawHeader(*CACHE_CONTROL)
-            reply = self._manager.get(request)
-            reply.finished.connect(lambda reply=reply, url=url: self._handle_reply(reply, url))  # type: ignore
+            self._http.get_async(
+                url, lambda response, error, url=url: self._on_icon(url, response, error), ttl=ICON_TTL
+            )
         if len(self._pending_icons) == 0:
             self.finished.emit()
 
-    def _handle_reply(self, reply: QNetworkReply, url: str):
+    def _on_icon(self, url: str, response: HttpResponse | None, error: Exception | None):
+        # Called from the HTTP worker thread, hand the result over to the GUI thread
+        try:
+            self._icon_ready.emit(url, response, error)
+        except RuntimeError:
+            pass
+
+    def _handle_reply(self, url: str, response: HttpResponse | None, error: Exception | None):
         try:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                data = reply.readAll().data()
+            if response is not None:
+                data = response.body
                 if not data:
                     raise Exception(f"Failed to fetch icon {url}: No data received")
                 self._icon_cache[url] = data
                 self._pending_icons.discard(url)
             else:
-                raise Exception(f"Failed to fetch icon {url}: {reply.error().name} {reply.error().value}")
+                raise Exception(f"Failed to fetch icon {url}: {error}")
         except Exception as e:
             logging.warning(e)
         finally:
             if len(self._pending_icons) == 0:
                 self.finished.emit()
-            reply.deleteLater()
 
     def get_icon(self, url: str) -> bytes:
         return self._icon_cache.get(url, b"")
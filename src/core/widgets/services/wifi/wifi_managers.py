@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from enum import IntFlag, StrEnum, auto
 from typing import override
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QThread, pyqtSignal
 from winrt.windows.devices.wifi import (
     WiFiAdapter,
     WiFiConnectionStatus,
@@ -53,8 +53,10 @@ from core.utils.win32.constants import (
     WLAN_INTERFACE_STATE_CONNECTED,
     WLAN_INTF_OPCODE_CURRENT_CONNECTION,
     WLAN_NOTIFICATION_SOURCE_ACM,
+    WLAN_NOTIFICATION_SOURCE_MSM,
     WLAN_NOTIFICATION_SOURCE_NONE,
     WlanNotificationAcm,
+    WlanNotificationMsm,
 )
 from core.utils.win32.error_check import format_error_message
 from core.utils.win32.structs import (
@@ -68,10 +70,31 @@ from core.utils.win32.structs import (
     WLAN_NOTIFICATION_DATA,
 )
 from core.utils.win32.typecheck import CPointer
+from core.widgets.services.wifi.wifi_status import WiFiInfo, WiFiStatusTracker
 
 logger = logging.getLogger("wifi_widget")
 
 
+# Notifications after which the current connection (or its signal quality) may be different
+_ACM_CONNECTION_CHANGES = frozenset(
+    {
+        WlanNotificationAcm.CONNECTION_COMPLETE,
+        WlanNotificationAcm.DISCONNECTED,
+        WlanNotificationAcm.INTERFACE_ARRIVAL,
+        WlanNotificationAcm.INTERFACE_REMOVAL,
+    }
+)
+_MSM_CONNECTION_CHANGES = frozenset(
+    {
+        WlanNotificationMsm.CONNECTED,
+        WlanNotificationMsm.ROAMING_END,
+        WlanNotificationMsm.RADIO_STATE_CHANGE,
+        WlanNotificationMsm.SIGNAL_QUALITY_CHANGE,
+        WlanNotificationMsm.DISCONNECTED,
+    }
+)
+
+
 class WifiState(IntFlag):
     CONNECTED = auto()
     SECURED = auto()
@@ -86,15 +109,6 @@ class ScanResultStatus(StrEnum):
     ERROR = "Error"
 
 
-@dataclass
-class WiFiInfo:
-    """Info used by wifi widget"""
-
-    bars: int
-    name: str
-    exact_quality: int
-
-
 @dataclass
 class NetworkInfo:
     """Info used by wifi popup"""
@@ -108,8 +122,43 @@ class NetworkInfo:
     auto_connect: bool = False
 
 
+class WinRTWiFiStatusProvider:
+    """Reads the WiFi status through WinRT connection profiles and the WLAN API"""
+
+    def __init__(self, wifi_manager: WiFiManager):
+        self._wifi_manager = wifi_manager
+
+    def connection(self) -> tuple[int, str]:
+        """
+        Signal bars and name of the connection with internet access
+        Bars are imprecise, but do not require location permissions
+        """
+        bars: int | None = None
+        name: str | None = None
+        for connection in NetworkInformation.get_connection_profiles():
+            if connection.get_network_connectivity_level() != NetworkConnectivityLevel.INTERNET_ACCESS:
+                continue
+            if name is None:
+                name = connection.profile_name
+            signal_strength = connection.get_signal_bars()
+            if signal_strength is not None:
+                bars = int(signal_strength)
+                break
+        return bars or 0, name if name is not None else "Disconnected"
+
+    def exact_quality(self) -> int:
+        """Get exact WiFi quality via WLAN API. Returns -1 if unavailable."""
+        network_info = self._wifi_manager.get_current_connection()
+        return network_info.quality if network_info else -1
+
+
 class WiFiWorker(QThread):
-    """Singleton worker thread that periodically fetches WiFi info"""
+    """
+    Singleton worker thread that publishes WiFi info when it changes
+
+    Refreshes are driven by network status and WLAN notifications, ``poll_interval`` is the
+    minimum time between two refreshes. A slow safety poll covers changes nobody reported.
+    """
 
     result = pyqtSignal(WiFiInfo)
     _instance = None
@@ -124,63 +173,41 @@ class WiFiWorker(QThread):
         if self._initialized:
             return
         super().__init__()
-        self._get_exact = get_exact
-        self._poll_interval = poll_interval
         self._initialized = True
-        self._running = False
         self._wifi_manager = WiFiManager()
+        self._tracker = WiFiStatusTracker(
+            WinRTWiFiStatusProvider(self._wifi_manager),
+            get_exact=get_exact,
+            min_interval=poll_interval / 1000,
+        )
+        self._wifi_manager.connection_changed.connect(self._tracker.notify, Qt.ConnectionType.DirectConnection)
+
+    @property
+    def latest_info(self) -> WiFiInfo | None:
+        """Last published info, for widgets created after it was emitted"""
+        return self._tracker.latest
 
     def stop(self):
         """Stop the worker"""
-        self._running = False
+        self._tracker.stop()
 
     @override
     def run(self):
         """Run the worker"""
         threading.current_thread().name = "WiFiWorker"
-        self._running = True
-        while self._running:
-            try:
-                bars = self._get_wifi_strength()
-                name = self._get_wifi_name()
-                exact_quality = self._get_exact_quality()
-                self.result.emit(WiFiInfo(bars, name, exact_quality))
-            except Exception as e:
-                logger.error("WiFiWorker error: %s", e)
-                self.result.emit(WiFiInfo(0, "Error", -1))
-            self.msleep(self._poll_interval)
-
-    def _get_wifi_strength(self) -> int:
-        """
-        Get WiFi signal strength in bars
-        Imprecise, but does not require location permissions
-        """
-        connections = NetworkInformation.get_connection_profiles()
-        for connection in connections:
-            if connection.get_network_connectivity_level() == NetworkConnectivityLevel.INTERNET_ACCESS:
-                signal_strength = connection.get_signal_bars()
-                if signal_strength is not None:
-                    return int(signal_strength)
-        return 0
-
-    def _get_wifi_name(self) -> str:
-        connections = NetworkInformation.get_connection_profiles()
-        for connection in connections:
-            if connection.get_network_connectivity_level() == NetworkConnectivityLevel.INTERNET_ACCESS:
-                return connection.profile_name
-        return "Disconnected"
-
-    def _get_exact_quality(self) -> int:
-        """Get exact WiFi quality via WLAN API. Returns -1 if unavailable."""
-        if not self._get_exact:
-            return -1
+        status_token = NetworkInformation.add_network_status_changed(lambda _sender: self._tracker.notify())
         try:
-            network_info = self._wifi_manager.get_current_connection()
-            if network_info:
-                return network_info.quality
-        except Exception as e:
-            logger.debug("Could not get exact WiFi quality: %s", e)
-        return -1
+            self._wifi_manager.init_wlan(WLAN_NOTIFICATION_SOURCE_ACM | WLAN_NOTIFICATION_SOURCE_MSM)
+        except OSError as e:
+            logger.debug("WLAN notifications unavailable: %s", e)
+        try:
+            while self._tracker.wait():
+                info = self._tracker.refresh()
+                if info is not None:
+                    self.result.emit(info)
+        finally:
+            NetworkInformation.remove_network_status_changed(status_token)
+            self._wifi_manager.uninit_wlan()
 
 
 class WiFiConnectWorker(QThread):
@@ -276,6 +303,8 @@ class WiFiManager(QObject):
 
     wifi_scan_completed = pyqtSignal(ScanResultStatus, list)
     wifi_disconnected = pyqtSignal(str)
+    # Emitted from the WLAN notification thread
+    connection_changed = pyqtSignal()
 
     def __init__(self, parent: QObject | None = None):
         super().__init__(parent)
@@ -289,7 +318,7 @@ class WiFiManager(QObject):
         self._interfaces: list[WLAN_INTERFACE_INFO] = []
         self._notification_callback = WLAN_NOTIFICATION_CALLBACK(self._on_wlan_notification)
 
-    def init_wlan(self):
+    def init_wlan(self, notification_source: int = WLAN_NOTIFICATION_SOURCE_ACM):
         """Open the WLAN handle and register notification callback"""
         if self._client_handle.value is not None:
             self.uninit_wlan()
@@ -299,7 +328,7 @@ class WiFiManager(QObject):
 
         result = WlanRegisterNotification(
             self._client_handle,
-            WLAN_NOTIFICATION_SOURCE_ACM,
+            notification_source,
             True,
             self._notification_callback,
             None,
@@ -359,10 +388,11 @@ class WiFiManager(QObject):
 
     def get_current_connection(self) -> NetworkInfo | None:
         """Get the current WiFi connection"""
-        try:
-            self.init_wlan()
-        except OSError:
-            return None
+        if self._client_handle.value is None:
+            try:
+                self.init_wlan()
+            except OSError:
+                return None
         interfaces_ptr, interfaces = self._get_interface_list()
         network_info: NetworkInfo | None = None
         for interface in interfaces:
@@ -529,7 +559,14 @@ class WiFiManager(QObject):
         _context: c_void_p,
     ):
         """Callback for WLAN notifications handling"""
+        source = notification_data.contents.NotificationSource
         code = notification_data.contents.NotificationCode
+        if source == WLAN_NOTIFICATION_SOURCE_MSM:
+            if code in _MSM_CONNECTION_CHANGES:
+                self.connection_changed.emit()
+            return
+        if code in _ACM_CONNECTION_CHANGES:
+            self.connection_changed.emit()
         if code == WlanNotificationAcm.SCAN_COMPLETE:
             if self.wifi_updates_enabled:
                 self.get_available_networks()
@@ -0,0 +1,131 @@
+"""
+Change detection and scheduling for the WiFi status shown in the bar.
+
+Network status and WLAN notifications mark the status dirty, the worker then reads the connection
+once and publishes the result only when it differs from the last one. Refreshes are spaced at least
+``min_interval`` apart so a burst of notifications costs a single query, and a slow safety poll
+catches anything no notification reported. In between the worker sleeps on a condition variable,
+so an idle connection causes no wakeups.
+
+The network queries are injected through ``WiFiStatusProvider``, this module has no WinRT or Win32
+dependencies.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+logger = logging.getLogger("wifi_widget")
+
+# Backstop for changes that arrive without a notification (e.g. signal strength drifting)
+SAFETY_POLL_INTERVAL = 30.0
+
+
+@dataclass
+class WiFiInfo:
+    """Info used by wifi widget"""
+
+    bars: int
+    name: str
+    exact_quality: int
+
+
+ERROR_INFO = WiFiInfo(0, "Error", -1)
+
+
+class WiFiStatusProvider(Protocol):
+    def connection(self) -> tuple[int, str]:
+        """Signal bars and profile name of the connection with internet access, ``(0, "Disconnected")`` if none"""
+        ...
+
+    def exact_quality(self) -> int:
+        """Exact WLAN signal quality, -1 if unavailable"""
+        ...
+
+
+class WiFiStatusTracker:
+    """
+    Decides when the WiFi status is refreshed and whether the result is worth publishing.
+
+    ``notify`` may be called from any thread. ``wait`` and ``refresh`` belong to the worker thread.
+    """
+
+    def __init__(
+        self,
+        provider: WiFiStatusProvider,
+        get_exact: bool = False,
+        min_interval: float = 1.0,
+        safety_interval: float = SAFETY_POLL_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._provider = provider
+        self._get_exact = get_exact
+        self._min_interval = min_interval
+        self._safety_interval = max(safety_interval, min_interval)
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._dirty = True
+        self._stopped = False
+        self._last_refresh: float | None = None
+        self._latest: WiFiInfo | None = None
+
+    @property
+    def latest(self) -> WiFiInfo | None:
+        """The last published status, None before the first refresh"""
+        return self._latest
+
+    def notify(self) -> None:
+        """Something about the connection changed, refresh as soon as ``min_interval`` allows"""
+        with self._condition:
+            self._dirty = True
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def next_refresh_in(self) -> float:
+        """Seconds until the next refresh is due"""
+        if self._last_refresh is None:
+            return 0.0
+        interval = self._min_interval if self._dirty else self._safety_interval
+        return max(0.0, self._last_refresh + interval - self._clock())
+
+    def wait(self) -> bool:
+        """Block until a refresh is due; returns False once stopped"""
+        with self._condition:
+            while not self._stopped:
+                timeout = self.next_refresh_in()
+                if timeout <= 0:
+                    return True
+                self._condition.wait(timeout)
+            return False
+
+    def refresh(self) -> WiFiInfo | None:
+        """Query the provider; returns the new status, or None if it did not change"""
+        with self._condition:
+            self._dirty = False
+            self._last_refresh = self._clock()
+        info = self._query()
+        if info == self._latest:
+            return None
+        self._latest = info
+        return info
+
+    def _query(self) -> WiFiInfo:
+        try:
+            bars, name = self._provider.connection()
+        except Exception as e:
+            logger.error("WiFiWorker error: %s", e)
+            return ERROR_INFO
+        exact_quality = -1
+        if self._get_exact:
+            try:
+                exact_quality = self._provider.exact_quality()
+            except Exception as e:
+                logger.debug("Could not get exact WiFi quality: %s", e)
+        return WiFiInfo(bars, name, exact_quality)
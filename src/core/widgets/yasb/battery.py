@@ -1,14 +1,12 @@
-import re
 from datetime import timedelta
 
 import humanize
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QLabel
 
-from core.utils.utilities import refresh_widget_style
 from core.utils.win32.constants import POWER_TIME_UNKNOWN, POWER_TIME_UNLIMITED
 from core.validation.widgets.yasb.battery import BatteryConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template, replace_options
 from core.widgets.services.battery.battery_api import BatteryAPI, BatteryData
 
 
@@ -38,6 +36,8 @@ class BatteryWidget(BaseWidget):
         self._charging_blink_timer.setInterval(self.config.charging_options.blink_interval)
         self._charging_blink_timer.timeout.connect(self._charging_blink)
         self._charging_icon_label: QLabel | None = None
+        self._charging_icon_class = ""
+        self._charging_blink_on = False
 
         self.start_timer()
 
@@ -105,24 +105,15 @@ class BatteryWidget(BaseWidget):
         label = self._charging_icon_label
         if not label:
             return
-
-        current_classes = label.property("class") or ""
-
-        if "blink" in current_classes:
-            new_classes = current_classes.replace("blink", "").strip()
-            new_classes = re.sub(r"\s+", " ", new_classes)
-        else:
-            new_classes = f"{current_classes} blink".strip()
-
-        label.setProperty("class", new_classes)
-        refresh_widget_style(label)
+        self._charging_blink_on = not self._charging_blink_on
+        class_name = self._charging_icon_class
+        if self._charging_blink_on:
+            class_name = f"{class_name} blink"
+        self.set_label(label, label.text(), class_name)
 
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
         self._battery_state = self._get_battery_state()
 
         if self._battery_state is None:
@@ -131,13 +122,10 @@ class BatteryWidget(BaseWidget):
                 self.timer.stop()
                 return
 
-            for part in label_parts:
-                part = part.strip()
-                if widget_index < len(active_widgets):
-                    if "<span" in part and "</span>" in part:
-                        active_widgets[widget_index].hide()
-                    active_widgets[widget_index].setText("Battery info not available")
-                    widget_index += 1
+            for widget, part in zip(active_widgets, parse_label_template(active_label_content)):
+                if part.span_class is not None:
+                    widget.hide()
+                self.set_label(widget, "Battery info not available")
             return
 
         original_threshold = self._get_battery_threshold()
@@ -158,54 +146,46 @@ class BatteryWidget(BaseWidget):
         health_str = f"{state.health_percent:.1f}" if state.health_percent is not None else "N/A"
         chemistry_str = state.chemistry if state.chemistry else "N/A"
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets):
-                battery_status = (
-                    part.replace("{percent}", str(self._battery_state.percent))
-                    .replace("{time_remaining}", time_remaining)
-                    .replace("{is_charging}", is_charging_str)
-                    .replace("{icon}", charging_icon)
-                    .replace("{power}", rate_str)
-                    .replace("{voltage}", voltage_str)
-                    .replace("{capacity}", capacity_str)
-                    .replace("{full_capacity}", full_capacity_str)
-                    .replace("{designed_capacity}", designed_capacity_str)
-                    .replace("{temperature}", temperature_str)
-                    .replace("{cycle_count}", cycle_count_str)
-                    .replace("{health}", health_str)
-                    .replace("{chemistry}", chemistry_str)
-                )
-                if "<span" in battery_status and "</span>" in battery_status:
-                    # icon-only QLabel
-                    widget_label = active_widgets[widget_index]
-                    icon = re.sub(r"<span.*?>|</span>", "", battery_status).strip()
-                    widget_label.setText(icon)
-                    # apply status‐class
-                    existing_classes = widget_label.property("class")
-                    new_classes = re.sub(r"status-\w+", "", existing_classes).strip()
-                    widget_label.setProperty("class", f"{new_classes} status-{threshold}")
-                    refresh_widget_style(widget_label)
-
-                    # only blink when plugged AND blink_enabled
-                    if self._battery_state.is_charging and self.config.charging_options.blink_charging_icon:
-                        self._charging_icon_label = widget_label
-                        if not self._charging_blink_timer.isActive():
-                            self._charging_blink_timer.start()
-                    else:
-                        if self._charging_blink_timer.isActive():
-                            self._charging_blink_timer.stop()
-                        self._charging_icon_label = None
-                        current_classes = widget_label.property("class") or ""
-                        if "blink" in current_classes:
-                            new_classes = current_classes.replace("blink", "").strip()
-                            new_classes = re.sub(r"\s+", " ", new_classes)
-                            widget_label.setProperty("class", new_classes)
-                            refresh_widget_style(widget_label)
-                else:
-                    alt_class = "alt" if self._show_alt_label else ""
-                    formatted_text = battery_status.format(battery_status)
-                    active_widgets[widget_index].setText(formatted_text)
-                    active_widgets[widget_index].setProperty("class", f"label {alt_class} status-{threshold}")
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        format_text = replace_options(
+            {
+                "{percent}": self._battery_state.percent,
+                "{time_remaining}": time_remaining,
+                "{is_charging}": is_charging_str,
+                "{icon}": charging_icon,
+                "{power}": rate_str,
+                "{voltage}": voltage_str,
+                "{capacity}": capacity_str,
+                "{full_capacity}": full_capacity_str,
+                "{designed_capacity}": designed_capacity_str,
+                "{temperature}": temperature_str,
+                "{cycle_count}": cycle_count_str,
+                "{health}": health_str,
+                "{chemistry}": chemistry_str,
+            }
+        )
+        label_class = f"{'label alt' if self._show_alt_label else 'label'} status-{threshold}"
+        icon_labels = []
+        for widget, part in zip(active_widgets, parse_label_template(active_label_content)):
+            if part.span_class is None:
+                self.set_label(widget, format_text(part.text), label_class)
+            else:
+                icon_labels.append((widget, format_text(part.text), f"{part.span_class} status-{threshold}"))
+
+        # The last icon of the label blinks, only when plugged AND blink_enabled
+        blinking = (
+            bool(icon_labels) and self._battery_state.is_charging and self.config.charging_options.blink_charging_icon
+        )
+        if blinking:
+            self._charging_icon_label = icon_labels[-1][0]
+            self._charging_icon_class = icon_labels[-1][2]
+            if not self._charging_blink_timer.isActive():
+                self._charging_blink_timer.start()
+        else:
+            if self._charging_blink_timer.isActive():
+                self._charging_blink_timer.stop()
+            self._charging_icon_label = None
+            self._charging_blink_on = False
+        for widget, text, class_name in icon_labels:
+            if widget is self._charging_icon_label and self._charging_blink_on:
+                class_name = f"{class_name} blink"
+            self.set_label(widget, text, class_name)
@@ -1,4 +1,3 @@
-import re
 from datetime import datetime
 
 from PyQt6.QtCore import QEvent, QRect, Qt, QTimer
@@ -8,7 +7,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSlider, QStyle, QStyle
 from core.utils.tooltip import CustomToolTip, set_tooltip
 from core.utils.utilities import PopupWidget, build_progress_widget
 from core.validation.widgets.yasb.brightness import BrightnessConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.brightness.service import BrightnessService
 
 
@@ -127,9 +126,6 @@ class BrightnessWidget(BaseWidget):
         """Update the widget label with current brightness."""
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         percent = self.current_brightness
         if percent is None:
@@ -154,14 +150,8 @@ class BrightnessWidget(BaseWidget):
             self.progress_widget.set_value(percent)
 
         # Update label widgets
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets):
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                active_widgets[widget_index].setText(formatted_text)
-                widget_index += 1
+        format_text = replace_options(label_options)
+        self.render_label(active_widgets, active_label_content, format_text=format_text, format_icon=format_text)
 
     def _get_brightness_icon(self, brightness: int) -> str:
         """Get icon based on brightness level."""
@@ -1,4 +1,3 @@
-import json
 import locale
 import logging
 import os
@@ -29,12 +28,13 @@ from PyQt6.QtWidgets import (
 )
 
 from core.config import HOME_CONFIGURATION_DIR
+from core.utils.local_store import LocalStore
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.utils.win32.backdrop import enable_blur
 from core.utils.win32.utils import apply_qmenu_style
 from core.validation.widgets.yasb.clock import ClockConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 from settings import SCRIPT_PATH
 
 _holidays_cache = {"module": None, "supported_countries": None, "country_holidays": {}}
@@ -66,7 +66,9 @@ class ClockWidgetSharedState:
         self._startup_minute = datetime.now().strftime("%H:%M")
         self._timer_seconds_remaining = 0
         self._timer_active = False
-        self._alarms_file = os.path.join(HOME_CONFIGURATION_DIR, "alarms.json")
+        self._alarms_store = LocalStore.get_instance().get_list(
+            "alarms", legacy_file=os.path.join(HOME_CONFIGURATION_DIR, "alarms.json")
+        )
         self._load_alarms()
 
     def register_widget(self, widget):
@@ -168,26 +170,17 @@ class ClockWidgetSharedState:
                 pass
 
     def _load_alarms(self):
-        """Load alarms from disk into shared state, if the file exists."""
+        """Load alarms from the local store into shared state."""
         try:
-            if os.path.exists(self._alarms_file):
-                with open(self._alarms_file, encoding="utf-8") as f:
-                    self._alarms = json.load(f)
+            self._alarms = self._alarms_store.load()
         except Exception as e:
             logging.error("Error loading alarms: %s", e)
             self._alarms = []
 
     def save_alarms(self):
-        """Persist alarms to disk in a tidy JSON format."""
+        """Persist alarms to the local store, only changed alarms are written."""
         try:
-            json_str = json.dumps(self._alarms, indent=2, ensure_ascii=False)
-            json_str = re.sub(
-                r"\[\s*(\d+(?:\s*,\s*\d+)*)\s*\]",
-                lambda m: "[" + m.group(1).replace("\n", "").replace(" ", "") + "]",
-                json_str,
-            )
-            with open(self._alarms_file, "w", encoding="utf-8") as f:
-                f.write(json_str)
+            self._alarms_store.save(self._alarms)
         except Exception as e:
             logging.error("Error saving alarms: %s", e)
 
@@ -335,6 +328,8 @@ class CustomCalendar(QCalendarWidget):
 
 class ClockWidget(BaseWidget):
     validation_schema = ClockConfig
+    # One shared tick drives the clocks of all bars, alarms and the countdown timer
+    pause_timer_when_hidden = False
 
     def __init__(self, config: ClockConfig):
         super().__init__(config.update_interval, class_name=f"clock-widget {config.class_name}")
@@ -351,9 +346,6 @@ class ClockWidget(BaseWidget):
         self._label_alt_content = self.config.label_alt
         self._icons = self.config.icons or {}
         self._alarm_icons = self.config.alarm_icons
-        self._current_hour = None
-        self._current_minute = None
-        self._previous_alarm_state = False
         self._timer_visible = False
         self._country_code = self.config.calendar.country_code or self.get_country_code()
         self._subdivision = self.config.calendar.subdivision
@@ -477,18 +469,8 @@ class ClockWidget(BaseWidget):
         # Choose which label set to update (primary or alternate)
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
         now = datetime.now(ZoneInfo(self._active_tz)) if self._active_tz else datetime.now().astimezone()
-        current_hour = f"{now.hour:02d}"
-        current_minute = f"{now.minute:02d}"
-        hour_changed = self._current_hour != current_hour
-        minute_changed = self._current_minute != current_minute
-        if hour_changed:
-            self._current_hour = current_hour
-        if minute_changed:
-            self._current_minute = current_minute
+        hour_class = f"clock_{now.hour:02d}"
 
         # Temporarily switch locale so strftime outputs are localized
         org_locale_time, org_locale_ctype = self._set_locale_context()
@@ -505,74 +487,50 @@ class ClockWidget(BaseWidget):
                 self._timer_label.hide()
                 self._timer_visible = False
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon_placeholder = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    if icon_placeholder == "{icon}":
-                        if hour_changed:
-                            icon = self._get_icon_for_hour(now.hour)
-                            active_widgets[widget_index].setText(icon)
-                            hour_class = f"clock_{current_hour}"
-                            active_widgets[widget_index].setProperty("class", f"icon {hour_class}")
-                            refresh_widget_style(active_widgets[widget_index])
-                    elif icon_placeholder == "{alarm}":
-                        if self._shared_state._snoozed_alarms:
-                            active_widgets[widget_index].setText(self.config.alarm_icons.snooze)
-                            active_widgets[widget_index].setProperty("class", "icon alarm snooze")
-                            active_widgets[widget_index].setVisible(True)
-                            refresh_widget_style(active_widgets[widget_index])
-                        elif self._has_enabled_alarms():
-                            active_widgets[widget_index].setText(self.config.alarm_icons.enabled)
-                            active_widgets[widget_index].setProperty("class", "icon alarm")
-                            active_widgets[widget_index].setVisible(True)
-                            refresh_widget_style(active_widgets[widget_index])
-                        else:
-                            active_widgets[widget_index].setText("")
-                            active_widgets[widget_index].setVisible(False)
-
+        for widget, part in zip(active_widgets, parse_label_template(active_label_content)):
+            if part.span_class is not None:
+                if part.text == "{icon}":
+                    self.set_label(widget, self._get_icon_for_hour(now.hour), f"icon {hour_class}")
+                elif part.text == "{alarm}":
+                    if self._shared_state._snoozed_alarms:
+                        self.set_label(widget, self.config.alarm_icons.snooze, "icon alarm snooze")
+                        widget.setVisible(True)
+                    elif self._has_enabled_alarms():
+                        self.set_label(widget, self.config.alarm_icons.enabled, "icon alarm")
+                        widget.setVisible(True)
                     else:
-                        active_widgets[widget_index].setText(icon_placeholder)
+                        self.set_label(widget, "")
+                        widget.setVisible(False)
                 else:
-                    has_alarm = "{alarm}" in part and (self._shared_state._snoozed_alarms or self._has_enabled_alarms())
-
-                    if "{icon}" in part:
-                        icon = self._get_icon_for_hour(now.hour)
-                        part = part.replace("{icon}", icon)
-
-                    if "{alarm}" in part:
-                        if self._shared_state._snoozed_alarms:
-                            part = part.replace("{alarm}", self.config.alarm_icons.snooze)
-                        elif self._has_enabled_alarms():
-                            part = part.replace("{alarm}", self.config.alarm_icons.enabled)
-                        else:
-                            part = part.replace("{alarm}", "")
-                    try:
-                        datetime_format_search = re.search(r"\{(.*)}", part)
-                        datetime_format_str = datetime_format_search.group()
-                        datetime_format = datetime_format_search.group(1)
-                        format_label_content = part.replace(datetime_format_str, now.strftime(datetime_format))
-                    except Exception:
-                        format_label_content = part
-
-                    active_widgets[widget_index].setText(format_label_content)
-
-                    alarm_state_changed = has_alarm != self._previous_alarm_state
-                    if has_alarm:
-                        if self._shared_state._snoozed_alarms:
-                            active_widgets[widget_index].setProperty("class", "label alarm snooze")
-                        else:
-                            active_widgets[widget_index].setProperty("class", "label alarm")
-                        refresh_widget_style(active_widgets[widget_index])
-                    else:
-                        hour_class = f"clock_{current_hour}"
-                        active_widgets[widget_index].setProperty("class", f"label {hour_class}")
-                        if hour_changed or alarm_state_changed:
-                            refresh_widget_style(active_widgets[widget_index])
+                    self.set_label(widget, part.text)
+                continue
+
+            text = part.text
+            has_alarm = "{alarm}" in text and (self._shared_state._snoozed_alarms or self._has_enabled_alarms())
+
+            if "{icon}" in text:
+                text = text.replace("{icon}", self._get_icon_for_hour(now.hour))
 
-                    self._previous_alarm_state = has_alarm
-                widget_index += 1
+            if "{alarm}" in text:
+                if self._shared_state._snoozed_alarms:
+                    text = text.replace("{alarm}", self.config.alarm_icons.snooze)
+                elif self._has_enabled_alarms():
+                    text = text.replace("{alarm}", self.config.alarm_icons.enabled)
+                else:
+                    text = text.replace("{alarm}", "")
+            try:
+                datetime_format_search = re.search(r"\{(.*)}", text)
+                datetime_format_str = datetime_format_search.group()
+                datetime_format = datetime_format_search.group(1)
+                text = text.replace(datetime_format_str, now.strftime(datetime_format))
+            except Exception:
+                pass
+
+            if has_alarm:
+                label_class = "label alarm snooze" if self._shared_state._snoozed_alarms else "label alarm"
+            else:
+                label_class = f"label {hour_class}"
+            self.set_label(widget, text, label_class)
 
         self._restore_locale_context(org_locale_time, org_locale_ctype)
 
@@ -4,7 +4,6 @@ Displays premium request usage data with a popup showing detailed statistics.
 """
 
 import os
-import re
 from datetime import UTC, datetime
 
 from PyQt6.QtCore import QPointF, Qt, QTimer
@@ -12,9 +11,9 @@ from PyQt6.QtGui import QBrush, QColor, QGuiApplication, QLinearGradient, QPaint
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
 from core.utils.tooltip import CustomToolTip, set_tooltip
-from core.utils.utilities import PopupWidget, refresh_widget_style
+from core.utils.utilities import PopupWidget
 from core.validation.widgets.yasb.copilot import CopilotConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.copilot.api import CopilotDataManager, CopilotUsageData
 from core.widgets.services.github.auth import get_saved_token, save_token
 from core.widgets.services.github.auth_dialog import GitHubAuthDialog
@@ -388,7 +387,6 @@ class CopilotWidget(BaseWidget):
 
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = [p for p in re.split(r"(<span.*?>.*?</span>)", active_label) if p]
 
         label_options = {
             "{icon}": self.config.icons.copilot,
@@ -398,17 +396,7 @@ class CopilotWidget(BaseWidget):
             "{total_cost}": f"{data.total_cost:.2f}",
         }
 
-        for i, part in enumerate(label_parts):
-            if i >= len(active_widgets):
-                break
-            text = part
-            for key, val in label_options.items():
-                text = text.replace(key, val)
-            if "<span" in text:
-                text = re.sub(r"<span.*?>|</span>", "", text)
-            active_widgets[i].setText(text)
-
-        # Update tooltip and state classes
+        # Update state classes and tooltip
         state_class = (
             "critical"
             if pct >= self.config.thresholds.critical
@@ -418,14 +406,20 @@ class CopilotWidget(BaseWidget):
         )
         tip = f"Error: {data.error}" if data.error else f"Copilot: {used}/{allowance} ({pct}%)"
 
-        for widget in active_widgets:
-            if self.config.tooltip:
+        format_text = replace_options(label_options)
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label,
+            format_text=format_text,
+            label_class=f"{label_class} {state_class}".rstrip(),
+            format_icon=format_text,
+            icon_class=state_class,
+        )
+
+        if self.config.tooltip:
+            for widget in active_widgets:
                 set_tooltip(widget, tip)
-            classes = [c for c in widget.property("class").split() if c not in ("warning", "critical")]
-            if state_class:
-                classes.append(state_class)
-            widget.setProperty("class", " ".join(classes))
-            refresh_widget_style(widget)
 
     def _show_popup(self):
         data = CopilotDataManager.get_data()
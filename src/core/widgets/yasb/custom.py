@@ -1,5 +1,4 @@
 import json
-import re
 import subprocess
 import threading
 
@@ -9,7 +8,7 @@ from PyQt6.QtWidgets import QLabel
 from core.utils.tooltip import set_tooltip
 from core.utils.win32.system_function import function_map
 from core.validation.widgets.yasb.custom import CustomConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 
 
 class CustomWorker(QObject):
@@ -102,20 +101,13 @@ class CustomWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str):
         def process_content(content, is_alt=False):
-            label_parts = re.split("(<span.*?>.*?</span>)", content)
             widgets = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                     label.setText(self.config.label_placeholder)
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -140,27 +132,16 @@ class CustomWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        widget_index = 0
-        try:
-            for part in label_parts:
-                part = part.strip()
-                if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                    if "<span" in part and "</span>" in part:
-                        icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                        active_widgets[widget_index].setText(icon)
-                    else:
-                        active_widgets[widget_index].setText(self._truncate_label(part.format(data=self._exec_data)))
-                    if self.config.exec_options.hide_empty:
-                        if self._exec_data:
-                            self.setVisible(True)
-                            # active_widgets[widget_index].show()
-                        else:
-                            self.setVisible(False)
-                            # active_widgets[widget_index].hide()
-                    widget_index += 1
-        except Exception:
-            active_widgets[widget_index].setText(self._truncate_label(part))
+
+        def format_text(text: str) -> str:
+            try:
+                return self._truncate_label(text.format(data=self._exec_data))
+            except Exception:
+                return self._truncate_label(text)
+
+        self.render_label(active_widgets, active_label_content, format_text=format_text)
+        if self.config.exec_options.hide_empty and active_widgets:
+            self.setVisible(bool(self._exec_data))
 
         # Update tooltip if enabled
         self._update_tooltip()
@@ -9,9 +9,9 @@ from PyQt6.QtWidgets import QFrame, QGraphicsOpacityEffect, QHBoxLayout, QLabel,
 
 from core.utils.time_utils import get_relative_time
 from core.utils.tooltip import set_tooltip
-from core.utils.utilities import PopupWidget, refresh_widget_style
+from core.utils.utilities import PopupWidget
 from core.validation.widgets.yasb.github import Corner, GithubConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 from core.widgets.services.github.api import GitHubDataManager
 from core.widgets.services.github.auth import get_saved_token
 from core.widgets.services.github.auth_dialog import GitHubAuthDialog
@@ -152,29 +152,22 @@ class GithubWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str) -> None:
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = [part for part in re.split("(<span.*?>.*?</span>)", content) if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()  # Remove any leading/trailing whitespace
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
+            for part in parse_label_template(content):
+                if part.span_class is not None:
                     label = NotificationLabel(
-                        icon,
+                        part.text,
                         corner=self.config.notification_dot.corner,
                         color=self.config.notification_dot.color,
                         margin=self.config.notification_dot.margin,
                     )
-                    label.setProperty("class", class_result)
+                    label.setProperty("class", part.span_class)
                     if is_alt:
                         self._notification_label_alt = label
                     else:
                         self._notification_label = label
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 if not self.github_token and self.config.tooltip:
@@ -205,8 +198,6 @@ class GithubWidget(BaseWidget):
 
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        # Split label content and filter out empty parts
-        label_parts = [part.strip() for part in re.split(r"(<span.*?>.*?</span>)", active_label_content) if part]
 
         # Setting the notification dot if enabled and the label exists
         if self.config.notification_dot.enabled:
@@ -215,31 +206,18 @@ class GithubWidget(BaseWidget):
             if self._show_alt_label and self._notification_label_alt is not None:
                 self._notification_label_alt.show_dot(notification_count > 0)
 
-        for widget_index, part in enumerate(label_parts):
-            if widget_index >= len(active_widgets):
-                continue
-
-            current_widget = active_widgets[widget_index]
-            icon = ""
-
-            if "<span" in part and "</span>" in part:
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                current_widget.setText(icon)
-                if self.config.tooltip:
-                    set_tooltip(current_widget, f"Notifications {notification_count}")
-                # Update class based on notification count
-                current_classes = current_widget.property("class").split()
-                notification_class = "new-notification"
-                if notification_count > 0:
-                    current_classes.append(notification_class)
-                else:
-                    current_classes = [cls for cls in current_classes if cls != notification_class]
-                current_widget.setProperty("class", " ".join(current_classes))
-
-            else:
-                formatted_text = part.format(data=notification_count)
-                current_widget.setText(formatted_text)
-            refresh_widget_style(current_widget)
+        # Update class based on notification count
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=lambda text: text.format(data=notification_count),
+            label_class="label",
+            icon_class="new-notification" if notification_count > 0 else "",
+        )
+        if self.config.tooltip:
+            for widget, part in zip(active_widgets, parse_label_template(active_label_content)):
+                if part.span_class is not None:
+                    set_tooltip(widget, f"Notifications {notification_count}")
 
     def mark_as_read(self, notification_id: str, container_label: QFrame) -> None:
         # Update in GitHubDataManager and sync with GitHub API
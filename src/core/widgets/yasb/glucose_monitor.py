@@ -2,18 +2,16 @@ import datetime
 import hashlib
 import json
 import os
-import re
 import urllib.request
 from collections.abc import Callable
 
 from PyQt6.QtCore import QThread, QTimer, pyqtSignal
-from PyQt6.QtWidgets import QLabel
 
 from core.utils.shell_utils import shell_open
 from core.utils.tooltip import set_tooltip
-from core.utils.utilities import ToastNotifier, refresh_widget_style
+from core.utils.utilities import ToastNotifier
 from core.validation.widgets.yasb.glucose_monitor import GlucoseMonitorConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 from settings import SCRIPT_PATH
 
 
@@ -138,9 +136,6 @@ class GlucoseMonitor(BaseWidget):
 
         active_widgets = self._error_message and self._widgets_alt or self._widgets
         active_label_content = self._error_message and self.config.error_label or self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = list(filter(None, label_parts))
-        widget_index = 0
 
         format_data = (
             self._error_message
@@ -150,24 +145,11 @@ class GlucoseMonitor(BaseWidget):
             or self._status_data
         )
 
-        for part in label_parts:
-            part = part.strip()
-            if not part or widget_index >= len(active_widgets) or not isinstance(active_widgets[widget_index], QLabel):
-                continue
-
-            if "<span" in part and "</span>" in part:
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                active_widgets[widget_index].setText(icon.format_map(format_data))
-
-                current_class = active_widgets[widget_index].property("class") or ""
-                if "sgv" in current_class.split():
-                    new_class = self._is_sgv_in_range and "sgv in-range" or "sgv out-range"
-                    active_widgets[widget_index].setProperty("class", new_class)
-                    refresh_widget_style(active_widgets[widget_index])
-            else:
-                formatted_text = part.format_map(format_data)
-                active_widgets[widget_index].setText(formatted_text)
-            widget_index += 1
+        for widget, part in zip(active_widgets, parse_label_template(active_label_content)):
+            new_class = None
+            if part.span_class is not None and "sgv" in part.span_class.split():
+                new_class = self._is_sgv_in_range and "sgv in-range" or "sgv out-range"
+            self.set_label(widget, part.text.format_map(format_data), new_class)
 
         if self.config.tooltip:
             set_tooltip(
@@ -1,4 +1,3 @@
-import re
 from collections import deque
 
 from humanize import naturalsize
@@ -8,7 +7,6 @@ from core.utils.stat_popup import GraphWidget, build_stat_popup
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.validation.widgets.yasb.gpu import GpuConfig
 from core.widgets.base import BaseWidget
@@ -112,9 +110,6 @@ class GpuWidget(BaseWidget):
 
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         if self.config.progress_bar.enabled and self.progress_widget:
             if self._widget_container_layout.indexOf(self.progress_widget) == -1:
@@ -124,22 +119,13 @@ class GpuWidget(BaseWidget):
                 )
             self.progress_widget.set_value(gpu_data.utilization)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = part.format(info=gpu_info)
-                    active_widgets[widget_index].setText(formatted_text)
-                    active_widgets[widget_index].setProperty("class", label_class)
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_gpu_threshold(gpu_data.utilization)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=lambda text: text.format(info=gpu_info),
+            label_class=f"{label_class} status-{self._get_gpu_threshold(gpu_data.utilization)}",
+        )
 
     def _get_gpu_threshold(self, utilization: float) -> str:
         if utilization <= self.config.gpu_thresholds.low:
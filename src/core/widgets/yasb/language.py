@@ -1,7 +1,6 @@
 import ctypes
 import logging
 import os
-import re
 import winreg
 
 from PyQt6.QtCore import Qt
@@ -79,9 +78,6 @@ class LanguageWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
         prev_caps_lock = self._caps_lock_active
         try:
             lang = self._get_current_keyboard_language()
@@ -95,18 +91,11 @@ class LanguageWidget(BaseWidget):
                 self._widget_container.setProperty("class", "widget-container")
             refresh_widget_style(self._widget_container, *self._widgets, *self._widgets_alt)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    # Ensure the icon is correctly set
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    # Update label with formatted content
-                    formatted_text = part.format(lang=lang) if lang else part
-                    active_widgets[widget_index].setText(formatted_text)
-                widget_index += 1
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=lambda text: text.format(lang=lang) if lang else text,
+        )
 
     def _on_settings_click(self, ev: QMouseEvent | None):
         if ev and ev.button() == Qt.MouseButton.LeftButton:
@@ -4,13 +4,10 @@ from collections.abc import Callable
 from enum import StrEnum
 from typing import Any, Literal, cast
 
-from PIL import Image, ImageChops
-from PIL.ImageDraw import ImageDraw
-from PIL.ImageQt import ImageQt
 from pycaw.pycaw import AudioUtilities
 from PyQt6 import QtCore
 from PyQt6.QtCore import QEvent, QObject, Qt, QTimer, pyqtSlot
-from PyQt6.QtGui import QMouseEvent, QPixmap, QWheelEvent
+from PyQt6.QtGui import QImage, QMouseEvent, QPixmap, QWheelEvent
 from PyQt6.QtWidgets import (
     QFrame,
     QGridLayout,
@@ -45,6 +42,13 @@ from core.widgets.services.media.source_apps import (
     get_source_app_display_name,
     get_source_app_mapping,
 )
+from core.widgets.services.media.thumbnail import (
+    BarThumbnailStyle,
+    ThumbnailRenderer,
+    render_bar_thumbnail,
+    render_empty_thumbnail,
+    render_popup_thumbnail,
+)
 from core.widgets.services.media.tokenizer import clean_string
 
 logger = logging.getLogger("MediaWidget")
@@ -196,6 +200,21 @@ class MediaWidget(BaseWidget):
         self._is_playing = False
         self._app_is_muted = False
 
+        # Thumbnails are rendered off the GUI thread, remember which result each label is waiting for
+        corners = (False, True, True, False) if self.config.controls_left else (True, False, False, True)
+        if self.config.symmetric_corner_radius:
+            corners = (True, True, True, True)
+        self._bar_thumbnail_style = BarThumbnailStyle(
+            alpha=self.config.thumbnail_alpha,
+            edge_fade=self.config.thumbnail_edge_fade,
+            corner_radius=self.config.thumbnail_corner_radius,
+            corners=corners,
+        )
+        self._pending_bar_thumbnail: tuple | None = None
+        self._pending_popup_thumbnail: tuple | None = None
+        self._thumbnail_renderer = ThumbnailRenderer()
+        self._thumbnail_renderer.thumbnail_ready.connect(self._on_thumbnail_ready)
+
     @pyqtSlot(dict)
     def _on_media_data_changed(self, data: dict[str, SessionState]):
         self.all_sessions = data
@@ -242,12 +261,8 @@ class MediaWidget(BaseWidget):
                 self.config.media_menu.thumbnail_size,
             )
             try:
-                # Use thumbnail if available, otherwise create a default one
-                if self.current_session.thumbnail is not None:
-                    popup_pixmap = self._create_thumbnail_for_popup(self.current_session.thumbnail)
-                else:
-                    # Create default thumbnail
-                    popup_pixmap = self._create_empty_thumbnail()
+                # Use thumbnail if available, otherwise show the default one until it is rendered
+                popup_pixmap = self._request_popup_thumbnail()
 
                 if popup_pixmap:
                     self._popup_thumbnail_label.setPixmap(popup_pixmap)
@@ -637,20 +652,16 @@ class MediaWidget(BaseWidget):
             # Hide thumbnail and label fields
             self._thumbnail_label.hide()
             active_label.hide()
-            active_label.setText("")
+            self.set_label(active_label, "")
             if not self.config.controls_hide:
                 if self._play_label is not None:
-                    self._play_label.setText(self.config.icons.play)
-                    self._play_label.setProperty("class", "btn play disabled")
-                    refresh_widget_style(self._play_label)
+                    self.set_label(self._play_label, self.config.icons.play, "btn play disabled")
 
                 if self._prev_label is not None:
-                    self._prev_label.setProperty("class", "btn prev disabled")
-                    refresh_widget_style(self._prev_label)
+                    self.set_label(self._prev_label, self._prev_label.text(), "btn prev disabled")
 
                 if self._next_label is not None:
-                    self._next_label.setProperty("class", "btn next disabled")
-                    refresh_widget_style(self._next_label)
+                    self.set_label(self._next_label, self._next_label.text(), "btn next disabled")
 
             # If we want to hide the widget when no music is playing, hide it!
             if self.config.hide_empty:
@@ -671,21 +682,17 @@ class MediaWidget(BaseWidget):
             play_icon = self.config.icons.pause if is_playing else self.config.icons.play
             # We need to clear any inline styles: setStyleSheet("")
             # Related to https://github.com/amnweb/yasb/issues/481
-            if self._play_label is not None:
-                self._play_label.setText(play_icon)
-                self._play_label.setProperty("class", f"btn play {'disabled' if not is_play_enabled else ''}")
-                refresh_widget_style(self._play_label)
-                self._play_label.setStyleSheet("")
-
-            if self._prev_label is not None:
-                self._prev_label.setProperty("class", f"btn prev {'disabled' if not is_prev_enabled else ''}")
-                refresh_widget_style(self._prev_label)
-                self._prev_label.setStyleSheet("")
-
-            if self._next_label is not None:
-                self._next_label.setProperty("class", f"btn next {'disabled' if not is_next_enabled else ''}")
-                refresh_widget_style(self._next_label)
-                self._next_label.setStyleSheet("")
+            buttons = (
+                (self._play_label, play_icon, f"btn play {'disabled' if not is_play_enabled else ''}"),
+                (self._prev_label, None, f"btn prev {'disabled' if not is_prev_enabled else ''}"),
+                (self._next_label, None, f"btn next {'disabled' if not is_next_enabled else ''}"),
+            )
+            for button, text, class_name in buttons:
+                if button is None:
+                    continue
+                self.set_label(button, button.text() if text is None else text, class_name)
+                if button.styleSheet():
+                    button.setStyleSheet("")
 
         # Update popup if it's currently open
         try:
@@ -734,10 +741,7 @@ class MediaWidget(BaseWidget):
                             self._format_max_field_size(self.current_session.artist, "popup_artist")
                         )
 
-                        if self.current_session.thumbnail is not None:
-                            popup_pixmap = self._create_thumbnail_for_popup(self.current_session.thumbnail)
-                        else:
-                            popup_pixmap = self._create_empty_thumbnail()
+                        popup_pixmap = self._request_popup_thumbnail()
                         self._popup_thumbnail_label.setPixmap(popup_pixmap or QPixmap())
 
                     if hasattr(self, "_popup_source_label"):
@@ -788,7 +792,7 @@ class MediaWidget(BaseWidget):
                     formatted_label = self._format_max_field_size(self.current_session.title)
                 else:
                     formatted_label = "No media"
-            active_label.setText(formatted_label)
+            self.set_label(active_label, formatted_label)
 
         # If we don't want the thumbnail, stop here
         if not self.config.show_thumbnail:
@@ -796,251 +800,83 @@ class MediaWidget(BaseWidget):
 
         # If no media in session, hide thumbnail and stop here
         if self.current_session and self.current_session.thumbnail is None:
+            self._pending_bar_thumbnail = None
             self._thumbnail_label.hide()
             return
         # Only update the thumbnail if the title/artist changes or if we did a toggle (resize)
         try:
             if self.current_session and self.current_session.title and self.current_session.thumbnail:
-                thumbnail = self._crop_thumbnail(self.current_session.thumbnail, active_label.sizeHint().width())
-                pixmap = QPixmap.fromImage(ImageQt(thumbnail))
-                self._thumbnail_label.setPixmap(pixmap)
-
+                self._request_bar_thumbnail(active_label.sizeHint().width())
         except Exception as e:
             logger.error("Error setting thumbnail: %s", e)
             self._thumbnail_label.hide()
-        else:
-            self._thumbnail_label.show()
 
     def _create_empty_thumbnail(self):
         """Create a default thumbnail with an eighth note icon."""
         try:
-            size = self.config.media_menu.thumbnail_size
-            corner_radius = self.config.media_menu.thumbnail_corner_radius
-            # Create base image with dark background
-            large_size = size * 2  # Create at higher resolution for better quality
-            large_img = Image.new("RGBA", (large_size, large_size), (0, 0, 0, 255))
-            draw = ImageDraw(large_img)
-
-            # Use white color for the note
-            note_color = (255, 255, 255, 255)
-
-            # Scale all elements relative to image size
-            center_x = large_size // 2
-            center_y = large_size // 2
-
-            # Calculate note head dimensions - make it large like in the image
-            head_radius = int(large_size * 0.14)  # Note head is about 44% of width
-
-            # Calculate position of the note head (centered horizontally, lower half vertically)
-            head_x = center_x - int(large_size * 0.1)  # Slightly left of center
-            head_y = center_y + int(large_size * 0.12)  # Lower half
-
-            # Calculate stem dimensions
-            stem_width = int(large_size * 0.05)
-            stem_height = int(large_size * 0.4)
-
-            # Calculate flag dimensions
-            flag_width = int(large_size * 0.15)
-            flag_height = int(large_size * 0.3)
-
-            # Draw the note stem (vertical line)
-            stem_x = head_x + head_radius - stem_width  # Stem attaches to right side of note head
-            stem_top_y = head_y - stem_height
-            draw.rectangle(
-                (
-                    (stem_x, stem_top_y),  # Top-left
-                    (stem_x + stem_width, head_y),  # Bottom-right
-                ),
-                fill=note_color,
-            )
-
-            # Draw the note head (circle)
-            draw.ellipse(
-                [
-                    (head_x - head_radius, head_y - head_radius),
-                    (head_x + head_radius, head_y + head_radius),
-                ],
-                fill=note_color,
-            )
-
-            draw.rectangle(
-                (
-                    (stem_x + stem_width - 1, stem_top_y),
-                    (stem_x + stem_width + flag_width, stem_top_y + flag_height // 3),
-                ),
-                fill=note_color,
+            return QPixmap.fromImage(
+                render_empty_thumbnail(
+                    self.config.media_menu.thumbnail_size, self.config.media_menu.thumbnail_corner_radius
+                )
             )
-
-            # Resize down to target size with high quality anti-aliasing
-            img = large_img.resize((size, size), Image.LANCZOS)
-
-            # Add rounded corners
-            mask = Image.new("L", (size, size), 0)
-            mask_draw = ImageDraw(mask)
-            mask_draw.rounded_rectangle(((0, 0), (size, size)), corner_radius, fill=150)
-
-            # Apply mask for rounded corners
-            img.putalpha(mask)
-
-            return QPixmap.fromImage(ImageQt(img))
-
         except Exception as e:
             logger.error("Error creating default thumbnail: %s", e)
             return None
 
-    def _create_thumbnail_for_popup(self, img: Image.Image):
-        """Process image thumbnail into a square with rounded corners for popup display."""
-        try:
-            square_size = self.config.media_menu.thumbnail_size
-            # Increase corner radius for more visible rounded corners (25% instead of 15%)
-            corner_radius = self.config.media_menu.thumbnail_corner_radius
-
-            # Calculate aspect ratio
-            aspect = img.width / img.height
-
-            # First resize maintaining aspect ratio to cover the square
-            if aspect > 1:  # Wider than tall
-                new_height = square_size
-                new_width = int(square_size * aspect)
-            else:  # Taller than wide
-                new_width = square_size
-                new_height = int(square_size / aspect)
-
-            # Resize with high-quality resampling
-            resized = img.resize((new_width, new_height), Image.LANCZOS)
-
-            # Crop to square
-            if resized.width >= square_size and resized.height >= square_size:
-                left = (resized.width - square_size) // 2
-                top = (resized.height - square_size) // 2
-                square_img = resized.crop((left, top, left + square_size, top + square_size))
-            else:
-                square_img = resized.resize((square_size, square_size), Image.LANCZOS)
-
-            # Ensure image is RGBA
-            if square_img.mode != "RGBA":
-                square_img = square_img.convert("RGBA")
-
-            # Create much higher-resolution mask for better anti-aliasing (12x size)
-            scale = 4  # Significantly increased for smoother corners
-            hr_size = square_size * scale
-            hr_radius = corner_radius * scale
-
-            # Create the mask
-            mask = Image.new("L", (hr_size, hr_size), color=0)
-            draw = ImageDraw(mask)
-
-            # Draw rounded rectangle with smoother corners
-            draw.rounded_rectangle(((0, 0), (hr_size, hr_size)), radius=hr_radius, fill=255)
-
-            # Resize mask back down with high-quality anti-aliasing
-            mask = mask.resize((square_size, square_size), Image.LANCZOS)
-
-            # Apply the mask to create rounded corners
-            square_img.putalpha(mask)
-
-            # Convert to QPixmap
-            return QPixmap.fromImage(ImageQt(square_img))
-        except Exception as e:
-            logger.error("Error creating square thumbnail: %s", e)
-            return None
-
-    def _crop_thumbnail(self, thumbnail: Image.Image, active_label_width: int) -> Image.Image:
-        """Process an image thumbnail for proper display."""
-        # Calculate dimensions while respecting container padding
+    def _request_popup_thumbnail(self) -> QPixmap | None:
+        """Request the popup thumbnail, returns it right away if already rendered, otherwise the default one."""
+        session = self.current_session
+        if session is None or session.thumbnail is None:
+            return self._create_empty_thumbnail()
+        size = self.config.media_menu.thumbnail_size
+        radius = self.config.media_menu.thumbnail_corner_radius
+        key = ("popup", session.thumbnail_key or id(session.thumbnail), size, radius)
+        self._pending_popup_thumbnail = key
+        image = self._thumbnail_renderer.request(key, render_popup_thumbnail, session.thumbnail, size, radius)
+        if image is not None:
+            return QPixmap.fromImage(image)
+        return self._create_empty_thumbnail()
+
+    def _request_bar_thumbnail(self, active_label_width: int) -> None:
+        """Request the bar thumbnail for the current session, applied in _on_thumbnail_ready once rendered."""
+        session = self.current_session
         available_width = active_label_width
-
         if not self.config.scrolling_label.enabled:
             available_width = available_width + self.config.thumbnail_padding
-        # Preserve aspect ratio during resize
-        aspect_ratio = thumbnail.width / thumbnail.height
-        new_height = int(available_width / aspect_ratio)
-
-        # Resize with high-quality resampling
-        thumbnail = thumbnail.resize((available_width, new_height), Image.LANCZOS)
-
-        # Crop vertically to fit widget height
         available_height = max(1, int(self._widget_container.contentsRect().height()))
-        if thumbnail.height > available_height:
-            y1 = (thumbnail.height - available_height) // 2
-            thumbnail = thumbnail.crop((0, y1, thumbnail.width, y1 + available_height))
-
-        # Apply base transparency
-        if thumbnail.mode != "RGBA":
-            thumbnail = thumbnail.convert("RGBA")
-
-        # Create base alpha channel filled with the thumbnail alpha value
-        base_alpha = Image.new("L", thumbnail.size, color=self.config.thumbnail_alpha)
-
-        # Apply effects based on priorities
-        if self.config.thumbnail_edge_fade:
-            # If edge fade is enabled, use it without corner radius
-            base_alpha = self._apply_edge_fade(base_alpha)
-        elif self.config.thumbnail_corner_radius > 0:
-            # Only apply corner radius if edge fade is disabled
-            base_alpha = self._create_corner_mask(thumbnail.size, base_alpha)
-
-        # Apply final alpha channel
-        thumbnail.putalpha(base_alpha)
-        return thumbnail
-
-    def _create_corner_mask(self, image_size: tuple[int, int], base_mask: Image.Image) -> Image.Image:
-        """Create a rounded corner mask compatible with the base alpha mask."""
-        # Determine which corners to round
-        corners = (False, True, True, False) if self.config.controls_left else (True, False, False, True)
-        if self.config.symmetric_corner_radius:
-            corners = (True, True, True, True)
-
-        # Use a higher resolution for better antialiasing
-        scale_factor = 2
-        hr_size = (image_size[0] * scale_factor, image_size[1] * scale_factor)
-        hr_radius = self.config.thumbnail_corner_radius * scale_factor
-
-        # Create the high-resolution mask
-        corner_mask = Image.new("L", hr_size, color=0)
-        painter = ImageDraw(corner_mask)
+        key = (
+            "bar",
+            session.thumbnail_key or id(session.thumbnail),
+            available_width,
+            available_height,
+            self._bar_thumbnail_style,
+        )
+        self._pending_bar_thumbnail = key
+        image = self._thumbnail_renderer.request(
+            key,
+            render_bar_thumbnail,
+            session.thumbnail,
+            available_width,
+            available_height,
+            self._bar_thumbnail_style,
+        )
+        if image is not None:
+            self._on_thumbnail_ready(key, image)
 
+    @pyqtSlot(tuple, QImage)
+    def _on_thumbnail_ready(self, key: tuple, image: QImage):
         try:
-            # Draw rounded rectangle
-            painter.rounded_rectangle(
-                (0, 0, hr_size[0] - 1, hr_size[1] - 1),
-                hr_radius,
-                self.config.thumbnail_alpha,
-                None,
-                0,
-                corners=corners,
-            )
-        except Exception as e:
-            logger.error("Error creating corner mask, return default thumb: %s", e)
-            return base_mask
-
-        # Scale back down with antialiasing
-        corner_mask = corner_mask.resize(image_size, Image.LANCZOS)
-
-        return corner_mask
-
-    def _apply_edge_fade(self, alpha_mask: Image.Image) -> Image.Image:
-        """Apply edge fade effect to an alpha mask."""
-
-        width, height = alpha_mask.size
-        fade_width = int(width * 0.3)
-        fade_mask = Image.new("L", (width, height), color=255)
-
-        # Create gradient arrays for better performance
-        left_gradient = [int(255 * (x / fade_width)) for x in range(fade_width)]
-        right_gradient = [int(255 * ((width - x) / fade_width)) for x in range(width - fade_width, width)]
-
-        # Apply gradients
-        for x, alpha in enumerate(left_gradient):
-            line = Image.new("L", (1, height), color=alpha)
-            fade_mask.paste(line, (x, 0))
-
-        for i, x in enumerate(range(width - fade_width, width)):
-            line = Image.new("L", (1, height), color=right_gradient[i])
-            fade_mask.paste(line, (x, 0))
-
-        # Use ImageChops.darker instead of multiply to preserve corner transparency
-        return ImageChops.darker(alpha_mask, fade_mask)
+            if key == self._pending_bar_thumbnail:
+                self._pending_bar_thumbnail = None
+                if self.current_session is not None and self.current_session.thumbnail is not None:
+                    self._thumbnail_label.setPixmap(QPixmap.fromImage(image))
+                    self._thumbnail_label.show()
+            if key == self._pending_popup_thumbnail:
+                self._pending_popup_thumbnail = None
+                if hasattr(self, "_popup_thumbnail_label") and self.dialog.isVisible():
+                    self._popup_thumbnail_label.setPixmap(QPixmap.fromImage(image))
+        except RuntimeError:
+            pass
 
     def _format_max_field_size(self, text: str, field_type: FieldTypes = "default"):
         if field_type == "popup_title":
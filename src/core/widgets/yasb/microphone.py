@@ -3,7 +3,7 @@ import re
 
 from PyQt6.QtCore import QRect, Qt
 from PyQt6.QtGui import QWheelEvent
-from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSlider, QVBoxLayout, QWidget
+from PyQt6.QtWidgets import QFrame, QHBoxLayout, QPushButton, QSlider, QVBoxLayout, QWidget
 
 from core.utils.qobject import is_valid_qobject
 from core.utils.tooltip import CustomToolTip, set_tooltip
@@ -13,7 +13,7 @@ from core.utils.utilities import (
     refresh_widget_style,
 )
 from core.validation.widgets.yasb.microphone import MicrophoneConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.microphone.service import AudioInputService
 
 
@@ -76,9 +76,6 @@ class MicrophoneWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         # Handle no device case
         if self.audio_endpoint is None:
@@ -106,25 +103,19 @@ class MicrophoneWidget(BaseWidget):
             numeric_value = int(re.search(r"\d+", min_level).group()) if re.search(r"\d+", min_level) else 0
             self.progress_widget.set_value(numeric_value)
 
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if "<span" in part and "</span>" in part:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        self._set_muted_class(
-                            active_widgets[widget_index], mute_status == 1 if mute_status is not None else False
-                        )
-                else:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        self._set_muted_class(
-                            active_widgets[widget_index], mute_status == 1 if mute_status is not None else False
-                        )
-                widget_index += 1
+        format_text = replace_options(label_options)
+        state_classes = " ".join(
+            name for name, active in (("no-device", self.audio_endpoint is None), ("muted", mute_status == 1)) if active
+        )
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {state_classes}".rstrip(),
+            format_icon=format_text,
+            icon_class=state_classes,
+        )
 
     def _update_slider_value(self):
         """Helper method to update slider value based on current microphone level"""
@@ -141,26 +132,6 @@ class MicrophoneWidget(BaseWidget):
         slider.setSingleStep(step)
         slider.setPageStep(step)
 
-    def _set_muted_class(self, widget, muted: bool):
-        """Set or remove the 'muted' and 'no-device' classes on the widget."""
-        current_class = widget.property("class") or ""
-        classes = set(current_class.split())
-
-        # Handle no-device class
-        if self.audio_endpoint is None:
-            classes.add("no-device")
-        else:
-            classes.discard("no-device")
-
-        # Handle muted class
-        if muted:
-            classes.add("muted")
-        else:
-            classes.discard("muted")
-
-        widget.setProperty("class", " ".join(classes))
-        refresh_widget_style(widget)
-
     def _on_slider_released(self):
         """Hide tooltip when slider is released"""
         if hasattr(self, "_slider_tooltip") and self._slider_tooltip:
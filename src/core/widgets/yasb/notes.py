@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 import os
-import re
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
@@ -22,6 +22,7 @@ from PyQt6.QtWidgets import (
 )
 
 from core.config import HOME_CONFIGURATION_DIR
+from core.utils.local_store import LocalStore, StoredList
 from core.utils.qobject import is_valid_qobject
 from core.utils.tooltip import set_tooltip
 from core.utils.win32.utils import find_focused_screen, get_foreground_hwnd, set_foreground_hwnd  # type: ignore
@@ -57,6 +58,7 @@ class NotesWidget(BaseWidget):
         self.editing_note: dict[str, str] | None = None
         self._pending_note_html: str = ""
         self.notes_file: str = ""
+        self._notes_store: StoredList | None = None
         self.notes: list[dict[str, str]] = []
 
         self.note_input: NoteTextEdit
@@ -72,6 +74,8 @@ class NotesWidget(BaseWidget):
             self.notes_file = os.path.expanduser(config.data_path)
         else:
             self.notes_file = os.path.join(HOME_CONFIGURATION_DIR, "notes.json")
+            # Default notes live in the local store, notes.json is only imported once
+            self._notes_store = LocalStore.get_instance().get_list("notes", legacy_file=self.notes_file)
         self.notes = self._load_notes()
 
         self._init_container()
@@ -255,26 +259,8 @@ class NotesWidget(BaseWidget):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
 
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-
         notes_count = len(self.notes)
-
-        for widget_index, part in enumerate(label_parts):
-            if widget_index >= len(active_widgets):
-                continue
-
-            current_widget = active_widgets[widget_index]
-            if not isinstance(current_widget, QLabel):
-                continue
-
-            if "<span" in part and "</span>" in part:
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                current_widget.setText(icon)
-            else:
-                formatted_text = part.format(count=notes_count)
-                current_widget.setText(formatted_text)
-            widget_index += 1
+        self.render_label(active_widgets, active_label_content, format_text=lambda text: text.format(count=notes_count))
 
     def _build_menu_button(
         self,
@@ -484,18 +470,20 @@ class NotesWidget(BaseWidget):
 
         if self.editing_note:
             # Update existing note
+            edited_note = self.editing_note
             for i, existing_note in enumerate(self.notes):
-                if existing_note == self.editing_note:
+                if existing_note == edited_note:
                     self.notes[i] = note_data
                     break
             self.editing_note = None  # Reset edit mode
             self.add_button.setText("Add Note")
             self.cancel_button.hide()
+            self._save_notes(lambda store: store.update(edited_note, note_data))
         else:
             # Add new note
             self.notes.insert(0, note_data)
+            self._save_notes(lambda store: store.insert(0, note_data))
 
-        self._save_notes()
         self.note_input.clear()
         NotesWidget.update_all()  # Update all widget instances
 
@@ -597,7 +585,7 @@ class NotesWidget(BaseWidget):
         """Delete a note"""
         if note in self.notes:
             self.notes.remove(note)
-            self._save_notes()
+            self._save_notes(lambda store: store.remove(note))
             NotesWidget.update_all()  # Update all widget instances
 
     def _on_clear_chat(self) -> None:
@@ -621,8 +609,10 @@ class NotesWidget(BaseWidget):
             clipboard.setText(note["title"])
 
     def _load_notes(self) -> list[dict[str, str]]:
-        """Load notes from JSON file"""
+        """Load notes from the local store or the custom JSON file"""
         try:
+            if self._notes_store is not None:
+                return self._notes_store.load()
             if os.path.exists(self.notes_file):
                 logging.debug("Loading notes from %s", self.notes_file)
                 with open(self.notes_file, encoding="utf-8") as f:
@@ -632,9 +622,17 @@ class NotesWidget(BaseWidget):
 
         return []
 
-    def _save_notes(self) -> None:
-        """Save notes to JSON file"""
+    def _save_notes(self, store_change: Callable[[StoredList], bool | None] | None = None) -> None:
+        """Save notes to the local store or the custom JSON file, ``store_change`` writes just the changed note"""
         try:
+            if self._notes_store is not None:
+                if store_change is not None:
+                    if store_change(self._notes_store) is not False:
+                        return
+                    # The store no longer matches the list in memory, write the whole list instead
+                    logging.warning("Changed note not found in the local store, saving all notes")
+                self._notes_store.save(self.notes)
+                return
             logging.debug("Saving notes to %s", self.notes_file)
             with open(self.notes_file, "w", encoding="utf-8") as f:
                 json.dump(self.notes, f, indent=2, ensure_ascii=False)
@@ -1,15 +1,12 @@
 import logging
-import re
 
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtWidgets import QLabel
 
 from core.events.service import EventService
 from core.utils.system import is_windows_10
-from core.utils.utilities import refresh_widget_style
 from core.utils.win32.system_function import notification_center, quick_settings
 from core.validation.widgets.yasb.notifications import NotificationsConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 
 try:
     from core.widgets.services.notifications.windows_notification import WindowsNotificationEventListener
@@ -86,35 +83,16 @@ class NotificationsWidget(BaseWidget):
         else:
             icon = self.config.icons.default
 
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         # Provide replacements for {count} and {icon}
-        label_options = [("{count}", self._notification_count), ("{icon}", icon)]
-
-        for part in label_parts:
-            part = part.strip()
-            for option, value in label_options:
-                part = part.replace(option, str(value))
-
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-
-                # Update class based on notification count
-                current_class = active_widgets[widget_index].property("class")
-                if self._notification_count > 0:
-                    if "new-notification" not in current_class:
-                        current_class += " new-notification"
-                else:
-                    current_class = current_class.replace(" new-notification", "")
-
-                active_widgets[widget_index].setProperty("class", current_class.strip())
-
-                widget_index += 1
-        for widget in active_widgets:
-            refresh_widget_style(widget)
+        format_text = replace_options({"{count}": self._notification_count, "{icon}": icon})
+        # Update class based on notification count
+        state_class = "new-notification" if self._notification_count > 0 else ""
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {state_class}".rstrip(),
+            format_icon=format_text,
+            icon_class=state_class,
+        )
@@ -4,7 +4,6 @@ from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QGraphicsOpacityEffect, QLabel
 
 from core.utils.tooltip import set_tooltip
-from core.utils.utilities import refresh_widget_style
 from core.validation.widgets.yasb.obs import ObsConfig
 from core.widgets.base import BaseWidget
 from core.widgets.services.obs.obs_client import ObsWebSocketClient, ObsWorker
@@ -207,16 +206,20 @@ class ObsWidget(BaseWidget):
     def _on_virtual_cam(self, active: bool):
         if self._virtual_cam_btn:
             self._virtual_cam_active = active
-            self._virtual_cam_btn.setText(self._icons["virtual_cam_on" if active else "virtual_cam_off"])
-            self._virtual_cam_btn.setProperty("class", f"icon virtual-cam {'on' if active else 'off'}")
-            refresh_widget_style(self._virtual_cam_btn)
+            self.set_label(
+                self._virtual_cam_btn,
+                self._icons["virtual_cam_on" if active else "virtual_cam_off"],
+                f"icon virtual-cam {'on' if active else 'off'}",
+            )
 
     def _on_studio_mode(self, enabled: bool):
         if self._studio_mode_btn:
             self._studio_mode_active = enabled
-            self._studio_mode_btn.setText(self._icons["studio_mode_on" if enabled else "studio_mode_off"])
-            self._studio_mode_btn.setProperty("class", f"icon studio-mode {'on' if enabled else 'off'}")
-            refresh_widget_style(self._studio_mode_btn)
+            self.set_label(
+                self._studio_mode_btn,
+                self._icons["studio_mode_on" if enabled else "studio_mode_off"],
+                f"icon studio-mode {'on' if enabled else 'off'}",
+            )
 
     def _on_scene_changed(self, scene_name: str):
         if self._scene_label and self._show_scene_name:
@@ -334,15 +337,13 @@ class ObsWidget(BaseWidget):
                 elapsed = int((time.monotonic() - self._record_base_time) * 1000)
                 self._record_base_ms = self._record_base_ms + elapsed
                 self._record_base_time = time.monotonic()
-            self._record_btn.setText(self._icons["paused"])
-            self._record_btn.setProperty("class", "icon record paused")
+            self.set_label(self._record_btn, self._icons["paused"], "icon record paused")
             self._start_time_timer()
             self._stop_opacity_timer()
             if self._time_label and self._show_record_time:
                 self._time_label.show()
         elif active:
-            self._record_btn.setText(self._icons["recording"])
-            self._record_btn.setProperty("class", "icon record recording")
+            self.set_label(self._record_btn, self._icons["recording"], "icon record recording")
             if self._record_base_time == 0.0:
                 self._record_base_time = time.monotonic()
             self._start_time_timer()
@@ -351,8 +352,7 @@ class ObsWidget(BaseWidget):
             if self._time_label and self._show_record_time:
                 self._time_label.show()
         else:
-            self._record_btn.setText(self._icons["stopped"])
-            self._record_btn.setProperty("class", "icon record stopped")
+            self.set_label(self._record_btn, self._icons["stopped"], "icon record stopped")
             self._record_base_ms = 0
             self._record_base_time = 0.0
             self._record_sync_counter = 0
@@ -361,8 +361,6 @@ class ObsWidget(BaseWidget):
                 self._time_label.setText("")
                 self._time_label.hide()
 
-        refresh_widget_style(self._record_btn)
-
         if self._hide_when_not_recording:
             self.show() if (active or paused) else self.hide()
 
@@ -381,18 +379,13 @@ class ObsWidget(BaseWidget):
         self._is_stream_stopping = stopping
         if self._stream_btn:
             if starting:
-                self._stream_btn.setText(self._icons["streaming"])
-                self._stream_btn.setProperty("class", "icon stream starting")
+                self.set_label(self._stream_btn, self._icons["streaming"], "icon stream starting")
             elif stopping:
-                self._stream_btn.setText(self._icons["streaming_stopped"])
-                self._stream_btn.setProperty("class", "icon stream stopping")
+                self.set_label(self._stream_btn, self._icons["streaming_stopped"], "icon stream stopping")
             elif active:
-                self._stream_btn.setText(self._icons["streaming"])
-                self._stream_btn.setProperty("class", "icon stream on")
+                self.set_label(self._stream_btn, self._icons["streaming"], "icon stream on")
             else:
-                self._stream_btn.setText(self._icons["streaming_stopped"])
-                self._stream_btn.setProperty("class", "icon stream off")
-            refresh_widget_style(self._stream_btn)
+                self.set_label(self._stream_btn, self._icons["streaming_stopped"], "icon stream off")
         if active or starting:
             if self._blinking_icon:
                 self._start_opacity_timer()
@@ -1,5 +1,4 @@
 import logging
-import re
 import time
 import traceback
 from datetime import datetime
@@ -22,7 +21,7 @@ from PyQt6.QtWidgets import (
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.validation.widgets.yasb.open_meteo import OpenMeteoWidgetConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template, replace_options
 from core.widgets.services.open_meteo.api import GeocodingFetcher, OpenMeteoDataFetcher
 from core.widgets.services.open_meteo.icons import get_weather_icon
 from core.widgets.services.open_meteo.location import (
@@ -613,22 +612,14 @@ class OpenMeteoWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str):
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split(r"(<span.*?>.*?</span>)", content)
-            label_parts = [part for part in label_parts if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                     label.hide()
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                     label.setText("weather update...")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -645,7 +636,7 @@ class OpenMeteoWidget(BaseWidget):
         """Set the same text on all visible label widgets."""
         for widget in self._widgets:
             if widget.property("class") and "icon" not in (widget.property("class") or ""):
-                widget.setText(text)
+                self.set_label(widget, text)
                 if not widget.isVisible():
                     widget.show()
 
@@ -661,10 +652,6 @@ class OpenMeteoWidget(BaseWidget):
         except ValueError, AttributeError:
             return iso_time
 
-    def _reload_css(self, label: QLabel):
-        refresh_widget_style(label)
-        label.update()
-
     @pyqtSlot(bool)
     def _update_label(self, update_class: bool = True):
         if self._weather_data is None:
@@ -672,8 +659,6 @@ class OpenMeteoWidget(BaseWidget):
 
         active_widgets = self._show_alt_label and self._widgets_alt or self._widgets
         active_label_content = self._show_alt_label and self._label_alt_content or self._label_content
-        label_parts = re.split(r"(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
 
         if self.config.tooltip:
             tooltip = (
@@ -682,29 +667,24 @@ class OpenMeteoWidget(BaseWidget):
             )
             set_tooltip(self, tooltip)
 
-        widget_index = 0
-        try:
-            for part in label_parts:
-                part = part.strip()
-                for option, value in self._weather_data.items():
-                    part = part.replace(option, str(value))
-                if not part or widget_index >= len(active_widgets):
-                    continue
-                if "<span" in part and "</span>" in part:
-                    icon_name = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(self.config.icons.model_dump().get(icon_name, icon_name))
-                    if update_class:
-                        current_class = active_widgets[widget_index].property("class") or ""
-                        append_class_icon = self._weather_data.get("{icon_class}", "")
-                        new_class = f"{current_class} {append_class_icon}"
-                        active_widgets[widget_index].setProperty("class", new_class)
-                        self._reload_css(active_widgets[widget_index])
-                else:
-                    active_widgets[widget_index].setText(part)
+        format_text = replace_options(self._weather_data)
+        icons = self.config.icons.model_dump()
 
-                if not active_widgets[widget_index].isVisible():
-                    active_widgets[widget_index].show()
-                widget_index += 1
+        def format_icon(text: str) -> str:
+            icon_name = format_text(text)
+            return icons.get(icon_name, icon_name)
+
+        try:
+            self.render_label(
+                active_widgets,
+                active_label_content,
+                format_text=format_text,
+                format_icon=format_icon,
+                icon_class=self._weather_data.get("{icon_class}", "") if update_class else None,
+            )
+            for widget in active_widgets:
+                if not widget.isVisible():
+                    widget.show()
         except Exception as e:
             logging.exception("Failed to update label: %s", e)
 
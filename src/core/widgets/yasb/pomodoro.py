@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 
 from PyQt6.QtCore import QPropertyAnimation, QRectF, Qt, QTimer, pyqtProperty
 from PyQt6.QtGui import QColor, QPainter, QPen
@@ -13,7 +12,7 @@ from core.utils.utilities import (
     refresh_widget_style,
 )
 from core.validation.widgets.yasb.pomodoro import PomodoroConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from settings import SCRIPT_PATH
 
 
@@ -139,9 +138,6 @@ class PomodoroWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         remaining_str = self._format_time(self._remaining_time)
         status = "Paused" if self._is_paused else "Break" if self._is_break else "Work"
@@ -179,26 +175,16 @@ class PomodoroWidget(BaseWidget):
             percent = (elapsed / max_value) * 100 if max_value > 0 else 0
             self.progress_widget.set_value(percent)
 
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if "<span" in part and "</span>" in part:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        base_class = active_widgets[widget_index].property("class").split()[0]
-                        active_widgets[widget_index].setProperty("class", f"{base_class} {class_name}")
-                        refresh_widget_style(active_widgets[widget_index])
-                else:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        alt_class = "alt" if self._show_alt_label else ""
-                        active_widgets[widget_index].setText(formatted_text)
-                        base_class = "label"
-                        active_widgets[widget_index].setProperty("class", f"{base_class} {alt_class} {class_name}")
-                        refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        format_text = replace_options(label_options)
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {class_name}",
+            format_icon=format_text,
+            icon_class=class_name,
+        )
 
     def _get_current_icon(self) -> str:
         if self._is_paused:
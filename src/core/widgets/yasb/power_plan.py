@@ -1,16 +1,15 @@
 import ctypes
 import logging
-import re
 from ctypes import wintypes
 
 from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QFrame, QLabel, QPushButton, QVBoxLayout
+from PyQt6.QtWidgets import QFrame, QPushButton, QVBoxLayout
 
-from core.utils.utilities import PopupWidget, refresh_widget_style
+from core.utils.utilities import PopupWidget
 from core.utils.win32.bindings import PowerEnumerate, PowerGetActiveScheme, PowerReadFriendlyName, PowerSetActiveScheme
 from core.utils.win32.structs import GUID
 from core.validation.widgets.yasb.power_plan import PowerPlanConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 
 
 class PowerPlanWidget(BaseWidget):
@@ -99,26 +98,17 @@ class PowerPlanWidget(BaseWidget):
         """Update the label with the current power plan name."""
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
-        label_options = {"{active_plan}": self._active_plan_name}
-
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                    active_widgets[widget_index].setText(formatted_text)
-                    # Get the base class (without any power plan classes)
-                    alt_class = "alt" if self._show_alt_label else ""
-                    base_class = "icon" if "<span" in part else f"label {alt_class}"
-                    active_widgets[widget_index].setProperty("class", f"{base_class} {self._plan_class_name}")
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+
+        format_text = replace_options({"{active_plan}": self._active_plan_name})
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {self._plan_class_name}",
+            format_icon=format_text,
+            icon_class=self._plan_class_name,
+        )
 
     def _toggle_label(self):
         """Toggle between main and alt labels."""
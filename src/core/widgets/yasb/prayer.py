@@ -1,16 +1,18 @@
 import json
 import logging
+import os
 import re
 import urllib.parse
-from datetime import datetime, timedelta, date
+from datetime import date, datetime, timedelta
 
 from PyQt6.QtCore import Qt, QTimer, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout
 
-from core.utils.utilities import PopupWidget, refresh_widget_style
+from core.utils.system import app_data_path
+from core.utils.utilities import PopupWidget
 from core.validation.widgets.yasb.prayer import PrayerTimeConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 
 logger = logging.getLogger("prayer_widget")
 
@@ -19,8 +21,14 @@ _NEXT_DAY_PRAYERS = {"lastthird", "firstthird"}
 HEADER = (b"User-Agent", b"Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0")
 CACHE_CONTROL = (b"Cache-Control", b"no-cache")
 
+_CALENDAR_FILE = "prayer_times.json"
+# Fetch the next month once fewer than this many days of timings are left
+_PREFETCH_DAYS = 7
+
 
 class PrayerDataFetcher(QNetworkAccessManager):
+    """Fetches a month of timings; emits ``{iso_date: timings}`` or ``{}`` on failure."""
+
     finished = pyqtSignal(dict)
 
     def __init__(self, parent=None):
@@ -37,33 +45,38 @@ class PrayerDataFetcher(QNetworkAccessManager):
         try:
             if reply.error() == QNetworkReply.NetworkError.NoError:
                 data = json.loads(reply.readAll().data().decode())
-                timings = data["data"]["timings"]
-                meta = data["data"]["meta"]
-                result = {
-                    "city": meta["timezone"].split("/")[-1].replace("_", " "),
-                    "fajr": timings["Fajr"],
-                    "sunrise": timings["Sunrise"],
-                    "dhuhr": timings["Dhuhr"],
-                    "asr": timings["Asr"],
-                    "sunset": timings["Sunset"],
-                    "maghrib": timings["Maghrib"],
-                    "isha": timings["Isha"],
-                    "imsak": timings["Imsak"],
-                    "midnight": timings["Midnight"],
-                    "firstthird": timings["Firstthird"],
-                    "lastthird": timings["Lastthird"],
-                }
-                self.finished.emit(result)
+                self.finished.emit({day_date: timings for day_date, timings in map(_parse_day, data["data"])})
             else:
                 logger.error("Prayer API network error: %s", reply.error().name)
                 self.finished.emit({})
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
             logger.error("Prayer API response parse error: %s", e)
             self.finished.emit({})
         finally:
             reply.deleteLater()
 
 
+def _parse_day(day: dict) -> tuple[str, dict]:
+    """One calendar entry as ``(iso_date, timings)``"""
+    timings = day["timings"]
+    meta = day["meta"]
+    day_date = datetime.strptime(day["date"]["gregorian"]["date"], "%d-%m-%Y").date()
+    return day_date.isoformat(), {
+        "city": meta["timezone"].split("/")[-1].replace("_", " "),
+        "fajr": timings["Fajr"],
+        "sunrise": timings["Sunrise"],
+        "dhuhr": timings["Dhuhr"],
+        "asr": timings["Asr"],
+        "sunset": timings["Sunset"],
+        "maghrib": timings["Maghrib"],
+        "isha": timings["Isha"],
+        "imsak": timings["Imsak"],
+        "midnight": timings["Midnight"],
+        "firstthird": timings["Firstthird"],
+        "lastthird": timings["Lastthird"],
+    }
+
+
 class PrayerTimeWidget(BaseWidget):
     validation_schema = PrayerTimeConfig
 
@@ -75,35 +88,41 @@ class PrayerTimeWidget(BaseWidget):
         self._city = config.city
         self._country = config.country
         self._method = config.method
+        # An attribute so the schedule can be driven by a fake clock
+        self._clock = datetime.now
 
         tune_dict = config.tune.model_dump()
         tune_str = ",".join(
             str(tune_dict[p])
             for p in ["Imsak", "Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib", "Sunset", "Isha", "Midnight"]
         )
-        self._api_url = (
-            f"http://api.aladhan.com/v1/timingsByCity"
-            f"?city={urllib.parse.quote(self._city)}"
+        self._api_query = (
+            f"city={urllib.parse.quote(self._city)}"
             f"&country={urllib.parse.quote(self._country)}"
             f"&method={self._method}"
             f"&tune={urllib.parse.quote(tune_str)}"
         )
+        self._api_base_url = "http://api.aladhan.com/v1/calendarByCity"
 
         self._fetcher = PrayerDataFetcher(self)
         self._fetcher.finished.connect(self._on_data_fetched)
 
-        self._fetch_timer = QTimer(self)
-        self._fetch_timer.timeout.connect(self._do_fetch)
-        self._fetch_timer.start(config.update_interval * 1000)
-
+        # Single-shot, armed for the next moment the label can change
         self._update_timer = QTimer(self)
-        self._update_timer.timeout.connect(self._update_label)
-        self._update_timer.start(60_000)
+        self._update_timer.setSingleShot(True)
+        # Coarse timers may fire up to 5% early, which would only cost an extra wakeup
+        self._update_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._update_timer.timeout.connect(self._on_update_timer)
+        # Wall-clock time the update timer was armed for
+        self._update_due: datetime | None = None
 
         self._retry_timer = QTimer(self)
         self._retry_timer.setSingleShot(True)
         self._retry_timer.timeout.connect(self._do_fetch)
 
+        # Timings by ISO date, a month or more ahead
+        self._calendar: dict[str, dict] = {}
+        self._fetching: set[tuple[int, int]] = set()
         self.prayer_time_data: dict | None = None
         self._show_alt_label = False
         self._current_prayer: str | None = None
@@ -111,7 +130,6 @@ class PrayerTimeWidget(BaseWidget):
         self._current_prayer_end_time: datetime | None = None
         self._pre_prayer_time = 5
         self._post_prayer_time = 10
-        self.last_fetch_date: date | None = None
 
         self._init_container()
         self._create_dynamically_label(self._label_content, self._label_alt_content)
@@ -125,29 +143,41 @@ class PrayerTimeWidget(BaseWidget):
         self.callback_middle = config.callbacks.on_middle
 
         self._load_saved_data()
-
-        if self.prayer_time_data:
-            self._update_label()
-
-        if not self.prayer_time_data or self.last_fetch_date != datetime.now().date():
-            QTimer.singleShot(0, self._do_fetch)
+        # Shows stored timings right away and fetches whatever months are missing
+        self._update_label()
 
     # -------------------------------------------------------------------------
     # Networking
     # -------------------------------------------------------------------------
 
+    def _months_to_fetch(self) -> list[tuple[int, int]]:
+        """Months whose timings are needed soon and are not stored yet"""
+        today = self._clock().date()
+        months = []
+        if today.isoformat() not in self._calendar:
+            months.append((today.year, today.month))
+        ahead = today + timedelta(days=_PREFETCH_DAYS)
+        if ahead.isoformat() not in self._calendar and (ahead.year, ahead.month) not in months:
+            months.append((ahead.year, ahead.month))
+        return months
+
     def _do_fetch(self):
-        self._fetcher.fetch(self._api_url)
+        for year, month in self._months_to_fetch():
+            if (year, month) in self._fetching:
+                continue
+            self._fetching.add((year, month))
+            self._fetcher.fetch(f"{self._api_base_url}?{self._api_query}&month={month}&year={year}")
 
     @pyqtSlot(dict)
     def _on_data_fetched(self, data: dict):
         if not data:
+            self._fetching.clear()
             if not self._retry_timer.isActive():
                 logger.warning("Prayer API returned empty data. Retrying in 10 seconds.")
                 self._retry_timer.start(10_000)
             return
-        self.prayer_time_data = data
-        self.last_fetch_date = datetime.now().date()
+        self._fetching -= {(int(day[:4]), int(day[5:7])) for day in data}
+        self._calendar.update(data)
         self._save_data()
         self._update_label()
 
@@ -156,34 +186,52 @@ class PrayerTimeWidget(BaseWidget):
     # -------------------------------------------------------------------------
 
     def _data_file(self) -> str:
-        import os
-        return os.path.join(os.path.expanduser("~"), ".prayer_time_data.json")
+        return str(app_data_path(_CALENDAR_FILE))
 
-    def _load_saved_data(self):
-        import os
+    def _write_data_file(self, saved: dict):
+        # Written to a temp file first, so a crash never leaves another location's calendar truncated
         path = self._data_file()
-        if not os.path.exists(path):
-            return
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.error("Failed to save prayer time data")
+
+    def _load_saved_data(self):
         try:
-            with open(path) as f:
+            with open(self._data_file(), encoding="utf-8") as f:
                 saved = json.load(f)
-            self.prayer_time_data = saved["prayer_time_data"]
-            self.last_fetch_date = date.fromisoformat(saved["last_fetch_date"])
-        except (json.JSONDecodeError, KeyError, ValueError):
+            # Stored per location and calculation settings, a config change starts over
+            self._calendar = saved.get(self._api_query, {})
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError, OSError, AttributeError:
             logger.error("Failed to load saved prayer time data")
 
     def _save_data(self):
+        # Past days are never shown again
+        cutoff = (self._clock().date() - timedelta(days=1)).isoformat()
+        self._calendar = {day: timings for day, timings in self._calendar.items() if day >= cutoff}
         try:
-            with open(self._data_file(), "w") as f:
-                json.dump(
-                    {
-                        "prayer_time_data": self.prayer_time_data,
-                        "last_fetch_date": self.last_fetch_date.isoformat(),
-                    },
-                    f,
-                )
-        except OSError:
-            logger.error("Failed to save prayer time data")
+            with open(self._data_file(), encoding="utf-8") as f:
+                saved = json.load(f)
+        except OSError, json.JSONDecodeError:
+            saved = {}
+        if not isinstance(saved, dict):
+            saved = {}
+        saved[self._api_query] = self._calendar
+        self._write_data_file(saved)
+
+    def _select_today(self) -> None:
+        """Point ``prayer_time_data`` at today's timings, fetching ahead when running low"""
+        today = self._clock().date()
+        data = self._calendar.get(today.isoformat())
+        if data is not None:
+            self.prayer_time_data = data
+        if self._months_to_fetch() and not self._fetching and not self._retry_timer.isActive():
+            QTimer.singleShot(0, self._do_fetch)
 
     # -------------------------------------------------------------------------
     # Time helpers
@@ -196,7 +244,7 @@ class PrayerTimeWidget(BaseWidget):
         try:
             parts = time_str.split(":")
             hours, minutes = int(parts[0]), int(parts[1])
-            anchor = base_date or datetime.now().date()
+            anchor = base_date or self._clock().date()
             return datetime(anchor.year, anchor.month, anchor.day, hours, minutes, 0)
         except (ValueError, IndexError):
             logger.error("Invalid time format: %r", time_str)
@@ -206,7 +254,7 @@ class PrayerTimeWidget(BaseWidget):
         raw = self.prayer_time_data.get(key) if self.prayer_time_data else None
         if not raw:
             return None
-        today = datetime.now().date()
+        today = self._clock().date()
         base = today + timedelta(days=1) if key in _NEXT_DAY_PRAYERS else today
         return self.parse_time(raw, base)
 
@@ -234,7 +282,7 @@ class PrayerTimeWidget(BaseWidget):
         if not self.prayer_time_data:
             return None, None
 
-        now = datetime.now()
+        now = self._clock()
 
         if self._current_prayer and self._current_prayer_end_time and now < self._current_prayer_end_time:
             return self._current_prayer, self._prayer_start_time
@@ -253,15 +301,16 @@ class PrayerTimeWidget(BaseWidget):
 
         first_key, first_dt = prayer_list[0]
         tomorrow = now.date() + timedelta(days=1)
-        wrapped = first_dt.replace(year=tomorrow.year, month=tomorrow.month, day=tomorrow.day)
-        return first_key, wrapped
+        tomorrow_raw = self._calendar.get(tomorrow.isoformat(), {}).get(first_key)
+        wrapped = self.parse_time(tomorrow_raw, tomorrow) if tomorrow_raw else None
+        return first_key, wrapped or first_dt.replace(year=tomorrow.year, month=tomorrow.month, day=tomorrow.day)
 
     def time_until_next_prayer(self) -> tuple[str, str, float]:
         next_prayer, next_time = self.get_next_prayer()
         if not next_prayer or not next_time:
             return "N/A", "N/A", -1
 
-        now = datetime.now()
+        now = self._clock()
         total_minutes = (next_time - now).total_seconds() / 60
 
         if -self._post_prayer_time < total_minutes <= 0:
@@ -280,21 +329,13 @@ class PrayerTimeWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str):
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split(r"(<span.*?>.*?</span>)", content)
-            label_parts = [p for p in label_parts if p]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_match = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_match.group(2) if class_match else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 label.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -317,45 +358,68 @@ class PrayerTimeWidget(BaseWidget):
             w.setVisible(self._show_alt_label)
         self._update_label(update_class=False)
 
+    def _next_label_change(self, now: datetime) -> datetime:
+        """Earliest moment the label text or state class can differ from what it shows now"""
+        candidates = [datetime.combine(now.date() + timedelta(days=1), datetime.min.time())]
+        # Only the current or next prayer decides the label, later prayers are reached through it
+        if self._current_prayer_end_time:
+            candidates.append(self._current_prayer_end_time)
+        _, next_time = self.get_next_prayer()
+        if next_time:
+            pre = timedelta(minutes=self._pre_prayer_time)
+            post = timedelta(minutes=self._post_prayer_time)
+            candidates.extend((next_time - pre, next_time, next_time + post))
+        active_content = self._label_alt_content if self._show_alt_label else self._label_content
+        if "{time_until}" in active_content:
+            # The countdown changes every minute
+            candidates.append(now.replace(second=0, microsecond=0) + timedelta(minutes=1))
+        # Midnight is always ahead of now, so there is at least one candidate
+        return min(t for t in candidates if t > now)
+
+    def _arm_update_timer(self):
+        now = self._clock()
+        self._update_due = self._next_label_change(now)
+        wait = self._update_due - now
+        self._update_timer.start(max(int(wait.total_seconds() * 1000) + 1, 1))
+
+    @pyqtSlot()
+    def _on_update_timer(self):
+        # The timer counts elapsed time, if the wall clock was set back nothing is due yet
+        if self._update_due is not None and self._clock() < self._update_due:
+            self._arm_update_timer()
+            return
+        self._update_label()
+
     @pyqtSlot()
     def _update_label(self, update_class: bool = True):
+        self._select_today()
         if self.prayer_time_data is None:
             return
 
-        now = datetime.now()
+        now = self._clock()
         next_prayer, time_until, minutes_left = self.time_until_next_prayer()
 
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_content = self._label_alt_content if self._show_alt_label else self._label_content
 
         try:
+            if self._current_prayer and self._current_prayer_end_time and now < self._current_prayer_end_time:
+                text = active_content.format(next_prayer=self._current_prayer, time_until="", **self.prayer_time_data)
+                new_class = "label prayer-time-active"
+            elif minutes_left != -1 and minutes_left <= self._pre_prayer_time:
+                text = active_content.format(next_prayer=next_prayer, time_until=time_until, **self.prayer_time_data)
+                new_class = "label prayer-time-soon"
+            else:
+                text = active_content.format(next_prayer=next_prayer, time_until=time_until, **self.prayer_time_data)
+                new_class = "label"
+
             for widget in active_widgets:
-                if not isinstance(widget, QLabel):
-                    continue
-                if self._current_prayer and self._current_prayer_end_time and now < self._current_prayer_end_time:
-                    text = active_content.format(
-                        next_prayer=self._current_prayer, time_until="", **self.prayer_time_data
-                    )
-                    new_class = "label prayer-time-active"
-                elif minutes_left != -1 and minutes_left <= self._pre_prayer_time:
-                    text = active_content.format(
-                        next_prayer=next_prayer, time_until=time_until, **self.prayer_time_data
-                    )
-                    new_class = "label prayer-time-soon"
-                else:
-                    text = active_content.format(
-                        next_prayer=next_prayer, time_until=time_until, **self.prayer_time_data
-                    )
-                    new_class = "label"
-
-                widget.setText(text)
-                if update_class:
-                    widget.setProperty("class", new_class)
-                    refresh_widget_style(widget)
+                self.set_label(widget, text, new_class if update_class else None)
                 if not widget.isVisible():
                     widget.show()
         except Exception:
             logger.exception("Failed to update prayer label")
+        self._arm_update_timer()
 
     # -------------------------------------------------------------------------
     # Popup card
@@ -389,7 +453,7 @@ class PrayerTimeWidget(BaseWidget):
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(header)
 
-        now = datetime.now()
+        now = self._clock()
         next_prayer, _, _ = self.time_until_next_prayer()
         current_prayer = self._current_prayer
 
@@ -1,12 +1,8 @@
-import re
-
 from humanize import naturalsize
-from PyQt6.QtWidgets import QLabel
 
 from core.utils.tooltip import set_tooltip
-from core.utils.utilities import refresh_widget_style
 from core.validation.widgets.yasb.recycle_bin import RecycleBinConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.recycle_bin.recycle_bin_monitor import RecycleBinMonitor
 
 
@@ -50,9 +46,6 @@ class RecycleBinWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         class_name = "bin-filled" if self._bin_info["num_items"] > 0 else "bin-empty"
 
@@ -62,26 +55,16 @@ class RecycleBinWidget(BaseWidget):
             "{icon}": self._get_current_icon(),
         }
 
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if "<span" in part and "</span>" in part:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        base_class = active_widgets[widget_index].property("class").split()[0]
-                        active_widgets[widget_index].setProperty("class", f"{base_class} {class_name}")
-                        refresh_widget_style(active_widgets[widget_index])
-                else:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        alt_class = "alt" if self._show_alt_label else ""
-                        active_widgets[widget_index].setText(formatted_text)
-                        base_class = "label"
-                        active_widgets[widget_index].setProperty("class", f"{base_class} {alt_class} {class_name}")
-                        refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        format_text = replace_options(label_options)
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {class_name}",
+            format_icon=format_text,
+            icon_class=class_name,
+        )
         if self.config.tooltip:
             set_tooltip(
                 self._widget_container,
@@ -109,7 +92,7 @@ class RecycleBinWidget(BaseWidget):
         # Update label to indicate emptying
         for widget in self._widgets:
             if "label" in widget.property("class"):
-                widget.setText("Emptying...")
+                self.set_label(widget, "Emptying...")
         # Get the thread and signal from monitor, and store the thread reference
         signal, self._empty_thread = self.monitor.empty_recycle_bin_async(
             show_confirmation=self.config.show_confirmation
@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from datetime import datetime
 
 from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, Qt, QUrl
@@ -50,9 +49,11 @@ class ServerMonitor(BaseWidget):
             ssl_check=self.config.ssl_check,
             timeout=self.config.timeout,
             update_interval_s=self.config.update_interval,
+            max_concurrency=self.config.max_concurrent_checks,
         )
         self._service_released = False
         self._service.status_updated.connect(self._handle_status_update)
+        self._service.server_checked.connect(self._handle_server_checked)
         self._service.refresh_started.connect(self._on_refresh_started)
         self.destroyed.connect(lambda *_: self._release_service())
 
@@ -74,9 +75,21 @@ class ServerMonitor(BaseWidget):
             except RuntimeError:
                 return
 
-    def _handle_status_update(self, run_id: int, status_data):
-        status_list: list[dict] = [dict(s) for s in (status_data or []) if isinstance(s, dict)]
+    def _handle_server_checked(self, run_id: int, status: dict):
+        """Merge a single finished check into the last known results while the rest of the cycle is running."""
+        known = {s.get("url"): s for s in (self._server_status_data or [])[:-1]}
+        known[status.get("url")] = dict(status)
+        self._set_status_data([known[s.url] for s in self.config.servers if s.url in known])
+        self._update_label()
 
+        if hasattr(self, "dialog") and self.dialog:
+            try:
+                if self.dialog.isVisible():
+                    self._update_menu_content()
+            except Exception:
+                pass
+
+    def _set_status_data(self, status_list: list[dict]) -> tuple[int, bool, bool]:
         online_count = sum(1 for s in status_list if s.get("status") == "Online")
         offline_count = sum(1 for s in status_list if s.get("status") == "Offline")
         no_internet = online_count == 0 and all(s.get("no_internet") for s in status_list)
@@ -94,6 +107,11 @@ class ServerMonitor(BaseWidget):
         )
 
         self._server_status_data = status_list
+        return offline_count, ssl_warning, no_internet
+
+    def _handle_status_update(self, run_id: int, status_data):
+        status_list: list[dict] = [dict(s) for s in (status_data or []) if isinstance(s, dict)]
+        offline_count, ssl_warning, no_internet = self._set_status_data(status_list)
         self._last_refresh_time = datetime.now()
         self._update_label()
         self._send_notification(run_id, offline_count, ssl_warning, no_internet)
@@ -150,9 +168,6 @@ class ServerMonitor(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         try:
             online_count = self._server_status_data[-1]["online_count"]
@@ -166,25 +181,21 @@ class ServerMonitor(BaseWidget):
             total_count = len(self.config.servers)
 
         if offline_count > 0:
-            self._widget_container.setProperty("class", "widget-container error")
+            container_class = "widget-container error"
         elif ssl_warning:
-            self._widget_container.setProperty("class", "widget-container warning")
+            container_class = "widget-container warning"
         else:
-            self._widget_container.setProperty("class", "widget-container")
-        # Force style update
-        self._widget_container.setStyleSheet(self._widget_container.styleSheet())
-
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    # Ensure the icon is correctly set
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    formatted_text = part.format(online=online_count, offline=offline_count, total=total_count)
-                    active_widgets[widget_index].setText(formatted_text)
-                widget_index += 1
+            container_class = "widget-container"
+        if self._widget_container.property("class") != container_class:
+            self._widget_container.setProperty("class", container_class)
+            # Force style update
+            self._widget_container.setStyleSheet(self._widget_container.styleSheet())
+
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=lambda text: text.format(online=online_count, offline=offline_count, total=total_count),
+        )
         if self.config.tooltip:
             set_tooltip(
                 self._widget_container, f"{online_count} online, {offline_count} offline of {total_count} servers"
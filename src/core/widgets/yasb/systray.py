@@ -2,6 +2,7 @@ import json
 import logging
 import re
 import threading
+from bisect import bisect_left
 from typing import Any, override
 from uuid import UUID
 
@@ -128,6 +129,9 @@ class SystrayWidget(BaseWidget):
         }.get(self.config.pin_click_modifier.lower(), Qt.KeyboardModifier.AltModifier)
 
         self.icons: list[IconWidget] = []
+        # Lookup indexes kept in sync with self.icons, see _index_icon/_unindex_icon
+        self._icons_by_guid: dict[UUID, IconWidget] = {}
+        self._icons_by_handle: dict[tuple[int, int], IconWidget] = {}
         self.current_state: dict[str, IconState] = {}
         self.screen_id: str | None = None
 
@@ -394,7 +398,10 @@ class SystrayWidget(BaseWidget):
 
             # After a short delay (if no new icons are added) - re-sort the icons once
             self.sort_timer.start(1000)
+        # The update may carry a new GUID or handle for the icon
+        self._unindex_icon(icon)
         self.update_icon_data(icon.data, data)
+        self._index_icon(icon)
         icon.update_icon()
         was_hidden = icon.isHidden()
         icon.setHidden(data.uFlags & NIF_STATE != 0 and data.dwState == 1)
@@ -407,7 +414,7 @@ class SystrayWidget(BaseWidget):
         """Handles the icon deleted signal sent by the tray monitor"""
         icon = self.find_icon(data.guid, data.hWnd, data.uID)
         if icon is not None:
-            self.icons.remove(icon)
+            self._remove_icon(icon)
             icon.hide()
             icon.deleteLater()
             if self.config.show_in_popup:
@@ -442,23 +449,40 @@ class SystrayWidget(BaseWidget):
     def find_icon(self, uuid: UUID | None, hwnd: int, uID: int) -> IconWidget | None:
         """Find an icon by its uuid or hwnd and uID"""
         if uuid is not None:
-            for icon in self.icons:
-                if icon.data is None or icon.data.guid is None:
-                    continue
-                if icon.data.guid == uuid:
-                    return icon
-        for icon in self.icons:
-            if icon.data is None:
-                continue
-            if icon.data.hWnd == hwnd and icon.data.uID == uID:
+            icon = self._icons_by_guid.get(uuid)
+            if icon is not None:
                 return icon
+        return self._icons_by_handle.get((hwnd, uID))
+
+    def _index_icon(self, icon: IconWidget):
+        """Add the icon to the lookup indexes under its current GUID and handle"""
+        if icon.data is None:
+            return
+        if icon.data.guid is not None:
+            self._icons_by_guid.setdefault(icon.data.guid, icon)
+        self._icons_by_handle.setdefault((icon.data.hWnd, icon.data.uID), icon)
+
+    def _unindex_icon(self, icon: IconWidget):
+        """Remove the icon from the lookup indexes"""
+        if icon.data is None:
+            return
+        if icon.data.guid is not None and self._icons_by_guid.get(icon.data.guid) is icon:
+            del self._icons_by_guid[icon.data.guid]
+        key = (icon.data.hWnd, icon.data.uID)
+        if self._icons_by_handle.get(key) is icon:
+            del self._icons_by_handle[key]
+
+    def _remove_icon(self, icon: IconWidget):
+        """Stop tracking an icon"""
+        self._unindex_icon(icon)
+        self.icons.remove(icon)
 
     def check_icons(self):
         """Check if any icons are still valid and have actual process attached"""
         icons_changed = False
         for icon in self.icons[:]:
             if icon.data is not None and not IsWindow(icon.data.hWnd):
-                self.icons.remove(icon)
+                self._remove_icon(icon)
                 icon.hide()
                 icon.deleteLater()
                 icons_changed = True
@@ -553,32 +577,65 @@ class SystrayWidget(BaseWidget):
                 index = self.current_state.get(widget.data.exe_path)
             return index.index if index is not None else 9999
 
-        unpinned.sort(key=get_sort_index)
-        pinned.sort(key=get_sort_index)
+        sorted_unpinned = sorted(unpinned, key=get_sort_index)
+        sorted_pinned = sorted(pinned, key=get_sort_index)
 
         if self.config.show_in_popup:
-            self._systray_popup.sort_unpinned(unpinned)
+            if sorted_unpinned != unpinned:
+                self._systray_popup.sort_unpinned(sorted_unpinned)
         else:
-            for w in unpinned:
-                self.unpinned_layout.insertWidget(unpinned.index(w), w)
+            self._reorder_layout(self.unpinned_layout, unpinned, sorted_unpinned)
 
-        for w in pinned:
-            self.pinned_layout.insertWidget(pinned.index(w), w)
+        self._reorder_layout(self.pinned_layout, pinned, sorted_pinned)
         self.update_current_state()
 
+    @staticmethod
+    def _reorder_layout(layout: QLayout, current: list[IconWidget], target: list[IconWidget]):
+        """
+        Reorder the widgets of a box layout from ``current`` to ``target`` order.
+        Widgets on the longest run already in target order stay put, only the others are moved.
+        """
+        if current == target:
+            return
+        target_pos = {w: i for i, w in enumerate(target)}
+        # Longest increasing subsequence of target positions in current order (patience sorting)
+        seq = [target_pos[w] for w in current]
+        tails: list[int] = []
+        tails_idx: list[int] = []
+        prev = [-1] * len(seq)
+        for i, value in enumerate(seq):
+            pos = bisect_left(tails, value)
+            if pos == len(tails):
+                tails.append(value)
+                tails_idx.append(i)
+            else:
+                tails[pos] = value
+                tails_idx[pos] = i
+            prev[i] = tails_idx[pos - 1] if pos > 0 else -1
+        keep: set[IconWidget] = set()
+        i = tails_idx[-1] if tails_idx else -1
+        while i != -1:
+            keep.add(current[i])
+            i = prev[i]
+
+        # Place every other widget right after its target predecessor, in target order,
+        # so everything placed so far is always in the right relative order
+        for i, w in enumerate(target):
+            if w in keep:
+                continue
+            insert_at = layout.indexOf(target[i - 1]) + 1 if i > 0 else 0
+            if layout.indexOf(w) < insert_at:
+                insert_at -= 1
+            layout.insertWidget(insert_at, w)
+
     def update_current_state(self):
         widgets_state: dict[str, Any] = {}
+        unpinned_index = self._layout_positions(self.unpinned_layout)
+        pinned_index = self._layout_positions(self.pinned_layout)
         for w in self.icons:
             if w.data is None or w.isHidden():
                 continue
-            if self.config.show_in_popup and not w.is_pinned:
-                # Grid layout: compute linear index from grid position
-                idx = self.unpinned_layout.indexOf(w)
-                index = idx if idx != -1 else self.pinned_layout.indexOf(w)
-            else:
-                index = self.unpinned_layout.indexOf(w)
-                if index == -1:
-                    index = self.pinned_layout.indexOf(w)
+            index = unpinned_index.get(w, pinned_index.get(w, -1))
             uuid = None if w.data.guid is None else str(w.data.guid)
             widgets_state[uuid or w.data.exe_path] = IconState(
                 is_pinned=w.is_pinned,
@@ -586,6 +643,16 @@ class SystrayWidget(BaseWidget):
             )
         self.current_state |= widgets_state
 
+    @staticmethod
+    def _layout_positions(layout: QLayout) -> dict[IconWidget, int]:
+        """Map each widget to its layout index, the same index QLayout.indexOf returns"""
+        positions = {}
+        for i in range(layout.count()):
+            item = layout.itemAt(i)
+            if item is not None and (w := item.widget()) is not None:
+                positions[w] = i
+        return positions
+
     def save_state(self):
         """Save the current icon position and pinned state to disk."""
         self.update_current_state()
@@ -28,6 +28,8 @@ from core.validation.widgets.yasb.taskbar import TaskbarConfig
 from core.widgets.base import BaseWidget
 from core.widgets.services.recycle_bin.recycle_bin_monitor import RecycleBinMonitor
 from core.widgets.services.taskbar.app_menu import show_context_menu
+from core.widgets.services.taskbar.application_window import ALL_WINDOW_CHANGES, WindowChange
+from core.widgets.services.taskbar.icon_cache import TaskbarIconCache
 from core.widgets.services.taskbar.pin_manager import PinManager
 from core.widgets.services.taskbar.thumbnail import TaskbarThumbnailManager
 
@@ -485,7 +487,7 @@ class TaskbarWidget(BaseWidget):
         self.config.ignore_apps.processes = list(set(self.config.ignore_apps.processes))
         self.config.ignore_apps.titles = list(set(self.config.ignore_apps.titles))
 
-        self._icon_cache = {}
+        self._icon_cache = {}  # Recycle Bin stock icons, window icons use TaskbarIconCache
         self._hwnd_to_widget = {}
         self._window_buttons = {}
         self._suspend_updates = False
@@ -1150,11 +1152,12 @@ class TaskbarWidget(BaseWidget):
 
     def _on_window_removed(self, hwnd, window_data):
         """Handle window removed signal from task manager"""
+        TaskbarIconCache.get_instance().forget_window(hwnd)
         # Skip if we don't currently show this hwnd to avoid duplicate removals
         if hwnd in self._window_buttons:
             self._remove_window_ui(hwnd, window_data)
 
-    def _on_window_updated(self, hwnd, window_data):
+    def _on_window_updated(self, hwnd, window_data, changes=ALL_WINDOW_CHANGES):
         """Handle window updated signal from task manager"""
         # Apply filtering - remove if no longer should be shown
         if not self._should_show_window(hwnd, window_data):
@@ -1165,7 +1168,7 @@ class TaskbarWidget(BaseWidget):
         if hwnd not in self._window_buttons:
             self._add_window_ui(hwnd, window_data)
         else:
-            self._update_window_ui(hwnd, window_data)
+            self._update_window_ui(hwnd, window_data, changes)
 
     def _on_window_monitor_changed(self, hwnd, window_data):
         """Handle window monitor changed signal from task manager"""
@@ -1184,7 +1187,7 @@ class TaskbarWidget(BaseWidget):
             if hwnd not in self._window_buttons and self._should_show_window(hwnd, window_data):
                 self._add_window_ui(hwnd, window_data)
             else:
-                self._update_window_ui(hwnd, window_data)
+                self._update_window_ui(hwnd, window_data, frozenset({WindowChange.MONITOR}))
 
     def _get_widget_monitor_handle(self):
         """Get the monitor handle for this widget using win32 utilities."""
@@ -1407,8 +1410,8 @@ class TaskbarWidget(BaseWidget):
         if self.config.hide_empty and len(self._hwnd_to_widget) < 1 and not self._pending_pinned_recreations:
             self._hide_taskbar_widget()
 
-    def _update_window_ui(self, hwnd, window_data):
-        """Update window UI element (focused on the specific widget, no global sweep)."""
+    def _update_window_ui(self, hwnd, window_data, changes=ALL_WINDOW_CHANGES):
+        """Apply the given window changes to its button (focused on the specific widget, no global sweep)."""
         if self._suspend_updates:
             return
 
@@ -1419,11 +1422,24 @@ class TaskbarWidget(BaseWidget):
 
         title = window_data.get("title", "")
         process = window_data.get("process_name", "")
-        title_wrapper = None
-        title_label = None
-        # If process is explorer.exe (e.g. file explorer), we use the title for caching the icon.
-        icon = self._get_app_icon(hwnd, title if process == "explorer.exe" else "")
-        self._window_buttons[hwnd] = (title, icon, hwnd, process)
+        title_changed = WindowChange.TITLE in changes
+        state_changed = WindowChange.ACTIVE in changes or WindowChange.FLASHING in changes
+
+        # Window icons only change with the title for Explorer (the icon follows the current folder),
+        # so anything else keeps the icon it was added with unless it couldn't be read yet.
+        previous = self._window_buttons.get(hwnd)
+        if previous is None:
+            return
+        icon = previous[1]
+        icon_changed = icon is None or WindowChange.PROCESS in changes or (title_changed and process == "explorer.exe")
+        if icon_changed:
+            icon = self._get_app_icon(hwnd, title if process == "explorer.exe" else "")
+        if icon_changed or title_changed or WindowChange.PROCESS in changes:
+            self._window_buttons[hwnd] = (title, icon, hwnd, process)
+
+        # Cloak and monitor changes are fully handled by _should_show_window
+        if not (icon_changed or title_changed or state_changed):
+            return
 
         # Direct lookup for the widget
         widget = self._hwnd_to_widget.get(hwnd)
@@ -1443,21 +1459,22 @@ class TaskbarWidget(BaseWidget):
         if not layout:
             return
 
-        # Update icon using helper method
-        if icon:
+        if icon_changed and icon:
             icon_label = self._get_icon_label(widget)
             if icon_label:
                 icon_label.setPixmap(icon)
 
+        title_wrapper = None
+        title_label = None
         try:
             if self.config.title_label.enabled:
                 title_wrapper = self._get_title_wrapper(widget)
                 title_label = self._get_title_label(title_wrapper)
-                if title_label:
+                if title_label and title_changed:
                     formatted_title = self._format_title(title)
                     if title_label.text() != formatted_title:
                         title_label.setText(formatted_title)
-                if self.config.title_label.show == "focused" and title_wrapper:
+                if state_changed and self.config.title_label.show == "focused" and title_wrapper:
                     if not self._context_menu_open:
                         desired_visible = self._get_title_visibility(hwnd)
                         current_target = title_wrapper.property("target_visible")
@@ -1469,6 +1486,13 @@ class TaskbarWidget(BaseWidget):
         except Exception:
             pass
 
+        # Update the tooltip if enabled
+        if title_changed and self._tooltip and title:
+            set_tooltip(widget, title, delay=0)
+
+        if not state_changed:
+            return
+
         # If this window is marked active by the manager, enforce single foreground class.
         # This handles external changes (like minimizing via Windows taskbar) where only
         # the newly-active window might get an update initially.
@@ -1478,11 +1502,12 @@ class TaskbarWidget(BaseWidget):
         except Exception:
             pass
 
-        # Repolish the widget to apply any style changes
+        # Repolish the widget only when its class actually changes
         try:
             new_cls = self._get_container_class(hwnd)
-            widget.setProperty("class", new_cls)
-            refresh_widget_style(widget, title_wrapper, title_label)
+            if widget.property("class") != new_cls:
+                widget.setProperty("class", new_cls)
+                refresh_widget_style(widget, title_wrapper, title_label)
             if "flashing" in new_cls:
                 self._start_flash_timer(hwnd, widget)
             else:
@@ -1490,10 +1515,6 @@ class TaskbarWidget(BaseWidget):
         except Exception:
             pass
 
-        # Update the tooltip if enabled
-        if self._tooltip and title:
-            set_tooltip(widget, title, delay=0)
-
     def _refresh_title_visibility(self, hwnd: int) -> None:
         if not (self.config.title_label.enabled and self.config.title_label.show == "focused"):
             return
@@ -1808,7 +1829,7 @@ class TaskbarWidget(BaseWidget):
         return f"{base_class} running"
 
     def _get_app_icon(self, hwnd: int, title: str) -> QPixmap | None:
-        """Return a QPixmap for the given window handle, using a DPI-aware cache."""
+        """Return a QPixmap for the given window handle from the shared DPI-aware icon cache."""
         if self.config.icon_size <= 0:
             return None
         try:
@@ -1819,23 +1840,9 @@ class TaskbarWidget(BaseWidget):
                 is_empty = self._recycle_bin_state.get("is_empty", True)
                 return self._get_recycle_bin_icon(is_empty)
 
-            cache_key = (hwnd, title, self._dpi)
-            if cache_key in self._icon_cache:
-                icon_img = self._icon_cache[cache_key]
-            else:
-                icon_img = get_window_icon(hwnd)
-                if icon_img and self._dpi is not None:
-                    pixel_size = int(self.config.icon_size * self._dpi)
-                    icon_img = icon_img.resize((pixel_size, pixel_size), Image.LANCZOS).convert("RGBA")
-                    self._icon_cache[cache_key] = icon_img
-
-            if not icon_img:
-                return None
-
-            qimage = QImage(icon_img.tobytes(), icon_img.width, icon_img.height, QImage.Format.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimage)
-            pixmap.setDevicePixelRatio(self._dpi)
-            return pixmap
+            dpi = self._dpi if self._dpi is not None else 1.0
+            pixel_size = int(self.config.icon_size * dpi)
+            return TaskbarIconCache.get_instance().get(hwnd, title, pixel_size, dpi, get_window_icon)
 
         except Exception:
             logging.debug("Failed to get icons for window with HWND %s", hwnd, exc_info=True)
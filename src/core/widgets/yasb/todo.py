@@ -4,6 +4,7 @@ import logging
 import os
 import re
 import urllib.parse
+from collections.abc import Callable
 from functools import partial
 
 from PyQt6.QtCore import QMimeData, QPoint, Qt, QTimer
@@ -24,11 +25,12 @@ from PyQt6.QtWidgets import (
 )
 
 from core.config import HOME_CONFIGURATION_DIR
+from core.utils.local_store import LocalStore, StoredList
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.utils.win32.utils import apply_qmenu_style
 from core.validation.widgets.yasb.todo import TodoConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 
 
 class TodoWidget(BaseWidget):
@@ -72,10 +74,20 @@ class TodoWidget(BaseWidget):
             return os.path.expanduser(self.config.data_path)
         return os.path.join(HOME_CONFIGURATION_DIR, "todo.json")
 
+    def _get_tasks_store(self) -> StoredList | None:
+        """Default tasks live in the local store, todo.json is only imported once."""
+        if self.config.data_path and self.config.data_path.strip():
+            return None
+        return LocalStore.get_instance().get_list("todo", legacy_file=self._get_tasks_file_path())
+
     def _load_tasks(self):
         try:
+            tasks_store = self._get_tasks_store()
             tasks_file = self._get_tasks_file_path()
-            if os.path.exists(tasks_file):
+            if tasks_store is not None:
+                self._tasks = tasks_store.load()
+                self._tasks.sort(key=lambda t: t["order"], reverse=True)
+            elif os.path.exists(tasks_file):
                 with open(tasks_file, encoding="utf-8") as f:
                     self._tasks = json.load(f)
                 self._tasks.sort(key=lambda t: t["order"], reverse=True)
@@ -85,8 +97,18 @@ class TodoWidget(BaseWidget):
             logging.error("Error loading tasks: %s", e)
             self._tasks = []
 
-    def _save_tasks(self):
+    def _save_tasks(self, store_change: Callable[[StoredList], bool | None] | None = None):
+        """Save tasks to the local store or the custom JSON file, ``store_change`` writes just the changed task"""
         try:
+            tasks_store = self._get_tasks_store()
+            if tasks_store is not None:
+                if store_change is not None:
+                    if store_change(tasks_store) is not False:
+                        return
+                    # The store no longer matches the list in memory, write the whole list instead
+                    logging.warning("Changed task not found in the local store, saving all tasks")
+                tasks_store.save(self._tasks)
+                return
             tasks_file = self._get_tasks_file_path()
             with open(tasks_file, "w", encoding="utf-8") as f:
                 json.dump(self._tasks, f, indent=2, ensure_ascii=False)
@@ -108,7 +130,7 @@ class TodoWidget(BaseWidget):
             "order": len(self._tasks),
         }
         self._tasks.insert(0, task_data)
-        self._save_tasks()
+        self._save_tasks(lambda store: store.insert(0, task_data))
         TodoWidget.update_all()
         dialog.accept()
         self._show_completed = False
@@ -119,13 +141,12 @@ class TodoWidget(BaseWidget):
         description = self._desc_input.toPlainText().strip() if self._desc_input else ""
         if not title:
             return
-        for t in self._tasks:
+        for i, t in enumerate(self._tasks):
             if t["id"] == task["id"]:
-                t["title"] = title
-                t["description"] = description
-                t["category"] = self._selected_category
+                edited = {**t, "title": title, "description": description, "category": self._selected_category}
+                self._tasks[i] = edited
+                self._save_tasks(lambda store: store.update(t, edited))
                 break
-        self._save_tasks()
         TodoWidget.update_all()
         dialog.accept()
         self._show_completed = False
@@ -239,32 +260,14 @@ class TodoWidget(BaseWidget):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
 
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-
         active_tasks = self._get_filtered_tasks(completed=False)
         completed_tasks = self._get_filtered_tasks(completed=True)
         total_tasks = len(self._tasks)
         active_count = len(active_tasks)
         completed_count = len(completed_tasks)
 
-        for widget_index, part in enumerate(label_parts):
-            if widget_index >= len(active_widgets) or not isinstance(active_widgets[widget_index], QLabel):
-                continue
-
-            current_widget = active_widgets[widget_index]
-
-            if "<span" in part and "</span>" in part:
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                current_widget.setText(icon)
-            else:
-                formatted_text = (
-                    part.replace("{count}", str(active_count))
-                    .replace("{total}", str(total_tasks))
-                    .replace("{completed}", str(completed_count))
-                )
-                current_widget.setText(formatted_text)
-            widget_index += 1
+        format_text = replace_options({"{count}": active_count, "{total}": total_tasks, "{completed}": completed_count})
+        self.render_label(active_widgets, active_label_content, format_text=format_text)
 
         # Tooltip: show number of tasks per category, skip 0s
         category_counts = {}
@@ -598,11 +601,7 @@ class TodoWidget(BaseWidget):
                 checkbox.setText(self.config.icons.checked)
 
                 def do_archive():
-                    for i, existing_task in enumerate(self._tasks):
-                        if existing_task["id"] == t["id"]:
-                            self._tasks[i]["completed"] = True
-                            break
-                    self._save_tasks()
+                    self._set_task_completed(t, True)
                     TodoWidget.update_all()
                     try:
                         if hasattr(self, "_menu") and self._menu and self._menu.isVisible():
@@ -711,27 +710,30 @@ class TodoWidget(BaseWidget):
 
         layout.addWidget(container)
 
-    def _uncomplete_task(self, task):
+    def _set_task_completed(self, task, completed: bool):
         for i, existing_task in enumerate(self._tasks):
             if existing_task["id"] == task["id"]:
-                self._tasks[i]["completed"] = False
+                updated = {**existing_task, "completed": completed}
+                self._tasks[i] = updated
+                self._save_tasks(lambda store: store.update(existing_task, updated))
                 break
-        self._save_tasks()
+
+    def _uncomplete_task(self, task):
+        self._set_task_completed(task, False)
         TodoWidget.update_all()
         self._refresh_menu_task_list()
 
     def _archive_task(self, task):
-        for i, existing_task in enumerate(self._tasks):
-            if existing_task["id"] == task["id"]:
-                self._tasks[i]["completed"] = True
-                break
-        self._save_tasks()
+        self._set_task_completed(task, True)
         TodoWidget.update_all()
         self._remove_task_widget_from_menu(task["id"])
 
     def _delete_task(self, task):
-        self._tasks = [t for t in self._tasks if t["id"] != task["id"]]
-        self._save_tasks()
+        for existing_task in self._tasks:
+            if existing_task["id"] == task["id"]:
+                self._tasks.remove(existing_task)
+                self._save_tasks(lambda store: store.remove(existing_task))
+                break
         TodoWidget.update_all()
         self._remove_task_widget_from_menu(task["id"])
 
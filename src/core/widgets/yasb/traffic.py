@@ -1,5 +1,4 @@
 import logging
-import re
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
@@ -7,7 +6,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayou
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.validation.widgets.yasb.traffic import TrafficWidgetConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.traffic.connection_monitor import InternetChecker
 from core.widgets.services.traffic.traffic_manager import TrafficDataManager
 
@@ -211,49 +210,29 @@ class TrafficWidget(BaseWidget):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets  # type: ignore
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
 
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
-        label_options = [
-            ("{upload_speed}", shared_data["upload_speed"]),
-            ("{download_speed}", shared_data["download_speed"]),
-            ("{today_uploaded}", shared_data["today_uploaded"]),
-            ("{today_downloaded}", shared_data["today_downloaded"]),
-            ("{session_uploaded}", shared_data["session_uploaded"]),
-            ("{session_downloaded}", shared_data["session_downloaded"]),
-            ("{alltime_uploaded}", shared_data["alltime_uploaded"]),
-            ("{alltime_downloaded}", shared_data["alltime_downloaded"]),
-        ]
-
-        for part in label_parts:
-            part = part.strip()
-            for option, value in label_options:
-                part = part.replace(option, str(value))
-
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-
-                # Update CSS class based on internet connection status
-                current_class = active_widgets[widget_index].property("class") or ""
-                if not self._is_internet_connected:
-                    if "offline" not in current_class:
-                        new_class = f"{current_class} offline".strip()
-                        active_widgets[widget_index].setProperty("class", new_class)
-
-                else:
-                    # Remove offline class if connected
-                    if "offline" in current_class:
-                        new_class = current_class.replace("offline", "").strip()
-                        new_class = " ".join(new_class.split())
-                        active_widgets[widget_index].setProperty("class", new_class)
-                refresh_widget_style(active_widgets[widget_index])
-
-                widget_index += 1
+        format_text = replace_options(
+            {
+                "{upload_speed}": shared_data["upload_speed"],
+                "{download_speed}": shared_data["download_speed"],
+                "{today_uploaded}": shared_data["today_uploaded"],
+                "{today_downloaded}": shared_data["today_downloaded"],
+                "{session_uploaded}": shared_data["session_uploaded"],
+                "{session_downloaded}": shared_data["session_downloaded"],
+                "{alltime_uploaded}": shared_data["alltime_uploaded"],
+                "{alltime_downloaded}": shared_data["alltime_downloaded"],
+            }
+        )
+        # Update CSS class based on internet connection status
+        state_class = "" if self._is_internet_connected else "offline"
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {state_class}".rstrip(),
+            format_icon=format_text,
+            icon_class=state_class,
+        )
 
     def _on_connection_changed(self, is_connected: bool):
         """Handle internet connection status changes"""
@@ -1,12 +1,10 @@
-import re
-
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel
 
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import refresh_widget_style
 from core.validation.widgets.yasb.update_check import UpdateCheckWidgetConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template
 from core.widgets.services.update_check.service import UpdateCheckService
 
 # Sources and their config attribute names
@@ -61,22 +59,14 @@ class UpdateCheckWidget(BaseWidget):
         self.widget_layout.addWidget(container)
         container.hide()
 
-        label_parts = re.split(r"(<span.*?>.*?</span>)", label_text)
-        label_parts = [p for p in label_parts if p]
         widgets: list[QLabel] = []
 
-        for part in label_parts:
-            part = part.strip()
-            if not part:
-                continue
-            if "<span" in part and "</span>" in part:
-                class_match = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                class_result = class_match.group(2) if class_match else "icon"
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                label = QLabel(icon)
-                label.setProperty("class", class_result)
+        for part in parse_label_template(label_text):
+            if part.span_class is not None:
+                label = QLabel(part.text)
+                label.setProperty("class", part.span_class)
             else:
-                label = QLabel(part)
+                label = QLabel(part.text)
                 label.setProperty("class", "label")
 
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -101,26 +91,9 @@ class UpdateCheckWidget(BaseWidget):
         if cfg is None:
             return
 
-        label_parts = re.split(r"(<span.*?>.*?</span>)", cfg.label)
-        label_parts = [p for p in label_parts if p]
-        widgets = self._label_widgets.get(source, [])
-        idx = 0
-
-        for part in label_parts:
-            part = part.strip()
-            if not part or idx >= len(widgets):
-                continue
-            w = widgets[idx]
-            if not isinstance(w, QLabel):
-                idx += 1
-                continue
-
-            if "<span" in part and "</span>" in part:
-                icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                w.setText(icon)
-            else:
-                w.setText(part.format(count=count))
-            idx += 1
+        self.render_label(
+            self._label_widgets.get(source, []), cfg.label, format_text=lambda text: text.format(count=count)
+        )
 
         if cfg.tooltip:
             title = {"winget": "Winget Update", "scoop": "Scoop Update", "windows": "Windows Update"}.get(
@@ -17,7 +17,7 @@ from core.utils.utilities import (
 from core.utils.win32.app_icons import get_process_icon
 from core.utils.win32.utils import get_app_name_from_pid
 from core.validation.widgets.yasb.volume import VolumeConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, replace_options
 from core.widgets.services.volume.service import AudioOutputService
 
 
@@ -523,9 +523,6 @@ class VolumeWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
 
         if self.volume is None:
             mute_status, icon_volume, level_volume = None, self.config.volume_icons[0], "No Device"
@@ -555,41 +552,19 @@ class VolumeWidget(BaseWidget):
             numeric_value = int(re.search(r"\d+", level_volume).group()) if re.search(r"\d+", level_volume) else 0
             self.progress_widget.set_value(numeric_value)
 
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if "<span" in part and "</span>" in part:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        self._set_device_state_classes(active_widgets[widget_index], mute_status == 1)
-                else:
-                    if widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                        active_widgets[widget_index].setText(formatted_text)
-                        self._set_device_state_classes(active_widgets[widget_index], mute_status == 1)
-                widget_index += 1
-
-    def _set_device_state_classes(self, widget, muted: bool):
-        """Set or remove the 'muted' and 'no-device' classes on the widget."""
-        current_class = widget.property("class") or ""
-        classes = set(current_class.split())
-
-        # Handle no-device class
-        if self.volume is None:
-            classes.add("no-device")
-        else:
-            classes.discard("no-device")
-
-        # Handle muted class
-        if muted:
-            classes.add("muted")
-        else:
-            classes.discard("muted")
-
-        widget.setProperty("class", " ".join(classes))
-        refresh_widget_style(widget)
+        format_text = replace_options(label_options)
+        state_classes = " ".join(
+            name for name, active in (("no-device", self.volume is None), ("muted", mute_status == 1)) if active
+        )
+        label_class = "label alt" if self._show_alt_label else "label"
+        self.render_label(
+            active_widgets,
+            active_label_content,
+            format_text=format_text,
+            label_class=f"{label_class} {state_classes}".rstrip(),
+            format_icon=format_text,
+            icon_class=state_classes,
+        )
 
     def _get_volume_icon(self):
         current_mute_status = self.volume.GetMute()
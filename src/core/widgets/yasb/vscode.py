@@ -2,7 +2,6 @@ import datetime
 import json
 import logging
 import os
-import re
 import sqlite3
 import subprocess
 import urllib.parse
@@ -93,19 +92,7 @@ class VSCodeWidget(BaseWidget):
     def _update_label(self):
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-                widget_index += 1
+        self.render_label(active_widgets, active_label_content)
 
     def _handle_mouse_press_event(self, event, folder):
         try:
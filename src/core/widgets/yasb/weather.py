@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 import traceback
 import urllib.parse
 from datetime import datetime
@@ -14,7 +13,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout, QWidget
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.validation.widgets.yasb.weather import WeatherWidgetConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template, replace_options
 from core.widgets.services.weather.api import IconFetcher, WeatherDataFetcher
 from core.widgets.services.weather.models import WeatherApiResponse
 from core.widgets.services.weather.widgets import (
@@ -360,22 +359,14 @@ class WeatherWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str):
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split("(<span.*?>.*?</span>)", content)
-            label_parts = [part for part in label_parts if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                     label.hide()
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                     label.setText("weather update...")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -388,10 +379,6 @@ class WeatherWidget(BaseWidget):
         self._widgets = process_content(content)
         self._widgets_alt = process_content(content_alt, is_alt=True)
 
-    def _reload_css(self, label: QLabel):
-        refresh_widget_style(label)
-        label.update()
-
     @pyqtSlot(bool)
     def _update_label(self, update_class: bool = True):
         if self._weather_data is None:
@@ -400,8 +387,6 @@ class WeatherWidget(BaseWidget):
 
         active_widgets = self._show_alt_label and self._widgets_alt or self._widgets
         active_label_content = self._show_alt_label and self._label_alt_content or self._label_content
-        label_parts = re.split(r"(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
 
         if self.config.tooltip:
             tooltip = (
@@ -425,34 +410,26 @@ class WeatherWidget(BaseWidget):
 
             set_tooltip(self, tooltip)
 
-        widget_index = 0
+        format_text = replace_options(self._weather_data)
+        # Use model_dump for dynamic lookup
+        icons = self.config.icons.model_dump()
 
-        try:
-            for part in label_parts:
-                part = part.strip()
-                for option, value in self._weather_data.items():
-                    part = part.replace(option, str(value))
-                if not part or widget_index >= len(active_widgets):
-                    continue
-                if "<span" in part and "</span>" in part:
-                    icon_name = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    # Use model_dump for dynamic lookup
-                    active_widgets[widget_index].setText(self.config.icons.model_dump().get(icon_name, icon_name))
-                    if update_class:
-                        # Retrieve current class and append new class based on weather conditions
-                        current_class = active_widgets[widget_index].property("class") or ""
-                        append_class_icon = self._weather_data.get("{icon_class}", "")
-                        # Create the new class string
-                        new_class = f"{current_class} {append_class_icon}"
-                        active_widgets[widget_index].setProperty("class", new_class)
-                        # Update css
-                        self._reload_css(active_widgets[widget_index])
-                else:
-                    active_widgets[widget_index].setText(part)
+        def format_icon(text: str) -> str:
+            icon_name = format_text(text)
+            return icons.get(icon_name, icon_name)
 
-                if not active_widgets[widget_index].isVisible():
-                    active_widgets[widget_index].show()
-                widget_index += 1
+        try:
+            self.render_label(
+                active_widgets,
+                active_label_content,
+                format_text=format_text,
+                format_icon=format_icon,
+                # Append a class based on weather conditions to the icon
+                icon_class=self._weather_data.get("{icon_class}", "") if update_class else None,
+            )
+            for widget in active_widgets:
+                if not widget.isVisible():
+                    widget.show()
         except Exception as e:
             logging.exception("Failed to update label: %s", e)
 
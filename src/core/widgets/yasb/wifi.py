@@ -1,5 +1,4 @@
 import logging
-import re
 import socket
 
 from PyQt6.QtCore import Qt
@@ -9,7 +8,7 @@ from PyQt6.QtWidgets import (
 from winrt.windows.networking.connectivity import NetworkInformation
 
 from core.validation.widgets.yasb.wifi import WifiConfig
-from core.widgets.base import BaseWidget
+from core.widgets.base import BaseWidget, parse_label_template, replace_options
 from core.widgets.services.wifi.wifi_managers import NetworkInfo, WiFiInfo, WiFiWorker
 from core.widgets.services.wifi.wifi_widgets import WifiMenu
 
@@ -29,7 +28,7 @@ class WifiWidget(BaseWidget):
 
         self._cached_wifi_info = WiFiInfo(0, "Disconnected", -1)
 
-        # Worker thread that will fetch wifi info on an interval
+        # Worker thread that publishes wifi info whenever it changes
         self._wifi_worker = WiFiWorker(self.config.get_exact_wifi_strength, self.config.update_interval)
         self._wifi_worker.result.connect(self._on_wifi_info_result)
         self._wifi_worker.start()
@@ -51,6 +50,10 @@ class WifiWidget(BaseWidget):
         self.callback_right = self.config.callbacks.on_right
         self.callback_middle = self.config.callbacks.on_middle
 
+        # The shared worker only emits on change, widgets on other bars start from its last result
+        if (wifi_info := self._wifi_worker.latest_info) is not None:
+            self._on_wifi_info_result(wifi_info)
+
     def _display_correct_label(self):
         active_widget_group = "ethernet" if self._ethernet_active else "wifi"
         widget_groups = {
@@ -75,21 +78,13 @@ class WifiWidget(BaseWidget):
 
     def _create_dynamically_label(self, content: str, content_alt: str, is_ethernet: bool = False):
         def process_content(content: str, is_alt: bool = False, is_ethernet: bool = False) -> list[QLabel]:
-            label_parts = re.split("(<span.*?>.*?</span>)", content)  # Filters out empty parts before entering the loop
-            label_parts = [part for part in label_parts if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()  # Remove any leading/trailing whitespace
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in parse_label_template(content):
+                if part.span_class is not None:
+                    label = QLabel(part.text)
+                    label.setProperty("class", part.span_class)
                 else:
-                    label = QLabel(part)
+                    label = QLabel(part.text)
                     label.setProperty("class", "label alt" if is_alt else "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 self._widget_container_layout.addWidget(label)
@@ -152,24 +147,15 @@ class WifiWidget(BaseWidget):
             active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
             active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
 
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-        label_options = {
-            "{wifi_icon}": wifi_icon,
-            "{wifi_name}": wifi_name,
-            "{wifi_strength}": wifi_strength,
-            "{ip_addr}": ip_addr,
-        }
-        for part in label_parts:
-            part = part.strip()
-            if part:
-                formatted_text = part
-                for option, value in label_options.items():
-                    formatted_text = formatted_text.replace(option, str(value))
-                if widget_index < len(active_widgets):
-                    active_widgets[widget_index].setText(formatted_text)
-                widget_index += 1
+        format_text = replace_options(
+            {
+                "{wifi_icon}": wifi_icon,
+                "{wifi_name}": wifi_name,
+                "{wifi_strength}": wifi_strength,
+                "{ip_addr}": ip_addr,
+            }
+        )
+        self.render_label(active_widgets, active_label_content, format_text=format_text, format_icon=format_text)
 
     def _get_wifi_icon(self, strength: int) -> str:
         if strength >= 80:
@@ -270,7 +270,8 @@ class WindowControlsWidget(BaseWidget):
     def _update_maximize_button(self, maximized: bool) -> None:
         """Toggle the maximize button icon, tooltip, and CSS class between maximize and restore."""
         btn = self._buttons.get("maximize")
-        if btn:
+        # Polled on every foreground check, only touch the button when the state flips
+        if btn and btn.property("class") != ("btn restore" if maximized else "btn maximize"):
             if maximized:
                 btn.setText(self.config.button_labels.restore)
                 btn.setProperty("class", "btn restore")
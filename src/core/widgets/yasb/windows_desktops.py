@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
 )
 
 from core.utils.system import is_windows_10
-from core.utils.utilities import PopupWidget, refresh_widget_style
+from core.utils.utilities import PopupWidget, set_widget_class
 from core.utils.win32.utils import apply_qmenu_style
 from core.validation.widgets.yasb.windows_desktops import WindowsDesktopsConfig
 from core.widgets.base import BaseWidget
@@ -66,8 +66,7 @@ class WorkspaceButton(QPushButton):
             current_class = button.property("class")
             new_class = " ".join([cls for cls in current_class.split() if not cls.startswith("button-")])
             new_class = f"{new_class} button-{index + 1}"
-            button.setProperty("class", new_class)
-            refresh_widget_style(button)
+            set_widget_class(button, new_class)
 
     def activate_workspace(self):
         try:
@@ -444,8 +443,7 @@ class WorkspaceWidget(BaseWidget):
         if tokens:
             base = f"{base} {' '.join(tokens)}"
 
-        workspace_btn.setProperty("class", base)
-        refresh_widget_style(workspace_btn)
+        set_widget_class(workspace_btn, base)
         if schedule_update:
             QTimer.singleShot(0, workspace_btn.update_visible_buttons)
 
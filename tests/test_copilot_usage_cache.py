@@ -0,0 +1,103 @@
+"""Copilot daily usage must only be fetched once per completed day, even across restarts."""
+
+import json
+import threading
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from core.widgets.services.copilot import api, usage_cache
+from core.widgets.services.copilot.api import CopilotDataManager
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+MONTHLY_DATA = {"timePeriod": {"year": NOW.year, "month": NOW.month}}
+
+
+class _UsageStub(BaseHTTPRequestHandler):
+    hits: Counter = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        day = int(query["day"][0])
+        with self.lock:
+            self.hits[day] += 1
+        body = json.dumps({"usageItems": [{"product": "Copilot", "grossQuantity": day}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    _UsageStub.hits = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UsageStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(api, "API_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    try:
+        yield _UsageStub
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    cache_file = tmp_path / "copilot_usage.json"
+    monkeypatch.setattr(usage_cache, "_get_file_path", lambda: cache_file)
+    monkeypatch.setattr(CopilotDataManager, "_token", "token")
+    monkeypatch.setattr(CopilotDataManager, "_username", "octocat")
+    monkeypatch.setattr(CopilotDataManager, "_daily_cache", {})
+    monkeypatch.setattr(CopilotDataManager, "_daily_cache_key", None)
+    monkeypatch.setattr(CopilotDataManager, "_daily_final", set())
+    return CopilotDataManager.get_instance()
+
+
+def _restart():
+    """Drop the in-memory cache, as a new process would start without it."""
+    CopilotDataManager._daily_cache = {}
+    CopilotDataManager._daily_cache_key = None
+    CopilotDataManager._daily_final = set()
+
+
+def test_restart_only_fetches_today(stub_server, manager):
+    cold = manager._fetch_daily_data_parallel(NOW, MONTHLY_DATA)
+    assert stub_server.hits == Counter({day: 1 for day in range(1, NOW.day + 1)})
+
+    stub_server.hits.clear()
+    _restart()
+    warm = manager._fetch_daily_data_parallel(NOW, MONTHLY_DATA)
+    assert stub_server.hits == Counter({NOW.day: 1})
+
+    assert warm == cold
+    assert [entry["requests"] for entry in warm[: NOW.day]] == list(range(1, NOW.day + 1))
+
+
+def test_day_cached_as_today_is_persisted_after_midnight(stub_server, manager):
+    manager._fetch_daily_data_parallel(NOW, MONTHLY_DATA)
+    month_key = f"{NOW.year}-{NOW.month:02d}"
+    today = f"{month_key}-{NOW.day:02d}"
+    assert today not in usage_cache.load_days("octocat", month_key)
+
+    # The same process keeps running into the next day
+    tomorrow = NOW + timedelta(days=1)
+    stub_server.hits.clear()
+    manager._fetch_daily_data_parallel(tomorrow, MONTHLY_DATA)
+    assert stub_server.hits == Counter({NOW.day: 1, tomorrow.day: 1})
+    assert usage_cache.load_days("octocat", month_key)[today] == NOW.day
+
+    # Once persisted it is neither fetched again nor lost on restart
+    stub_server.hits.clear()
+    manager._fetch_daily_data_parallel(tomorrow, MONTHLY_DATA)
+    _restart()
+    manager._fetch_daily_data_parallel(tomorrow, MONTHLY_DATA)
+    assert stub_server.hits == Counter({tomorrow.day: 2})
@@ -0,0 +1,74 @@
+"""Bursts of Recycle Bin notifications must fold into as few bin queries as the debounce allows."""
+
+from core.widgets.services.recycle_bin.change_debounce import (
+    DEBOUNCE_MAX_DELAY,
+    DEBOUNCE_QUIET,
+    TrailingDebounce,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_queries(notify_times: list[float]) -> list[float]:
+    """Feed notifications at ``notify_times`` and return when queries ran, sleeping like the watcher does."""
+    clock = FakeClock()
+    debounce = TrailingDebounce(clock=clock)
+    queries = []
+
+    def sleep_until(deadline: float | None) -> None:
+        while (wait := debounce.next_fire_in()) is not None and (deadline is None or clock.now + wait <= deadline):
+            clock.now += wait
+            if debounce.take_due():
+                queries.append(clock.now)
+
+    for at in notify_times:
+        sleep_until(at)
+        clock.now = at
+        debounce.notify()
+    sleep_until(None)
+    return queries
+
+
+def burst(start: float, duration: float, count: int) -> list[float]:
+    return [start + duration * i / count for i in range(count)]
+
+
+def test_single_burst_gives_one_query():
+    notifications = burst(0.0, 0.2, 500)
+    queries = run_queries(notifications)
+    assert len(queries) == 1
+    assert abs(queries[0] - (notifications[-1] + DEBOUNCE_QUIET)) < 1e-9
+
+
+def test_bursts_separated_by_quiet_time_give_one_query_each():
+    assert len(run_queries(burst(0.0, 0.2, 500) + burst(2.0, 0.2, 500))) == 2
+
+
+def test_continuous_burst_is_capped_by_max_delay():
+    queries = run_queries(burst(0.0, 3.5, 350))
+    assert len(queries) == 4
+    # The first queries are forced by max_delay while notifications keep coming
+    assert queries[0] <= DEBOUNCE_MAX_DELAY + 1e-9
+    for earlier, later in zip(queries[:3], queries[1:3]):
+        assert later - earlier <= DEBOUNCE_MAX_DELAY + 0.01 + 1e-9
+
+
+def test_take_due_fires_once_and_only_when_due():
+    clock = FakeClock()
+    debounce = TrailingDebounce(quiet=0.3, max_delay=1.0, clock=clock)
+    assert not debounce.take_due()
+    assert debounce.next_fire_in() is None
+
+    debounce.notify()
+    clock.now = 0.2
+    assert not debounce.take_due()
+    clock.now = 0.3
+    assert debounce.take_due()
+    assert not debounce.take_due()
+    assert not debounce.pending
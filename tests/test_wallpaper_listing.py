@@ -0,0 +1,59 @@
+"""Wallpaper listings must not follow directory links, like the os.walk scan they replaced."""
+
+import os
+
+import pytest
+
+from core.widgets.services.wallpapers import thumbnail_cache
+from core.widgets.services.wallpapers.thumbnail_cache import list_wallpapers
+
+
+@pytest.fixture(autouse=True)
+def empty_listing_cache(monkeypatch):
+    monkeypatch.setattr(thumbnail_cache, "_listing_cache", {})
+
+
+def _symlink_dir(target, link):
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except (OSError, NotImplementedError) as e:
+        pytest.skip(f"Cannot create directory symlinks here: {e}")
+
+
+def test_symlink_loop_is_not_followed(tmp_path):
+    folder = tmp_path / "a"
+    folder.mkdir()
+    (folder / "x.png").write_bytes(b"")
+    _symlink_dir("..", folder / "loop")
+
+    assert list_wallpapers(str(tmp_path)) == [str(folder / "x.png")]
+    dir_mtimes, _ = thumbnail_cache._listing_cache[(str(tmp_path),)]
+    assert sorted(dir_mtimes) == sorted([str(tmp_path), str(folder)])
+
+
+def test_linked_directory_is_not_listed(tmp_path):
+    root = tmp_path / "wallpapers"
+    other = tmp_path / "other"
+    root.mkdir()
+    other.mkdir()
+    (root / "x.jpg").write_bytes(b"")
+    (other / "y.jpg").write_bytes(b"")
+    _symlink_dir(other, root / "linked.jpg")
+
+    assert list_wallpapers(str(root)) == [str(root / "x.jpg")]
+
+
+def test_listing_matches_os_walk(tmp_path):
+    for sub in ("a", "a/b", "c"):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "w.png").write_bytes(b"")
+        (tmp_path / sub / "notes.txt").write_bytes(b"")
+    _symlink_dir(tmp_path, tmp_path / "a" / "b" / "up")
+
+    expected = sorted(
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(tmp_path)
+        for name in names
+        if name.lower().endswith(thumbnail_cache.WALLPAPER_EXTENSIONS)
+    )
+    assert list_wallpapers(str(tmp_path)) == expected
@@ -0,0 +1,167 @@
+"""One WinEvent fans out to every bar, the window behind it must only be looked up once."""
+
+from collections import Counter
+
+from core.utils.win32 import window_info
+from core.utils.win32.window_info import WindowInfoCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingAdapter:
+    """Fake Win32 adapter: one process per window, handles are ``pid + 1000``."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.exited: set[int] = set()
+        self.open_handles: set[int] = set()
+
+    def window_text(self, hwnd):
+        self.calls["window_text"] += 1
+        return f"window {hwnd}"
+
+    def class_name(self, hwnd):
+        self.calls["class_name"] += 1
+        return "FakeWindow"
+
+    def window_pid(self, hwnd):
+        self.calls["window_pid"] += 1
+        return hwnd * 10
+
+    def open_process(self, pid, access):
+        self.calls["open_process"] += 1
+        handle = pid + 1000
+        self.open_handles.add(handle)
+        return handle, 0
+
+    def process_image_path(self, handle):
+        self.calls["process_image_path"] += 1
+        return f"C:\\Apps\\app{handle - 1000}.exe"
+
+    def process_exited(self, handle):
+        self.calls["process_exited"] += 1
+        return handle - 1000 in self.exited
+
+    def close_handle(self, handle):
+        self.calls["close_handle"] += 1
+        self.open_handles.discard(handle)
+
+    def monitor_hwnd(self, hwnd):
+        return 1
+
+    def monitor_info(self, monitor_hwnd):
+        return {"device": "DISPLAY1"}
+
+    def window_rect(self, hwnd):
+        return {"x": 0, "y": 0, "width": 100, "height": 100}
+
+
+def make_cache(max_age=0.25):
+    adapter = CountingAdapter()
+    clock = FakeClock()
+    return WindowInfoCache(adapter, max_age=max_age, clock=clock), adapter, clock
+
+
+def test_event_is_looked_up_once_for_all_bars():
+    cache, adapter, _ = make_cache()
+    bars = 4
+    for hwnd in (1, 2, 3):
+        cache.invalidate(hwnd)
+        infos = [cache.hwnd_info(hwnd) for _ in range(bars)]
+        assert all(info == infos[0] for info in infos)
+        assert infos[0]["process"] == {
+            "name": f"app{hwnd * 10}.exe",
+            "pid": hwnd * 10,
+            "path": infos[0]["process"]["path"],
+        }
+    assert adapter.calls["window_text"] == 3
+    assert adapter.calls["open_process"] == 3
+
+
+def test_returned_info_is_a_copy():
+    cache, _, _ = make_cache()
+    cache.hwnd_info(1)["title"] = "changed"
+    cache.hwnd_info(1)["process"]["name"] = "changed"
+    info = cache.hwnd_info(1)
+    assert info["title"] == "window 1"
+    assert info["process"]["name"] == "app10.exe"
+
+
+def test_invalidate_forces_a_new_lookup():
+    cache, adapter, _ = make_cache()
+    cache.hwnd_info(1)
+    cache.invalidate(1)
+    cache.hwnd_info(1)
+    cache.hwnd_info(1)
+    assert adapter.calls["window_text"] == 2
+
+    cache.invalidate()
+    cache.hwnd_info(1)
+    assert adapter.calls["window_text"] == 3
+    # The process is still running, its memo survives window invalidation
+    assert adapter.calls["open_process"] == 1
+
+
+def test_entries_expire_after_max_age():
+    cache, adapter, clock = make_cache(max_age=0.25)
+    cache.hwnd_info(1)
+    clock.now = 0.2
+    cache.hwnd_info(1)
+    assert adapter.calls["window_text"] == 1
+    clock.now = 0.5
+    cache.hwnd_info(1)
+    assert adapter.calls["window_text"] == 2
+
+
+def test_process_memo_is_dropped_once_the_process_exited():
+    cache, adapter, _ = make_cache()
+    cache.hwnd_info(1)
+    cache.invalidate(1)
+    cache.hwnd_info(1)
+    assert adapter.calls["open_process"] == 1
+
+    adapter.exited.add(10)
+    cache.invalidate(1)
+    cache.hwnd_info(1)
+    assert adapter.calls["open_process"] == 2
+    assert 1010 in adapter.open_handles
+
+
+def test_exit_sweeps_other_exited_processes():
+    cache, adapter, _ = make_cache()
+    for hwnd in (1, 2, 3):
+        cache.hwnd_info(hwnd)
+    adapter.exited.update({10, 20})
+    cache.invalidate(1)
+    cache.hwnd_info(1)
+    # The handle of the other exited process is closed without its PID being looked up again
+    assert 1020 not in adapter.open_handles
+    assert 1030 in adapter.open_handles
+
+
+def test_exited_processes_are_swept_periodically():
+    cache, adapter, clock = make_cache()
+    cache.hwnd_info(1)
+    cache.hwnd_info(2)
+    adapter.exited.add(10)
+    clock.now = window_info.PROCESS_SWEEP_INTERVAL - 1
+    cache.hwnd_info(2)
+    assert 1010 in adapter.open_handles
+    clock.now = window_info.PROCESS_SWEEP_INTERVAL
+    cache.hwnd_info(2)
+    assert 1010 not in adapter.open_handles
+    assert 1020 in adapter.open_handles
+
+
+def test_close_releases_every_handle():
+    cache, adapter, _ = make_cache()
+    for hwnd in (1, 2, 3):
+        cache.hwnd_info(hwnd)
+    cache.close()
+    assert not adapter.open_handles